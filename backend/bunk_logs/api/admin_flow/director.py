@@ -20,13 +20,10 @@ a shortfall against a number nobody has configured.
 
 from __future__ import annotations
 
-import csv
-from io import StringIO
 from typing import TYPE_CHECKING
 from typing import Any
 
 from django.db.models import Count
-from django.http import HttpResponse
 from django.utils.dateparse import parse_date
 from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
@@ -34,6 +31,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bunk_logs.api.csv_stream import streaming_csv_response
 from bunk_logs.api.faculty.classroom_signals import build_weekly_completion
 from bunk_logs.api.faculty.roster import escalation_tier
 from bunk_logs.api.threads.common import ADMIN
@@ -675,12 +673,12 @@ class DirectorMadrichimExportView(APIView):
         ctx = viewer_or_403(request)
         program = _program(ctx)
         if program is None:
-            return _csv_response([], header=[], filename="madrichim.csv")
+            return streaming_csv_response([], header=None, filename="madrichim.csv")
         rows, period = _roster_rows(ctx, program)
         header = [
             "Name", "Grade", "Classroom", "Reflection this period", "Open threads",
         ]
-        body = [
+        body = (
             [
                 r["display_name"],
                 r["grade_level"] if r["grade_level"] is not None else "",
@@ -689,20 +687,8 @@ class DirectorMadrichimExportView(APIView):
                 r["open_thread_count"],
             ]
             for r in rows
-        ]
+        )
         stamp = period["start"] if period else ctx.today.isoformat()
-        return _csv_response(
+        return streaming_csv_response(
             body, header=header, filename=f"madrichim-{stamp}.csv",
         )
-
-
-def _csv_response(rows: list[list[Any]], *, header: list[str], filename: str) -> HttpResponse:
-    buf = StringIO()
-    writer = csv.writer(buf)
-    if header:
-        writer.writerow(header)
-    for row in rows:
-        writer.writerow(row)
-    resp = HttpResponse(buf.getvalue(), content_type="text/csv")
-    resp["Content-Disposition"] = f'attachment; filename="{filename}"'
-    return resp
@@ -26,20 +26,18 @@ Key invariants
 
 from __future__ import annotations
 
-import csv
 from collections import defaultdict
-from io import StringIO
 from typing import TYPE_CHECKING
 from typing import Any
 
 from django.db.models import Count
-from django.http import HttpResponse
 from django.utils.dateparse import parse_date
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bunk_logs.api.csv_stream import streaming_csv_response
 from bunk_logs.core import audit
 from bunk_logs.core.filters import reflections_visible_for_user
 from bunk_logs.core.models import Membership
@@ -61,6 +59,7 @@ from .reflections import _role_memberships
 from .reflections import _validate_role
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from datetime import date
 
 DEFAULT_ROLE = "madrich"
@@ -110,40 +109,6 @@ class AdminGrowthDashboardExportView(APIView):
             "metric_label",
             "value",
         ]
-        rows: list[list[Any]] = []
-        for grade in payload["grades"]:
-            base = [
-                grade["grade_level"] if grade["grade_level"] is not None else "",
-                grade["member_count"],
-                grade["reflection_count"],
-            ]
-            for theme in grade["themes"]:
-                for role in TAGGED_DASHBOARD_ROLES:
-                    rows.append([
-                        *base,
-                        f"theme_{role}",
-                        theme["theme_key"],
-                        theme["label"],
-                        theme[f"{role}_count"],
-                    ])
-            for rating in grade["ratings"]:
-                rows.append([
-                    *base,
-                    "rating_mean",
-                    rating["category_key"],
-                    rating["label"],
-                    rating["mean"] if rating["mean"] is not None else "",
-                ])
-            rows.append([
-                *base,
-                "index",
-                CONCERN_COMPLEXITY_KEY,
-                "Concern complexity index",
-                grade["concern_complexity_index"]
-                if grade["concern_complexity_index"] is not None
-                else "",
-            ])
-
         period = payload["header"]["period"]
         audit.export(
             actor=request.user,
@@ -157,13 +122,49 @@ class AdminGrowthDashboardExportView(APIView):
             organization=ctx.organization,
         )
 
-        return _csv_response(
-            rows,
+        return streaming_csv_response(
+            _growth_rows(payload),
             header=header,
             filename=f"{payload['header']['role']}-growth-by-grade-{period['start']}.csv",
         )
 
 
+def _growth_rows(payload: dict[str, Any]) -> Iterator[list[Any]]:
+    """Long-format export rows: one per (grade, metric)."""
+    for grade in payload["grades"]:
+        base = [
+            grade["grade_level"] if grade["grade_level"] is not None else "",
+            grade["member_count"],
+            grade["reflection_count"],
+        ]
+        for theme in grade["themes"]:
+            for role in TAGGED_DASHBOARD_ROLES:
+                yield [
+                    *base,
+                    f"theme_{role}",
+                    theme["theme_key"],
+                    theme["label"],
+                    theme[f"{role}_count"],
+                ]
+        for rating in grade["ratings"]:
+            yield [
+                *base,
+                "rating_mean",
+                rating["category_key"],
+                rating["label"],
+                rating["mean"] if rating["mean"] is not None else "",
+            ]
+        yield [
+            *base,
+            "index",
+            CONCERN_COMPLEXITY_KEY,
+            "Concern complexity index",
+            grade["concern_complexity_index"]
+            if grade["concern_complexity_index"] is not None
+            else "",
+        ]
+
+
 class AdminGrowthExamplesView(APIView):
     """``GET growth/examples/`` -- excerpts behind one (grade, theme) cell.
 
@@ -636,14 +637,3 @@ def _answer_excerpt(reflection: Reflection, field_key: str) -> str:
     else:
         return ""
     return text[:EXCERPT_CHARS]
-
-
-def _csv_response(rows: list[list[Any]], *, header: list[str], filename: str) -> HttpResponse:
-    buf = StringIO()
-    writer = csv.writer(buf)
-    writer.writerow(header)
-    for row in rows:
-        writer.writerow(row)
-    resp = HttpResponse(buf.getvalue(), content_type="text/csv")
-    resp["Content-Disposition"] = f'attachment; filename="{filename}"'
-    return resp
@@ -40,6 +40,7 @@ from bunk_logs.core.campminder_csv import normalize_campminder_row
 from bunk_logs.core.campminder_csv import read_campminder_csv_bytes
 from bunk_logs.core.campminder_person_match import MatchStrategy
 from bunk_logs.core.campminder_person_match import match_campminder_person
+from bunk_logs.core.campminder_person_match import persons_by_campminder_id
 from bunk_logs.core.campminder_person_match import strategy_is_duplicate
 from bunk_logs.core.campminder_user_link import UserLinkAction
 from bunk_logs.core.campminder_user_link import preview_user_link
@@ -66,7 +67,7 @@ def _normalize_external_id(source: str, row: dict) -> str:
     return (row.get(key) or row.get("external_id") or "").strip()
 
 
-def _classify_row(*, source: str, org, program, row: dict) -> dict:
+def _classify_row(*, source: str, org, program, row: dict, known_by_id: dict | None = None) -> dict:
     """Classify a single CSV row as add / change / merge / duplicate / skip."""
     row = _normalize_row(source, row)
     external_id = _normalize_external_id(source, row)
@@ -113,6 +114,7 @@ def _classify_row(*, source: str, org, program, row: dict) -> dict:
             first_name=first_name,
             last_name=last_name,
             email=email,
+            known=known_by_id,
         )
         existing_person = person_match.person
         merge_reason = person_match.strategy.value
@@ -262,9 +264,16 @@ class AdminBulkImportPreviewView(APIView):
                 {"detail": f"Could not parse CSV: {exc}"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        known_by_id = None
+        if source == "campminder":
+            known_by_id = persons_by_campminder_id(
+                ctx.organization,
+                [_normalize_external_id(source, _normalize_row(source, row)) for row in rows],
+            )
         classified = [
             _classify_row(
                 source=source, org=ctx.organization, program=program, row=row,
+                known_by_id=known_by_id,
             )
             for row in rows
         ]
@@ -1,4 +1,4 @@
-"""Admin People dedupe — preview and apply Person merges from the UI."""
+"""Admin People dedupe — list likely duplicates, preview and apply Person merges."""
 
 from __future__ import annotations
 
@@ -12,6 +12,8 @@ from rest_framework.views import APIView
 from bunk_logs.core import audit as audit_module
 from bunk_logs.core.models import Person
 from bunk_logs.core.permissions import IsOrgAdminOrSuperuser
+from bunk_logs.core.person_duplicates import DEFAULT_MIN_SCORE
+from bunk_logs.core.person_duplicates import find_duplicate_candidates
 from bunk_logs.core.person_merge import LoserSpec
 from bunk_logs.core.person_merge import dedupe_persons
 from bunk_logs.core.person_merge import plan_dedupe
@@ -183,3 +185,55 @@ class AdminPeopleDedupeApplyView(APIView):
         )
         payload["winner"] = _serialize_person(winner, include_memberships=True)
         return Response(payload)
+
+
+class AdminPeopleDuplicatesView(APIView):
+    """``GET`` paginated likely-duplicate Person pairs for the active org.
+
+    Pairs come from :func:`find_duplicate_candidates` (blocking keys +
+    in-memory scoring), best match first. Accepts ``offset``, ``page_size``
+    and ``min_score`` (0-1). Only the current page's Persons are loaded for
+    serialization.
+    """
+
+    permission_classes = [IsOrgAdminOrSuperuser]
+
+    def get(self, request, *args, **kwargs):
+        ctx = viewer_or_403(request)
+        try:
+            page_size = max(1, min(int(request.query_params.get("page_size", "50")), 200))
+        except (TypeError, ValueError):
+            page_size = 50
+        try:
+            offset = max(0, int(request.query_params.get("offset", "0")))
+        except (TypeError, ValueError):
+            offset = 0
+        try:
+            min_score = float(request.query_params.get("min_score", DEFAULT_MIN_SCORE))
+        except (TypeError, ValueError):
+            min_score = DEFAULT_MIN_SCORE
+        min_score = max(0.0, min(min_score, 1.0))
+
+        candidates = find_duplicate_candidates(ctx.organization, min_score=min_score)
+        page = candidates[offset : offset + page_size]
+        person_ids = {c.person_id for c in page} | {c.other_person_id for c in page}
+        persons = {
+            p.id: _serialize_person(p)
+            for p in Person.all_objects.filter(
+                pk__in=person_ids, organization=ctx.organization,
+            )
+        }
+        return Response({
+            "count": len(candidates),
+            "offset": offset,
+            "page_size": page_size,
+            "results": [
+                {
+                    "score": c.score,
+                    "reasons": c.reasons,
+                    "person": persons.get(c.person_id),
+                    "other_person": persons.get(c.other_person_id),
+                }
+                for c in page
+            ],
+        })
@@ -12,12 +12,12 @@ Endpoints under ``/api/v1/admin/``:
 
 Key invariants:
 
-* ``POST /programs/<id>/end/`` runs inside a single ``transaction.atomic``
-  block so partial failures roll back. Memberships are soft-deactivated
+* ``POST /programs/<id>/end/`` runs inside a single ``audit.buffered``
+  (atomic) block so partial failures roll back. Memberships are soft-deactivated
   (``is_active=False`` + ``end_date=today``), open orders and tickets
   are closed via the state machine (``unable_to_fulfill``) with an
   ``override_close`` audit row, and an end-of-program AuditEvent is
-  written per affected row.
+  written per affected row -- bulk-inserted at the end of the block.
 * End Program refuses (400) when there are still open Camper Care
   flags -- those need to be resolved or migrated by the Admin
   intentionally rather than swept up automatically.
@@ -239,9 +239,13 @@ class AdminProgramEndView(APIView):
         actor = ctx.membership or request.user
         end_date = ctx.today
 
-        with transaction.atomic():
+        # One transaction for the whole cascade; the per-row audit events are
+        # buffered and bulk-inserted at the end instead of one INSERT each.
+        with audit_module.buffered():
             # Deactivate active Memberships.
-            ms_qs = Membership.all_objects.filter(program=program, is_active=True)
+            ms_qs = Membership.all_objects.filter(
+                program=program, is_active=True,
+            ).select_related("program__organization")
             deactivated_count = 0
             for m in list(ms_qs):
                 before = {"is_active": m.is_active, "end_date": m.end_date.isoformat() if m.end_date else None}
@@ -267,7 +271,7 @@ class AdminProgramEndView(APIView):
             for o in open_orders:
                 before = {"status": o.status}
                 o.status = OrderStateMachine.UNABLE_TO_FULFILL
-                o.save(update_fields=["status"])
+                o.save(update_fields=["status", "updated_at"])
                 audit_module.override_close(
                     actor, o,
                     before_state=before, after_state={"status": o.status},
@@ -284,7 +288,7 @@ class AdminProgramEndView(APIView):
             for t in open_tickets:
                 before = {"status": t.status}
                 t.status = OrderStateMachine.UNABLE_TO_FULFILL
-                t.save(update_fields=["status"])
+                t.save(update_fields=["status", "updated_at"])
                 audit_module.override_close(
                     actor, t,
                     before_state=before, after_state={"status": t.status},
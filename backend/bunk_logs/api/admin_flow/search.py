@@ -17,10 +17,18 @@ Org isolation is enforced via the existing ``OrgScopedManager`` (or
 the ``filter()`` for defence-in-depth in case a future manager change
 relaxes the implicit scope.
 
-We do **not** add ``SearchVectorField`` columns or perf indexes here.
-At-query-time ``SearchVector`` is good enough for the v1 admin tool;
-real fulltext indexes land in Step 7_17 alongside the broader perf
-pass.
+Reflections, orders, tickets and templates match against their stored,
+GIN-indexed ``search_vector`` columns (Step 7_17, see
+:mod:`bunk_logs.core.search_vectors`), so latency tracks the number of
+hits rather than the org's total content volume. Reflection vectors also
+cover the English translation of non-English answers. People still rank
+at query time over the (permission-scoped, small) camper set.
+
+``GET /api/v1/admin/search/autocomplete/?q=<query>`` is the typeahead
+companion: camper and bunk names only, prefix matches first, answered from
+the pg_trgm name indexes (see :mod:`bunk_logs.core.person_search`). Same
+visibility as the people group above; bunks are limited to those holding a
+camper the viewer may see (all active bunks for org admins).
 """
 
 from __future__ import annotations
@@ -29,22 +37,30 @@ from django.contrib.postgres.search import SearchQuery
 from django.contrib.postgres.search import SearchRank
 from django.contrib.postgres.search import SearchVector
 from django.db.models import F
+from django.db.models import Q
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from bunk_logs.core.identity import person_for_user
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import MaintenanceTicket
 from bunk_logs.core.models import Order
 from bunk_logs.core.models import Reflection
 from bunk_logs.core.models import ReflectionTemplate
 from bunk_logs.core.permissions import IsOrgAdminOrSuperuser
 from bunk_logs.core.permissions.subject_dashboard import viewable_camper_queryset
-from bunk_logs.core.person_search import filter_persons_by_name_query
+from bunk_logs.core.person_search import person_name_q
+from bunk_logs.core.person_search import rank_groups_by_name
+from bunk_logs.core.person_search import rank_persons_by_name
+from bunk_logs.core.search_vectors import search_query
 
 PER_GROUP_LIMIT = 25
 MIN_QUERY_LEN = 2
+AUTOCOMPLETE_DEFAULT_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 25
 
 
 class AdminGlobalSearchView(APIView):
@@ -66,11 +82,11 @@ class AdminGlobalSearchView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         viewer = person_for_user(request.user, organization=org)
-        query = SearchQuery(q)
         groups: dict[str, list[dict]] = {
-            "people": _search_people(org, viewer, request.user, query, q),
+            "people": _search_people(org, viewer, request.user, SearchQuery(q), q),
         }
         if IsOrgAdminOrSuperuser().has_permission(request, self):
+            query = search_query(q)
             groups["reflections"] = _search_reflections(org, query)
             groups["orders"] = _search_orders(org, query)
             groups["tickets"] = _search_tickets(org, query)
@@ -78,6 +94,70 @@ class AdminGlobalSearchView(APIView):
         return Response({"query": q, "groups": groups})
 
 
+class AdminSearchAutocompleteView(APIView):
+    """Camper + bunk name typeahead for the global search header."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        org = getattr(request, "organization", None)
+        if org is None:
+            return Response(
+                {"detail": "Organization context required."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        q = (request.query_params.get("q") or "").strip()
+        if len(q) < MIN_QUERY_LEN:
+            return Response(
+                {"detail": f"q must be at least {MIN_QUERY_LEN} characters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            limit = int(request.query_params.get("limit", AUTOCOMPLETE_DEFAULT_LIMIT))
+        except (TypeError, ValueError):
+            limit = AUTOCOMPLETE_DEFAULT_LIMIT
+        limit = max(1, min(limit, AUTOCOMPLETE_MAX_LIMIT))
+
+        viewer = person_for_user(request.user, organization=org)
+        campers = viewable_camper_queryset(viewer, org, request.user)
+        people = rank_persons_by_name(campers, q)[:limit]
+
+        bunks = AssignmentGroup.all_objects.filter(
+            organization=org, group_type="bunk", is_active=True,
+        )
+        if not IsOrgAdminOrSuperuser().has_permission(request, self):
+            bunks = bunks.filter(
+                id__in=AssignmentGroupMembership.all_objects.filter(
+                    person_id__in=campers.values("id"),
+                    role_in_group="subject",
+                    is_active=True,
+                ).values("group_id"),
+            )
+        bunks = rank_groups_by_name(bunks.select_related("program"), q)[:limit]
+
+        return Response({
+            "query": q,
+            "people": [
+                {
+                    "id": p.id,
+                    "label": p.full_name,
+                    "secondary": p.email or "",
+                    "deep_link": f"/profile/{p.id}",
+                }
+                for p in people
+            ],
+            "bunks": [
+                {
+                    "id": g.id,
+                    "label": g.name,
+                    "secondary": g.program.name,
+                    "deep_link": f"/dashboards/group/{g.id}",
+                }
+                for g in bunks
+            ],
+        })
+
+
 def _search_people(org, viewer, user, query, raw: str) -> list[dict]:
     """Campers the viewer may open on profile, ranked by name similarity."""
     base = viewable_camper_queryset(viewer, org, user)
@@ -95,9 +175,10 @@ def _search_people(org, viewer, user, query, raw: str) -> list[dict]:
     rows = list(qs)
     if len(rows) < PER_GROUP_LIMIT:
         seen = {p.id for p in rows}
+        # Name substrings (pg_trgm) or an exact Campminder ID
+        # (``core_person_cm_id``) -- both index-backed.
         extra = (
-            filter_persons_by_name_query(base, raw)
-            .filter(external_ids__icontains=raw)
+            base.filter(person_name_q(raw) | Q(external_ids__campminder_id=raw.strip()))
             .exclude(id__in=seen)[: (PER_GROUP_LIMIT - len(rows))]
         )
         rows.extend(extra)
@@ -112,14 +193,21 @@ def _search_people(org, viewer, user, query, raw: str) -> list[dict]:
     ]
 
 
+def _ranked(qs, query):
+    """Index-backed ``search_vector @@ query`` match, best rank first."""
+    return (
+        qs.filter(search_vector=query)
+        .defer("search_vector")
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by(F("rank").desc())
+    )
+
+
 def _search_reflections(org, query) -> list[dict]:
-    vector = SearchVector("answers")
     qs = (
-        Reflection.all_objects.filter(organization=org)
-        .annotate(rank=SearchRank(vector, query))
-        .filter(rank__gt=0)
-        .select_related("subject", "template")
-        .order_by(F("rank").desc())[:PER_GROUP_LIMIT]
+        _ranked(Reflection.all_objects.filter(organization=org), query)
+        .defer("answers")
+        .select_related("subject", "template")[:PER_GROUP_LIMIT]
     )
     return [
         {
@@ -136,17 +224,7 @@ def _search_reflections(org, query) -> list[dict]:
 
 
 def _search_orders(org, query) -> list[dict]:
-    vector = (
-        SearchVector("item")
-        + SearchVector("item_note")
-        + SearchVector("description")
-    )
-    qs = (
-        Order.all_objects.filter(organization=org)
-        .annotate(rank=SearchRank(vector, query))
-        .filter(rank__gt=0)
-        .order_by(F("rank").desc())[:PER_GROUP_LIMIT]
-    )
+    qs = _ranked(Order.all_objects.filter(organization=org), query)[:PER_GROUP_LIMIT]
     return [
         {
             "id": str(o.id),
@@ -159,17 +237,7 @@ def _search_orders(org, query) -> list[dict]:
 
 
 def _search_tickets(org, query) -> list[dict]:
-    vector = (
-        SearchVector("title")
-        + SearchVector("location")
-        + SearchVector("description")
-    )
-    qs = (
-        MaintenanceTicket.all_objects.filter(organization=org)
-        .annotate(rank=SearchRank(vector, query))
-        .filter(rank__gt=0)
-        .order_by(F("rank").desc())[:PER_GROUP_LIMIT]
-    )
+    qs = _ranked(MaintenanceTicket.all_objects.filter(organization=org), query)[:PER_GROUP_LIMIT]
     return [
         {
             "id": str(t.id),
@@ -182,13 +250,7 @@ def _search_tickets(org, query) -> list[dict]:
 
 
 def _search_templates(org, query) -> list[dict]:
-    vector = SearchVector("name") + SearchVector("description")
-    qs = (
-        ReflectionTemplate.all_objects.filter(organization=org)
-        .annotate(rank=SearchRank(vector, query))
-        .filter(rank__gt=0)
-        .order_by(F("rank").desc())[:PER_GROUP_LIMIT]
-    )
+    qs = _ranked(ReflectionTemplate.all_objects.filter(organization=org), query)[:PER_GROUP_LIMIT]
     return [
         {
             "id": t.id,
@@ -50,6 +50,7 @@ from .people import AdminPersonInviteView
 from .people import AdminPersonMembershipsView
 from .people_dedupe import AdminPeopleDedupeApplyView
 from .people_dedupe import AdminPeopleDedupePreviewView
+from .people_dedupe import AdminPeopleDuplicatesView
 from .people_delete import AdminPersonDeleteApplyView
 from .people_delete import AdminPersonDeletePreviewView
 from .programs import AdminMaintenanceNotificationsTestView
@@ -61,6 +62,7 @@ from .reflections import AdminReflectionsMemberDetailView
 from .reflections import AdminReflectionsTeamExportView
 from .reflections import AdminReflectionsTeamView
 from .search import AdminGlobalSearchView
+from .search import AdminSearchAutocompleteView
 from .templates import AdminTemplateReviewView
 from .templates import AdminTemplatesListView
 
@@ -95,6 +97,11 @@ urlpatterns = [
         AdminPersonInviteView.as_view(),
         name="admin-person-invite",
     ),
+    path(
+        "people/duplicates/",
+        AdminPeopleDuplicatesView.as_view(),
+        name="admin-people-duplicates",
+    ),
     path(
         "people/dedupe/preview/",
         AdminPeopleDedupePreviewView.as_view(),
@@ -163,6 +170,11 @@ urlpatterns = [
     # Global search + Templates oversight + Bulk import (PR3)
     # ------------------------------------------------------------------
     path("search/", AdminGlobalSearchView.as_view(), name="admin-search"),
+    path(
+        "search/autocomplete/",
+        AdminSearchAutocompleteView.as_view(),
+        name="admin-search-autocomplete",
+    ),
     path("templates/", AdminTemplatesListView.as_view(), name="admin-templates"),
     path(
         "templates/<int:template_id>/review/",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from django.db import transaction
 from django.http import HttpResponse
 from django.utils.text import slugify
 from rest_framework import permissions
@@ -23,6 +24,8 @@ from bunk_logs.core.models import Program
 from bunk_logs.core.models import Reflection
 from bunk_logs.core.models import RosterImportLog
 from bunk_logs.core.permissions import IsOrgAdminOrSuperuser
+from bunk_logs.core.program_rollover import IMPORTER_TYPE as ROLLOVER_IMPORTER_TYPE
+from bunk_logs.core.program_rollover import plan_rollover
 
 
 class PersonSummarySerializer(serializers.ModelSerializer):
@@ -185,6 +188,28 @@ class GroupCloneSerializer(serializers.Serializer):
         return value
 
 
+class ProgramRolloverSerializer(serializers.Serializer):
+    source_program = serializers.PrimaryKeyRelatedField(queryset=Program.all_objects.all())
+    target_program = serializers.PrimaryKeyRelatedField(queryset=Program.all_objects.all())
+    root_group_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, default=list,
+    )
+    include_memberships = serializers.BooleanField(default=True)
+    include_assignments = serializers.BooleanField(default=False)
+    mode = serializers.ChoiceField(choices=["preview", "commit"], default="preview")
+
+    def _validate_program(self, value: Program) -> Program:
+        request = self.context.get("request")
+        org = getattr(request, "organization", None)
+        if org and value.organization_id != org.pk:
+            msg = "Program must belong to your organization."
+            raise serializers.ValidationError(msg)
+        return value
+
+    validate_source_program = _validate_program
+    validate_target_program = _validate_program
+
+
 class AssignmentGroupCloneResponseSerializer(AssignmentGroupSerializer):
     clone_summary = serializers.SerializerMethodField()
 
@@ -221,6 +246,7 @@ class AssignmentGroupViewSet(viewsets.ModelViewSet):
             "bulk_import",
             "import_template",
             "clone",
+            "rollover",
         ):
             return [AssignmentGroupPermission(), IsOrgAdminOrSuperuser()]
         return [AssignmentGroupPermission()]
@@ -460,6 +486,55 @@ class AssignmentGroupViewSet(viewsets.ModelViewSet):
         )
         return Response(out.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["post"], url_path="rollover")
+    def rollover(self, request):
+        """Preview or queue a program rollover (whole group tree, or sub-trees).
+
+        ``mode=preview`` returns the dry-run diff; ``mode=commit`` queues
+        the rollover on the bulk worker and returns its import log, pollable
+        at ``import-logs/<id>``.
+        """
+        serializer = ProgramRolloverSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        source_program = data["source_program"]
+        target_program = data["target_program"]
+        options = {
+            "root_group_ids": data["root_group_ids"],
+            "include_memberships": data["include_memberships"],
+            "include_assignments": data["include_assignments"],
+        }
+
+        try:
+            plan = plan_rollover(
+                source_program=source_program,
+                target_program=target_program,
+                root_group_ids=options["root_group_ids"] or None,
+                include_memberships=options["include_memberships"],
+                include_assignments=options["include_assignments"],
+            )
+        except GroupCloneError as exc:
+            field = exc.field_name or "detail"
+            return Response({field: exc.message}, status=status.HTTP_400_BAD_REQUEST)
+
+        if data["mode"] == "preview":
+            return Response({"plan": plan.as_summary()}, status=status.HTTP_200_OK)
+
+        log = RosterImportLog.all_objects.create(
+            organization=request.organization,
+            program=target_program,
+            importer_type=ROLLOVER_IMPORTER_TYPE,
+            initiated_by=request.user,
+            status="pending",
+            summary={"plan": plan.as_summary()},
+        )
+
+        from bunk_logs.core.tasks import rollover_program_task
+
+        task_options = {**options, "source_program_id": source_program.pk}
+        transaction.on_commit(lambda: rollover_program_task.delay(log.pk, task_options))
+        return Response(RosterImportLogSerializer(log).data, status=status.HTTP_202_ACCEPTED)
+
     @action(detail=False, methods=["get"], url_path="import-template")
     def import_template(self, request):
         filename, csv_text = build_group_import_template_csv()
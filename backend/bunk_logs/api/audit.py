@@ -11,11 +11,17 @@ Per the spec, viewing an audit trail is itself an audited action: the
 each viewed content row. The other two endpoints are aggregate views
 that intentionally do not log meta-audits (matches Story 59 wording,
 which scopes meta-audit to per-content-trail viewing).
+
+All three accept optional ``since`` / ``until`` bounds. They are applied as
+a plain ``created_at`` range so Postgres only scans the monthly
+``AuditEvent`` partitions the window covers (see
+:mod:`bunk_logs.core.audit_partitions`).
 """
 
 from __future__ import annotations
 
 from datetime import datetime
+from datetime import time
 from datetime import timedelta
 
 from django.utils import timezone
@@ -89,6 +95,9 @@ class AuditEventViewSet(viewsets.ReadOnlyModelViewSet):
     * ``GET /api/v1/audit/admin-overrides/?since=<YYYY-MM-DD>`` -- all
       admin-override events (``is_admin_override=True``) since the given
       date (defaults to 30 days ago, mirroring the spec's example).
+
+    Every route also takes ``since`` / ``until`` (ISO date or datetime;
+    a bare ``until`` date is inclusive) to narrow the partitions scanned.
     """
 
     serializer_class = AuditEventSerializer
@@ -133,9 +142,12 @@ class AuditEventViewSet(viewsets.ReadOnlyModelViewSet):
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        window, error = _created_at_window(request)
+        if error is not None:
+            return error
         qs = (
             self.get_queryset()
-            .filter(content_type=content_type, content_id=content_id)
+            .filter(content_type=content_type, content_id=content_id, **window)
             .order_by("created_at")
         )
         data = self.get_serializer(qs, many=True).data
@@ -160,35 +172,68 @@ class AuditEventViewSet(viewsets.ReadOnlyModelViewSet):
                 {"detail": "membership_id query param is required (integer)."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        window, error = _created_at_window(request)
+        if error is not None:
+            return error
         qs = (
             self.get_queryset()
-            .filter(actor_membership_id=int(raw))
+            .filter(actor_membership_id=int(raw), **window)
             .order_by("-created_at")
         )
         return Response(self.get_serializer(qs, many=True).data)
 
     @action(detail=False, methods=["get"], url_path="admin-overrides")
     def admin_overrides(self, request):
-        since_raw = (request.query_params.get("since") or "").strip()
-        if since_raw:
-            try:
-                since = datetime.fromisoformat(since_raw).date()
-            except ValueError:
-                return Response(
-                    {"detail": "'since' must be ISO date (YYYY-MM-DD)."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-        else:
-            since = (timezone.now() - timedelta(days=30)).date()
-
+        default_since = (timezone.now() - timedelta(days=30)).date()
+        window, error = _created_at_window(request, default_since=default_since)
+        if error is not None:
+            return error
         qs = (
             self.get_queryset()
-            .filter(is_admin_override=True, created_at__date__gte=since)
+            .filter(is_admin_override=True, **window)
             .order_by("-created_at")
         )
         return Response(self.get_serializer(qs, many=True).data)
 
 
+def _parse_bound(raw: str, *, end: bool):
+    """ISO date or datetime -> aware datetime. A bare date is the day's start
+    (or, for an ``end`` bound, the next day's start, making it inclusive)."""
+    try:
+        value = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    if len(raw) <= len("YYYY-MM-DD"):
+        day = value.date() + timedelta(days=1) if end else value.date()
+        value = datetime.combine(day, time.min)
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def _created_at_window(request, *, default_since=None):
+    """``created_at`` range filters from ``since`` / ``until`` query params.
+
+    Returns ``(filters, error_response)``. Filtering ``created_at`` directly
+    (rather than ``created_at__date``) keeps partition pruning effective.
+    """
+    filters = {}
+    for param, lookup, end in (("since", "created_at__gte", False), ("until", "created_at__lt", True)):
+        raw = (request.query_params.get(param) or "").strip()
+        if not raw and param == "since" and default_since is not None:
+            raw = default_since.isoformat()
+        if not raw:
+            continue
+        bound = _parse_bound(raw, end=end)
+        if bound is None:
+            return None, Response(
+                {"detail": f"'{param}' must be ISO date (YYYY-MM-DD) or datetime."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        filters[lookup] = bound
+    return filters, None
+
+
 def _org_from_first_event(qs):
     """Fallback org lookup for meta-audit when request.organization is absent."""
     first = qs.first()
@@ -29,7 +29,6 @@ from bunk_logs.api.counselor.common import is_editable_today  # noqa: F401 (re-e
 from bunk_logs.core.assignment_resolution import resolve_template_for
 from bunk_logs.core.managers import _caseload_bunk_ids_for_membership
 from bunk_logs.core.models import AssignmentGroup
-from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import Order
 from bunk_logs.core.models import Person
@@ -38,6 +37,7 @@ from bunk_logs.core.models import Supervision
 from bunk_logs.core.permissions import is_super_admin
 from bunk_logs.core.program_scope import operational_memberships_qs
 from bunk_logs.core.program_scope import operational_program_q
+from bunk_logs.core.roster_snapshot import roster_snapshot
 from bunk_logs.core.time_utils import get_today
 
 if TYPE_CHECKING:
@@ -313,13 +313,7 @@ def bunk_camper_ids(bunk: AssignmentGroup) -> list[int]:
     Mirrors :func:`api.unit_head.common.bunk_camper_ids` so the
     dashboard payload shape stays consistent across UH and CC.
     """
-    return list(
-        AssignmentGroupMembership.objects.filter(
-            group=bunk, role_in_group="subject", is_active=True,
-        )
-        .order_by("person__last_name", "person__first_name")
-        .values_list("person_id", flat=True),
-    )
+    return roster_snapshot(bunk.program_id).subject_ids(bunk.id)
 
 
 def caseload_bunk_ids(
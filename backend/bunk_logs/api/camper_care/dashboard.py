@@ -12,27 +12,25 @@ freshness stays bounded.
 
 from __future__ import annotations
 
-from django.core.cache import cache
 from django.utils.dateparse import parse_date
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bunk_logs.api.conditional import cache_payload
+from bunk_logs.api.conditional import cached_payload
+from bunk_logs.api.conditional import conditional_response
+from bunk_logs.api.conditional import payload_etag
 from bunk_logs.api.counselor.common import camper_reflection_template
 from bunk_logs.api.counselor.common import is_day_off_answer
 from bunk_logs.api.counselor.common import latest_self_reflection
-from bunk_logs.api.unit_head.common import bunk_concerns_referencing
-from bunk_logs.api.unit_head.common import compute_attention_badges
+from bunk_logs.api.unit_head.bunk_summary import build_bunk_summaries
 from bunk_logs.api.unit_head.common import expected_by_passed
-from bunk_logs.api.unit_head.common import help_requested_camper_ids_from
-from bunk_logs.api.unit_head.common import off_camp_camper_ids
 from bunk_logs.core.flags import active_flags_for_program_day
 from bunk_logs.core.flags import flagged_camper_ids_for_date
 from bunk_logs.core.flags import sync_missing_camper_care_help_flags
 from bunk_logs.core.models import Order
 
-from .common import bunk_camper_ids
 from .common import camper_care_self_template
 from .common import caseload_bunks_with_unit
 from .common import viewer_or_403
@@ -69,9 +67,9 @@ class CamperCareDashboardView(APIView):
             today=target_date,
         )
         if not bypass and target_date == ctx.today:
-            cached = cache.get(cache_key)
+            cached, etag = cached_payload(cache_key)
             if cached is not None:
-                return Response(cached)
+                return conditional_response(request, cached, etag=etag)
 
         units_payload = _build_caseload_tree(ctx, target_date=target_date)
 
@@ -108,8 +106,10 @@ class CamperCareDashboardView(APIView):
             },
         }
         if target_date == ctx.today:
-            cache.set(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
-        return Response(payload)
+            etag = cache_payload(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
+        else:
+            etag = payload_etag(payload)
+        return conditional_response(request, payload, etag=etag)
 
 
 # ---------------------------------------------------------------------------
@@ -155,10 +155,6 @@ def _build_caseload_tree(ctx, *, target_date) -> list[dict]:
 
     camper_template = camper_reflection_template(ctx.organization, ctx.program)
     expected_passed = expected_by_passed(ctx.organization, target_date)
-    bc_map = bunk_concerns_referencing(
-        organization=ctx.organization, program=ctx.program, target_date=target_date,
-    )
-    bc_bunk_ids = set(bc_map.keys())
 
     # Resolve unit Person/Group rows once for naming.
     unit_ids = [uid for uid in by_unit if uid is not None]
@@ -166,15 +162,18 @@ def _build_caseload_tree(ctx, *, target_date) -> list[dict]:
         u.id: u for u in AssignmentGroup.all_objects.filter(id__in=unit_ids)
     } if unit_ids else {}
 
-    # Camper-Care attention: per-camper unresolved flags + open orders.
-    bunk_to_camper_ids: dict[int, list[int]] = {}
-    all_camper_ids: set[int] = set()
-    for bunks in by_unit.values():
-        for bunk in bunks:
-            ids = bunk_camper_ids(bunk)
-            bunk_to_camper_ids[bunk.id] = ids
-            all_camper_ids.update(ids)
+    # Rosters, off-camp flags, submissions, help requests and bunk-concern
+    # references for the whole caseload in a fixed number of queries.
+    summaries = build_bunk_summaries(
+        organization=ctx.organization,
+        program=ctx.program,
+        bunks=[bunk for bunks in by_unit.values() for bunk in bunks],
+        target_date=target_date,
+        camper_template=camper_template,
+    )
+    all_camper_ids = {cid for s in summaries.values() for cid in s.camper_ids}
 
+    # Camper-Care attention: per-camper unresolved flags + open orders.
     flagged_camper_ids = (
         flagged_camper_ids_for_date(
             program=ctx.program,
@@ -202,32 +201,9 @@ def _build_caseload_tree(ctx, *, target_date) -> list[dict]:
         bunks = by_unit[unit_id]
         bunks_payload: list[dict] = []
         for bunk in bunks:
-            camper_ids = bunk_to_camper_ids.get(bunk.id, [])
-            off_camp = off_camp_camper_ids(ctx.organization, target_date, camper_ids)
-            submitted_ids: set[int] = set()
-            help_ids: set[int] = set()
-            if camper_template and camper_ids:
-                from bunk_logs.core.models import Reflection
-                reflections = {
-                    r.subject_id: r
-                    for r in Reflection.all_objects.filter(
-                        template=camper_template,
-                        assignment_group=bunk,
-                        period_start=target_date,
-                        period_end=target_date,
-                        is_complete=True,
-                    ).select_related("template")
-                }
-                submitted_ids = set(reflections.keys())
-                help_ids = help_requested_camper_ids_from(reflections)
-
-            badges = compute_attention_badges(
-                bunk=bunk,
-                bunk_camper_ids_list=camper_ids,
-                off_camp_ids=off_camp,
-                submitted_camper_ids=submitted_ids,
-                help_requested_camper_ids=help_ids,
-                bunk_concerns_referenced_bunk_ids=bc_bunk_ids,
+            summary = summaries[bunk.id]
+            camper_ids = summary.camper_ids
+            badges = summary.badges(
                 low_completion_threshold=LOW_COMPLETION_THRESHOLD,
                 expected_by_passed=expected_passed,
             )
@@ -238,21 +214,12 @@ def _build_caseload_tree(ctx, *, target_date) -> list[dict]:
             if cc_pending_order and "cc_pending_order" not in badges:
                 badges.insert(0, "cc_pending_order")
 
-            on_camp_total = len([c for c in camper_ids if c not in off_camp])
-            submitted_on_camp = len([
-                c for c in camper_ids if c in submitted_ids and c not in off_camp
-            ])
-
             bunks_payload.append({
                 "id": bunk.id,
                 "name": bunk.name,
                 "slug": bunk.slug,
-                "counselor_names": _counselor_names(bunk),
-                "completion": {
-                    "submitted": submitted_on_camp,
-                    "expected": on_camp_total,
-                    "off_camp": len(off_camp),
-                },
+                "counselor_names": summary.counselor_names,
+                "completion": summary.completion,
                 "badges": badges,
                 "camper_count": len(camper_ids),
             })
@@ -274,18 +241,3 @@ def _build_caseload_tree(ctx, *, target_date) -> list[dict]:
         }
         out.append(unit_payload)
     return out
-
-
-def _counselor_names(bunk):
-    """Active counselor display names for the bunk (shared with UH dashboard shape)."""
-    from bunk_logs.api.counselor.common import person_display_name
-    from bunk_logs.core.models import AssignmentGroupMembership
-
-    rows = (
-        AssignmentGroupMembership.objects.filter(
-            group=bunk, role_in_group="author", is_active=True,
-        )
-        .select_related("person")
-        .order_by("person__last_name", "person__first_name")
-    )
-    return [person_display_name(agm.person) for agm in rows if agm.person]
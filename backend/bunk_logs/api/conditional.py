@@ -0,0 +1,84 @@
+"""Conditional GET (``ETag`` / ``If-None-Match`` -> 304) for polled dashboards.
+
+The role home dashboards and the group dashboard are re-fetched every
+``REFRESH_INTERVAL_MS`` by the SPA. There is no per-dashboard data version
+to key on, so the ETag is a hash of the payload itself: it changes exactly
+when the JSON body would.
+
+Views that cache their payload store the ETag alongside it
+(:func:`cache_payload` / :func:`cached_payload`), so a poll that lands on
+a live cache entry with a matching ``If-None-Match`` is answered 304
+without building, hashing or rendering anything. After the entry expires
+the payload is rebuilt, and an unchanged hash still turns into a 304 with
+no body on the wire. Uncached views call :func:`payload_etag` on the built
+payload.
+
+Responses carry ``Cache-Control: private, no-cache``: browsers may keep the
+body but must revalidate every poll, and shared caches must not store it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from django.utils.http import quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+ETAG_KEY_SUFFIX = ":etag"
+
+
+def payload_etag(payload: Any) -> str:
+    """Strong ETag for a JSON-serializable ``payload``."""
+    body = json.dumps(payload, cls=DjangoJSONEncoder, sort_keys=True, separators=(",", ":"))
+    return quote_etag(hashlib.sha256(body.encode()).hexdigest()[:32])
+
+
+def etag_cache_key(cache_key: str) -> str:
+    return f"{cache_key}{ETAG_KEY_SUFFIX}"
+
+
+def cache_payload(cache_key: str, payload: Any, timeout: int) -> str:
+    """``cache.set`` the payload and its ETag together; returns the ETag."""
+    etag = payload_etag(payload)
+    cache.set_many({cache_key: payload, etag_cache_key(cache_key): etag}, timeout)
+    return etag
+
+
+def cached_payload(cache_key: str) -> tuple[Any, str | None]:
+    """``(payload, etag)`` from the cache, or ``(None, None)`` on a miss.
+
+    An entry written without its ETag (or whose ETag key expired first)
+    gets one computed from the payload.
+    """
+    found = cache.get_many([cache_key, etag_cache_key(cache_key)])
+    payload = found.get(cache_key)
+    if payload is None:
+        return None, None
+    return payload, found.get(etag_cache_key(cache_key)) or payload_etag(payload)
+
+
+def if_none_match(request, etag: str) -> bool:
+    """Whether the request's ``If-None-Match`` matches ``etag`` (weak comparison)."""
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    tags = parse_etags(header)
+    return "*" in tags or etag in {tag.removeprefix("W/") for tag in tags}
+
+
+def conditional_response(request, payload: Any, *, etag: str) -> Response:
+    """200 with ``payload``, or an empty 304 when the client already has ``etag``."""
+    if if_none_match(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(payload)
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -6,6 +6,7 @@ Endpoints under ``/api/v1/counselor/`` for the mobile-first counselor flow:
 - ``GET /camper-reflections/?date=<>`` — Story 3: bunk roster for a date
 - ``GET /self-reflection/history/`` — Story 6: counselor's prior reflections
 - ``GET /requests/`` — Stories 7, 8: my + co-counselors' open Orders & Tickets
+- ``GET /sync/?since=<cursor>`` — change feed for the offline client
 
 Write endpoints (submit / edit) live in 7_6c.
 """
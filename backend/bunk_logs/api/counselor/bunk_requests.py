@@ -7,13 +7,13 @@ from typing import TYPE_CHECKING
 from django.db.models import Q
 
 from bunk_logs.core.models import AssignmentGroup
-from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import MaintenanceTicket
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import Order
 from bunk_logs.core.models import OrderActivityEvent
 from bunk_logs.core.models import Organization
 from bunk_logs.core.models import Person
+from bunk_logs.core.roster_snapshot import roster_snapshot
 from bunk_logs.core.state_machine import OrderStateMachine
 
 from .common import person_display_name
@@ -32,11 +32,7 @@ CLOSED_STATUSES: tuple[str, ...] = (
 
 def counselor_membership_ids_for_bunk(bunk: AssignmentGroup) -> list[int]:
     """Program ``Membership`` ids for active authors on ``bunk``."""
-    person_ids = list(
-        AssignmentGroupMembership.objects.filter(
-            group=bunk, role_in_group="author", is_active=True,
-        ).values_list("person_id", flat=True),
-    )
+    person_ids = roster_snapshot(bunk.program_id).author_ids(bunk.id)
     if not person_ids:
         return []
     return list(
@@ -49,11 +45,7 @@ def counselor_membership_ids_for_bunk(bunk: AssignmentGroup) -> list[int]:
 
 
 def bunk_camper_ids(bunk: AssignmentGroup) -> set[int]:
-    return set(
-        AssignmentGroupMembership.objects.filter(
-            group=bunk, role_in_group="subject", is_active=True,
-        ).values_list("person_id", flat=True),
-    )
+    return set(roster_snapshot(bunk.program_id).subject_ids(bunk.id))
 
 
 def _order_matches_bunk(order: Order, bunk: AssignmentGroup, camper_ids: set[int]) -> bool:
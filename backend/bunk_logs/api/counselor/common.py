@@ -23,18 +23,18 @@ from rest_framework.exceptions import PermissionDenied
 
 from bunk_logs.core.assignment_resolution import resolve_template_for
 from bunk_logs.core.models import AssignmentGroup
-from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import CamperDayState
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
 from bunk_logs.core.models import Reflection
 from bunk_logs.core.models import ReflectionTemplate
-from bunk_logs.core.program_scope import operational_author_groups_qs
+from bunk_logs.core.program_scope import operational_program_q
+from bunk_logs.core.roster_snapshot import roster_snapshot
 from bunk_logs.core.time_utils import get_today
 
 if TYPE_CHECKING:
     from bunk_logs.core.models import Organization
-    from bunk_logs.core.models import Program
 
 
 COUNSELOR_ROLES: frozenset[str] = frozenset({"counselor", "junior_counselor"})
@@ -89,12 +89,7 @@ def resolve_submitted_from_bunk(
         return by_id[bunk_id]
     if subject_id is not None:
         for bunk in bunks:
-            if AssignmentGroupMembership.objects.filter(
-                group=bunk,
-                person_id=subject_id,
-                role_in_group="subject",
-                is_active=True,
-            ).exists():
+            if subject_id in roster_snapshot(bunk.program_id).subject_ids(bunk.id):
                 return bunk
     if len(bunks) == 1:
         return bunks[0]
@@ -114,13 +109,14 @@ def viewer_bunk_groups(viewer: Person, *, today: date | None = None) -> list[Ass
     """
     if today is None:
         today = get_today(viewer.organization)
-    bunk_ids = list(
-        operational_author_groups_qs(
-            viewer,
-            today=today,
-            group__group_type="bunk",
-        ).values_list("group_id", flat=True),
-    )
+    program_ids = Program.objects.filter(
+        operational_program_q(today=today, prefix=""),
+    ).values_list("id", flat=True)
+    bunk_ids = [
+        group_id
+        for program_id in program_ids
+        for group_id in roster_snapshot(program_id).author_group_ids(viewer.id, group_type="bunk")
+    ]
     if not bunk_ids:
         return []
     return list(
@@ -133,17 +129,11 @@ def co_counselor_person_ids(viewer: Person, bunks: list[AssignmentGroup]) -> set
 
     Excludes the viewer themselves so "is_self" attribution stays clean.
     """
-    if not bunks:
-        return set()
-    return set(
-        AssignmentGroupMembership.objects.filter(
-            group__in=bunks,
-            role_in_group="author",
-            is_active=True,
-        )
-        .exclude(person=viewer)
-        .values_list("person_id", flat=True),
-    )
+    out: set[int] = set()
+    for bunk in bunks:
+        out.update(roster_snapshot(bunk.program_id).author_ids(bunk.id))
+    out.discard(viewer.id)
+    return out
 
 
 def bunk_camper_persons(bunks: list[AssignmentGroup]) -> dict[int, list[Person]]:
@@ -155,19 +145,14 @@ def bunk_camper_persons(bunks: list[AssignmentGroup]) -> dict[int, list[Person]]
     """
     if not bunks:
         return {}
-    rows = (
-        AssignmentGroupMembership.objects.filter(
-            group__in=bunks,
-            role_in_group="subject",
-            is_active=True,
-        )
-        .select_related("person", "group")
-        .order_by("person__last_name", "person__first_name")
+    ids_by_bunk = {b.id: roster_snapshot(b.program_id).subject_ids(b.id) for b in bunks}
+    persons = Person.all_objects.in_bulk(
+        {pid for ids in ids_by_bunk.values() for pid in ids},
     )
-    out: dict[int, list[Person]] = {b.id: [] for b in bunks}
-    for agm in rows:
-        out.setdefault(agm.group_id, []).append(agm.person)
-    return out
+    return {
+        bunk_id: [persons[pid] for pid in ids if pid in persons]
+        for bunk_id, ids in ids_by_bunk.items()
+    }
 
 
 def off_camp_camper_ids(
@@ -420,12 +405,8 @@ def viewer_can_edit_camper_reflection(
     """
     if reflection.assignment_group_id is None:
         return False
-    return AssignmentGroupMembership.objects.filter(
-        group_id=reflection.assignment_group_id,
-        person=viewer,
-        role_in_group="author",
-        is_active=True,
-    ).exists()
+    snapshot = roster_snapshot(reflection.program_id)
+    return viewer.id in snapshot.author_ids(reflection.assignment_group_id)
 
 
 def dashboard_cache_key(viewer_id: int, organization_id: int, today: date) -> str:
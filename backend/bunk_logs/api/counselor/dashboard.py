@@ -28,11 +28,12 @@ from __future__ import annotations
 
 from datetime import date as date_type
 
-from django.core.cache import cache
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bunk_logs.api.conditional import cache_payload
+from bunk_logs.api.conditional import cached_payload
+from bunk_logs.api.conditional import conditional_response
 from bunk_logs.core.assignment_resolution import active_assignments_for
 from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import Membership
@@ -142,15 +143,15 @@ class CounselorDashboardView(APIView):
         skip_cache = request.query_params.get("nocache") in {"1", "true"}
         cache_key = _cache_key(viewer.id, org.id, target_date)
         if not skip_cache:
-            cached = cache.get(cache_key)
+            cached, etag = cached_payload(cache_key)
             if cached is not None:
-                return Response(cached)
+                return conditional_response(request, cached, etag=etag)
 
         primary_membership = primary_operational_membership(viewer, today=org_today)
         if primary_membership is None or primary_membership.program is None:
             payload = self._empty_payload(org_today, target_date, org, viewer)
-            cache.set(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
-            return Response(payload)
+            etag = cache_payload(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
+            return conditional_response(request, payload, etag=etag)
         program = primary_membership.program
 
         bunks = viewer_bunk_groups(viewer, today=org_today)
@@ -200,8 +201,8 @@ class CounselorDashboardView(APIView):
                 "requests": requests_section,
             },
         }
-        cache.set(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
-        return Response(payload)
+        etag = cache_payload(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
+        return conditional_response(request, payload, etag=etag)
 
     def _empty_payload(
         self,
@@ -0,0 +1,238 @@
+"""Counselor change feed: ``GET /api/v1/counselor/sync/?since=<cursor>``.
+
+Lets the mobile client stay current after a reconnect (or on every poll)
+without re-downloading rosters and request lists. The response carries the
+rows the viewer can see that changed since ``since``::
+
+    {"cursor": "...", "reset": false,
+     "reflections": [...], "camper_day_states": [...], "orders": [...],
+     "maintenance_tickets": [...], "flags": [...],
+     "deleted": [{"type": "order", "id": "..."}]}
+
+Scope matches the read endpoints: reflections pass
+:func:`~bunk_logs.core.filters.reflections_visible_for_user`, day states are
+limited to campers on the viewer's bunks, and orders / tickets / flags to
+those the viewer's memberships filed or raised. Tombstones cover the
+viewer's programs (ids only).
+
+``cursor`` is a UTC ISO timestamp that trails the response by
+``SYNC_CURSOR_LAG_SECONDS``, so consecutive polls overlap slightly and a
+row saved just before the response but committed after it is not missed;
+clients upsert by id. ``reset: true`` (with empty lists) means "refetch the
+full endpoints, then sync from this cursor" -- sent when ``since`` is
+missing, older than the tombstone retention, or more than
+``SYNC_MAX_ROWS`` rows of one type changed. Roster membership changes are
+not feed events; the dashboard still owns the roster itself.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from bunk_logs.core.change_feed import tombstone_retention
+from bunk_logs.core.filters import reflections_visible_for_user
+from bunk_logs.core.models import CamperDayState
+from bunk_logs.core.models import Flag
+from bunk_logs.core.models import MaintenanceTicket
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Order
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import SyncTombstone
+
+from .bunk_requests import _bunk_name_for_order
+from .bunk_requests import _serialize_order_row
+from .bunk_requests import _serialize_ticket_row
+from .bunk_requests import viewer_membership_ids
+from .common import bunk_camper_persons
+from .common import viewer_bunk_groups
+from .common import viewer_or_403
+from .responses import reflection_response
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from django.db.models import QuerySet
+
+    from .common import ViewerContext
+
+EMPTY_CHANGES: dict[str, list] = {
+    "reflections": [],
+    "camper_day_states": [],
+    "orders": [],
+    "maintenance_tickets": [],
+    "flags": [],
+    "deleted": [],
+}
+
+
+class _TooManyChangesError(Exception):
+    """More than ``SYNC_MAX_ROWS`` rows of one type changed; send a reset."""
+
+
+class CounselorSyncView(APIView):
+    """Rows visible to the counselor that changed since the cursor."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        ctx = viewer_or_403(request)
+        now = timezone.now()
+        cursor = _format_cursor(now - timedelta(seconds=settings.SYNC_CURSOR_LAG_SECONDS))
+
+        raw = request.query_params.get("since")
+        if not raw:
+            return Response({"cursor": cursor, "reset": True, **EMPTY_CHANGES})
+        since = parse_datetime(raw)
+        if since is None:
+            return Response(
+                {"detail": "Invalid 'since' cursor; expected an ISO-8601 timestamp."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if timezone.is_naive(since):
+            since = since.replace(tzinfo=UTC)
+        if since < now - tombstone_retention():
+            return Response({"cursor": cursor, "reset": True, **EMPTY_CHANGES})
+
+        try:
+            changes = changes_since(ctx, request.user, since)
+        except _TooManyChangesError:
+            return Response({"cursor": cursor, "reset": True, **EMPTY_CHANGES})
+        return Response({"cursor": cursor, "reset": False, **changes})
+
+
+def _format_cursor(moment: datetime) -> str:
+    # ``Z`` rather than ``+00:00`` so a cursor pasted into a query string
+    # unencoded doesn't turn its ``+`` into a space.
+    return moment.astimezone(UTC).isoformat().replace("+00:00", "Z")
+
+
+def _capped(qs: QuerySet) -> list:
+    limit = settings.SYNC_MAX_ROWS
+    rows = list(qs[: limit + 1])
+    if len(rows) > limit:
+        raise _TooManyChangesError
+    return rows
+
+
+def changes_since(ctx: ViewerContext, user, since: datetime) -> dict[str, list]:
+    """Feed payload for ``ctx.person``; raises ``_TooManyChangesError``."""
+    org = ctx.organization
+    viewer = ctx.person
+
+    bunks = viewer_bunk_groups(viewer, today=ctx.today)
+    bunk_by_id = {b.id: b for b in bunks}
+    camper_bunk_by_person: dict[int, int] = {}
+    for bunk_id, campers in bunk_camper_persons(bunks).items():
+        for camper in campers:
+            camper_bunk_by_person.setdefault(camper.id, bunk_id)
+    membership_ids = viewer_membership_ids(viewer, org)
+    program_ids = set(
+        Membership.all_objects.filter(id__in=membership_ids).values_list("program_id", flat=True),
+    )
+
+    reflections = _capped(
+        reflections_visible_for_user(
+            user,
+            Reflection.all_objects.filter(organization=org, updated_at__gte=since),
+        )
+        .select_related("template")
+        .order_by("updated_at"),
+    )
+    day_states = _capped(
+        CamperDayState.all_objects.filter(
+            organization=org,
+            camper_id__in=list(camper_bunk_by_person),
+            updated_at__gte=since,
+        ).order_by("updated_at"),
+    )
+    orders = _capped(
+        Order.all_objects.filter(
+            organization=org,
+            submitted_by_id__in=membership_ids,
+            updated_at__gte=since,
+        )
+        .select_related("subject")
+        .order_by("updated_at"),
+    )
+    tickets = _capped(
+        MaintenanceTicket.all_objects.filter(
+            organization=org,
+            submitted_by_id__in=membership_ids,
+            updated_at__gte=since,
+        )
+        .prefetch_related("photos")
+        .order_by("updated_at"),
+    )
+    flags = _capped(
+        Flag.all_objects.filter(
+            organization=org,
+            raised_by_membership_id__in=membership_ids,
+            updated_at__gte=since,
+        ).order_by("updated_at"),
+    )
+    tombstones = _capped(
+        SyncTombstone.all_objects.filter(
+            organization=org,
+            program_id__in=program_ids,
+            deleted_at__gte=since,
+        ).order_by("deleted_at"),
+    )
+
+    order_rows = []
+    for order in orders:
+        row = _serialize_order_row(order)
+        row["bunk_id"], row["bunk_name"] = _bunk_name_for_order(
+            order,
+            bunk_by_id=bunk_by_id,
+            camper_bunk_by_person=camper_bunk_by_person,
+        )
+        order_rows.append(row)
+    ticket_rows = []
+    for ticket in tickets:
+        row = _serialize_ticket_row(ticket)
+        row["bunk_id"] = None
+        row["bunk_name"] = None
+        ticket_rows.append(row)
+
+    return {
+        "reflections": [reflection_response(r) for r in reflections],
+        "camper_day_states": [_day_state_row(s) for s in day_states],
+        "orders": order_rows,
+        "maintenance_tickets": ticket_rows,
+        "flags": [_flag_row(f) for f in flags],
+        "deleted": [{"type": t.model, "id": t.object_id} for t in tombstones],
+    }
+
+
+def _day_state_row(state: CamperDayState) -> dict:
+    # ``reason`` is not surfaced to counselors (see ``CamperDayState.reason``).
+    return {
+        "id": str(state.id),
+        "camper_id": state.camper_id,
+        "date": state.date.isoformat(),
+        "is_off_camp": state.is_off_camp,
+        "updated_at": state.updated_at.isoformat(),
+    }
+
+
+def _flag_row(flag: Flag) -> dict:
+    return {
+        "id": str(flag.id),
+        "subject_camper_id": flag.subject_camper_id,
+        "status": flag.status,
+        "status_label": flag.get_status_display(),
+        "flagged_for_role": flag.flagged_for_role,
+        "created_at": flag.created_at.isoformat(),
+        "updated_at": flag.updated_at.isoformat(),
+        "resolved_at": flag.resolved_at.isoformat() if flag.resolved_at else None,
+    }
@@ -26,7 +26,7 @@ from rest_framework.views import APIView
 
 from bunk_logs.api.leadership_team.common import resolve_period
 from bunk_logs.api.unit_head.common import score_grid_columns
-from bunk_logs.core.assignment_resolution import resolve_members
+from bunk_logs.core.assignment_audience import audience_by_assignment
 from bunk_logs.core.assignment_visibility import assignments_visible_for_user
 from bunk_logs.core.filters import reflections_visible_for_user
 from bunk_logs.core.models import Membership
@@ -458,10 +458,10 @@ class AssignmentTemplateDashboardView(APIView):
 
         members_by_person: dict[int, dict[str, str]] = {}
         audience_qs: list[Q] = []
+        audience = audience_by_assignment(assignments)
         for assignment in assignments:
-            members = resolve_members(assignment, as_of).select_related("person")
             member_ids: set[int] = set()
-            for m in members:
+            for m in audience.get(assignment.pk, []):
                 member_ids.add(m.person_id)
                 members_by_person.setdefault(
                     m.person_id, {"name": _person_name(m.person), "role": m.role},
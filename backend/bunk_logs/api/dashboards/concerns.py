@@ -9,6 +9,11 @@ fields, plus low_rating events) the viewer is permitted to see, with per-user
 read state stored in ConcernReadState. Items default to unread; calling the
 mark-read endpoint creates a row keyed by (user, reflection, field_key) so the
 inbox can hide them on the next fetch.
+
+Items are read from the write-time ``ConcernItem`` table (see
+:mod:`bunk_logs.core.concerns`): one indexed query filtered by date window,
+visible reflection ids and an ``EXISTS`` against ConcernReadState, rather than
+loading every visible reflection and re-walking its template schema.
 """
 
 from __future__ import annotations
@@ -18,12 +23,16 @@ from datetime import timedelta
 from functools import reduce
 from operator import or_
 
+from django.db.models import Exists
+from django.db.models import OuterRef
 from django.db.models import Q
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bunk_logs.core.concerns import INBOX_KINDS
 from bunk_logs.core.filters import reflections_visible_for_user
+from bunk_logs.core.models import ConcernItem
 from bunk_logs.core.models import ConcernReadState
 from bunk_logs.core.models import Person
 from bunk_logs.core.models import Reflection
@@ -32,7 +41,6 @@ from bunk_logs.core.time_utils import get_today
 
 DEFAULT_WINDOW_DAYS = 14
 MAX_WINDOW_DAYS = 60
-LOW_RATING_THRESHOLD = 1
 BULK_READ_MAX_ITEMS = 200
 
 
@@ -45,56 +53,6 @@ def _parse_date(s: str | None, default: date) -> date:
         return default
 
 
-def _extract_concerns_from_reflection(r: Reflection) -> list[dict]:
-    """Walk r.template.schema and pull out every concerning item present in answers."""
-    items: list[dict] = []
-    schema = (r.template.schema or {}).get("fields") or []
-    for f in schema:
-        if not isinstance(f, dict):
-            continue
-        ftype = f.get("type")
-        fkey = f.get("key")
-        role = f.get("dashboard_role")
-        v = r.answers.get(fkey)
-        if role == "open_concern" and ftype in ("text", "textarea"):
-            if isinstance(v, str) and v.strip():
-                items.append({
-                    "kind": "open_concern",
-                    "field_key": fkey,
-                    "field_label": f.get("prompts", {}).get("en") or fkey,
-                    "value": v.strip()[:1000],
-                })
-        if ftype in ("single_rating",) and (
-            f.get("dashboard_role") == "primary_rating"
-        ):
-            if isinstance(v, (int, float)) and not isinstance(v, bool):
-                if float(v) <= LOW_RATING_THRESHOLD:
-                    items.append({
-                        "kind": "low_rating",
-                        "field_key": fkey,
-                        "field_label": f.get("prompts", {}).get("en") or fkey,
-                        "value": float(v),
-                    })
-        if ftype == "rating_group":
-            block = v if isinstance(v, dict) else {}
-            for cat in f.get("categories") or []:
-                if not isinstance(cat, dict):
-                    continue
-                ck = cat.get("key")
-                cv = block.get(ck)
-                if isinstance(cv, (int, float)) and not isinstance(cv, bool):
-                    if float(cv) <= LOW_RATING_THRESHOLD:
-                        items.append({
-                            "kind": "low_rating",
-                            "field_key": f"{fkey}__{ck}",
-                            "field_label": (
-                                cat.get("labels", {}).get("en") or f"{fkey} · {ck}"
-                            ),
-                            "value": float(cv),
-                        })
-    return items
-
-
 def _person_for_organization(user, organization) -> Person | None:
     """Resolve the viewer's Person row for this tenant without thread-local org context."""
     if user is None or not getattr(user, "is_authenticated", False):
@@ -173,50 +131,65 @@ class ConcernsInboxView(APIView):
             "1", "true", "yes",
         )
 
-        refs = list(
-            _concerns_visible_queryset(
-                request.user,
-                Reflection.objects.filter(
-                    period_end__gte=cur_start,
-                    period_end__lte=cur_end,
-                    is_complete=True,
-                ).select_related("subject", "author", "template", "assignment_group"),
+        visible_ids = _concerns_visible_queryset(
+            request.user,
+            Reflection.objects.filter(
+                period_end__gte=cur_start,
+                period_end__lte=cur_end,
+                is_complete=True,
+            ),
+            organization=org,
+        ).values("id")
+        concerns = (
+            ConcernItem.all_objects.filter(
                 organization=org,
-            ).order_by("-period_end"),
-        )
-
-        # Pull this viewer's read states for all candidate reflections in one query
-        read_pairs: set[tuple[int, str]] = set(
-            ConcernReadState.objects.filter(
-                user=request.user,
-                reflection_id__in=[r.id for r in refs],
-            ).values_list("reflection_id", "field_key"),
+                kind__in=INBOX_KINDS,
+                date__gte=cur_start,
+                date__lte=cur_end,
+                reflection_id__in=visible_ids,
+            )
+            .annotate(
+                read=Exists(
+                    ConcernReadState.objects.filter(
+                        user=request.user,
+                        reflection_id=OuterRef("reflection_id"),
+                        field_key=OuterRef("field_key"),
+                    ),
+                ),
+            )
+            .select_related(
+                "reflection__subject",
+                "reflection__author",
+                "reflection__template",
+                "reflection__assignment_group",
+            )
+            .defer("reflection__answers", "reflection__template__schema")
+            .order_by("-date", "reflection_id", "position")
         )
+        if not include_read:
+            concerns = concerns.filter(read=False)
 
         items: list[dict] = []
-        for r in refs:
-            for c in _extract_concerns_from_reflection(r):
-                read = (r.id, c["field_key"]) in read_pairs
-                if read and not include_read:
-                    continue
-                items.append({
-                    "reflection_id": r.id,
-                    "date": r.period_end.isoformat(),
-                    "subject_id": r.subject_id,
-                    "subject_name": r.subject.full_name if r.subject else None,
-                    "author_name": r.author.full_name if r.author else None,
-                    "template_name": r.template.name,
-                    "team_visibility": r.team_visibility,
-                    "assignment_group": (
-                        {"id": r.assignment_group_id, "name": r.assignment_group.name}
-                        if r.assignment_group_id else None
-                    ),
-                    "kind": c["kind"],
-                    "field_key": c["field_key"],
-                    "field_label": c["field_label"],
-                    "value": c["value"],
-                    "read": read,
-                })
+        for c in concerns:
+            r = c.reflection
+            items.append({
+                "reflection_id": r.id,
+                "date": c.date.isoformat(),
+                "subject_id": r.subject_id,
+                "subject_name": r.subject.full_name if r.subject else None,
+                "author_name": r.author.full_name if r.author else None,
+                "template_name": r.template.name,
+                "team_visibility": r.team_visibility,
+                "assignment_group": (
+                    {"id": r.assignment_group_id, "name": r.assignment_group.name}
+                    if r.assignment_group_id else None
+                ),
+                "kind": c.kind,
+                "field_key": c.field_key,
+                "field_label": c.field_label,
+                "value": c.value_text if c.kind == ConcernItem.Kind.OPEN_CONCERN else c.value_number,
+                "read": c.read,
+            })
         return Response({
             "period": {"start": cur_start.isoformat(), "end": cur_end.isoformat()},
             "include_read": include_read,
@@ -15,9 +15,10 @@ from __future__ import annotations
 from django.utils.dateparse import parse_date
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bunk_logs.api.conditional import conditional_response
+from bunk_logs.api.conditional import payload_etag
 from bunk_logs.api.dashboards.group_dashboard_common import resolve_group_dashboard_context
 from bunk_logs.api.dashboards.group_payloads import build_classroom_dashboard_payload
 from bunk_logs.api.dashboards.group_payloads import build_division_dashboard_payload
@@ -122,7 +123,7 @@ class GroupDashboardView(APIView):
             payload["header"]["program_name"] = program_display_name(
                 ctx.program, ctx.organization,
             )
-        return Response(payload)
+        return conditional_response(request, payload, etag=payload_etag(payload))
 
 
 def _parse_date_param(raw, *, default):
@@ -45,6 +45,7 @@ from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import ClassroomChallenge
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import Reflection
+from bunk_logs.utils.instrumentation import hot_path
 
 if TYPE_CHECKING:
     from datetime import date
@@ -182,6 +183,7 @@ def _briefs_for_persons(persons: list[Person]) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+@hot_path("dashboard.unit")
 def build_unit_dashboard_payload(
     *,
     request,
@@ -310,6 +312,7 @@ def build_unit_dashboard_payload(
 # ---------------------------------------------------------------------------
 
 
+@hot_path("dashboard.division")
 def build_division_dashboard_payload(
     *,
     request,
@@ -465,6 +468,7 @@ def _classroom_challenges_summary(
     }
 
 
+@hot_path("dashboard.classroom")
 def build_classroom_dashboard_payload(
     *,
     request,
@@ -1,7 +1,7 @@
 """Member roster for the unified group dashboard.
 
 Lists everyone with an active ``AssignmentGroupMembership`` in the group
-(authors + subjects) alongside their active program ``Membership`` role,
+(authors + subjects, read from the program's roster snapshot) alongside their active program ``Membership`` role,
 so any group dashboard can answer "who is in this group and in what role".
 Authors are listed before subjects, then alphabetically by name.
 """
@@ -10,8 +10,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Any
 
-from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Person
+from bunk_logs.core.roster_snapshot import roster_snapshot
 
 if TYPE_CHECKING:
     from bunk_logs.core.models import AssignmentGroup
@@ -31,15 +32,14 @@ def build_group_roster(
     (e.g. ``counselor``, ``camper``, ``unit_head``) or ``None`` if they have
     no active membership in the group's program.
     """
-    agms = list(
-        AssignmentGroupMembership.all_objects.filter(group=group, is_active=True)
-        .select_related("person")
-        .order_by("person__last_name", "person__first_name", "person_id"),
-    )
-    if not agms:
+    snapshot = roster_snapshot(group.program_id)
+    members = [(pid, "author") for pid in snapshot.author_ids(group.id)]
+    members += [(pid, "subject") for pid in snapshot.subject_ids(group.id)]
+    if not members:
         return []
 
-    person_ids = [a.person_id for a in agms]
+    person_ids = {pid for pid, _ in members}
+    persons = Person.all_objects.in_bulk(person_ids)
     membership_role_by_person: dict[int, str] = {}
     for m in Membership.all_objects.filter(
         person_id__in=person_ids, program=program, is_active=True,
@@ -48,12 +48,12 @@ def build_group_roster(
 
     roster = [
         {
-            "person_id": a.person_id,
-            "name": a.person.full_name if a.person else "Unknown",
-            "role_in_group": a.role_in_group,
-            "membership_role": membership_role_by_person.get(a.person_id),
+            "person_id": pid,
+            "name": persons[pid].full_name if pid in persons else "Unknown",
+            "role_in_group": role_in_group,
+            "membership_role": membership_role_by_person.get(pid),
         }
-        for a in agms
+        for pid, role_in_group in members
     ]
     roster.sort(key=lambda m: (_ROLE_IN_GROUP_ORDER.get(m["role_in_group"], 9), m["name"]))
     return roster
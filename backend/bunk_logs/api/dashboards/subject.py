@@ -1,20 +1,29 @@
 """Per-subject detail dashboard.
 
 GET /api/v1/dashboards/subject/{person_id}/?date_start=&date_end=
+GET /api/v1/dashboards/subject/{person_id}/reflections/?date_start=&date_end=&cursor=
 GET /api/v1/dashboards/subject/{person_id}/export/?date_start=&date_end=
 
-Returns all reflections about ``person_id`` (visible to viewer), grouped by
+Returns the reflections about ``person_id`` (visible to viewer), grouped by
 template, plus per-rating-field time series, recent text responses, and a
 ``concerning_patterns`` array (low ratings + downward trends) — used to surface
 campers who may need a check-in.
 
+The cost of the detail payload does not grow with the subject's history:
+
+* per-template totals and yes/no flag counts are ``COUNT ... FILTER``
+  aggregates in the database (:func:`_template_summaries`);
+* rating series, recent texts and pattern detection read only ``answers``
+  of the newest ``MAX_SERIES_REFLECTIONS`` rows in the window;
+* full reflection rows are an oldest-first page of ``REFLECTION_PAGE_SIZE``
+  (the order the SPA's response table and "view responses" link expect);
+  ``reflections_next_cursor`` fetches later rows from ``reflections/``.
+
 No scipy dependency: trend detection is a simple two-window average compare.
 """
 
 from __future__ import annotations
 
-import csv
-import io
 import re
 from collections import defaultdict
 from dataclasses import dataclass
@@ -22,9 +31,16 @@ from datetime import date
 from datetime import datetime
 from datetime import time
 from datetime import timedelta
+from operator import itemgetter
+from typing import TYPE_CHECKING
 from typing import Any
 
-from django.http import HttpResponse
+from django.db.models import Count
+from django.db.models import Min
+from django.db.models import Q
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Lower
+from django.db.models.functions import Trim
 from django.utils import timezone
 from django.utils.html import strip_tags
 from rest_framework.permissions import IsAuthenticated
@@ -32,6 +48,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from bunk_logs.api.counselor.common import is_truthy_yes_no
+from bunk_logs.api.csv_stream import EXPORT_CHUNK_SIZE
+from bunk_logs.api.csv_stream import merge_sorted
+from bunk_logs.api.csv_stream import streaming_csv_response
 from bunk_logs.core import audit
 from bunk_logs.core.filters import reflections_visible_for_user
 from bunk_logs.core.identity import person_for_user
@@ -39,14 +58,25 @@ from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import Person
 from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import ReflectionTemplate
 from bunk_logs.core.permissions.observation_read import filter_observations_readable
 from bunk_logs.core.permissions.subject_dashboard import can_view_subject_dashboard
 from bunk_logs.core.time_utils import get_org_timezone
 from bunk_logs.notes.models import Observation
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from django.db.models import QuerySet
+
 DEFAULT_WINDOW_DAYS = 30
 MAX_WINDOW_DAYS = 90
 MAX_REFLECTIONS_PER_SUBJECT = 200
+MAX_SERIES_REFLECTIONS = 500
+# The SPA renders only the first page (it doesn't follow
+# ``reflections_next_cursor`` yet), so this stays at the old row cap.
+REFLECTION_PAGE_SIZE = MAX_REFLECTIONS_PER_SUBJECT
 LOW_RATING_LOOKBACK_DAYS = 14
 TREND_LOOKBACK_DAYS = 14
 TREND_DELTA_THRESHOLD = 0.5
@@ -58,6 +88,9 @@ SCORE_CATEGORY_KEYS = ("behavior", "participation", "social")
 NARRATIVE_FIELD_KEYS = frozenset({"daily_report", "description"})
 NARRATIVE_DASHBOARD_ROLES = frozenset({"open_concern"})
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Lower-cased, trimmed answer text counted as "yes" (mirrors is_truthy_yes_no;
+# JSON ``true`` reads back as the text 'true').
+_YES_ANSWER_TEXT = ("yes", "true", "1")
 
 
 def _parse_date(s: str | None, default: date) -> date:
@@ -131,23 +164,212 @@ def _get_subject_dashboard_context(
     ), None
 
 
-def _reflections_for_subject(
+def _visible_subject_reflections(
     user,
     person_id: int,
     cur_start: date,
     cur_end: date,
-) -> list[Reflection]:
-    return list(
-        reflections_visible_for_user(
-            user,
-            Reflection.objects.filter(
-                subject_id=person_id,
-                period_end__gte=cur_start,
-                period_end__lte=cur_end,
-                is_complete=True,
-            ).select_related("template", "author", "assignment_group"),
-        ).order_by("period_end")[:MAX_REFLECTIONS_PER_SUBJECT],
+) -> QuerySet[Reflection]:
+    return reflections_visible_for_user(
+        user,
+        Reflection.objects.filter(
+            subject_id=person_id,
+            period_end__gte=cur_start,
+            period_end__lte=cur_end,
+            is_complete=True,
+        ).select_related("template", "author", "assignment_group"),
+    ).order_by("period_end")
+
+
+def _template_summaries(visible: QuerySet[Reflection]) -> dict[int, dict[str, Any]]:
+    """Per-template payload blocks with totals and flag counts from the database.
+
+    Blocks are ordered by each template's first reflection in the window.
+    Counting runs over a pk subquery: the visibility filter joins through
+    rosters and de-duplicates with ``DISTINCT``, which would otherwise skew
+    a grouped count.
+    """
+    rows = Reflection.all_objects.filter(pk__in=visible.order_by().values("pk")).order_by()
+    template_ids = set(rows.values_list("template_id", flat=True).distinct())
+    if not template_ids:
+        return {}
+    templates = ReflectionTemplate.all_objects.filter(id__in=template_ids)
+    schema_by_template = {
+        tpl.id: (tpl, (tpl.schema or {}).get("fields") or []) for tpl in templates
+    }
+    flag_keys_by_template = {
+        tpl_id: [
+            f.get("key") for f in schema_fields
+            if isinstance(f, dict) and _is_yes_no_field(f) and f.get("key")
+        ]
+        for tpl_id, (_, schema_fields) in schema_by_template.items()
+    }
+    all_flag_keys = sorted({k for keys in flag_keys_by_template.values() for k in keys})
+    aliases = {
+        f"flag_{i}": Lower(Trim(KeyTextTransform(key, "answers")))
+        for i, key in enumerate(all_flag_keys)
+    }
+    counts = {}
+    for i in range(len(all_flag_keys)):
+        counts[f"yes_{i}"] = Count("id", filter=Q(**{f"flag_{i}__in": _YES_ANSWER_TEXT}))
+        counts[f"no_{i}"] = Count("id", filter=Q(**{f"flag_{i}": "no"}))
+    grouped = (
+        rows.alias(**aliases)
+        .values("template_id")
+        .annotate(total=Count("id"), first_date=Min("period_end"), **counts)
+        .order_by("first_date", "template_id")
+    )
+
+    by_template: dict[int, dict[str, Any]] = {}
+    for row in grouped:
+        tpl, schema_fields = schema_by_template[row["template_id"]]
+        flag_counts = {}
+        for key in flag_keys_by_template[tpl.id]:
+            i = all_flag_keys.index(key)
+            yes, no = row[f"yes_{i}"], row[f"no_{i}"]
+            flag_counts[key] = {"yes": yes, "no": no, "total": yes + no}
+        by_template[tpl.id] = {
+            "template": {
+                "id": tpl.id,
+                "name": tpl.name,
+                "slug": tpl.slug,
+                "subject_mode": tpl.subject_mode,
+            },
+            "schema_fields": schema_fields,
+            "summary": {
+                "total_reflections": row["total"],
+                "flag_counts": flag_counts,
+            },
+            "rating_series": [],
+            "reflections": [],
+        }
+    return by_template
+
+
+def _collect_series_and_texts(
+    visible: QuerySet[Reflection],
+    by_template: dict[int, dict[str, Any]],
+) -> tuple[dict[str, list[tuple]], list[dict[str, Any]]]:
+    """Fill each block's ``rating_series``; return pattern series and recent texts.
+
+    Reads ``answers`` of the newest ``MAX_SERIES_REFLECTIONS`` rows only
+    (no model instances or joins), oldest first so points stay in date order.
+    """
+    rows = list(
+        visible.order_by("-period_end", "-id").values_list(
+            "id", "template_id", "period_end", "answers", "team_visibility", "author_id",
+        )[:MAX_SERIES_REFLECTIONS],
     )
+    rows.reverse()
+
+    all_series: dict[str, list[tuple[date, float, int, int | None, str]]] = defaultdict(list)
+    series_by_template: dict[int, dict[str, list[dict]]] = defaultdict(lambda: defaultdict(list))
+    recent_texts: list[dict[str, Any]] = []
+    for ref_id, tpl_id, period_end, answers, team_visibility, author_id in rows:
+        entry = by_template.get(tpl_id)
+        if entry is None:
+            continue
+        answers = answers or {}
+        for field in entry["schema_fields"]:
+            if not isinstance(field, dict):
+                continue
+            ftype = field.get("type")
+            if ftype not in ("single_rating", "rating_group"):
+                if ftype in ("text", "textarea"):
+                    v = answers.get(field.get("key"))
+                    if isinstance(v, str) and v.strip():
+                        recent_texts.append({
+                            "reflection_id": ref_id,
+                            "template_id": tpl_id,
+                            "template_name": entry["template"]["name"],
+                            "field_key": field.get("key"),
+                            "dashboard_role": field.get("dashboard_role"),
+                            "text": v.strip()[:1000],
+                            "date": period_end.isoformat(),
+                            "author_id": author_id,
+                            "team_visibility": team_visibility,
+                        })
+                continue
+            ratings = _resolve_rating(field, answers)
+            scale = field.get("scale") or [1, 5]
+            try:
+                scale_max = int(scale[-1])
+            except (IndexError, ValueError, TypeError):
+                scale_max = 5
+            for label, value in ratings.items():
+                series_by_template[tpl_id][label].append({
+                    "date": period_end.isoformat(),
+                    "value": value,
+                    "reflection_id": ref_id,
+                    "scale_max": scale_max,
+                    "team_visibility": team_visibility,
+                })
+                if value is not None:
+                    all_series[label].append(
+                        (period_end, value, ref_id, scale_max, team_visibility),
+                    )
+
+    for tpl_id, series in series_by_template.items():
+        by_template[tpl_id]["rating_series"] = [
+            {
+                "label": label,
+                "scale_max": (points[0]["scale_max"] if points else 5),
+                "points": points,
+            }
+            for label, points in series.items()
+        ]
+
+    recent_texts.sort(key=lambda x: x["date"], reverse=True)
+    recent_texts = recent_texts[:RECENT_TEXT_LIMIT]
+    authors = Person.all_objects.in_bulk({t["author_id"] for t in recent_texts if t["author_id"]})
+    for text in recent_texts:
+        author = authors.get(text.pop("author_id"))
+        text["author_name"] = author.full_name if author else None
+    return all_series, recent_texts
+
+
+def _format_reflection_cursor(reflection: Reflection) -> str:
+    return f"{reflection.period_end.isoformat()}:{reflection.id}"
+
+
+def _parse_reflection_cursor(raw: str) -> tuple[date, int] | None:
+    day, _, ref_id = (raw or "").partition(":")
+    try:
+        return date.fromisoformat(day), int(ref_id)
+    except ValueError:
+        return None
+
+
+def _reflection_page(
+    visible: QuerySet[Reflection],
+    *,
+    cursor: tuple[date, int] | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Oldest-first reflection rows after ``cursor``, plus the next cursor."""
+    limit = REFLECTION_PAGE_SIZE
+    qs = visible.order_by("period_end", "id")
+    if cursor is not None:
+        day, ref_id = cursor
+        qs = qs.filter(Q(period_end__gt=day) | Q(period_end=day, id__gt=ref_id))
+    page = list(qs[: limit + 1])
+    next_cursor = _format_reflection_cursor(page[limit - 1]) if len(page) > limit else None
+    rows = [
+        {
+            "id": r.id,
+            "template_id": r.template_id,
+            "date": r.period_end.isoformat(),
+            "author_name": r.author.full_name if r.author else None,
+            "team_visibility": r.team_visibility,
+            "language": r.language,
+            "answers": r.answers or {},
+            "assignment_group": (
+                {"id": r.assignment_group_id, "name": r.assignment_group.name}
+                if r.assignment_group_id else None
+            ),
+        }
+        for r in page[:limit]
+    ]
+    return rows, next_cursor
 
 
 def _normalize_csv_cell(value: str) -> str:
@@ -252,21 +474,32 @@ def _sortable_datetime(d: date, dt: datetime | None) -> datetime:
     return timezone.make_aware(naive, timezone.get_current_timezone())
 
 
-def _build_subject_entries_csv(
-    *,
-    subject_name: str,
-    reflections: list[Reflection],
-    observations: list[Observation],
-) -> str:
-    rows: list[tuple[date, datetime, list[Any]]] = []
-
+SUBJECT_ENTRIES_CSV_HEADER = [
+    "date",
+    "subject_name",
+    "entry_type",
+    "template_name",
+    "author_name",
+    "assignment_group",
+    "language",
+    "behavior",
+    "participation",
+    "social",
+    "flags",
+    "full_text",
+    "entry_id",
+]
+
+
+def _reflection_entries(
+    subject_name: str, reflections: Iterable[Reflection],
+) -> Iterator[tuple[datetime, list[Any]]]:
     for r in reflections:
         schema_fields = (r.template.schema or {}).get("fields") or []
         language = r.language or "en"
         category_scores = _extract_category_scores(schema_fields, r.answers or {})
-        rows.append((
-            r.period_end,
-            datetime.combine(r.period_end, time.min),
+        yield (
+            _sortable_datetime(r.period_end, None),
             [
                 r.period_end.isoformat(),
                 subject_name,
@@ -282,13 +515,16 @@ def _build_subject_entries_csv(
                 _format_reflection_full_text(schema_fields, r.answers or {}, language),
                 r.id,
             ],
-        ))
+        )
 
+
+def _observation_entries(
+    subject_name: str, observations: Iterable[Observation],
+) -> Iterator[tuple[datetime, list[Any]]]:
     for o in observations:
         obs_date = o.observed_at.date() if o.observed_at else date.min
-        rows.append((
-            obs_date,
-            o.observed_at or datetime.combine(obs_date, time.min),
+        yield (
+            _sortable_datetime(obs_date, o.observed_at),
             [
                 obs_date.isoformat() if o.observed_at else "",
                 subject_name,
@@ -304,30 +540,27 @@ def _build_subject_entries_csv(
                 _normalize_csv_cell(_strip_html(o.body or "")),
                 o.id,
             ],
-        ))
-
-    rows.sort(key=lambda item: _sortable_datetime(item[0], item[1]))
-
-    out = io.StringIO()
-    writer = csv.writer(out)
-    writer.writerow([
-        "date",
-        "subject_name",
-        "entry_type",
-        "template_name",
-        "author_name",
-        "assignment_group",
-        "language",
-        "behavior",
-        "participation",
-        "social",
-        "flags",
-        "full_text",
-        "entry_id",
-    ])
-    for _, __, row in rows:
-        writer.writerow(row)
-    return "\ufeff" + out.getvalue()
+        )
+
+
+def _subject_entry_rows(
+    *,
+    subject_name: str,
+    reflections: Iterable[Reflection],
+    observations: Iterable[Observation],
+) -> Iterator[list[Any]]:
+    """Export rows in date order; reflections before observations on ties.
+
+    Both inputs must already be ordered (``period_end`` / ``observed_at``);
+    they are merged lazily so neither stream is held in memory.
+    """
+    merged = merge_sorted(
+        _reflection_entries(subject_name, reflections),
+        _observation_entries(subject_name, observations),
+        key=itemgetter(0),
+    )
+    for _, row in merged:
+        yield row
 
 
 def _subject_profile(subject: Person, organization) -> dict[str, Any]:
@@ -503,126 +736,18 @@ class SubjectDetailView(APIView):
         cur_end = ctx.cur_end
         today = date.today()
 
-        refs = _reflections_for_subject(request.user, person_id, cur_start, cur_end)
-
-        if not refs:
-            # 403 vs empty: if viewer has zero visible reflections of any kind for this
-            # subject, that may legitimately be empty (subject not in a visible group).
-            # We don't 403 — empty result is informative. Caller can render empty state.
-            pass
-
-        # Group by template
-        by_template: dict[int, dict[str, Any]] = {}
-        # series_by_label across ALL templates: used for concerning-pattern detection
-        all_series: dict[str, list[tuple[date, float, int, int | None, str]]] = defaultdict(list)
-        recent_texts: list[dict[str, Any]] = []
-
-        for r in refs:
-            tpl = r.template
-            tpl_entry = by_template.get(tpl.id)
-            schema_fields = (tpl.schema or {}).get("fields") or []
-            if tpl_entry is None:
-                flag_keys = [
-                    f.get("key")
-                    for f in schema_fields
-                    if isinstance(f, dict) and _is_yes_no_field(f)
-                ]
-                tpl_entry = {
-                    "template": {
-                        "id": tpl.id,
-                        "name": tpl.name,
-                        "slug": tpl.slug,
-                        "subject_mode": tpl.subject_mode,
-                    },
-                    "schema_fields": schema_fields,
-                    "summary": {
-                        "total_reflections": 0,
-                        "flag_counts": {
-                            k: {"yes": 0, "no": 0, "total": 0} for k in flag_keys
-                        },
-                    },
-                    "rating_series": defaultdict(list),
-                    "reflections": [],
-                }
-                by_template[tpl.id] = tpl_entry
-            tpl_entry["summary"]["total_reflections"] += 1
-            for fkey, counts in tpl_entry["summary"]["flag_counts"].items():
-                raw = (r.answers or {}).get(fkey)
-                if is_truthy_yes_no(raw):
-                    counts["yes"] += 1
-                    counts["total"] += 1
-                elif raw is not None and str(raw).lower() == "no":
-                    counts["no"] += 1
-                    counts["total"] += 1
-            for field in schema_fields:
-                if not isinstance(field, dict):
-                    continue
-                ftype = field.get("type")
-                if ftype not in ("single_rating", "rating_group"):
-                    if ftype in ("text", "textarea"):
-                        v = r.answers.get(field.get("key"))
-                        if isinstance(v, str) and v.strip():
-                            recent_texts.append({
-                                "reflection_id": r.id,
-                                "template_id": tpl.id,
-                                "template_name": tpl.name,
-                                "field_key": field.get("key"),
-                                "dashboard_role": field.get("dashboard_role"),
-                                "text": v.strip()[:1000],
-                                "date": r.period_end.isoformat(),
-                                "author_name": r.author.full_name if r.author else None,
-                                "team_visibility": r.team_visibility,
-                            })
-                    continue
-                ratings = _resolve_rating(field, r.answers)
-                scale = field.get("scale") or [1, 5]
-                try:
-                    scale_max = int(scale[-1])
-                except (IndexError, ValueError, TypeError):
-                    scale_max = 5
-                for label, value in ratings.items():
-                    tpl_entry["rating_series"][label].append({
-                        "date": r.period_end.isoformat(),
-                        "value": value,
-                        "reflection_id": r.id,
-                        "scale_max": scale_max,
-                        "team_visibility": r.team_visibility,
-                    })
-                    if value is not None:
-                        all_series[label].append(
-                            (r.period_end, value, r.id, scale_max, r.team_visibility),
-                        )
-            tpl_entry["reflections"].append({
-                "id": r.id,
-                "date": r.period_end.isoformat(),
-                "author_name": r.author.full_name if r.author else None,
-                "team_visibility": r.team_visibility,
-                "language": r.language,
-                "answers": r.answers or {},
-                "assignment_group": (
-                    {"id": r.assignment_group_id, "name": r.assignment_group.name}
-                    if r.assignment_group_id else None
-                ),
-            })
-
-        # Convert defaultdicts to lists for JSON serialization
-        templates_out = []
-        for entry in by_template.values():
-            series = []
-            for label, points in entry["rating_series"].items():
-                series.append({
-                    "label": label,
-                    "scale_max": (points[0]["scale_max"] if points else 5),
-                    "points": points,
-                })
-            entry["rating_series"] = series
-            templates_out.append(entry)
-
-        recent_texts.sort(key=lambda x: x["date"], reverse=True)
-        recent_texts = recent_texts[:RECENT_TEXT_LIMIT]
-
+        # An empty result is informative (subject not in a visible group), not a 403.
+        visible = _visible_subject_reflections(request.user, person_id, cur_start, cur_end)
+        by_template = _template_summaries(visible)
+        all_series, recent_texts = _collect_series_and_texts(visible, by_template)
         concerns = _detect_concerning_patterns(all_series, today)
 
+        page, next_cursor = _reflection_page(visible)
+        for row in page:
+            block = by_template.get(row["template_id"])
+            if block is not None:  # written between the two reads
+                block["reflections"].append(row)
+
         observations = _observations_for_viewer(
             viewer_person, subject, org, request.user,
             start=cur_start, end=cur_end,
@@ -636,7 +761,8 @@ class SubjectDetailView(APIView):
             },
             "subject_profile": _subject_profile(subject, org),
             "period": {"start": cur_start.isoformat(), "end": cur_end.isoformat()},
-            "templates": templates_out,
+            "templates": list(by_template.values()),
+            "reflections_next_cursor": next_cursor,
             "recent_texts": recent_texts,
             "concerning_patterns": concerns,
             # TODO(7_23): legacy "notes" key removed; observations is the Profile feed.
@@ -644,6 +770,40 @@ class SubjectDetailView(APIView):
         })
 
 
+class SubjectReflectionsView(APIView):
+    """Later pages of a subject's reflection rows (``reflections_next_cursor``)."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, person_id: int, *args, **kwargs):
+        ctx, err = _get_subject_dashboard_context(request, person_id)
+        if err is not None:
+            return err
+        assert ctx is not None
+
+        cursor = None
+        raw_cursor = request.query_params.get("cursor")
+        if raw_cursor:
+            cursor = _parse_reflection_cursor(raw_cursor)
+            if cursor is None:
+                return Response(
+                    {"detail": "Invalid 'cursor'; expected '<YYYY-MM-DD>:<reflection id>'."},
+                    status=400,
+                )
+        visible = _visible_subject_reflections(
+            request.user, person_id, ctx.cur_start, ctx.cur_end,
+        )
+        template_id = request.query_params.get("template")
+        if template_id and template_id.isdigit():
+            visible = visible.filter(template_id=int(template_id))
+        page, next_cursor = _reflection_page(visible, cursor=cursor)
+        return Response({
+            "period": {"start": ctx.cur_start.isoformat(), "end": ctx.cur_end.isoformat()},
+            "reflections": page,
+            "next_cursor": next_cursor,
+        })
+
+
 class SubjectEntriesExportView(APIView):
     """CSV export of all visible reflections + observations for one subject."""
 
@@ -655,9 +815,9 @@ class SubjectEntriesExportView(APIView):
             return err
         assert ctx is not None
 
-        refs = _reflections_for_subject(
+        refs = _visible_subject_reflections(
             request.user, person_id, ctx.cur_start, ctx.cur_end,
-        )
+        )[:MAX_REFLECTIONS_PER_SUBJECT]
         tz = get_org_timezone(ctx.org)
         range_start = datetime.combine(ctx.cur_start, time.min, tzinfo=tz)
         range_end = datetime.combine(ctx.cur_end, time.min, tzinfo=tz) + timedelta(days=1)
@@ -670,22 +830,21 @@ class SubjectEntriesExportView(APIView):
             )
             .select_related("author")
         )
-        observations = list(
-            filter_observations_readable(
-                obs_base, ctx.viewer_person, ctx.org, request.user,
-            ).order_by("observed_at"),
-        )
+        observations = filter_observations_readable(
+            obs_base, ctx.viewer_person, ctx.org, request.user,
+        ).order_by("observed_at")
 
-        csv_text = _build_subject_entries_csv(
+        rows = _subject_entry_rows(
             subject_name=ctx.subject.full_name,
-            reflections=refs,
-            observations=observations,
+            reflections=refs.iterator(chunk_size=EXPORT_CHUNK_SIZE),
+            observations=observations.iterator(chunk_size=EXPORT_CHUNK_SIZE),
         )
         name_part = ctx.subject.full_name or ctx.subject.preferred_name or str(ctx.subject.id)
         slug = re.sub(r"[^\w\-]+", "_", name_part.strip()) or str(ctx.subject.id)
         filename = f"{slug}_entries_{ctx.cur_start}_{ctx.cur_end}.csv"
-        response = HttpResponse(csv_text, content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response = streaming_csv_response(
+            rows, header=SUBJECT_ENTRIES_CSV_HEADER, filename=filename, bom=True,
+        )
 
         audit.export(
             actor=request.user,
@@ -0,0 +1,214 @@
+"""Precompute role home dashboards into their cache keys.
+
+The Counselor, Unit Head, Camper Care and Leadership Team home payloads
+are built on demand and cached per ``(org, viewer, today)`` for
+``DASHBOARD_CACHE_TTL_SECONDS``. At the org's morning rollover
+(:func:`~bunk_logs.core.time_utils.get_today` flips) and through the
+evening submission peak, every staff member's first load used to pay the
+full cold build at the same moment.
+
+:func:`dispatch_warmup` (the ``dispatch_dashboard_warmup`` beat task, every
+minute) finds organizations whose local time sits inside a warm-up window
+-- the first ``DASHBOARD_WARMUP_WINDOW_MINUTES`` of the rollover hour or of
+each ``DASHBOARD_WARMUP_EVENING_HOURS`` hour -- and fans out
+``warm_dashboards`` tasks of at most ``DASHBOARD_WARMUP_CHUNK_SIZE``
+viewers each, capped at ``DASHBOARD_WARMUP_MAX_VIEWERS`` per org and role.
+
+Each viewer's payload is built by the real view (with ``nocache=1``), so
+warmed and on-demand payloads are identical and land in the same key.
+The entry is then held for ``DASHBOARD_WARMUP_TTL_SECONDS``; with the
+minute cadence that keeps keys hot through the window while bounding
+cross-viewer staleness to that TTL. Build times are reported per role.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+from rest_framework.test import force_authenticate
+
+from bunk_logs.api.camper_care.dashboard import CamperCareDashboardView
+from bunk_logs.api.camper_care.dashboard import _cache_key as camper_care_cache_key
+from bunk_logs.api.conditional import etag_cache_key
+from bunk_logs.api.counselor.common import dashboard_cache_key as counselor_cache_key
+from bunk_logs.api.counselor.dashboard import CounselorDashboardView
+from bunk_logs.api.leadership_team.dashboard import LeadershipTeamDashboardView
+from bunk_logs.api.leadership_team.dashboard import _cache_key as leadership_team_cache_key
+from bunk_logs.api.unit_head.dashboard import UnitHeadDashboardView
+from bunk_logs.api.unit_head.dashboard import _cache_key as unit_head_cache_key
+from bunk_logs.core.context import organization_context
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.time_utils import get_org_timezone
+from bunk_logs.core.time_utils import get_rollover_hour
+from bunk_logs.core.time_utils import get_today
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import date
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WarmableDashboard:
+    path: str
+    view_class: type
+    membership_roles: tuple[str, ...]
+    # ``(person_id, organization_id, today) -> cache key`` -- the view's own key.
+    cache_key: Callable[[int, int, date], str]
+
+
+def _keyword_key(func) -> Callable[[int, int, date], str]:
+    return lambda person_id, organization_id, today: func(
+        viewer_id=person_id, organization_id=organization_id, today=today,
+    )
+
+
+DASHBOARDS: dict[str, WarmableDashboard] = {
+    "counselor": WarmableDashboard(
+        "/api/v1/counselor/dashboard/",
+        CounselorDashboardView,
+        ("counselor", "junior_counselor"),
+        counselor_cache_key,
+    ),
+    "unit_head": WarmableDashboard(
+        "/api/v1/unit-head/dashboard/",
+        UnitHeadDashboardView,
+        ("unit_head",),
+        _keyword_key(unit_head_cache_key),
+    ),
+    "camper_care": WarmableDashboard(
+        "/api/v1/camper-care/dashboard/",
+        CamperCareDashboardView,
+        ("camper_care",),
+        _keyword_key(camper_care_cache_key),
+    ),
+    "leadership_team": WarmableDashboard(
+        "/api/v1/leadership-team/dashboard/",
+        LeadershipTeamDashboardView,
+        ("leadership_team",),
+        _keyword_key(leadership_team_cache_key),
+    ),
+}
+
+
+def in_warmup_window(org: Organization, *, now=None) -> bool:
+    """Whether ``org``'s local time is inside a rollover / evening warm-up window."""
+    local = (now or timezone.now()).astimezone(get_org_timezone(org))
+    hours = {get_rollover_hour(org), *settings.DASHBOARD_WARMUP_EVENING_HOURS}
+    return local.hour in hours and local.minute < settings.DASHBOARD_WARMUP_WINDOW_MINUTES
+
+
+def active_viewers(org: Organization, role: str) -> list[tuple[int, int]]:
+    """``(user_id, person_id)`` of recently active viewers of ``role``'s dashboard.
+
+    "Active" is an active Membership with one of the role's membership
+    roles plus a login within ``DASHBOARD_WARMUP_ACTIVE_DAYS`` -- staff who
+    never open the app are not worth a build.
+    """
+    since = timezone.now() - timedelta(days=settings.DASHBOARD_WARMUP_ACTIVE_DAYS)
+    person_ids = Membership.all_objects.filter(
+        program__organization=org,
+        program__is_active=True,
+        role__in=DASHBOARDS[role].membership_roles,
+        is_active=True,
+    ).values("person_id")
+    return list(
+        Person.all_objects.filter(
+            organization=org,
+            user__last_login__gte=since,
+            id__in=person_ids,
+            user__is_active=True,
+        )
+        .order_by("id")
+        .values_list("user_id", "id")[: settings.DASHBOARD_WARMUP_MAX_VIEWERS],
+    )
+
+
+def warm_viewer(org: Organization, role: str, user, person_id: int) -> float | None:
+    """Build one viewer's dashboard into its cache key; seconds taken, or ``None`` on failure."""
+    dashboard = DASHBOARDS[role]
+    request = APIRequestFactory().get(dashboard.path, {"nocache": "1"})
+    force_authenticate(request, user=user)
+    request.organization = org
+    started = time.monotonic()
+    with organization_context(org):
+        response = dashboard.view_class.as_view()(request)
+    elapsed = time.monotonic() - started
+    if response.status_code != status.HTTP_200_OK:
+        logger.info(
+            "dashboard warm-up: %s for user %s returned %s", role, user.pk, response.status_code,
+        )
+        return None
+    ttl = settings.DASHBOARD_WARMUP_TTL_SECONDS
+    if ttl:
+        key = dashboard.cache_key(person_id, org.id, get_today(org))
+        cache.touch(key, ttl)
+        cache.touch(etag_cache_key(key), ttl)
+    return elapsed
+
+
+def warm_viewers(org: Organization, role: str, viewers: list[tuple[int, int]]) -> dict:
+    """Warm ``viewers`` for ``role``; returns ``{role, warmed, failed, total_ms, max_ms}``."""
+    users = get_user_model().objects.in_bulk([user_id for user_id, _ in viewers])
+    timings: list[float] = []
+    failed = 0
+    for user_id, person_id in viewers:
+        user = users.get(user_id)
+        elapsed = warm_viewer(org, role, user, person_id) if user is not None else None
+        if elapsed is None:
+            failed += 1
+        else:
+            timings.append(elapsed)
+    report = {
+        "role": role,
+        "warmed": len(timings),
+        "failed": failed,
+        "total_ms": round(sum(timings) * 1000),
+        "max_ms": round(max(timings, default=0) * 1000),
+    }
+    logger.info("dashboard warm-up: org=%s %s", org.slug, report)
+    return report
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def warm_chunk(organization_id: str, role: str, viewers: list[list[int]]) -> dict:
+    """Body of the ``warm_dashboards`` task: one chunk of ``[user_id, person_id]``."""
+    org = Organization.objects.filter(pk=organization_id).first()
+    if org is None:
+        return {"role": role, "warmed": 0, "failed": len(viewers), "total_ms": 0, "max_ms": 0}
+    return warm_viewers(org, role, [tuple(v) for v in viewers])
+
+
+def dispatch_warmup(*, force: bool = False) -> dict:
+    """Fan out ``warm_dashboards`` chunks for orgs inside a warm-up window."""
+    from bunk_logs.core.tasks import warm_dashboards
+
+    queued = []
+    chunk_size = settings.DASHBOARD_WARMUP_CHUNK_SIZE
+    for org in Organization.objects.filter(is_active=True):
+        if not force and not in_warmup_window(org):
+            continue
+        for role in DASHBOARDS:
+            viewers = active_viewers(org, role)
+            for chunk in _chunks(viewers, chunk_size):
+                warm_dashboards.delay(str(org.pk), role, [list(v) for v in chunk])
+            if viewers:
+                queued.append({"organization": org.slug, "role": role, "viewers": len(viewers)})
+    return {"queued": queued}
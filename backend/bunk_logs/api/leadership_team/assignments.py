@@ -61,23 +61,6 @@ __all__ = ["resolve_members"]
 # ---------------------------------------------------------------------------
 
 
-def _reflection_count_for(assignment: TemplateAssignment) -> int:
-    """Reflections submitted under this assignment's template/program window."""
-    qs = Reflection.all_objects.filter(
-        template_id=assignment.template_id,
-        program_id=assignment.program_id,
-        period_start__gte=assignment.start_date,
-    )
-    if assignment.end_date:
-        qs = qs.filter(period_end__lte=assignment.end_date)
-    if (
-        assignment.target_type == TemplateAssignment.TargetType.ASSIGNMENT_GROUP
-        and assignment.assignment_group_id
-    ):
-        qs = qs.filter(assignment_group_id=assignment.assignment_group_id)
-    return qs.count()
-
-
 def _serialize(
     assignment: TemplateAssignment,
     *,
@@ -125,6 +108,7 @@ def _serialize(
     }
     if reflection_count is not None:
         data["reflection_count"] = reflection_count
+        data["expected_count"] = assignment.expected_count
     return data
 
 
@@ -308,14 +292,12 @@ class LeadershipTeamAssignmentListCreateView(APIView):
         template_id = (request.query_params.get("template") or "").strip()
         if template_id.isdigit():
             qs = qs.filter(template_id=int(template_id))
-        assignments = list(qs[:200])
-        reflection_counts = {
-            a.pk: _reflection_count_for(a) for a in assignments
-        }
+        # Counts come from the counters ``core.assignment_audience`` keeps
+        # on each row, not a COUNT per assignment.
         return Response({
             "assignments": [
-                _serialize(a, reflection_count=reflection_counts.get(a.pk, 0))
-                for a in assignments
+                _serialize(a, reflection_count=a.submitted_count)
+                for a in qs[:200]
             ],
         })
 
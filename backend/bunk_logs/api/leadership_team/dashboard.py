@@ -13,14 +13,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from django.core.cache import cache
-
 if TYPE_CHECKING:
     from datetime import date
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bunk_logs.api.conditional import cache_payload
+from bunk_logs.api.conditional import cached_payload
+from bunk_logs.api.conditional import conditional_response
 from bunk_logs.api.counselor.common import camper_reflection_template
 from bunk_logs.api.counselor.common import is_day_off_answer
 from bunk_logs.api.counselor.common import latest_self_reflection
@@ -64,9 +64,9 @@ class LeadershipTeamDashboardView(APIView):
         bypass = (request.query_params.get("nocache") or "").lower() in {"1", "true"}
         cache_key = _cache_key(viewer_id=viewer.id, organization_id=org.id, today=today)
         if not bypass:
-            cached = cache.get(cache_key)
+            cached, etag = cached_payload(cache_key)
             if cached is not None:
-                return Response(cached)
+                return conditional_response(request, cached, etag=etag)
 
         teams_payload = _build_team_cards(ctx)
         bunks_units = _build_bunks_units_summary(ctx)
@@ -80,8 +80,8 @@ class LeadershipTeamDashboardView(APIView):
             "self_reflection": self_section,
             "templates_and_assignments": templates_summary,
         }
-        cache.set(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
-        return Response(payload)
+        etag = cache_payload(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
+        return conditional_response(request, payload, etag=etag)
 
 
 # ---------------------------------------------------------------------------
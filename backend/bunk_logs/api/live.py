@@ -0,0 +1,172 @@
+"""Live dashboard invalidation stream (Server-Sent Events).
+
+Two endpoints replace the SPA's fixed-interval dashboard polling:
+
+- ``POST /api/v1/live/ticket/`` -- authenticated like any other API call;
+  returns a short-lived signed ticket that pins the viewer's organization,
+  active programs and (for counselors) author groups.
+- ``GET /api/v1/live/events/?ticket=<>`` -- an ``EventSource`` stream of
+  ``invalidate`` events relayed from the organization's Redis channel (see
+  :mod:`bunk_logs.core.live_events`), filtered to the ticket's scope. The
+  client refetches its dashboard on each event.
+
+``EventSource`` cannot send an ``Authorization`` header, hence the ticket;
+resolving the scope up front also keeps the stream itself free of database
+work. The stream is an async view and only runs under the ASGI app
+(``config.asgi``, uvicorn workers): on the sync gunicorn workers it answers
+503 rather than pinning a worker per open tab.
+
+Reconnect contract. Tickets are checked only when a stream opens, and they
+expire after ``LIVE_TICKET_MAX_AGE_SECONDS``, long before a stream ends
+after ``LIVE_STREAM_MAX_SECONDS``. An ``EventSource`` reconnecting with
+the same URL would therefore be refused. So the stream's last message is
+a ``reauth`` event::
+
+    event: reauth
+    data: {"reason": "stream_expired"}
+
+On ``reauth`` the client must ``close()`` its ``EventSource``, ``POST`` for
+a fresh ticket (which also re-checks the viewer's memberships) and open a
+new stream. It should do the same on an ``error`` that leaves the source
+``CLOSED`` -- that is how a refused (403) reconnect after a dropped
+connection surfaces. The ``retry:`` sent first only paces reconnects
+after a network drop.
+
+Deployment: ``render.yaml`` still starts only ``config.wsgi`` on gunicorn
+sync workers, so on Render the stream answers 503 until a uvicorn service
+for ``config.asgi`` is added (see that module) and the SPA's stream URL
+points at it; until then dashboards keep polling and ``LIVE_EVENTS_ENABLED``
+stays off.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+import redis.asyncio as aioredis
+from django.conf import settings
+from django.core import signing
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from bunk_logs.core.live_events import channel_for
+from bunk_logs.core.models import Membership
+from bunk_logs.core.program_scope import operational_author_groups_qs
+
+from .counselor.common import COUNSELOR_ROLES
+from .counselor.common import viewer_or_403
+
+TICKET_SALT = "bunk_logs.api.live.ticket"
+REAUTH_EVENT = {"reason": "stream_expired"}
+
+
+class LiveTicketView(APIView):
+    """Issue a signed ticket for opening the live event stream."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        ctx = viewer_or_403(request)
+        memberships = list(
+            Membership.all_objects.filter(
+                person=ctx.person,
+                program__organization=ctx.organization,
+                is_active=True,
+            ).values_list("program_id", "role"),
+        )
+        # Counselors only hear about their own groups; every other role's
+        # dashboards span the program, so they get program-wide events.
+        group_ids = None
+        if memberships and {role for _, role in memberships} <= COUNSELOR_ROLES:
+            group_ids = sorted(
+                set(
+                    operational_author_groups_qs(ctx.person, today=ctx.today).values_list(
+                        "group_id", flat=True,
+                    ),
+                ),
+            )
+        scope = {
+            "org": str(ctx.organization.id),
+            "programs": sorted({program_id for program_id, _ in memberships}),
+            "groups": group_ids,
+        }
+        return Response(
+            {
+                "ticket": signing.dumps(scope, salt=TICKET_SALT),
+                "expires_in": settings.LIVE_TICKET_MAX_AGE_SECONDS,
+            },
+        )
+
+
+def event_is_relevant(event: dict, scope: dict) -> bool:
+    """Whether ``event`` could change a dashboard the ticket holder sees."""
+    if event.get("program_id") not in scope["programs"]:
+        return False
+    groups = scope["groups"]
+    event_groups = event.get("group_ids") or []
+    if groups is None or not event_groups:
+        return True
+    return bool(set(event_groups) & set(groups))
+
+
+# ATOMIC_REQUESTS cannot wrap an async view (Django raises on every request);
+# the stream does no database work anyway.
+@transaction.non_atomic_requests
+async def live_events_view(request):
+    """``GET /api/v1/live/events/?ticket=<>`` -- see the module docstring."""
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(
+            "The live event stream is served by the ASGI app.",
+            status=503,
+            content_type="text/plain",
+        )
+    try:
+        scope = signing.loads(
+            request.GET.get("ticket", ""),
+            salt=TICKET_SALT,
+            max_age=settings.LIVE_TICKET_MAX_AGE_SECONDS,
+        )
+    except signing.BadSignature:
+        return HttpResponse("Invalid or expired ticket.", status=403, content_type="text/plain")
+
+    response = StreamingHttpResponse(_event_stream(scope), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx-style proxies from buffering the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def _event_stream(scope: dict):
+    # ``get_message(timeout=...)`` below overrides the short socket timeout
+    # for the idle wait between events.
+    client = aioredis.Redis.from_url(settings.REDIS_URL, **settings.LIVE_REDIS_OPTIONS)
+    pubsub = client.pubsub()
+    await pubsub.subscribe(channel_for(scope["org"]))
+    deadline = time.monotonic() + settings.LIVE_STREAM_MAX_SECONDS
+    try:
+        yield "retry: 5000\n\n"
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=settings.LIVE_HEARTBEAT_SECONDS,
+            )
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+            event = json.loads(message["data"])
+            if event_is_relevant(event, scope):
+                yield f"event: invalidate\ndata: {json.dumps(event)}\n\n"
+        # The ticket has long expired; tell the client to fetch a new one
+        # rather than let EventSource reconnect into a 403.
+        yield f"event: reauth\ndata: {json.dumps(REAUTH_EVENT)}\n\n"
+    finally:
+        # Also runs when the client disconnects and the generator is closed.
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
+        await client.aclose()
@@ -41,7 +41,7 @@ from bunk_logs.core.permissions.observation_authoring import recipients_clearing
 from bunk_logs.core.permissions.observation_read import filter_observations_readable
 from bunk_logs.core.permissions.subject_dashboard import _has_org_admin_membership
 from bunk_logs.core.permissions.super_admin import is_super_admin
-from bunk_logs.core.person_search import filter_persons_by_name_query
+from bunk_logs.core.person_search import rank_persons_by_name
 from bunk_logs.core.submission import idempotent_create
 from bunk_logs.notes.models import Observation
 from bunk_logs.notes.models import ObservationArchive
@@ -487,6 +487,5 @@ class ObservationSubjectsView(APIView):
             base = observation_authorable_subject_queryset(
                 ctx.person, ctx.organization,
             ).exclude(id=ctx.person.id)
-        base = filter_persons_by_name_query(base, q)
-        persons = list(base.order_by("last_name", "first_name")[:limit])
+        persons = list(rank_persons_by_name(base, q)[:limit])
         return Response({"subjects": [{"id": p.id, "full_name": p.full_name} for p in persons]})
@@ -10,12 +10,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from django.db import transaction
 from rest_framework import permissions
 from rest_framework import status as http_status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bunk_logs.core import audit as audit_module
 from bunk_logs.core.identity import person_for_user
 from bunk_logs.core.models import MaintenanceTicket
 from bunk_logs.core.models import Membership
@@ -391,32 +391,37 @@ def _do_bulk_transition(request, *, model, fulfilling_role: str) -> Response:
     failed: list[dict] = []
     transitioned: list[dict] = []
     activity_by_id: dict[str, list[dict]] = {}
-    for instance in instances:
-        if not _can_transition(
-            request, content=instance, fulfilling_role=fulfilling_role,
-        ):
-            failed.append(
-                {"id": str(instance.id), "error": "permission_denied"},
-            )
-            continue
-        actor = _actor_membership_for(request, content=instance)
-        if actor is None and not is_super_admin(request.user):
-            failed.append(
-                {"id": str(instance.id), "error": "no_membership"},
-            )
-            continue
-        try:
-            with transaction.atomic():
-                instance.transition_to(
-                    to_state, actor=actor, note=note, reason=reason,
+    # Each inner ``buffered()`` is the per-item transaction / savepoint, so a
+    # failed transition drops its own audit rows with it. The outer block
+    # opens no transaction, so row locks go as each item commits; only when
+    # the request is already atomic does it batch the rows into one INSERT.
+    with audit_module.buffered(atomic=False):
+        for instance in instances:
+            if not _can_transition(
+                request, content=instance, fulfilling_role=fulfilling_role,
+            ):
+                failed.append(
+                    {"id": str(instance.id), "error": "permission_denied"},
                 )
-        except OrderStateMachineError as exc:
-            failed.append({"id": str(instance.id), "error": str(exc)})
-            continue
-        transitioned.append(_content_payload(instance))
-        activity_by_id[str(instance.id)] = _activity_payload(
-            _activity_for(instance),
-        )
+                continue
+            actor = _actor_membership_for(request, content=instance)
+            if actor is None and not is_super_admin(request.user):
+                failed.append(
+                    {"id": str(instance.id), "error": "no_membership"},
+                )
+                continue
+            try:
+                with audit_module.buffered():
+                    instance.transition_to(
+                        to_state, actor=actor, note=note, reason=reason,
+                    )
+            except OrderStateMachineError as exc:
+                failed.append({"id": str(instance.id), "error": str(exc)})
+                continue
+            transitioned.append(_content_payload(instance))
+            activity_by_id[str(instance.id)] = _activity_payload(
+                _activity_for(instance),
+            )
 
     payload = {
         "transitioned": transitioned,
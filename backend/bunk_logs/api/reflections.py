@@ -39,6 +39,8 @@ from bunk_logs.core.program_scope import operational_assignment_groups_qs
 from bunk_logs.core.program_scope import operational_author_groups_qs
 from bunk_logs.core.program_scope import operational_memberships_qs
 from bunk_logs.core.reflection_threads import materialize_threads_and_shares
+from bunk_logs.core.roster_snapshot import roster_snapshot
+from bunk_logs.core.template_view import template_view
 from bunk_logs.core.theme_tagging import enqueue_theme_tagging_for_reflection
 from bunk_logs.core.time_utils import get_today
 from bunk_logs.core.translation import enqueue_translation_for_reflection
@@ -131,40 +133,6 @@ def _validate_language_coverage(schema: dict, lang: str) -> None:
                 )
 
 
-def _localize_schema(schema: dict, lang: str) -> dict:
-    out: dict = {"fields": []}
-    for field in schema.get("fields") or []:
-        if not isinstance(field, dict):
-            continue
-        f = dict(field)
-        ftype = f.get("type")
-        if ftype == "rating_group":
-            sl = f.get("scale_labels") or {}
-            if lang in sl:
-                f["scale_labels"] = {lang: sl[lang]}
-            cats = []
-            for c in f.get("categories") or []:
-                if not isinstance(c, dict):
-                    cats.append(c)
-                    continue
-                nc = dict(c)
-                lbls = c.get("labels") or {}
-                if lang in lbls:
-                    nc["labels"] = {lang: lbls[lang]}
-                cats.append(nc)
-            f["categories"] = cats
-        elif ftype == "single_rating":
-            sl = f.get("scale_labels") or {}
-            if lang in sl:
-                f["scale_labels"] = {lang: sl[lang]}
-        else:
-            pr = f.get("prompts") or {}
-            if lang in pr:
-                f["prompts"] = {lang: pr[lang]}
-        out["fields"].append(f)
-    return out
-
-
 def _roster_roles_for_template(template: ReflectionTemplate) -> tuple[str, ...]:
     """Which ``AssignmentGroupMembership.role_in_group`` values may submit via a group."""
     if template.subject_mode == "self":
@@ -385,18 +353,15 @@ def _roster_subjects_data(
     return subjects_data
 
 
-def _subjects_by_group(group_ids: list[int]) -> dict[int, list[Person]]:
-    subject_agms = list(
-        AssignmentGroupMembership.objects.filter(
-            group_id__in=group_ids,
-            role_in_group="subject",
-            is_active=True,
-        ).select_related("person"),
+def _subjects_by_group(groups: list[AssignmentGroup]) -> dict[int, list[Person]]:
+    ids_by_group = {g.id: roster_snapshot(g.program_id).subject_ids(g.id) for g in groups}
+    persons = Person.all_objects.in_bulk(
+        {pid for ids in ids_by_group.values() for pid in ids},
     )
-    subjects_by_group: dict[int, list[Person]] = {}
-    for sagm in subject_agms:
-        subjects_by_group.setdefault(sagm.group_id, []).append(sagm.person)
-    return subjects_by_group
+    return {
+        group_id: [persons[pid] for pid in ids if pid in persons]
+        for group_id, ids in ids_by_group.items()
+    }
 
 
 def _tasks_from_required_assignments(
@@ -488,7 +453,7 @@ def _tasks_from_required_assignments(
                 groups = _eligible_groups_for_assignment(assignment, author_agms)
                 if not groups:
                     continue
-                subjects_by_group = _subjects_by_group([g.id for g in groups])
+                subjects_by_group = _subjects_by_group(groups)
                 for group in groups:
                     subject_persons = subjects_by_group.get(group.id, [])
                     if not subject_persons:
@@ -671,7 +636,7 @@ class ReflectionSerializer(serializers.ModelSerializer):
         if template is None or not getattr(template, "schema", None):
             return None
         language = getattr(obj, "language", None) or "en"
-        return _localize_schema(template.schema, language)
+        return template_view(template).localized_schema(language)
     subject = serializers.PrimaryKeyRelatedField(
         queryset=Person.all_objects.all(),
         allow_null=True,
@@ -976,7 +941,7 @@ class ReflectionViewSet(viewsets.ModelViewSet):
             detail = getattr(e, "detail", str(e))
             return Response(detail, status=status.HTTP_400_BAD_REQUEST)
         payload = ReflectionTemplateSummarySerializer(tpl).data
-        payload["schema"] = _localize_schema(tpl.schema, language)
+        payload["schema"] = template_view(tpl).localized_schema(language)
         payload["language"] = language
         payload["program_slug"] = program.slug
         return Response(payload)
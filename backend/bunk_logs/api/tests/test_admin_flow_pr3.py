@@ -138,6 +138,25 @@ class TestAdminGlobalSearch:
         assert any(row["label"].startswith("Hermione") for row in people)
         assert people[0]["deep_link"] == f"/profile/{camper.id}"
 
+    def test_finds_people_by_campminder_id(self, api, org, program, admin_user):
+        with organization_context(org):
+            camper = Person.all_objects.create(
+                organization=org, first_name="Luna", last_name="Lovegood",
+                external_ids={"campminder_id": "20476515"},
+            )
+            bunk = AssignmentGroup.all_objects.create(
+                organization=org, program=program, name="Bunk B",
+                slug="pr3-bunk-b", group_type="bunk",
+            )
+            AssignmentGroupMembership.all_objects.create(
+                group=bunk, person=camper, role_in_group="subject", is_active=True,
+            )
+        api.force_authenticate(user=admin_user)
+        with organization_context(org):
+            r = api.get(f"{self.URL}?q=20476515", **_hdr(org.slug))
+        assert r.status_code == 200, r.content
+        assert [row["id"] for row in r.json()["groups"]["people"]] == [camper.id]
+
     def test_does_not_leak_cross_org(
         self, api, org, other_org, admin_user, other_program,
     ):
@@ -206,6 +225,62 @@ class TestAdminGlobalSearch:
         assert "reflections" not in r.json()["groups"]
 
 
+class TestAdminSearchAutocomplete:
+    URL = "/api/v1/admin/search/autocomplete/"
+
+    def _camper(self, org, bunk, first, last):
+        person = Person.all_objects.create(organization=org, first_name=first, last_name=last)
+        AssignmentGroupMembership.all_objects.create(
+            group=bunk, person=person, role_in_group="subject", is_active=True,
+        )
+        return person
+
+    def test_prefix_matches_rank_first(self, api, org, program, admin_user):
+        bunk = AssignmentGroup.all_objects.create(
+            organization=org, program=program, name="Samaritans",
+            slug="pr3-ac-samaritans", group_type="bunk",
+        )
+        infix = self._camper(org, bunk, "Rosamund", "Pike")
+        prefix = self._camper(org, bunk, "Samuel", "Beckett")
+        api.force_authenticate(user=admin_user)
+        with organization_context(org):
+            r = api.get(f"{self.URL}?q=sam", **_hdr(org.slug))
+        assert r.status_code == 200, r.content
+        ids = [row["id"] for row in r.json()["people"]]
+        assert ids == [prefix.id, infix.id]
+        assert [row["label"] for row in r.json()["bunks"]] == ["Samaritans"]
+
+    def test_counselor_sees_only_own_bunks_and_campers(
+        self, api, org, program, non_admin_user,
+    ):
+        counselor = Person.all_objects.get(user=non_admin_user)
+        mine = AssignmentGroup.all_objects.create(
+            organization=org, program=program, name="Oak Cabin",
+            slug="pr3-ac-oak", group_type="bunk",
+        )
+        other = AssignmentGroup.all_objects.create(
+            organization=org, program=program, name="Oak Lodge",
+            slug="pr3-ac-oak-lodge", group_type="bunk",
+        )
+        AssignmentGroupMembership.all_objects.create(
+            group=mine, person=counselor, role_in_group="author", is_active=True,
+        )
+        self._camper(org, mine, "Olive", "Oakley")
+        self._camper(org, other, "Oscar", "Oakes")
+        api.force_authenticate(user=non_admin_user)
+        with organization_context(org):
+            r = api.get(f"{self.URL}?q=oak", **_hdr(org.slug))
+        assert r.status_code == 200, r.content
+        assert [row["label"] for row in r.json()["people"]] == ["Olive Oakley"]
+        assert [row["label"] for row in r.json()["bunks"]] == ["Oak Cabin"]
+
+    def test_short_query_rejected(self, api, org, admin_user):
+        api.force_authenticate(user=admin_user)
+        with organization_context(org):
+            r = api.get(f"{self.URL}?q=s", **_hdr(org.slug))
+        assert r.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # Templates oversight
 # ---------------------------------------------------------------------------
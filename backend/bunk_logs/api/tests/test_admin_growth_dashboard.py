@@ -407,7 +407,7 @@ class TestAdminGrowthExport:
 
         assert resp.status_code == 200
         assert resp["Content-Type"] == "text/csv"
-        body = resp.content.decode()
+        body = resp.getvalue().decode()
         lines = body.strip().splitlines()
         assert lines[0] == (
             "grade_level,member_count,reflection_count,"
@@ -186,3 +186,32 @@ class TestAdminPeopleDedupe:
             applied = api.post(self.APPLY_URL, payload, format="json", **_hdr(org.slug))
         assert applied.status_code == 200, applied.content
         assert not Person.all_objects.filter(pk=person.id).exists()
+
+
+class TestAdminPeopleDuplicates:
+    URL = "/api/v1/admin/people/duplicates/"
+
+    def test_non_admin_blocked(self, api, org, non_admin_user):
+        api.force_authenticate(user=non_admin_user)
+        with organization_context(org):
+            response = api.get(self.URL, **_hdr(org.slug))
+        assert response.status_code == 403
+
+    def test_lists_paginated_pairs(self, api, org, admin_user):
+        for _ in range(2):
+            Person.all_objects.create(organization=org, first_name="Rina", last_name="Gold")
+            Person.all_objects.create(organization=org, first_name="Eli", last_name="Roth")
+        api.force_authenticate(user=admin_user)
+
+        with organization_context(org):
+            first = api.get(self.URL, {"page_size": 1}, **_hdr(org.slug))
+            second = api.get(self.URL, {"page_size": 1, "offset": 1}, **_hdr(org.slug))
+
+        assert first.status_code == 200
+        body = first.json()
+        assert body["count"] == 2
+        assert len(body["results"]) == 1
+        pair = body["results"][0]
+        assert pair["person"]["last_name"] == pair["other_person"]["last_name"]
+        assert "same_name" in pair["reasons"]
+        assert second.json()["results"][0]["person"]["last_name"] != pair["person"]["last_name"]
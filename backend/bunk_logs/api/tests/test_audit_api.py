@@ -300,6 +300,26 @@ class TestAuditAdminOverrides:
         assert r.status_code == 200
         assert r.json() == []
 
+    def test_until_excludes_later_events(
+        self, api, org, order, admin_user, admin_membership,
+    ):
+        with organization_context(org):
+            audit_module.override_close(
+                admin_membership, order, reason="duplicate ticket",
+            )
+        api.force_authenticate(user=admin_user)
+        past = (timezone.now() - timedelta(days=2)).date().isoformat()
+        today = timezone.localdate().isoformat()
+        with organization_context(org):
+            before = api.get(
+                "/api/v1/audit/admin-overrides/", {"until": past}, **_hdr(org.slug),
+            )
+            through_today = api.get(
+                "/api/v1/audit/admin-overrides/", {"until": today}, **_hdr(org.slug),
+            )
+        assert before.json() == []
+        assert len(through_today.json()) == 1
+
     def test_invalid_since_returns_400(self, api, org, admin_user):
         api.force_authenticate(user=admin_user)
         with organization_context(org):
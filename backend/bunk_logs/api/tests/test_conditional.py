@@ -0,0 +1,48 @@
+"""Tests for the dashboard ETag helpers (``bunk_logs.api.conditional``)."""
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory
+
+from bunk_logs.api.conditional import cache_payload
+from bunk_logs.api.conditional import cached_payload
+from bunk_logs.api.conditional import etag_cache_key
+from bunk_logs.api.conditional import if_none_match
+from bunk_logs.api.conditional import payload_etag
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_payload_etag_is_stable_and_key_order_independent():
+    a = payload_etag({"b": [1, 2], "a": date(2026, 7, 1)})
+    b = payload_etag({"a": date(2026, 7, 1), "b": [1, 2]})
+    assert a == b
+    assert a != payload_etag({"a": date(2026, 7, 2), "b": [1, 2]})
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [(None, False), ('"x"', False), ('"abc"', True), ('W/"abc"', True), ('"x", "abc"', True), ("*", True)],
+)
+def test_if_none_match(header, expected):
+    extra = {"HTTP_IF_NONE_MATCH": header} if header else {}
+    request = APIRequestFactory().get("/", **extra)
+    assert if_none_match(request, '"abc"') is expected
+
+
+def test_cached_payload_round_trip_and_missing_etag():
+    assert cached_payload("k") == (None, None)
+
+    etag = cache_payload("k", {"n": 1}, 30)
+    assert cached_payload("k") == ({"n": 1}, etag)
+
+    cache.delete(etag_cache_key("k"))
+    assert cached_payload("k") == ({"n": 1}, etag)
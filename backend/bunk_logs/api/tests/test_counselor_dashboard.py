@@ -801,6 +801,38 @@ def test_dashboard_caches_response(
     assert fresh.data["sections"]["camper_reflections"]["covered"] == 1
 
 
+@pytest.mark.django_db
+def test_dashboard_conditional_get(org, counselor_user, counselor_person, django_assert_max_num_queries):
+    c = _client(counselor_user, org)
+    with organization_context(org):
+        first = c.get("/api/v1/counselor/dashboard/")
+    etag = first["ETag"]
+    assert etag.startswith('"')
+    assert "private" in first["Cache-Control"]
+    assert "no-cache" in first["Cache-Control"]
+
+    # Cache hit + matching validator -> 304, no body, no payload rebuild.
+    with organization_context(org), django_assert_max_num_queries(8):
+        not_modified = c.get("/api/v1/counselor/dashboard/", HTTP_IF_NONE_MATCH=etag)
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified["ETag"] == etag
+
+    # Rebuilt but unchanged payload -> still 304 (weak validators compare equal).
+    with organization_context(org):
+        rebuilt = c.get("/api/v1/counselor/dashboard/?nocache=1", HTTP_IF_NONE_MATCH=f"W/{etag}")
+    assert rebuilt.status_code == 304
+
+    # Payload changed -> new ETag and a full body.
+    counselor_person.preferred_name = "Mimi"
+    counselor_person.save(update_fields=["preferred_name"])
+    with organization_context(org):
+        changed = c.get("/api/v1/counselor/dashboard/?nocache=1", HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed["ETag"] != etag
+    assert changed.data["viewer"]["full_name"] == "Mimi Sandberg"
+
+
 # ---------------------------------------------------------------------------
 # Tenant isolation
 # ---------------------------------------------------------------------------
@@ -0,0 +1,230 @@
+"""Tests for ``GET /api/v1/counselor/sync/`` (counselor change feed)."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.test import APIClient
+
+from bunk_logs.core.change_feed import prune_tombstones
+from bunk_logs.core.context import organization_context
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import CamperDayState
+from bunk_logs.core.models import Flag
+from bunk_logs.core.models import MaintenanceTicket
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Order
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import ReflectionTemplate
+from bunk_logs.core.models import SyncTombstone
+
+User = get_user_model()
+
+URL = "/api/v1/counselor/sync/"
+
+
+@pytest.fixture(autouse=True)
+def _no_cursor_lag(settings):
+    settings.SYNC_CURSOR_LAG_SECONDS = 0
+
+
+@pytest.fixture
+def org(db):
+    return Organization.objects.create(name="Sync Camp", slug="sync-camp", settings={"rollover_hour": 0, "timezone": "UTC"})
+
+
+@pytest.fixture
+def program(org):
+    today = timezone.now().date()
+    return Program.all_objects.create(
+        organization=org,
+        name="Sync Camp Session",
+        slug="sync-session",
+        program_type="summer_camp",
+        start_date=today - timedelta(days=10),
+        end_date=today + timedelta(days=30),
+    )
+
+
+@pytest.fixture
+def counselor(org, program):
+    user = User.objects.create_user(email="counselor@sync.test", password="pw")
+    person = Person.all_objects.create(organization=org, first_name="Mira", last_name="Sandberg", user=user)
+    membership = Membership.all_objects.create(program=program, person=person, role="counselor", is_active=True)
+    return user, person, membership
+
+
+@pytest.fixture
+def bunk(org, program, counselor):
+    group = AssignmentGroup.objects.create(
+        organization=org, program=program, name="Bunk Birch", slug="bunk-birch", group_type="bunk", is_active=True,
+    )
+    AssignmentGroupMembership.objects.create(group=group, person=counselor[1], role_in_group="author", is_active=True)
+    return group
+
+
+@pytest.fixture
+def camper(org, bunk):
+    person = Person.all_objects.create(organization=org, first_name="Sarah", last_name="Levin")
+    AssignmentGroupMembership.objects.create(group=bunk, person=person, role_in_group="subject", is_active=True)
+    return person
+
+
+@pytest.fixture
+def other_camper(org):
+    return Person.all_objects.create(organization=org, first_name="Eli", last_name="Roth")
+
+
+@pytest.fixture
+def camper_template(org, program):
+    from bunk_logs.api.tests.conftest import make_active_assignment
+
+    template = ReflectionTemplate.all_objects.create(
+        organization=org,
+        name="Bunk Log",
+        slug="bunk-log-sync",
+        cadence="daily",
+        subject_mode="single_subject",
+        assignment_group_types=["bunk"],
+        schema={"fields": [{"key": "note", "type": "textarea", "required": False, "prompts": {"en": "Notes"}}]},
+        languages=["en"],
+        is_active=True,
+        program_type="summer_camp",
+        author_role_filter=["counselor"],
+    )
+    make_active_assignment(template=template, program=program, target_role="counselor")
+    return template
+
+
+def _sync(user, org, since=None):
+    c = APIClient()
+    c.force_authenticate(user=user)
+    c.credentials(HTTP_X_ORGANIZATION_SLUG=org.slug)
+    params = {"since": since} if since is not None else {}
+    with organization_context(org):
+        return c.get(URL, params)
+
+
+def _order(org, program, membership, **extra):
+    return Order.all_objects.create(
+        organization=org, program=program, submitted_by=membership, item="Toothbrush", status="new", **extra,
+    )
+
+
+@pytest.mark.django_db
+def test_missing_since_asks_for_reset_with_usable_cursor(org, counselor):
+    resp = _sync(counselor[0], org)
+    assert resp.status_code == 200
+    assert resp.data["reset"] is True
+    assert resp.data["orders"] == []
+    assert resp.data["cursor"].endswith("Z")
+    assert parse_datetime(resp.data["cursor"]) is not None
+
+
+@pytest.mark.django_db
+def test_invalid_since_is_rejected(org, counselor):
+    resp = _sync(counselor[0], org, since="yesterday")
+    assert resp.status_code == 400
+
+
+@pytest.mark.django_db
+def test_since_older_than_tombstone_retention_resets(org, counselor, settings):
+    settings.SYNC_TOMBSTONE_RETENTION_DAYS = 7
+    since = (timezone.now() - timedelta(days=8)).isoformat()
+    assert _sync(counselor[0], org, since=since).data["reset"] is True
+
+
+@pytest.mark.django_db
+def test_returns_visible_changes_since_cursor(org, program, counselor, bunk, camper, other_camper, camper_template):
+    user, person, membership = counselor
+    cursor = _sync(user, org).data["cursor"]
+
+    reflection = Reflection.all_objects.create(
+        organization=org, program=program, subject=camper, author=person, assignment_group=bunk,
+        template=camper_template, period_start=timezone.now().date(), period_end=timezone.now().date(),
+        answers={"note": "Good day"},
+    )
+    order = _order(org, program, membership, subject=camper)
+    ticket = MaintenanceTicket.all_objects.create(
+        organization=org, program=program, submitted_by=membership, location="Bunk Birch",
+        category=MaintenanceTicket.Category.LEAK, description="Drip",
+    )
+    state = CamperDayState.all_objects.create(organization=org, program=program, camper=camper, date=timezone.now().date(), is_off_camp=True)
+    flag = Flag.all_objects.create(organization=org, program=program, subject_camper=camper, raised_by_membership=membership)
+    # Outside the viewer's scope: a camper not on their bunks, another member's request.
+    CamperDayState.all_objects.create(organization=org, program=program, camper=other_camper, date=timezone.now().date(), is_off_camp=True)
+    other = Person.all_objects.create(organization=org, first_name="Jordan", last_name="Patel")
+    _order(org, program, Membership.all_objects.create(program=program, person=other, role="counselor", is_active=True))
+
+    resp = _sync(user, org, since=cursor)
+
+    assert resp.status_code == 200
+    data = resp.data
+    assert data["reset"] is False
+    assert [r["id"] for r in data["reflections"]] == [reflection.id]
+    assert [o["id"] for o in data["orders"]] == [str(order.id)]
+    assert data["orders"][0]["bunk_id"] == bunk.id
+    assert [t["id"] for t in data["maintenance_tickets"]] == [str(ticket.id)]
+    assert [s["id"] for s in data["camper_day_states"]] == [str(state.id)]
+    assert "reason" not in data["camper_day_states"][0]
+    assert [f["id"] for f in data["flags"]] == [str(flag.id)]
+    assert data["deleted"] == []
+
+    assert _sync(user, org, since=data["cursor"]).data["orders"] == []
+
+
+@pytest.mark.django_db
+def test_status_transition_reaches_the_feed(org, program, counselor):
+    user, _person, membership = counselor
+    order = _order(org, program, membership)
+    cursor = _sync(user, org).data["cursor"]
+
+    order.transition_to(Order.Status.IN_PROGRESS, actor=membership)
+
+    rows = _sync(user, org, since=cursor).data["orders"]
+    assert [(r["id"], r["status"]) for r in rows] == [(str(order.id), "in_progress")]
+
+
+@pytest.mark.django_db
+def test_deletions_are_reported_as_tombstones(org, program, counselor):
+    user, _person, membership = counselor
+    order = _order(org, program, membership)
+    order_id = str(order.id)
+    cursor = _sync(user, org).data["cursor"]
+
+    order.delete()
+
+    assert _sync(user, org, since=cursor).data["deleted"] == [{"type": "order", "id": order_id}]
+
+
+@pytest.mark.django_db
+def test_too_many_changes_resets(org, program, counselor, settings):
+    settings.SYNC_MAX_ROWS = 1
+    user, _person, membership = counselor
+    cursor = _sync(user, org).data["cursor"]
+    _order(org, program, membership)
+    _order(org, program, membership)
+
+    data = _sync(user, org, since=cursor).data
+    assert data["reset"] is True
+    assert data["orders"] == []
+
+
+@pytest.mark.django_db
+def test_prune_tombstones_drops_rows_past_retention(org, program, settings):
+    settings.SYNC_TOMBSTONE_RETENTION_DAYS = 7
+    old = SyncTombstone.all_objects.create(
+        organization=org, program=program, model="order", object_id="a", deleted_at=timezone.now() - timedelta(days=8),
+    )
+    fresh = SyncTombstone.all_objects.create(organization=org, program=program, model="order", object_id="b")
+
+    assert prune_tombstones()["deleted"] == 1
+    assert set(SyncTombstone.all_objects.values_list("pk", flat=True)) == {fresh.pk}
+    assert not SyncTombstone.all_objects.filter(pk=old.pk).exists()
@@ -0,0 +1,41 @@
+"""Tests for the shared streaming CSV writer (``bunk_logs.api.csv_stream``)."""
+from __future__ import annotations
+
+from operator import itemgetter
+
+from django.http import StreamingHttpResponse
+
+from bunk_logs.api.csv_stream import csv_lines
+from bunk_logs.api.csv_stream import merge_sorted
+from bunk_logs.api.csv_stream import streaming_csv_response
+
+
+def test_csv_lines_quotes_and_prefixes_bom():
+    lines = list(csv_lines([["a,b", 1]], header=["x", "y"], bom=True))
+    assert lines == ["\ufeff", "x,y\r\n", '"a,b",1\r\n']
+
+
+def test_streaming_response_pulls_rows_lazily():
+    pulled = []
+
+    def rows():
+        for i in range(3):
+            pulled.append(i)
+            yield [i]
+
+    resp = streaming_csv_response(rows(), header=["n"], filename="n.csv")
+    assert isinstance(resp, StreamingHttpResponse)
+    assert resp["Content-Disposition"] == 'attachment; filename="n.csv"'
+    assert pulled == []
+
+    body = iter(resp.streaming_content)
+    assert next(body) == b"n\r\n"
+    assert next(body) == b"0\r\n"
+    assert pulled == [0]
+
+
+def test_merge_sorted_prefers_earlier_stream_on_ties():
+    reflections = iter([(1, "r1"), (3, "r3")])
+    observations = iter([(1, "o1"), (2, "o2"), (4, "o4")])
+    merged = [label for _, label in merge_sorted(reflections, observations, key=itemgetter(0))]
+    assert merged == ["r1", "o1", "o2", "r3", "o4"]
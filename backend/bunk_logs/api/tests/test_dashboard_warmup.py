@@ -0,0 +1,131 @@
+"""Tests for role dashboard warm-up (``bunk_logs.api.dashboards.warmup``)."""
+from __future__ import annotations
+
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+from bunk_logs.api.counselor.common import dashboard_cache_key
+from bunk_logs.api.dashboards.warmup import active_viewers
+from bunk_logs.api.dashboards.warmup import dispatch_warmup
+from bunk_logs.api.dashboards.warmup import in_warmup_window
+from bunk_logs.api.dashboards.warmup import warm_viewers
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+from bunk_logs.core.time_utils import get_today
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def org(db):
+    return Organization.objects.create(name="WU Camp", slug="wu-camp", settings={"rollover_hour": 6, "timezone": "UTC"})
+
+
+@pytest.fixture
+def program(org):
+    return Program.all_objects.create(
+        organization=org,
+        name="WU Camp Summer 2026",
+        slug="wu-summer-2026",
+        program_type="summer_camp",
+        start_date=date(2026, 6, 1),
+        end_date=date(2026, 8, 31),
+    )
+
+
+def _staff(org, program, email, role, *, last_login):
+    user = User.objects.create_user(email=email, password="pw")
+    user.last_login = last_login
+    user.save(update_fields=["last_login"])
+    person = Person.all_objects.create(organization=org, first_name="Pat", last_name="Lee", user=user)
+    Membership.all_objects.create(program=program, person=person, role=role, is_active=True)
+    return user, person
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("hour", "minute", "expected"),
+    [(6, 0, True), (6, 14, True), (6, 15, False), (20, 5, True), (21, 10, True), (13, 0, False)],
+)
+def test_in_warmup_window(org, settings, hour, minute, expected):
+    settings.DASHBOARD_WARMUP_EVENING_HOURS = [20, 21]
+    settings.DASHBOARD_WARMUP_WINDOW_MINUTES = 15
+    now = datetime(2026, 7, 1, hour, minute, tzinfo=timezone.get_fixed_timezone(0))
+    assert in_warmup_window(org, now=now) is expected
+
+
+@pytest.mark.django_db
+def test_active_viewers_filters_role_and_recent_login(org, program):
+    recent = timezone.now() - timedelta(days=1)
+    user, person = _staff(org, program, "c1@wu.test", "counselor", last_login=recent)
+    _staff(org, program, "stale@wu.test", "counselor", last_login=timezone.now() - timedelta(days=30))
+    _staff(org, program, "uh@wu.test", "unit_head", last_login=recent)
+
+    assert active_viewers(org, "counselor") == [(user.id, person.id)]
+    assert len(active_viewers(org, "unit_head")) == 1
+    assert active_viewers(org, "camper_care") == []
+
+
+@pytest.mark.django_db
+def test_warm_viewers_populates_view_cache_key(org, program, settings):
+    settings.DASHBOARD_WARMUP_TTL_SECONDS = 90
+    user, person = _staff(org, program, "c1@wu.test", "counselor", last_login=timezone.now())
+    key = dashboard_cache_key(person.id, org.id, get_today(org))
+    assert cache.get(key) is None
+
+    report = warm_viewers(org, "counselor", [(user.id, person.id)])
+
+    assert report["role"] == "counselor"
+    assert report["warmed"] == 1
+    assert report["failed"] == 0
+    assert cache.get(key) is not None
+
+
+@pytest.mark.django_db
+def test_warm_viewers_counts_missing_users_as_failed(org, program):
+    report = warm_viewers(org, "counselor", [(999_999, 999_999)])
+    assert report["warmed"] == 0
+    assert report["failed"] == 1
+
+
+@pytest.mark.django_db
+def test_dispatch_warmup_chunks_viewers(org, program, settings):
+    settings.DASHBOARD_WARMUP_CHUNK_SIZE = 2
+    for i in range(3):
+        _staff(org, program, f"c{i}@wu.test", "counselor", last_login=timezone.now())
+
+    with patch("bunk_logs.core.tasks.warm_dashboards.delay") as delay:
+        result = dispatch_warmup(force=True)
+
+    assert delay.call_count == 2
+    sizes = sorted(len(c.args[2]) for c in delay.call_args_list)
+    assert sizes == [1, 2]
+    assert result["queued"] == [{"organization": "wu-camp", "role": "counselor", "viewers": 3}]
+
+
+@pytest.mark.django_db
+def test_dispatch_warmup_skips_orgs_outside_window(org, program):
+    _staff(org, program, "c1@wu.test", "counselor", last_login=timezone.now())
+    with (
+        patch("bunk_logs.api.dashboards.warmup.in_warmup_window", return_value=False),
+        patch("bunk_logs.core.tasks.warm_dashboards.delay") as delay,
+    ):
+        result = dispatch_warmup()
+    delay.assert_not_called()
+    assert result == {"queued": []}
@@ -10,6 +10,7 @@ import pytest
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 
+from bunk_logs.api.dashboards import subject as subject_dashboard
 from bunk_logs.core.models import AssignmentGroup
 from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import Membership
@@ -651,7 +652,7 @@ def test_subject_entries_export_csv(api_client, org, program, setup):
     assert r["Content-Type"] == "text/csv"
     assert "attachment" in r["Content-Disposition"]
     assert "Sarah_Levin" in r["Content-Disposition"]
-    text = r.content.decode("utf-8")
+    text = r.getvalue().decode("utf-8")
     assert "subject_name" in text
     assert "behavior" in text
     assert "participation" in text
@@ -697,7 +698,7 @@ def test_subject_entries_export_respects_date_range(api_client, org, program, se
         **_hdr(org.slug),
     )
     assert r.status_code == 200, r.content
-    text = r.content.decode("utf-8")
+    text = r.getvalue().decode("utf-8")
     assert "today only" in text
     assert "yesterday only" not in text
 
@@ -716,3 +717,55 @@ def test_subject_entries_export_forbidden_for_unauthorized_viewer(
         f"/api/v1/dashboards/subject/{camper.id}/export/", **_hdr(org.slug),
     )
     assert r.status_code == 403
+
+
+def test_reflection_rows_page_while_summary_counts_everything(
+    api_client, org, program, setup, monkeypatch,
+):
+    """Summaries aggregate the whole window; full rows come oldest-first in pages."""
+    monkeypatch.setattr(subject_dashboard, "REFLECTION_PAGE_SIZE", 2)
+    bunk, camper, counselor_user, counselor = setup
+    tpl = _bunk_pulse_with_flag_template(org)
+    today = date.today()
+    for i in range(5):
+        _make_reflection(
+            org, program, tpl, subject=camper, author=counselor, group=bunk,
+            day=today - timedelta(days=i),
+            answers={"overall": 4, "needs_followup": "Yes" if i % 2 else "no"},
+        )
+    api_client.force_authenticate(user=counselor_user)
+
+    body = api_client.get(
+        f"/api/v1/dashboards/subject/{camper.id}/", **_hdr(org.slug),
+    ).json()
+    block = body["templates"][0]
+    assert block["summary"]["total_reflections"] == 5
+    assert block["summary"]["flag_counts"]["needs_followup"] == {
+        "yes": 2, "no": 3, "total": 5,
+    }
+    assert len(next(s for s in block["rating_series"] if s["label"] == "overall")["points"]) == 5
+    assert [r["date"] for r in block["reflections"]] == [
+        (today - timedelta(days=4)).isoformat(), (today - timedelta(days=3)).isoformat(),
+    ]
+
+    dates = []
+    cursor = body["reflections_next_cursor"]
+    while cursor:
+        r = api_client.get(
+            f"/api/v1/dashboards/subject/{camper.id}/reflections/",
+            {"cursor": cursor}, **_hdr(org.slug),
+        )
+        assert r.status_code == 200, r.content
+        dates += [row["date"] for row in r.json()["reflections"]]
+        cursor = r.json()["next_cursor"]
+    assert dates == [(today - timedelta(days=i)).isoformat() for i in (2, 1, 0)]
+
+
+def test_reflections_page_rejects_bad_cursor(api_client, org, setup):
+    _, camper, counselor_user, _ = setup
+    api_client.force_authenticate(user=counselor_user)
+    r = api_client.get(
+        f"/api/v1/dashboards/subject/{camper.id}/reflections/",
+        {"cursor": "yesterday"}, **_hdr(org.slug),
+    )
+    assert r.status_code == 400
@@ -0,0 +1,210 @@
+"""Tests for the live dashboard invalidation channel.
+
+Covers publishing (``bunk_logs.core.live_events``) and the ticket / SSE
+endpoints (``bunk_logs.api.live``). Redis itself is not exercised.
+"""
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.test import AsyncRequestFactory
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from bunk_logs.api import live as live_api
+from bunk_logs.api.live import TICKET_SALT
+from bunk_logs.api.live import event_is_relevant
+from bunk_logs.api.live import live_events_view
+from bunk_logs.core import live_events
+from bunk_logs.core.context import organization_context
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import Flag
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Order
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+
+User = get_user_model()
+
+
+@pytest.fixture
+def org(db):
+    return Organization.objects.create(name="Live Camp", slug="live-camp", settings={"rollover_hour": 0, "timezone": "UTC"})
+
+
+@pytest.fixture
+def program(org):
+    today = timezone.now().date()
+    return Program.all_objects.create(
+        organization=org,
+        name="Live Camp Session",
+        slug="live-session",
+        program_type="summer_camp",
+        start_date=today - timedelta(days=10),
+        end_date=today + timedelta(days=30),
+    )
+
+
+@pytest.fixture
+def counselor(org, program):
+    user = User.objects.create_user(email="counselor@live.test", password="pw")
+    person = Person.all_objects.create(organization=org, first_name="Mira", last_name="Sandberg", user=user)
+    membership = Membership.all_objects.create(program=program, person=person, role="counselor", is_active=True)
+    return user, person, membership
+
+
+@pytest.fixture
+def bunk(org, program, counselor):
+    group = AssignmentGroup.objects.create(
+        organization=org, program=program, name="Bunk Birch", slug="bunk-birch", group_type="bunk", is_active=True,
+    )
+    AssignmentGroupMembership.objects.create(group=group, person=counselor[1], role_in_group="author", is_active=True)
+    return group
+
+
+@pytest.fixture
+def sent(settings, monkeypatch):
+    settings.LIVE_EVENTS_ENABLED = True
+    messages: list[tuple[str, dict]] = []
+    monkeypatch.setattr(live_events, "_send", lambda channel, message: messages.append((channel, json.loads(message))))
+    return messages
+
+
+@pytest.mark.django_db
+def test_order_save_publishes_after_commit(org, program, counselor, bunk, sent, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        Order.all_objects.create(
+            organization=org, program=program, submitted_by=counselor[2], submitted_from_bunk=bunk,
+            item="Toothbrush", status="new",
+        )
+    assert sent == []
+
+    for callback in callbacks:
+        callback()
+    assert (live_events.channel_for(org.id), {"kind": "order", "program_id": program.id, "group_ids": [bunk.id]}) in sent
+
+
+@pytest.mark.django_db
+def test_flag_publishes_program_wide_event(org, program, counselor, sent, django_capture_on_commit_callbacks):
+    camper = Person.all_objects.create(organization=org, first_name="Sarah", last_name="Levin")
+    with django_capture_on_commit_callbacks(execute=True):
+        Flag.all_objects.create(organization=org, program=program, subject_camper=camper, raised_by_membership=counselor[2])
+    assert [event for _, event in sent if event["kind"] == "flag"] == [
+        {"kind": "flag", "program_id": program.id, "group_ids": []},
+    ]
+
+
+@pytest.mark.django_db
+def test_nothing_published_when_disabled(org, program, counselor, sent, settings, django_capture_on_commit_callbacks):
+    settings.LIVE_EVENTS_ENABLED = False
+    with django_capture_on_commit_callbacks(execute=True):
+        Order.all_objects.create(organization=org, program=program, submitted_by=counselor[2], item="Soap", status="new")
+    assert sent == []
+
+
+def test_publisher_reuses_one_client_with_timeouts(settings, monkeypatch):
+    settings.LIVE_REDIS_OPTIONS = {"socket_connect_timeout": 1.0, "socket_timeout": 1.0}
+    calls = []
+    monkeypatch.setattr(live_events, "_client", None)
+    monkeypatch.setattr(
+        live_events.redis.Redis, "from_url", lambda url, **kwargs: calls.append(kwargs) or object(),
+    )
+
+    assert live_events._redis() is live_events._redis()
+    assert calls == [{"socket_connect_timeout": 1.0, "socket_timeout": 1.0}]
+
+
+@pytest.mark.parametrize(
+    ("event", "scope", "expected"),
+    [
+        ({"program_id": 1, "group_ids": [5]}, {"programs": [1], "groups": None}, True),
+        ({"program_id": 2, "group_ids": []}, {"programs": [1], "groups": None}, False),
+        ({"program_id": 1, "group_ids": []}, {"programs": [1], "groups": [5]}, True),
+        ({"program_id": 1, "group_ids": [5, 6]}, {"programs": [1], "groups": [5]}, True),
+        ({"program_id": 1, "group_ids": [6]}, {"programs": [1], "groups": [5]}, False),
+    ],
+)
+def test_event_is_relevant(event, scope, expected):
+    assert event_is_relevant(event, scope) is expected
+
+
+@pytest.mark.django_db
+def test_ticket_scopes_counselor_to_author_groups(org, program, counselor, bunk):
+    c = APIClient()
+    c.force_authenticate(user=counselor[0])
+    c.credentials(HTTP_X_ORGANIZATION_SLUG=org.slug)
+    with organization_context(org):
+        resp = c.post("/api/v1/live/ticket/")
+
+    assert resp.status_code == 200
+    scope = signing.loads(resp.data["ticket"], salt=TICKET_SALT)
+    assert scope == {"org": str(org.id), "programs": [program.id], "groups": [bunk.id]}
+
+
+@pytest.mark.django_db
+def test_stream_refuses_sync_workers(client):
+    assert client.get("/api/v1/live/events/", {"ticket": "x"}).status_code == 503
+
+
+def test_stream_rejects_bad_ticket():
+    request = AsyncRequestFactory().get("/api/v1/live/events/", {"ticket": "forged"})
+    assert async_to_sync(live_events_view)(request).status_code == 403
+
+
+def test_stream_opens_event_stream_for_valid_ticket():
+    ticket = signing.dumps({"org": "1", "programs": [1], "groups": None}, salt=TICKET_SALT)
+    request = AsyncRequestFactory().get("/api/v1/live/events/", {"ticket": ticket})
+    response = async_to_sync(live_events_view)(request)
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/event-stream"
+    assert response["Cache-Control"] == "no-cache"
+
+
+class _FakePubSub:
+    def __init__(self):
+        self.closed = False
+
+    async def subscribe(self, channel):
+        pass
+
+    async def get_message(self, **kwargs):
+        return None
+
+    async def unsubscribe(self):
+        pass
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.pubsub_instance = _FakePubSub()
+
+    def pubsub(self):
+        return self.pubsub_instance
+
+    async def aclose(self):
+        pass
+
+
+def test_stream_ends_with_reauth_event(settings, monkeypatch):
+    settings.LIVE_STREAM_MAX_SECONDS = 0
+    fake = _FakeRedis()
+    monkeypatch.setattr(live_api.aioredis.Redis, "from_url", lambda url, **kwargs: fake)
+
+    async def consume():
+        return [chunk async for chunk in live_api._event_stream({"org": "1", "programs": [1], "groups": None})]
+
+    chunks = async_to_sync(consume)()
+
+    assert chunks[0].startswith("retry: ")
+    assert chunks[-1] == 'event: reauth\ndata: {"reason": "stream_expired"}\n\n'
+    assert fake.pubsub_instance.closed
@@ -7,18 +7,23 @@ import hmac
 import json
 import uuid
 from datetime import date
+from io import StringIO
+from unittest.mock import patch
 
 import pytest
+from django.core.management import call_command
 from django.test import override_settings
 from rest_framework.test import APIClient
 
 from bunk_logs.core.context import organization_context
+from bunk_logs.core.models import InboundEmail
 from bunk_logs.core.models import MaintenanceTicket
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import OrderActivityEvent
 from bunk_logs.core.models import Organization
 from bunk_logs.core.models import Person
 from bunk_logs.core.models import Program
+from bunk_logs.core.tasks import process_inbound_emails
 
 pytestmark = pytest.mark.django_db
 
@@ -242,3 +247,65 @@ def test_closed_ticket_rejected(api_client, org, program):
         sender="facilities@camp.test",
     )
     assert resp.status_code == 400
+
+
+@override_settings(ANYMAIL={"MAILGUN_API_KEY": API_KEY}, MAILGUN_INBOUND_ASYNC=True)
+def test_async_ingest_acks_then_task_creates_note_once(
+    api_client, open_ticket, django_capture_on_commit_callbacks,
+):
+    recipient = f"ticket+{open_ticket.id}@reply.mail.test"
+    with patch("bunk_logs.core.tasks.process_inbound_emails.delay") as delay, \
+         django_capture_on_commit_callbacks(execute=True):
+        first = _post_payload(
+            api_client, recipient=recipient, body="Queued reply.", sender="facilities@camp.test",
+        )
+        retry = _post_payload(
+            api_client, recipient=recipient, body="Queued reply.", sender="facilities@camp.test",
+        )
+    assert (first.status_code, retry.status_code) == (200, 200)
+    assert InboundEmail.objects.count() == 1
+    assert not OrderActivityEvent.all_objects.filter(content_id=open_ticket.id).exists()
+    delay.assert_called_once()
+
+    row = InboundEmail.objects.get()
+    assert process_inbound_emails(*delay.call_args.args) == {
+        "processed": 1, "rejected": 0, "failed": 0,
+    }
+    row.refresh_from_db()
+    assert (row.status, row.ticket_id, row.attempts) == ("processed", open_ticket.id, 1)
+    assert OrderActivityEvent.all_objects.get(content_id=open_ticket.id).note == "Queued reply."
+    # Already processed: draining again is a no-op.
+    assert process_inbound_emails()["processed"] == 0
+
+
+@override_settings(ANYMAIL={"MAILGUN_API_KEY": API_KEY}, MAILGUN_INBOUND_ASYNC=True)
+def test_async_ingest_rejects_bad_signature_without_storing(api_client):
+    resp = api_client.post(URL, {"timestamp": "1", "token": "t", "signature": "bad"})
+    assert resp.status_code == 403
+    assert not InboundEmail.objects.exists()
+
+
+def test_replay_command_retries_failed_rows(open_ticket):
+    row = InboundEmail.objects.create(
+        dedup_key="token:replay",
+        token="replay",
+        status=InboundEmail.Status.FAILED,
+        payload={
+            "recipient": [f"ticket+{open_ticket.id}@reply.mail.test"],
+            "from": ["facilities@camp.test"],
+            "stripped-text": ["Replayed reply."],
+        },
+    )
+    unknown = InboundEmail.objects.create(
+        dedup_key="token:unknown",
+        status=InboundEmail.Status.FAILED,
+        payload={"recipient": ["nobody@reply.mail.test"]},
+    )
+
+    call_command("replay_inbound_emails", "--status", "failed", stdout=StringIO())
+
+    row.refresh_from_db()
+    unknown.refresh_from_db()
+    assert row.status == InboundEmail.Status.PROCESSED
+    assert (unknown.status, unknown.response_status) == (InboundEmail.Status.REJECTED, 406)
+    assert OrderActivityEvent.all_objects.get(content_id=open_ticket.id).note == "Replayed reply."
@@ -3,13 +3,16 @@
 Covers the S3-backed replacement for base64-in-HTML images:
   - the upload endpoint (happy path, auth required, rejects non-images)
   - serializer guards rejecting new inline base64 submissions
-  - the migrate_inline_images command extracting existing blobs
+  - the migrate_inline_images command extracting existing blobs (parallel
+    uploads, checkpoint/resume, failed uploads)
 """
 
 import base64
 import io
 from datetime import date
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
 from django.test import TestCase
@@ -19,6 +22,7 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from bunk_logs.bunklogs.models import StaffLog
+from bunk_logs.core.management.commands.migrate_inline_images import Command as MigrateInlineImages
 from bunk_logs.core.models import RichTextImage
 from bunk_logs.core.rich_text import contains_inline_base64_image
 from bunk_logs.core.rich_text import replace_inline_images
@@ -87,14 +91,15 @@ class TestReplaceInlineImages(TestCase):
 class TestMigrateInlineImagesCommand(TestCase):
     def setUp(self):
         self.user = UserFactory()
+        cache.clear()
 
-    def _make_log_with_inline_image(self):
+    def _make_log_with_inline_image(self, *, images=1, user=None):
         return StaffLog.objects.create(
-            staff_member=self.user,
+            staff_member=user or self.user,
             date=date.today(),
             day_quality_score=4,
             support_level_score=4,
-            elaboration=f'<p><img src="{_data_uri()}"></p>',
+            elaboration="".join(f'<p><img src="{_data_uri()}"></p>' for _ in range(images)),
             values_reflection="Plain text.",
         )
 
@@ -114,3 +119,63 @@ class TestMigrateInlineImagesCommand(TestCase):
         # Second run is a no-op (idempotent).
         call_command("migrate_inline_images", "--commit")
         assert RichTextImage.objects.count() == 1
+
+    def test_parallel_batches_rewrite_every_row(self):
+        logs = [self._make_log_with_inline_image(images=2, user=UserFactory()) for _ in range(3)]
+        out = io.StringIO()
+        call_command(
+            "migrate_inline_images", "--commit", "--workers", "3", "--batch-size", "2", stdout=out,
+        )
+        for log in logs:
+            log.refresh_from_db()
+            assert not contains_inline_base64_image(log.elaboration)
+            assert log.elaboration.count("<img") == 2
+        assert RichTextImage.objects.count() == 6
+        assert "6 image(s) across 3 row(s)" in out.getvalue()
+        assert "MB/s" in out.getvalue()
+
+    def test_resumes_after_checkpoint(self):
+        first = self._make_log_with_inline_image()
+        second = self._make_log_with_inline_image(user=UserFactory())
+        cache.set("migrate_inline_images:StaffLog:last_pk", first.pk)
+
+        call_command("migrate_inline_images", "--commit")
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert contains_inline_base64_image(first.elaboration)
+        assert not contains_inline_base64_image(second.elaboration)
+        # A clean finish clears the checkpoint, so the next run rescans.
+        assert cache.get("migrate_inline_images:StaffLog:last_pk") is None
+
+        cache.set("migrate_inline_images:StaffLog:last_pk", second.pk)
+        call_command("migrate_inline_images", "--commit", "--restart")
+        first.refresh_from_db()
+        assert not contains_inline_base64_image(first.elaboration)
+        assert RichTextImage.objects.count() == 2
+
+    def test_checkpoint_stops_before_failed_upload(self):
+        logs = [self._make_log_with_inline_image(user=UserFactory()) for _ in range(3)]
+        store = MigrateInlineImages._store
+        calls = []
+
+        def flaky_store(command, image, data):
+            calls.append(image)
+            if len(calls) == 2:
+                msg = "storage unavailable"
+                raise OSError(msg)
+            return store(command, image, data)
+
+        with patch.object(MigrateInlineImages, "_store", flaky_store):
+            call_command(
+                "migrate_inline_images", "--commit", "--workers", "1", "--batch-size", "1",
+                stdout=io.StringIO(),
+            )
+        for log in logs:
+            log.refresh_from_db()
+        assert [contains_inline_base64_image(log.elaboration) for log in logs] == [False, True, False]
+        # The next run resumes just before the failed row and retries it.
+        assert cache.get("migrate_inline_images:StaffLog:last_pk") == logs[0].pk
+        call_command("migrate_inline_images", "--commit", stdout=io.StringIO())
+        logs[1].refresh_from_db()
+        assert not contains_inline_base64_image(logs[1].elaboration)
+        assert cache.get("migrate_inline_images:StaffLog:last_pk") is None
@@ -886,7 +886,7 @@ class TestDirector:
         resp = _get(api, org, "/api/v1/admin/reflections/madrichim/export/")
         assert resp.status_code == 200
         assert resp["Content-Type"] == "text/csv"
-        text = resp.content.decode()
+        text = resp.getvalue().decode()
         assert "Name,Grade,Classroom" in text
         assert "Ari Rich,9,Tzedakah 101,complete" in text
 
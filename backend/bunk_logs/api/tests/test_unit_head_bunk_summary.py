@@ -0,0 +1,136 @@
+"""Tests for the set-based bunk summaries behind the UH / Camper Care dashboards."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from bunk_logs.api.unit_head.bunk_summary import build_bunk_summaries
+from bunk_logs.core.context import organization_context
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import CamperDayState
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import ReflectionTemplate
+
+pytestmark = pytest.mark.django_db
+
+DAY = date(2026, 7, 10)
+
+
+@pytest.fixture
+def org():
+    return Organization.objects.create(name="Summary Org", slug="summary-org")
+
+
+@pytest.fixture
+def program(org):
+    return Program.all_objects.create(
+        organization=org, name="Summary Org Summer", slug="summary-summer",
+        program_type="summer_camp",
+        start_date=date(2026, 6, 1), end_date=date(2026, 8, 31),
+    )
+
+
+@pytest.fixture
+def camper_template(org):
+    return ReflectionTemplate.all_objects.create(
+        organization=org, name="Camper Daily", slug="summary-camper-daily", cadence="daily",
+        schema={"fields": [{"key": "request_unit_head_help", "type": "yes_no"}]},
+    )
+
+
+@pytest.fixture
+def self_template(org):
+    return ReflectionTemplate.all_objects.create(
+        organization=org, name="Counselor Self", slug="summary-self", cadence="daily",
+        subject_mode="self", schema={"fields": []},
+    )
+
+
+def _person(org, first, last):
+    return Person.all_objects.create(organization=org, first_name=first, last_name=last)
+
+
+def _bunk(org, program, n, *, campers=2):
+    bunk = AssignmentGroup.all_objects.create(
+        organization=org, program=program, name=f"Bunk {n}", slug=f"summary-bunk-{n}",
+        group_type="bunk",
+    )
+    counselor = _person(org, "Coun", f"Selor{n}")
+    AssignmentGroupMembership.all_objects.create(
+        group=bunk, person=counselor, role_in_group="author", is_active=True,
+    )
+    camper_ids = []
+    for i in range(campers):
+        camper = _person(org, f"Camper{i}", f"Bunk{n}")
+        AssignmentGroupMembership.all_objects.create(
+            group=bunk, person=camper, role_in_group="subject", is_active=True,
+        )
+        camper_ids.append(camper.id)
+    return bunk, counselor, camper_ids
+
+
+def _reflect(org, program, template, *, subject, author, bunk=None, answers=None):
+    return Reflection.all_objects.create(
+        organization=org, program=program, template=template,
+        subject=subject, author=author, assignment_group=bunk,
+        period_start=DAY, period_end=DAY, answers=answers or {},
+    )
+
+
+def test_summary_fields(org, program, camper_template, self_template):
+    bunk, counselor, (first, second) = _bunk(org, program, 1)
+    other, _, _ = _bunk(org, program, 2)
+    CamperDayState.objects.create(
+        organization=org, program=program, camper_id=second, date=DAY, is_off_camp=True,
+    )
+    camper = Person.all_objects.get(id=first)
+    _reflect(
+        org, program, camper_template, subject=camper, author=counselor, bunk=bunk,
+        answers={"request_unit_head_help": "yes"},
+    )
+    _reflect(org, program, self_template, subject=counselor, author=counselor)
+    _reflect(
+        org, program, self_template, subject=counselor, author=counselor,
+        answers={"bunk_concerns_bunks": [other.id]},
+    )
+
+    with organization_context(org):
+        summaries = build_bunk_summaries(
+            organization=org, program=program, bunks=[bunk, other], target_date=DAY,
+            camper_template=camper_template, include_counselor_self=True,
+        )
+
+    s = summaries[bunk.id]
+    assert s.camper_ids == [first, second]
+    assert s.completion == {"submitted": 1, "expected": 1, "off_camp": 1}
+    assert s.help_requested_camper_ids == {first}
+    assert s.counselor_names == ["Coun S."]
+    assert s.counselor_self_reflections == {"submitted": 1, "expected": 1}
+    assert s.badges(low_completion_threshold=0.5, expected_by_passed=True) == [
+        "help_requested", "off_camp",
+    ]
+    assert summaries[other.id].has_bunk_concerns
+    assert summaries[other.id].completion == {"submitted": 0, "expected": 2, "off_camp": 0}
+
+
+def test_query_count_does_not_grow_with_bunks(
+    org, program, camper_template, django_assert_num_queries,
+):
+    few = [_bunk(org, program, n)[0] for n in range(2)]
+    many = few + [_bunk(org, program, n)[0] for n in range(2, 12)]
+
+    kwargs = {
+        "organization": org, "program": program, "target_date": DAY,
+        "camper_template": camper_template, "include_counselor_self": True,
+    }
+    with organization_context(org):
+        with django_assert_num_queries(5):
+            build_bunk_summaries(bunks=few, **kwargs)
+        with django_assert_num_queries(5):
+            build_bunk_summaries(bunks=many, **kwargs)
@@ -53,6 +53,7 @@ from bunk_logs.core.permissions.observation_read import filter_observations_read
 from bunk_logs.core.state_machine import OrderStateMachine
 from bunk_logs.core.time_utils import get_org_timezone
 from bunk_logs.notes.models import Observation
+from bunk_logs.utils.instrumentation import hot_path
 
 from .common import build_score_grid
 from .common import bunk_concerns_referencing
@@ -131,6 +132,7 @@ class UnitHeadBunkDashboardView(APIView):
 # ---------------------------------------------------------------------------
 
 
+@hot_path("dashboard.bunk")
 def build_bunk_dashboard_payload(
     *,
     request,
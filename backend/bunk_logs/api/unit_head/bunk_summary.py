@@ -0,0 +1,186 @@
+"""Set-based per-bunk day summaries for the Unit Head and Camper Care dashboards.
+
+Both dashboards render one card per bunk: completion against the on-camp
+roster, counselor names, and the attention badges from
+:func:`~bunk_logs.api.unit_head.common.compute_attention_badges`. Built
+bunk by bunk that was five or six queries per bunk, so a Unit Head over 20
+bunks (or Camper Care over a division) paid well over a hundred round trips
+per load.
+
+:func:`build_bunk_summaries` takes the whole bunk list and a date and
+issues a fixed number of queries regardless of how many bunks there are:
+
+1. active rosters (campers + counselor authors) for every bunk,
+2. ``CamperDayState`` off-camp flags for every camper,
+3. the day's complete camper reflections across the bunks (submissions and
+   help requests),
+4. bunk-concern references (``ConcernItem`` rows) pointing at the bunks,
+5. optionally, the counselors' self-reflections covering the date.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+from django.db.models import F
+
+from bunk_logs.api.counselor.common import off_camp_camper_ids
+from bunk_logs.api.counselor.common import person_display_name
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import ConcernItem
+from bunk_logs.core.models import Reflection
+
+from .common import compute_attention_badges
+from .common import help_requested_camper_ids_from
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from bunk_logs.core.models import AssignmentGroup
+    from bunk_logs.core.models import Organization
+    from bunk_logs.core.models import Program
+    from bunk_logs.core.models import ReflectionTemplate
+
+
+@dataclass
+class BunkSummary:
+    """Everything a dashboard bunk card needs for one bunk on one date."""
+
+    bunk: AssignmentGroup
+    camper_ids: list[int] = field(default_factory=list)
+    counselor_ids: list[int] = field(default_factory=list)
+    counselor_names: list[str] = field(default_factory=list)
+    off_camp_ids: set[int] = field(default_factory=set)
+    submitted_camper_ids: set[int] = field(default_factory=set)
+    help_requested_camper_ids: set[int] = field(default_factory=set)
+    has_bunk_concerns: bool = False
+    counselor_self_submitted: int = 0
+
+    @property
+    def completion(self) -> dict:
+        on_camp = [c for c in self.camper_ids if c not in self.off_camp_ids]
+        return {
+            "submitted": sum(1 for c in on_camp if c in self.submitted_camper_ids),
+            "expected": len(on_camp),
+            "off_camp": len(self.off_camp_ids),
+        }
+
+    @property
+    def counselor_self_reflections(self) -> dict:
+        return {
+            "submitted": self.counselor_self_submitted,
+            "expected": len(self.counselor_ids),
+        }
+
+    def badges(self, *, low_completion_threshold: float, expected_by_passed: bool) -> list[str]:
+        return compute_attention_badges(
+            bunk=self.bunk,
+            bunk_camper_ids_list=self.camper_ids,
+            off_camp_ids=self.off_camp_ids,
+            submitted_camper_ids=self.submitted_camper_ids,
+            help_requested_camper_ids=self.help_requested_camper_ids,
+            bunk_concerns_referenced_bunk_ids={self.bunk.id} if self.has_bunk_concerns else set(),
+            low_completion_threshold=low_completion_threshold,
+            expected_by_passed=expected_by_passed,
+        )
+
+
+def build_bunk_summaries(
+    *,
+    organization: Organization,
+    program: Program,
+    bunks: list[AssignmentGroup],
+    target_date: date,
+    camper_template: ReflectionTemplate | None,
+    include_counselor_self: bool = False,
+) -> dict[int, BunkSummary]:
+    """``bunk_id -> BunkSummary`` for ``bunks`` on ``target_date``.
+
+    Roster order matches :func:`~bunk_logs.api.unit_head.common.bunk_camper_ids`
+    (last, first name). ``include_counselor_self`` adds the
+    ``counselor_self_reflections`` roll-up the Unit Head list shows.
+    """
+    summaries = {bunk.id: BunkSummary(bunk=bunk) for bunk in bunks}
+    if not summaries:
+        return summaries
+    bunk_ids = list(summaries)
+
+    roster = (
+        AssignmentGroupMembership.all_objects.filter(
+            group_id__in=bunk_ids,
+            role_in_group__in=("subject", "author"),
+            is_active=True,
+        )
+        .select_related("person")
+        .order_by("person__last_name", "person__first_name")
+    )
+    for agm in roster:
+        summary = summaries[agm.group_id]
+        if agm.role_in_group == "subject":
+            summary.camper_ids.append(agm.person_id)
+        elif agm.person is not None:
+            summary.counselor_ids.append(agm.person_id)
+            summary.counselor_names.append(person_display_name(agm.person))
+
+    all_camper_ids = {cid for s in summaries.values() for cid in s.camper_ids}
+    if all_camper_ids:
+        off_camp = off_camp_camper_ids(organization, target_date, all_camper_ids)
+        for summary in summaries.values():
+            summary.off_camp_ids = {cid for cid in summary.camper_ids if cid in off_camp}
+
+    if camper_template is not None and all_camper_ids:
+        by_bunk: dict[int, dict[int, Reflection]] = {}
+        for r in Reflection.all_objects.filter(
+            template=camper_template,
+            assignment_group_id__in=bunk_ids,
+            period_start=target_date,
+            period_end=target_date,
+            is_complete=True,
+        ).select_related("template"):
+            by_bunk.setdefault(r.assignment_group_id, {})[r.subject_id] = r
+        for bunk_id, reflections in by_bunk.items():
+            summaries[bunk_id].submitted_camper_ids = set(reflections)
+            summaries[bunk_id].help_requested_camper_ids = help_requested_camper_ids_from(reflections)
+
+    for bunk_id in set(
+        ConcernItem.all_objects.filter(
+            organization=organization,
+            program=program,
+            kind=ConcernItem.Kind.BUNK_CONCERN,
+            assignment_group_id__in=bunk_ids,
+            period_start__lte=target_date,
+            date__gte=target_date,
+        ).values_list("assignment_group_id", flat=True),
+    ):
+        summaries[bunk_id].has_bunk_concerns = True
+
+    if include_counselor_self:
+        _attach_counselor_self_counts(summaries, target_date)
+    return summaries
+
+
+def _attach_counselor_self_counts(summaries: dict[int, BunkSummary], target_date: date) -> None:
+    """Bulk form of :func:`~bunk_logs.api.unit_head.common.counselor_self_reflection_counts`."""
+    counselor_ids = {pid for s in summaries.values() for pid in s.counselor_ids}
+    if not counselor_ids:
+        return
+    program_ids = {s.bunk.program_id for s in summaries.values()}
+    filed = set(
+        Reflection.all_objects.filter(
+            author_id__in=counselor_ids,
+            subject_id__in=counselor_ids,
+            program_id__in=program_ids,
+            template__subject_mode="self",
+            period_start__lte=target_date,
+            period_end__gte=target_date,
+            is_complete=True,
+        )
+        .filter(author_id=F("subject_id"))
+        .values_list("author_id", "program_id"),
+    )
+    for summary in summaries.values():
+        summary.counselor_self_submitted = sum(
+            1 for pid in summary.counselor_ids if (pid, summary.bunk.program_id) in filed
+        )
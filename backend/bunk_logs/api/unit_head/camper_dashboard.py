@@ -43,6 +43,7 @@ from bunk_logs.core.models import Person
 from bunk_logs.core.models import Reflection
 from bunk_logs.core.reflection_scores import iter_scored_fields
 from bunk_logs.core.reflection_scores import resolve_rating_cells
+from bunk_logs.utils.instrumentation import hot_path
 
 from .common import supervised_bunks
 from .common import viewer_or_403
@@ -97,6 +98,7 @@ class UnitHeadCamperDashboardView(APIView):
 # ---------------------------------------------------------------------------
 
 
+@hot_path("dashboard.camper")
 def build_camper_dashboard_payload(
     *,
     request,
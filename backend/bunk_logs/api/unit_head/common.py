@@ -30,7 +30,7 @@ from bunk_logs.api.counselor.common import off_camp_camper_ids
 from bunk_logs.api.counselor.common import person_full_name
 from bunk_logs.core.assignment_resolution import resolve_template_for
 from bunk_logs.core.models import AssignmentGroup
-from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import ConcernItem
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import Person
 from bunk_logs.core.models import Reflection
@@ -39,6 +39,7 @@ from bunk_logs.core.models import Supervision
 from bunk_logs.core.program_scope import operational_memberships_qs
 from bunk_logs.core.reflection_scores import iter_grid_fields
 from bunk_logs.core.reflection_scores import resolve_grid_cells
+from bunk_logs.core.roster_snapshot import roster_snapshot
 from bunk_logs.core.time_utils import get_current_period
 from bunk_logs.core.time_utils import get_today
 
@@ -151,7 +152,7 @@ def supervised_bunks(
     badge-sort in Story 10 criterion 7 has a deterministic tie-breaker.
     """
     qs = Supervision.objects.bunks_for_uh(membership, today=today).order_by("name")
-    return list(qs.select_related("organization"))
+    return list(qs.select_related("organization", "parent"))
 
 
 def supervised_bunk_ids(
@@ -171,13 +172,7 @@ def bunk_camper_ids(bunk: AssignmentGroup) -> list[int]:
     Camper Dashboard endpoint loads those when drilled into), so we
     return IDs to keep the bunk-list endpoint cheap.
     """
-    return list(
-        AssignmentGroupMembership.objects.filter(
-            group=bunk, role_in_group="subject", is_active=True,
-        )
-        .order_by("person__last_name", "person__first_name")
-        .values_list("person_id", flat=True),
-    )
+    return roster_snapshot(bunk.program_id).subject_ids(bunk.id)
 
 
 # ---------------------------------------------------------------------------
@@ -187,14 +182,11 @@ def bunk_camper_ids(bunk: AssignmentGroup) -> list[int]:
 
 def _bunk_counselor_authors(bunk: AssignmentGroup) -> list[Person]:
     """Active author (counselor / JC) Persons on the bunk, name-ordered."""
-    rows = (
-        AssignmentGroupMembership.objects.filter(
-            group=bunk, role_in_group="author", is_active=True,
-        )
-        .select_related("person")
-        .order_by("person__last_name", "person__first_name")
-    )
-    return [agm.person for agm in rows if agm.person]
+    author_ids = roster_snapshot(bunk.program_id).author_ids(bunk.id)
+    if not author_ids:
+        return []
+    persons = Person.all_objects.in_bulk(author_ids)
+    return [persons[pid] for pid in author_ids if pid in persons]
 
 
 def _self_reflections_for_authors(person_ids, target_date, program_id):
@@ -610,28 +602,26 @@ def bunk_concerns_referencing(
 
     Empty values in ``bunk_concerns_bunks`` (missing key, ``None``,
     empty list) are skipped — only positive references count.
+
+    Served from the write-time ``bunk_concern`` :class:`ConcernItem` rows
+    (one per referenced bunk; see :mod:`bunk_logs.core.concerns`), so the
+    per-bunk badge is an indexed lookup instead of a scan of every
+    reflection in the program.
     """
     rows = (
-        Reflection.all_objects.filter(
+        ConcernItem.all_objects.filter(
             organization=organization,
             program=program,
+            kind=ConcernItem.Kind.BUNK_CONCERN,
             period_start__lte=target_date,
-            period_end__gte=target_date,
-            is_complete=True,
+            date__gte=target_date,
         )
-        .select_related("author", "template")
+        .select_related("reflection__author", "reflection__template")
+        .order_by("assignment_group_id", "reflection_id")
     )
     out: dict[int, list[Reflection]] = {}
-    for r in rows:
-        ids = (r.answers or {}).get("bunk_concerns_bunks") or []
-        if not isinstance(ids, list):
-            continue
-        for raw in ids:
-            try:
-                bid = int(raw)
-            except (ValueError, TypeError):
-                continue
-            out.setdefault(bid, []).append(r)
+    for item in rows:
+        out.setdefault(item.assignment_group_id, []).append(item.reflection)
     return out
 
 
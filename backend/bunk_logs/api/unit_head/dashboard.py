@@ -15,24 +15,20 @@ freshness stays consistent.
 
 from __future__ import annotations
 
-from django.core.cache import cache
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bunk_logs.api.conditional import cache_payload
+from bunk_logs.api.conditional import cached_payload
+from bunk_logs.api.conditional import conditional_response
 from bunk_logs.api.counselor.common import camper_reflection_template
 from bunk_logs.api.counselor.common import is_day_off_answer
 from bunk_logs.api.counselor.common import latest_self_reflection
 
+from .bunk_summary import build_bunk_summaries
 from .common import ATTENTION_BADGE_ORDER
 from .common import build_score_grid  # noqa: F401 — re-exported for downstream tests
-from .common import bunk_camper_ids
-from .common import bunk_concerns_referencing
-from .common import compute_attention_badges
-from .common import counselor_self_reflection_counts
 from .common import expected_by_passed
-from .common import help_requested_camper_ids_from
-from .common import off_camp_camper_ids
 from .common import supervised_bunks
 from .common import unit_head_self_period
 from .common import unit_head_self_template
@@ -61,76 +57,42 @@ class UnitHeadDashboardView(APIView):
         bypass = (request.query_params.get("nocache") or "").lower() in {"1", "true"}
         cache_key = _cache_key(viewer_id=viewer.id, organization_id=org.id, today=today)
         if not bypass:
-            cached = cache.get(cache_key)
+            cached, etag = cached_payload(cache_key)
             if cached is not None:
-                return Response(cached)
+                return conditional_response(request, cached, etag=etag)
 
         bunks = supervised_bunks(ctx.membership, today=today)
         camper_template = camper_reflection_template(org, program)
         uh_template = unit_head_self_template(org, program)
 
-        # Bunk-concerns surface (Story 11 criterion 1.iv): which bunk IDs
-        # have AT LEAST one reflection referencing them today? We need this
-        # union to set the per-bunk badge.
-        bc_map = bunk_concerns_referencing(
-            organization=org, program=program, target_date=today,
+        # Rosters, off-camp flags, submissions, help requests and
+        # bunk-concern references (Story 11 criterion 1.iv) for every
+        # supervised bunk in a fixed number of queries.
+        summaries = build_bunk_summaries(
+            organization=org,
+            program=program,
+            bunks=bunks,
+            target_date=today,
+            camper_template=camper_template,
+            include_counselor_self=True,
         )
-        bc_bunk_ids = set(bc_map.keys())
-
-        bunks_payload: list[dict] = []
         expected_passed = expected_by_passed(org, today)
 
+        bunks_payload: list[dict] = []
         for bunk in bunks:
-            camper_ids = bunk_camper_ids(bunk)
-            off_camp = off_camp_camper_ids(org, today, camper_ids)
-            submitted_ids: set[int] = set()
-            help_ids: set[int] = set()
-            if camper_template and camper_ids:
-                from bunk_logs.core.models import Reflection
-                reflections = {
-                    r.subject_id: r
-                    for r in Reflection.all_objects.filter(
-                        template=camper_template,
-                        assignment_group=bunk,
-                        period_start=today,
-                        period_end=today,
-                        is_complete=True,
-                    ).select_related("template")
-                }
-                submitted_ids = set(reflections.keys())
-                help_ids = help_requested_camper_ids_from(reflections)
-
-            badges = compute_attention_badges(
-                bunk=bunk,
-                bunk_camper_ids_list=camper_ids,
-                off_camp_ids=off_camp,
-                submitted_camper_ids=submitted_ids,
-                help_requested_camper_ids=help_ids,
-                bunk_concerns_referenced_bunk_ids=bc_bunk_ids,
-                low_completion_threshold=LOW_COMPLETION_THRESHOLD,
-                expected_by_passed=expected_passed,
-            )
-
-            on_camp_total = len([c for c in camper_ids if c not in off_camp])
-            submitted_on_camp = len([
-                c for c in camper_ids if c in submitted_ids and c not in off_camp
-            ])
-
+            summary = summaries[bunk.id]
             bunks_payload.append({
                 "id": bunk.id,
                 "name": bunk.name,
                 "slug": bunk.slug,
                 "unit_name": (bunk.parent.name if bunk.parent_id else None),
-                "counselor_names": _counselor_names(bunk),
-                "completion": {
-                    "submitted": submitted_on_camp,
-                    "expected": on_camp_total,
-                    "off_camp": len(off_camp),
-                },
-                "counselor_self_reflections": counselor_self_reflection_counts(
-                    bunk, today,
+                "counselor_names": summary.counselor_names,
+                "completion": summary.completion,
+                "counselor_self_reflections": summary.counselor_self_reflections,
+                "badges": summary.badges(
+                    low_completion_threshold=LOW_COMPLETION_THRESHOLD,
+                    expected_by_passed=expected_passed,
                 ),
-                "badges": badges,
             })
 
         bunks_payload.sort(key=_bunk_sort_key)
@@ -174,23 +136,8 @@ class UnitHeadDashboardView(APIView):
                 ),
             },
         }
-        cache.set(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
-        return Response(payload)
-
-
-def _counselor_names(bunk) -> list[str]:
-    """Active counselor display names for the bunk."""
-    from bunk_logs.api.counselor.common import person_display_name
-    from bunk_logs.core.models import AssignmentGroupMembership
-
-    rows = (
-        AssignmentGroupMembership.objects.filter(
-            group=bunk, role_in_group="author", is_active=True,
-        )
-        .select_related("person")
-        .order_by("person__last_name", "person__first_name")
-    )
-    return [person_display_name(agm.person) for agm in rows if agm.person]
+        etag = cache_payload(cache_key, payload, DASHBOARD_CACHE_TTL_SECONDS)
+        return conditional_response(request, payload, etag=etag)
 
 
 def _bunk_sort_key(bunk_row: dict) -> tuple:
@@ -7,6 +7,7 @@ from bunk_logs.users.api.views import UserViewSet
 from . import assignment_groups
 from . import audit as audit_api
 from . import field_keys as field_keys_api
+from . import live as live_api
 from . import me as me_api
 from . import memberships
 from . import orders_state_machine as order_sm
@@ -28,6 +29,7 @@ from .counselor import dashboard as counselor_dashboard
 from .counselor import maintenance_tickets as counselor_maintenance_tickets
 from .counselor import requests as counselor_requests
 from .counselor import self_reflection as counselor_self_reflection
+from .counselor import sync as counselor_sync
 from .dashboards import assignment as assignment_dashboard
 from .dashboards import authors as authors_dashboard
 from .dashboards import concerns as concerns_dashboard
@@ -359,6 +361,10 @@ urlpatterns = [
     path("me/preferences/", me_api.MePreferencesView.as_view(), name="me-preferences"),
     path("me/date-range/", me_api.MeDateRangeView.as_view(), name="me-date-range"),
 
+    # Live dashboard invalidation (SSE; the stream runs under config.asgi)
+    path("live/ticket/", live_api.LiveTicketView.as_view(), name="live-ticket"),
+    path("live/events/", live_api.live_events_view, name="live-events"),
+
     # User lookup by email (used by several frontend components)
     path("users/email/<str:email>/", views.get_user_by_email, name="user-by-email"),
 
@@ -417,6 +423,11 @@ urlpatterns = [
         subject_dashboard.SubjectDetailView.as_view(),
         name="dashboard-subject-detail",
     ),
+    path(
+        "dashboards/subject/<int:person_id>/reflections/",
+        subject_dashboard.SubjectReflectionsView.as_view(),
+        name="dashboard-subject-reflections",
+    ),
     path(
         "dashboards/subject/<int:person_id>/export/",
         subject_dashboard.SubjectEntriesExportView.as_view(),
@@ -490,6 +501,11 @@ urlpatterns = [
         counselor_requests.CounselorRequestsListView.as_view(),
         name="counselor-requests",
     ),
+    path(
+        "counselor/sync/",
+        counselor_sync.CounselorSyncView.as_view(),
+        name="counselor-sync",
+    ),
     path(
         "counselor/requests/camper-care/<uuid:order_id>/",
         counselor_requests.CamperCareRequestDetailView.as_view(),
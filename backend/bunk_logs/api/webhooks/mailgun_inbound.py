@@ -1,4 +1,11 @@
-"""Mailgun inbound webhook — email replies become maintenance ticket notes."""
+"""Mailgun inbound webhook — email replies become maintenance ticket notes.
+
+By default the note is written inside the webhook request. With
+``MAILGUN_INBOUND_ASYNC`` the view only verifies, stores the payload as an
+:class:`~bunk_logs.core.models.InboundEmail` (deduplicated on Message-Id /
+token) and acks; ``process_inbound_emails`` does the rest, and
+``replay_inbound_emails`` re-runs stored payloads.
+"""
 
 from __future__ import annotations
 
@@ -8,11 +15,14 @@ import json
 import logging
 import re
 import uuid
+from dataclasses import dataclass
 from email.utils import getaddresses
 from email.utils import parseaddr
 
 from django.conf import settings
+from django.db import transaction
 from django.http import HttpResponse
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from email_reply_parser import EmailReplyParser
@@ -22,6 +32,7 @@ from rest_framework.views import APIView
 
 from bunk_logs.api.maintenance.settings import is_configured_recipient
 from bunk_logs.core.context import organization_context
+from bunk_logs.core.models import InboundEmail
 from bunk_logs.core.models import MaintenanceTicket
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import OrderActivityEvent
@@ -187,9 +198,177 @@ def authorize_sender(
     return None
 
 
+@dataclass(frozen=True)
+class InboundOutcome:
+    """What processing one inbound payload did, as the webhook would answer it."""
+
+    status_code: int
+    detail: str = ""
+    ticket_id: uuid.UUID | None = None
+
+    @property
+    def created_note(self) -> bool:
+        return self.status_code == status.HTTP_200_OK
+
+
+def process_inbound_payload(post_data: dict) -> InboundOutcome:
+    """Turn one verified Mailgun payload into a ticket note.
+
+    Shared by the synchronous webhook and the ``process_inbound_emails``
+    task; ``post_data`` maps field names to a value or a list of values.
+    """
+    ticket_id = extract_ticket_id_from_inbound(post_data)
+    if ticket_id is None:
+        recipient = _field_value(post_data, "recipient")
+        logger.info(
+            "mailgun inbound: unrecognized recipient fields (recipient=%r)",
+            recipient,
+        )
+        return InboundOutcome(status.HTTP_406_NOT_ACCEPTABLE, "Unrecognized recipient.")
+
+    ticket = (
+        MaintenanceTicket.all_objects.filter(pk=ticket_id)
+        .select_related("organization", "program", "submitted_by__person")
+        .first()
+    )
+    if ticket is None:
+        return InboundOutcome(status.HTTP_404_NOT_FOUND, "Ticket not found.", ticket_id)
+
+    sender_email = extract_sender_email(
+        _field_value(post_data, "from") or _field_value(post_data, "sender"),
+    )
+    if not sender_email:
+        return InboundOutcome(status.HTTP_400_BAD_REQUEST, "Missing sender.", ticket_id)
+
+    membership = authorize_sender(ticket.organization, sender_email, ticket=ticket)
+    if membership is None and not is_configured_recipient(ticket.organization, sender_email):
+        # The ticket+uuid address is only distributed to notification recipients;
+        # accept the reply but log when the From address is unexpected.
+        logger.info(
+            "mailgun inbound: reply from unlisted sender %s on ticket %s",
+            sender_email,
+            ticket_id,
+        )
+
+    if ticket.status in STATUS_CLOSED:
+        return InboundOutcome(
+            status.HTTP_400_BAD_REQUEST, "Cannot add notes to a closed ticket.", ticket_id,
+        )
+
+    body = parse_reply_body(post_data)
+    if not body:
+        logger.info(
+            "mailgun inbound: empty reply body for ticket %s from %s",
+            ticket_id,
+            sender_email,
+        )
+        return InboundOutcome(status.HTTP_400_BAD_REQUEST, "Empty reply body.", ticket_id)
+
+    with organization_context(ticket.organization):
+        OrderActivityEvent.all_objects.create(
+            organization=ticket.organization,
+            program=ticket.program,
+            actor_membership=membership,
+            event_type=OrderActivityEvent.EventType.NOTE,
+            content_type="maintenance_ticket",
+            content_id=ticket.id,
+            note=body,
+            metadata={
+                "visibility": "team_only",
+                "source": "email",
+                "sender_email": sender_email,
+            },
+        )
+
+    logger.info(
+        "mailgun inbound: note created on ticket %s from %s", ticket_id, sender_email,
+    )
+    return InboundOutcome(status.HTTP_200_OK, ticket_id=ticket_id)
+
+
+# ---------------------------------------------------------------------------
+# Deferred ingestion (MAILGUN_INBOUND_ASYNC)
+# ---------------------------------------------------------------------------
+
+
+def inbound_dedup_key(post_data: dict) -> str:
+    """Idempotency key for a payload: the Message-Id, else the Mailgun token."""
+    message_id = _field_value(post_data, "Message-Id") or _field_value(post_data, "message-id")
+    if message_id:
+        return f"msg:{message_id}"[:512]
+    return f"token:{_field_value(post_data, 'token')}"[:512]
+
+
+def store_inbound_payload(data) -> tuple[InboundEmail, bool]:
+    """Persist a verified payload once per dedup key; ``(row, created)``."""
+    payload = {key: data.getlist(key) for key in data} if hasattr(data, "getlist") else dict(data)
+    return InboundEmail.objects.get_or_create(
+        dedup_key=inbound_dedup_key(payload),
+        defaults={
+            "token": _field_value(payload, "token")[:128],
+            "message_id": (
+                _field_value(payload, "Message-Id") or _field_value(payload, "message-id")
+            )[:512],
+            "payload": payload,
+        },
+    )
+
+
+def process_stored_inbound(ids: list[int] | None = None, *, batch_size: int | None = None) -> dict[str, int]:
+    """Process pending :class:`InboundEmail` rows in batches.
+
+    Each batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` so
+    concurrent workers never process the same reply twice. Outcomes that the
+    synchronous webhook would answer with 4xx are recorded as ``rejected``;
+    unexpected errors mark the row ``failed`` for the replay command.
+    """
+    batch_size = batch_size or settings.MAILGUN_INBOUND_BATCH_SIZE
+    counts = {"processed": 0, "rejected": 0, "failed": 0}
+    while True:
+        with transaction.atomic():
+            qs = InboundEmail.objects.filter(status=InboundEmail.Status.PENDING)
+            if ids is not None:
+                qs = qs.filter(pk__in=ids)
+            batch = list(qs.order_by("received_at", "pk").select_for_update(skip_locked=True)[:batch_size])
+            if not batch:
+                return counts
+            for row in batch:
+                _process_row(row)
+                counts[row.status] += 1
+            InboundEmail.objects.bulk_update(
+                batch,
+                ["status", "ticket_id", "response_status", "detail", "attempts", "processed_at"],
+            )
+
+
+def _process_row(row: InboundEmail) -> None:
+    row.attempts += 1
+    row.processed_at = timezone.now()
+    try:
+        with transaction.atomic():
+            outcome = process_inbound_payload(row.payload)
+    except Exception as exc:
+        logger.exception("mailgun inbound: processing stored payload %s failed", row.pk)
+        row.status = InboundEmail.Status.FAILED
+        row.response_status = None
+        row.detail = str(exc)[:255]
+        return
+    row.status = (
+        InboundEmail.Status.PROCESSED if outcome.created_note else InboundEmail.Status.REJECTED
+    )
+    row.ticket_id = outcome.ticket_id
+    row.response_status = outcome.status_code
+    row.detail = outcome.detail[:255]
+
+
 @method_decorator(csrf_exempt, name="dispatch")
 class MailgunInboundWebhookView(APIView):
-    """``POST /api/v1/webhooks/mailgun/inbound/`` — inbound email replies."""
+    """``POST /api/v1/webhooks/mailgun/inbound/`` — inbound email replies.
+
+    With ``MAILGUN_INBOUND_ASYNC`` on, a verified payload is stored and
+    acknowledged immediately (retries of an already-stored reply are acked
+    without re-queuing); a Celery task creates the note.
+    """
 
     authentication_classes: list = []
     permission_classes: list = []
@@ -204,72 +383,20 @@ class MailgunInboundWebhookView(APIView):
             logger.warning("mailgun inbound: invalid signature")
             return Response({"detail": "Invalid signature."}, status=status.HTTP_403_FORBIDDEN)
 
-        post_data = dict(data)
-        ticket_id = extract_ticket_id_from_inbound(post_data)
-        if ticket_id is None:
-            recipient = _field_value(post_data, "recipient")
-            logger.info(
-                "mailgun inbound: unrecognized recipient fields (recipient=%r)",
-                recipient,
-            )
-            return HttpResponse(status=406)
-
-        ticket = (
-            MaintenanceTicket.all_objects.filter(pk=ticket_id)
-            .select_related("organization", "program", "submitted_by__person")
-            .first()
-        )
-        if ticket is None:
-            return Response({"detail": "Ticket not found."}, status=status.HTTP_404_NOT_FOUND)
+        if settings.MAILGUN_INBOUND_ASYNC:
+            return self._ingest(data)
 
-        sender_email = extract_sender_email(
-            _field_value(post_data, "from") or _field_value(post_data, "sender"),
-        )
-        if not sender_email:
-            return Response({"detail": "Missing sender."}, status=status.HTTP_400_BAD_REQUEST)
-
-        membership = authorize_sender(ticket.organization, sender_email, ticket=ticket)
-        if membership is None and not is_configured_recipient(ticket.organization, sender_email):
-            # The ticket+uuid address is only distributed to notification recipients;
-            # accept the reply but log when the From address is unexpected.
-            logger.info(
-                "mailgun inbound: reply from unlisted sender %s on ticket %s",
-                sender_email,
-                ticket_id,
-            )
+        outcome = process_inbound_payload(dict(data))
+        if outcome.status_code in (status.HTTP_200_OK, status.HTTP_406_NOT_ACCEPTABLE):
+            return HttpResponse(status=outcome.status_code)
+        return Response({"detail": outcome.detail}, status=outcome.status_code)
 
-        if ticket.status in STATUS_CLOSED:
-            return Response(
-                {"detail": "Cannot add notes to a closed ticket."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+    def _ingest(self, data) -> HttpResponse:
+        from bunk_logs.core.tasks import process_inbound_emails
 
-        body = parse_reply_body(post_data)
-        if not body:
-            logger.info(
-                "mailgun inbound: empty reply body for ticket %s from %s",
-                ticket_id,
-                sender_email,
-            )
-            return Response({"detail": "Empty reply body."}, status=status.HTTP_400_BAD_REQUEST)
-
-        with organization_context(ticket.organization):
-            OrderActivityEvent.all_objects.create(
-                organization=ticket.organization,
-                program=ticket.program,
-                actor_membership=membership,
-                event_type=OrderActivityEvent.EventType.NOTE,
-                content_type="maintenance_ticket",
-                content_id=ticket.id,
-                note=body,
-                metadata={
-                    "visibility": "team_only",
-                    "source": "email",
-                    "sender_email": sender_email,
-                },
-            )
-
-        logger.info(
-            "mailgun inbound: note created on ticket %s from %s", ticket_id, sender_email,
-        )
+        row, created = store_inbound_payload(data)
+        if created:
+            transaction.on_commit(lambda: process_inbound_emails.delay([row.pk]))
+        else:
+            logger.info("mailgun inbound: duplicate delivery %s acknowledged", row.dedup_key)
         return HttpResponse(status=200)
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "bunk_logs.core"
+
+    def ready(self):
+        # Keep stored search vectors in sync on save; the receivers attach
+        # as an import side-effect.
+        from bunk_logs.core import signals  # noqa: F401
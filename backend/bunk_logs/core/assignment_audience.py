@@ -0,0 +1,264 @@
+"""Materialized TemplateAssignment audiences and compliance counters.
+
+:class:`~bunk_logs.core.models.AssignmentAudience` holds one row per
+(assignment, Membership) in the assignment's audience, so the per-role
+dashboards (:func:`~bunk_logs.core.assignment_resolution.active_assignments_for`)
+and the assignment dashboard read it instead of resolving each
+assignment's target on every request. ``TemplateAssignment.expected_count``
+and ``submitted_count`` back the Leadership Team assignment list.
+
+Maintenance is driven by the receivers in :mod:`bunk_logs.core.signals`:
+
+* assignment saved (target, dates, status) or its template's author roles
+  changed -> :func:`rebuild_assignment`;
+* membership saved (role, tags, active flag) or roster row saved ->
+  :func:`sync_membership` for the affected memberships;
+* roster row deleted -> :func:`sync_membership` with ``allow_additions``
+  off (a deletion can only shrink an audience, and the membership may be
+  mid-cascade);
+* membership deleted -> :func:`forget_membership`;
+* reflection created or deleted -> :func:`bump_submitted_counts` (an
+  ``F()`` increment / decrement, no recount).
+
+``resolve_members`` and :func:`count_submitted` stay the source of truth
+for full rebuilds; :func:`membership_in_audience` mirrors the former for
+one membership at a time. Bulk ``.update()`` paths call
+:func:`rebuild_program` afterwards, and ``manage.py
+backfill_assignment_audience`` runs :func:`rebuild_all` (migration 0072
+mirrors it against the historical models for the initial fill).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+
+from bunk_logs.core.assignment_resolution import _assignment_group_membership_roles
+from bunk_logs.core.assignment_resolution import _effective_author_roles
+from bunk_logs.core.assignment_resolution import resolve_members
+from bunk_logs.core.models import AssignmentAudience
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import TemplateAssignment
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import QuerySet
+
+_CANCELLED = TemplateAssignment.Status.CANCELLED
+_TargetType = TemplateAssignment.TargetType
+
+
+def membership_in_audience(
+    assignment: TemplateAssignment,
+    membership: Membership,
+    roster: set[tuple[int, str]],
+) -> bool:
+    """Whether ``resolve_members(assignment)`` would include ``membership``.
+
+    ``roster`` is the membership's person's active ``(group_id,
+    role_in_group)`` roster rows.
+    """
+    if not membership.is_active or membership.program_id != assignment.program_id:
+        return False
+    payload = assignment.target_payload or {}
+    target_type = assignment.target_type
+    if target_type == _TargetType.ROLE:
+        role = payload.get("role")
+        return bool(role) and membership.role == role
+    if target_type == _TargetType.INDIVIDUALS:
+        ids = payload.get("membership_ids") or []
+        if not isinstance(ids, list):
+            return False
+        return str(membership.pk) in {str(i) for i in ids if i is not None}
+    if target_type == _TargetType.TAG_GROUP:
+        tag = payload.get("tag")
+        return bool(tag) and tag in (membership.tags or [])
+    if target_type == _TargetType.ASSIGNMENT_GROUP:
+        group_id = assignment.assignment_group_id
+        if not group_id:
+            return False
+        tpl = assignment.template
+        if membership.role not in _effective_author_roles(tpl):
+            return False
+        return any(
+            (group_id, role_in_group) in roster
+            for role_in_group in _assignment_group_membership_roles(tpl)
+        )
+    return False
+
+
+def _audience_row(assignment: TemplateAssignment, membership_id: int) -> AssignmentAudience:
+    return AssignmentAudience(
+        assignment=assignment,
+        membership_id=membership_id,
+        program_id=assignment.program_id,
+        start_date=assignment.start_date,
+        end_date=assignment.end_date,
+    )
+
+
+def audience_by_assignment(
+    assignments: Iterable[TemplateAssignment],
+) -> dict[int, list[Membership]]:
+    """Audience Memberships (with ``person`` loaded) keyed by assignment id."""
+    out: dict[int, list[Membership]] = {}
+    rows = AssignmentAudience.all_objects.filter(
+        assignment__in=list(assignments),
+    ).select_related("membership__person")
+    for row in rows:
+        out.setdefault(row.assignment_id, []).append(row.membership)
+    return out
+
+
+def refresh_expected_counts(assignment_ids: Iterable[int]) -> None:
+    """Recompute ``expected_count`` from the audience rows, in one UPDATE."""
+    ids = list(assignment_ids)
+    if not ids:
+        return
+    audience_size = (
+        AssignmentAudience.all_objects.filter(assignment=OuterRef("pk"))
+        .values("assignment")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    TemplateAssignment.all_objects.filter(pk__in=ids).update(
+        expected_count=Coalesce(Subquery(audience_size), 0),
+    )
+
+
+def count_submitted(assignment: TemplateAssignment) -> int:
+    """Reflections filed under ``assignment``'s template, program and window."""
+    qs = Reflection.all_objects.filter(
+        template_id=assignment.template_id,
+        program_id=assignment.program_id,
+        period_start__gte=assignment.start_date,
+    )
+    if assignment.end_date:
+        qs = qs.filter(period_end__lte=assignment.end_date)
+    if (
+        assignment.target_type == _TargetType.ASSIGNMENT_GROUP
+        and assignment.assignment_group_id
+    ):
+        qs = qs.filter(assignment_group_id=assignment.assignment_group_id)
+    return qs.count()
+
+
+def rebuild_assignment(assignment: TemplateAssignment) -> None:
+    """Re-materialize one assignment's audience and both counters."""
+    if assignment.status == _CANCELLED:
+        target: set[int] = set()
+    else:
+        target = set(
+            resolve_members(assignment, assignment.start_date).values_list("pk", flat=True),
+        )
+    rows = AssignmentAudience.all_objects.filter(assignment=assignment)
+    existing = set(rows.values_list("membership_id", flat=True))
+    if existing - target:
+        rows.filter(membership_id__in=existing - target).delete()
+    rows.update(start_date=assignment.start_date, end_date=assignment.end_date)
+    AssignmentAudience.all_objects.bulk_create(
+        [_audience_row(assignment, membership_id) for membership_id in target - existing],
+        ignore_conflicts=True,
+    )
+    assignment.expected_count = len(target)
+    assignment.submitted_count = count_submitted(assignment)
+    TemplateAssignment.all_objects.filter(pk=assignment.pk).update(
+        expected_count=assignment.expected_count,
+        submitted_count=assignment.submitted_count,
+    )
+
+
+def rebuild_program(program_id: int) -> None:
+    """Rebuild every assignment in a program (after bulk membership edits)."""
+    for assignment in TemplateAssignment.all_objects.filter(program_id=program_id).select_related("template"):
+        rebuild_assignment(assignment)
+
+
+def rebuild_all(assignments: QuerySet[TemplateAssignment] | None = None) -> int:
+    """Rebuild ``assignments`` (default: all), one transaction each; returns the count."""
+    if assignments is None:
+        assignments = TemplateAssignment.all_objects.all()
+    count = 0
+    for assignment in assignments.select_related("template").order_by("pk").iterator(chunk_size=200):
+        with transaction.atomic():
+            rebuild_assignment(assignment)
+        count += 1
+    return count
+
+
+def sync_membership(membership: Membership, *, allow_additions: bool = True) -> None:
+    """Bring one membership's audience rows in line with its current state."""
+    assignments = list(
+        TemplateAssignment.all_objects.filter(program_id=membership.program_id)
+        .exclude(status=_CANCELLED)
+        .select_related("template"),
+    )
+    roster = set(
+        AssignmentGroupMembership.all_objects.filter(
+            person_id=membership.person_id, is_active=True,
+        ).values_list("group_id", "role_in_group"),
+    )
+    by_id = {a.pk: a for a in assignments}
+    want = {a.pk for a in assignments if membership_in_audience(a, membership, roster)}
+    have = set(
+        AssignmentAudience.all_objects.filter(membership_id=membership.pk).values_list(
+            "assignment_id", flat=True,
+        ),
+    )
+    removed = have - want
+    added = want - have if allow_additions else set()
+    if removed:
+        AssignmentAudience.all_objects.filter(
+            membership_id=membership.pk, assignment_id__in=removed,
+        ).delete()
+    if added:
+        AssignmentAudience.all_objects.bulk_create(
+            [_audience_row(by_id[pk], membership.pk) for pk in added],
+            ignore_conflicts=True,
+        )
+    refresh_expected_counts(removed | added)
+
+
+def sync_person(person_id: int, *, allow_additions: bool = True) -> None:
+    """:func:`sync_membership` for every membership a person holds."""
+    for membership in Membership.all_objects.filter(person_id=person_id):
+        sync_membership(membership, allow_additions=allow_additions)
+
+
+def forget_membership(membership: Membership) -> None:
+    """Drop a membership's rows ahead of its deletion and fix the counts."""
+    rows = AssignmentAudience.all_objects.filter(membership_id=membership.pk)
+    assignment_ids = set(rows.values_list("assignment_id", flat=True))
+    rows.delete()
+    refresh_expected_counts(assignment_ids)
+
+
+def bump_submitted_counts(reflection: Reflection, delta: int) -> None:
+    """Add ``delta`` to ``submitted_count`` on the assignments a reflection falls under."""
+    if not reflection.template_id or not reflection.period_start:
+        return
+    candidates = TemplateAssignment.all_objects.filter(
+        template_id=reflection.template_id,
+        program_id=reflection.program_id,
+        start_date__lte=reflection.period_start,
+    ).filter(
+        Q(end_date__isnull=True) | Q(end_date__gte=reflection.period_end),
+    ).filter(
+        ~Q(target_type=_TargetType.ASSIGNMENT_GROUP)
+        | Q(assignment_group__isnull=True)
+        | Q(assignment_group_id=reflection.assignment_group_id),
+    )
+    if delta < 0:
+        # Never below zero, even if a recount and this delete race.
+        candidates = candidates.filter(submitted_count__gte=-delta)
+    candidates.update(submitted_count=F("submitted_count") + delta)
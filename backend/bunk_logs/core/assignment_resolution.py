@@ -16,7 +16,9 @@ Why a separate module
   place prevents drift between roles.
 - ``resolve_members`` (the LT API's audience materializer) lives here
   too so the assignments API and the dashboards share one source of
-  truth.
+  truth. Its results are materialized per Membership into
+  ``AssignmentAudience`` (see ``core.assignment_audience``), which the
+  viewer-facing ``active_assignments_for`` reads.
 
 Key invariant
 -------------
@@ -35,6 +37,7 @@ from django.db.models import IntegerField
 from django.db.models import Q
 from django.db.models import When
 
+from bunk_logs.core.models import AssignmentAudience
 from bunk_logs.core.models import AssignmentGroup
 from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import Membership
@@ -178,85 +181,23 @@ def _active_assignments_base_qs(
     )
 
 
-def _viewer_membership_ids(
-    viewer: Person, program: Program, *, role: str | None = None,
-) -> set[int]:
-    qs = Membership.all_objects.filter(
-        person=viewer, program=program, is_active=True,
-    )
-    if role:
-        qs = qs.filter(role=role)
-    return set(qs.values_list("id", flat=True))
-
+def _viewer_audience_assignment_ids(viewer: Person, program: Program, as_of: date):
+    """Assignment ids whose materialized audience holds the viewer on ``as_of``.
 
-def _viewer_in_audience(
-    assignment: TemplateAssignment,
-    viewer: Person,
-    *,
-    program: Program,
-    target_role: str | None,
-) -> bool:
-    """Whether ``viewer`` falls inside an assignment's resolved audience.
-
-    Mirrors the cases in ``resolve_members`` but answers a yes/no
-    question for one Person without materializing the full queryset.
-    When ``target_role`` is given, also requires the viewer to have an
-    active Membership with that role in the program.
+    Reads :class:`~bunk_logs.core.models.AssignmentAudience` (maintained by
+    :mod:`bunk_logs.core.assignment_audience`), which mirrors
+    ``resolve_members`` per Membership, instead of resolving every
+    assignment's target for the viewer.
     """
-    if target_role is not None:
-        viewer_role_ids = _viewer_membership_ids(
-            viewer, program, role=target_role,
-        )
-        if not viewer_role_ids:
-            return False
-    payload = assignment.target_payload or {}
-    target_type = assignment.target_type
-    if target_type == TemplateAssignment.TargetType.ROLE:
-        role = payload.get("role")
-        if not role:
-            return False
-        viewer_roles = set(
-            Membership.all_objects.filter(
-                person=viewer, program=program, is_active=True,
-            ).values_list("role", flat=True),
-        )
-        return role in viewer_roles
-    if target_type == TemplateAssignment.TargetType.INDIVIDUALS:
-        ids = payload.get("membership_ids") or []
-        if not isinstance(ids, list):
-            return False
-        viewer_membership_ids = _viewer_membership_ids(viewer, program)
-        return any(int(i) in viewer_membership_ids for i in ids if i is not None)
-    if target_type == TemplateAssignment.TargetType.TAG_GROUP:
-        tag = payload.get("tag")
-        if not tag:
-            return False
-        return Membership.all_objects.filter(
-            person=viewer,
+    return (
+        AssignmentAudience.all_objects.filter(
+            membership__person=viewer,
             program=program,
-            is_active=True,
-            tags__contains=[tag],
-        ).exists()
-    if target_type == TemplateAssignment.TargetType.ASSIGNMENT_GROUP:
-        group_id = assignment.assignment_group_id
-        if not group_id:
-            return False
-        tpl = assignment.template
-        author_roles = _effective_author_roles(tpl)
-        if not author_roles:
-            return False
-        roster_roles = _assignment_group_membership_roles(tpl)
-        return AssignmentGroupMembership.all_objects.filter(
-            group_id=group_id,
-            person=viewer,
-            role_in_group__in=roster_roles,
-            is_active=True,
-        ).filter(
-            Q(person__memberships__role__in=author_roles)
-            & Q(person__memberships__program=program)
-            & Q(person__memberships__is_active=True),
-        ).exists()
-    return False
+            start_date__lte=as_of,
+        )
+        .filter(Q(end_date__isnull=True) | Q(end_date__gte=as_of))
+        .values("assignment_id")
+    )
 
 
 def active_assignments_for(
@@ -288,20 +229,20 @@ def active_assignments_for(
     - When ``require_required`` is True (default), drops is_required=False
       rows (those land in the Wave 2 optional-form library instead).
     """
+    if target_role is not None and not Membership.all_objects.filter(
+        person=viewer, program=program, is_active=True, role=target_role,
+    ).exists():
+        return []
     qs = _active_assignments_base_qs(
         organization=organization, program=program, as_of=as_of,
+    ).filter(
+        pk__in=_viewer_audience_assignment_ids(viewer, program, as_of),
     ).select_related("template")
     if require_required:
         qs = qs.filter(is_required=True)
     if target_assignment_group is not None:
         qs = qs.filter(assignment_group=target_assignment_group)
-    out: list[TemplateAssignment] = []
-    for assignment in qs:
-        if _viewer_in_audience(
-            assignment, viewer, program=program, target_role=target_role,
-        ):
-            out.append(assignment)
-    return out
+    return list(qs)
 
 
 def list_required_assignments_for(
@@ -326,16 +267,14 @@ def list_optional_assignments_for(
     symmetry with the required side and is the seed for the Wave 2
     "forms I can also fill out" library.
     """
-    qs = _active_assignments_base_qs(
-        organization=organization, program=program, as_of=as_of,
-    ).filter(is_required=False).select_related("template")
-    out: list[TemplateAssignment] = []
-    for assignment in qs:
-        if _viewer_in_audience(
-            assignment, viewer, program=program, target_role=None,
-        ):
-            out.append(assignment)
-    return out
+    return list(
+        _active_assignments_base_qs(
+            organization=organization, program=program, as_of=as_of,
+        ).filter(
+            is_required=False,
+            pk__in=_viewer_audience_assignment_ids(viewer, program, as_of),
+        ).select_related("template"),
+    )
 
 
 # ---------------------------------------------------------------------------
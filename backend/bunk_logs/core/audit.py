@@ -18,19 +18,42 @@ Design notes for callers:
   optional ``_audit_content_type_label()`` method.
 * Snapshots are caller-provided dicts; the audit module does not introspect
   content rows so it stays agnostic to schema changes.
+* Bulk paths that emit many events in one transaction should wrap the loop
+  in :func:`buffered`: events are collected in memory and written with one
+  ``bulk_create`` when the block exits cleanly (or handed to Celery after
+  commit when ``AUDIT_ASYNC_FLUSH`` is on). Loops that commit item by item
+  pass ``atomic=False``. Outside a ``buffered`` block every helper still
+  writes immediately.
 """
 
 from __future__ import annotations
 
+import logging
+from contextlib import contextmanager
+from datetime import datetime
 from typing import TYPE_CHECKING
 from typing import Any
 
+from asgiref.local import Local
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
 from bunk_logs.core.models import AuditEvent
 from bunk_logs.core.models import Membership
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from django.contrib.auth.models import AbstractBaseUser
 
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement when a buffer is flushed.
+FLUSH_BATCH_SIZE = 500
+
+_buffer_local = Local()
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -141,7 +164,7 @@ def _write(
     if content_id is None:
         msg = "audit._write: cannot determine content_id from content row."
         raise ValueError(msg)
-    return AuditEvent.all_objects.create(
+    return _emit(
         event_type=event_type,
         actor_membership=actor_membership,
         actor_user=actor_user,
@@ -157,6 +180,169 @@ def _write(
     )
 
 
+def _emit(**fields) -> AuditEvent:
+    """Insert the event now, or queue it on the innermost open buffer.
+
+    Buffered events are unsaved instances with ``id`` (UUID default) and
+    ``created_at`` (``timezone.now`` default) already set at emit time, so a
+    flushed row keeps the time the change happened.
+    """
+    stack = getattr(_buffer_local, "stack", None)
+    if not stack:
+        return AuditEvent.all_objects.create(**fields)
+    event = AuditEvent(**fields)
+    stack[-1].append(event)
+    return event
+
+
+# ---------------------------------------------------------------------------
+# Write buffering
+# ---------------------------------------------------------------------------
+
+
+def _async_flush_default() -> bool:
+    return bool(getattr(settings, "AUDIT_ASYNC_FLUSH", False))
+
+
+@contextmanager
+def buffered(
+    *, async_flush: bool | None = None, atomic: bool = True,
+) -> Iterator[list[AuditEvent]]:
+    """Collect audit events emitted inside the block and write them in bulk.
+
+    The block runs inside ``transaction.atomic()``, so it behaves like a
+    savepoint for audit rows as well as business rows: if it exits with an
+    exception, its buffered events are dropped along with the rolled-back
+    writes. Nested ``buffered()`` blocks hand their events to the enclosing
+    buffer on a clean exit, which makes the per-item savepoint pattern of
+    bulk endpoints work unchanged::
+
+        with audit.buffered(atomic=False):
+            for order in orders:
+                try:
+                    with audit.buffered():
+                        order.transition_to(...)
+                except OrderStateMachineError:
+                    continue  # this order's audit rows are discarded
+
+    ``atomic=False`` (outermost block only) never starts a transaction, so
+    a bulk loop doesn't hold every item's row locks until the last
+    one is done. What happens to the nested blocks depends on the caller:
+
+    * already inside a transaction (``ATOMIC_REQUESTS``) -- the items are
+      savepoints of that transaction (the block adds one more around
+      them), so their events are still collected here and flushed once,
+      inside it, when the block exits cleanly;
+    * in autocommit -- each nested block is its own transaction and flushes
+      its own events before committing, so a committed item never lacks
+      its audit rows. Nothing is collected and the yielded list stays empty.
+
+    When the outermost block exits the events are flushed:
+
+    * sync (default) -- one ``bulk_create`` inside the block's transaction,
+      so the audit rows commit or roll back with the business write.
+    * async (``AUDIT_ASYNC_FLUSH`` or ``async_flush=True``) -- serialized
+      and handed to :func:`bunk_logs.core.tasks.flush_audit_events` via
+      ``transaction.on_commit``, so nothing is enqueued unless the business
+      write commits. ``created_at`` is carried in the payload, so it still
+      reflects emit time.
+
+    Yields the list of events buffered by this block (mostly for tests).
+    """
+    stack = getattr(_buffer_local, "stack", None)
+    if stack is None:
+        stack = _buffer_local.stack = []
+    outermost = not stack
+    if outermost and not atomic and not transaction.get_connection().in_atomic_block:
+        # Leave the stack empty so each nested block is outermost and
+        # flushes inside its own transaction.
+        yield []
+        return
+    events: list[AuditEvent] = []
+    stack.append(events)
+    try:
+        with transaction.atomic():
+            yield events
+            if not outermost:
+                stack[-2].extend(events)
+            else:
+                _flush_buffer(events, async_flush)
+    finally:
+        stack.pop()
+
+
+def _flush_buffer(events: list[AuditEvent], async_flush: bool | None) -> None:
+    if not events:
+        return
+    use_async = _async_flush_default() if async_flush is None else async_flush
+    if use_async:
+        payload = [_serialize_event(event) for event in events]
+        transaction.on_commit(lambda: _enqueue_flush(payload))
+    else:
+        flush_events(events)
+
+
+def flush_events(events: list[AuditEvent]) -> int:
+    """``bulk_create`` buffered events; returns the number written.
+
+    ``ignore_conflicts`` keys idempotency on the client-assigned UUID and
+    emit-time ``created_at``, so a redelivered async flush cannot duplicate
+    rows.
+    """
+    if not events:
+        return 0
+    AuditEvent.all_objects.bulk_create(
+        events, batch_size=FLUSH_BATCH_SIZE, ignore_conflicts=True,
+    )
+    return len(events)
+
+
+def _serialize_event(event: AuditEvent) -> dict:
+    return {
+        "id": str(event.id),
+        "created_at": (event.created_at or timezone.now()).isoformat(),
+        "event_type": event.event_type,
+        "actor_membership_id": event.actor_membership_id,
+        "actor_user_id": event.actor_user_id,
+        "content_type": event.content_type,
+        "content_id": event.content_id,
+        "organization_id": event.organization_id,
+        "program_id": event.program_id,
+        "before_state": event.before_state,
+        "after_state": event.after_state,
+        "reason_note": event.reason_note,
+        "is_admin_override": event.is_admin_override,
+        "metadata": event.metadata,
+    }
+
+
+def deserialize_events(payload: list[dict]) -> list[AuditEvent]:
+    """Rebuild unsaved :class:`AuditEvent` rows from :func:`buffered` payloads."""
+    return [AuditEvent(**{**row, "created_at": _payload_time(row)}) for row in payload]
+
+
+def _payload_time(row: dict) -> datetime:
+    # Payloads queued before ``created_at`` was serialized carry none; their
+    # rows get the flush time, as they would have then.
+    raw = row.get("created_at")
+    return datetime.fromisoformat(raw) if raw else timezone.now()
+
+
+def _enqueue_flush(payload: list[dict]) -> None:
+    from bunk_logs.core.tasks import flush_audit_events
+
+    try:
+        flush_audit_events.delay(payload)
+    except Exception:
+        # The business write has already committed; losing the broker must
+        # not lose the trail. Fall back to writing inline.
+        logger.exception(
+            "audit: async flush enqueue failed; writing %d events inline",
+            len(payload),
+        )
+        flush_events(deserialize_events(payload))
+
+
 # ---------------------------------------------------------------------------
 # Public helpers (the nine documented in the step prompt)
 # ---------------------------------------------------------------------------
@@ -348,7 +534,7 @@ def export(actor: Any, content_query: dict, *, organization=None,
         msg = "audit.export: organization is required."
         raise ValueError(msg)
     actor_membership, actor_user = _resolve_actor(actor)
-    return AuditEvent.all_objects.create(
+    return _emit(
         event_type=AuditEvent.EventType.EXPORT,
         actor_membership=actor_membership,
         actor_user=actor_user,
@@ -0,0 +1,390 @@
+"""Monthly range partitioning and archival for ``core_auditevent``.
+
+``AuditEvent`` is append-only and never pruned, so one heap + five
+composite indexes grows forever. Migration 0062 converts the table to a
+native Postgres partitioned table, ``PARTITION BY RANGE (created_at)``,
+with one child per calendar month (UTC) named ``core_auditevent_pYYYYMM``
+plus a ``core_auditevent_default`` catch-all so an insert never fails for
+want of a partition.
+
+Postgres requires the partition key in every unique constraint, so the
+physical primary key is ``(id, created_at)``. Django still treats ``id``
+as the primary key; UUID4 collisions are not a practical concern.
+
+Lifecycle:
+
+* :func:`ensure_partitions` creates the current month plus
+  ``AUDIT_PARTITION_MONTHS_AHEAD`` future months, and drains any rows that
+  landed in the default partition into their proper month. The nightly
+  ``maintain_audit_partitions`` task (registered by
+  :func:`register_periodic_tasks`) calls it.
+* :func:`archive_partition` streams one closed month to a gzipped JSONL
+  file in the configured storage, then detaches and drops it. Driven by
+  ``manage.py archive_audit_partitions``.
+
+Queries prune to the relevant children only when they filter on a bare
+``created_at`` range -- ``created_at__date`` casts the column and defeats
+pruning, so the audit API converts day filters into datetime bounds.
+
+Every helper is a no-op on a database that is not Postgres or where the
+table is still a plain heap.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import re
+import tempfile
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import storages
+from django.db import connection as default_connection
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+TABLE = "core_auditevent"
+DEFAULT_PARTITION = f"{TABLE}_default"
+PARTITION_PREFIX = f"{TABLE}_p"
+_PARTITION_RE = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+
+# Rows fetched per round trip when streaming a partition to its archive.
+ARCHIVE_FETCH_SIZE = 2000
+
+PERIODIC_TASK_NAME = "audit.maintain_audit_partitions.nightly"
+PERIODIC_TASK_PATH = "bunk_logs.core.tasks.maintain_audit_partitions"
+SCHEDULE_HOUR = 2
+SCHEDULE_MINUTE = 45
+
+
+@dataclass(frozen=True)
+class Partition:
+    """One monthly child table and its ``[start, end)`` bounds (UTC)."""
+
+    name: str
+    start: date
+
+    @property
+    def end(self) -> date:
+        return add_months(self.start, 1)
+
+
+def month_start(value: date | datetime) -> date:
+    if isinstance(value, datetime):
+        value = value.astimezone(UTC).date() if timezone.is_aware(value) else value.date()
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month.year:04d}{month.month:02d}"
+
+
+def _bound(month: date) -> str:
+    return f"{month.isoformat()} 00:00:00+00"
+
+
+def _months_ahead() -> int:
+    return getattr(settings, "AUDIT_PARTITION_MONTHS_AHEAD", 3)
+
+
+def is_partitioned(connection=None) -> bool:
+    """True when ``core_auditevent`` is a partitioned (``relkind='p'``) table."""
+    connection = connection or default_connection
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE],
+        )
+        row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def list_partitions(connection=None) -> list[Partition]:
+    """Monthly children attached to ``core_auditevent``, oldest first."""
+    connection = connection or default_connection
+    if not is_partitioned(connection):
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            """,
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = []
+    for name in names:
+        match = _PARTITION_RE.match(name)
+        if match:
+            partitions.append(
+                Partition(name=name, start=date(int(match[1]), int(match[2]), 1)),
+            )
+    return sorted(partitions, key=lambda p: p.start)
+
+
+def _create_partition(cursor, month: date) -> str:
+    """Create ``month``'s child, moving any rows parked in the default partition.
+
+    Attaching a range the default partition already holds rows for fails,
+    so the child is built detached, filled from the default partition and
+    only then attached.
+    """
+    name = partition_name(month)
+    start, end = _bound(month), _bound(add_months(month, 1))
+    cursor.execute(f'CREATE TABLE "{name}" (LIKE "{TABLE}" INCLUDING DEFAULTS)')
+    cursor.execute(
+        f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '  # noqa: S608
+        "WHERE created_at >= %s AND created_at < %s RETURNING *) "
+        f'INSERT INTO "{name}" SELECT * FROM moved',
+        [start, end],
+    )
+    cursor.execute(
+        f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{name}" '
+        f"FOR VALUES FROM ('{start}') TO ('{end}')",
+    )
+    return name
+
+
+def _default_partition_months(cursor) -> list[date]:
+    cursor.execute(
+        f"SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC')::date "  # noqa: S608
+        f'FROM "{DEFAULT_PARTITION}"',
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def ensure_partitions(
+    *, through: date | None = None, since: date | None = None, connection=None,
+) -> list[str]:
+    """Create any missing monthly partitions; return the names created.
+
+    Covers ``since`` (default: the current month) through ``through``
+    (default: ``AUDIT_PARTITION_MONTHS_AHEAD`` months ahead), plus every
+    month that currently has rows in the default partition. Idempotent.
+    """
+    connection = connection or default_connection
+    if not is_partitioned(connection):
+        return []
+    current = month_start(timezone.now())
+    first = month_start(since) if since else current
+    last = month_start(through) if through else add_months(current, _months_ahead())
+    existing = {p.start for p in list_partitions(connection)}
+
+    created = []
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        wanted = set(_default_partition_months(cursor))
+        month = first
+        while month <= last:
+            wanted.add(month)
+            month = add_months(month, 1)
+        for month in sorted(wanted - existing):
+            created.append(_create_partition(cursor, month))
+    if created:
+        logger.info("audit_partitions.created", extra={"partitions": created})
+    return created
+
+
+def closed_partitions(*, keep_months: int, connection=None) -> list[Partition]:
+    """Monthly partitions that ended more than ``keep_months`` months ago."""
+    cutoff = add_months(month_start(timezone.now()), -keep_months)
+    return [p for p in list_partitions(connection) if p.end <= cutoff]
+
+
+def archive_path(partition: Partition) -> str:
+    prefix = getattr(settings, "AUDIT_ARCHIVE_PREFIX", "audit-archive").strip("/")
+    return f"{prefix}/{partition.name}.jsonl.gz"
+
+
+def _archive_storage():
+    return storages[getattr(settings, "AUDIT_ARCHIVE_STORAGE", "default")]
+
+
+def archive_partition(partition: Partition, *, drop: bool = True, connection=None) -> int:
+    """Write ``partition`` to ``<prefix>/<name>.jsonl.gz`` and drop it.
+
+    Rows are serialised by Postgres (``row_to_json``) and streamed through a
+    named cursor so memory stays flat regardless of partition size. The
+    partition is only detached/dropped after the archive is saved and its
+    line count matches the table's. Returns the number of rows archived.
+    """
+    connection = connection or default_connection
+    path = archive_path(partition)
+    storage = _archive_storage()
+    written = 0
+    with tempfile.TemporaryFile() as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb") as gz, transaction.atomic(
+            using=connection.alias,
+        ):
+            cursor = connection.chunked_cursor()
+            cursor.execute(
+                f'SELECT row_to_json(t)::text FROM "{partition.name}" t '  # noqa: S608
+                "ORDER BY created_at, id",
+            )
+            while rows := cursor.fetchmany(ARCHIVE_FETCH_SIZE):
+                gz.writelines(line.encode() + b"\n" for (line,) in rows)
+                written += len(rows)
+            cursor.close()
+        raw.seek(0)
+        if storage.exists(path):
+            storage.delete(path)
+        storage.save(path, File(raw, name=path))
+
+    if drop:
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM "{partition.name}"')  # noqa: S608
+            remaining = cursor.fetchone()[0]
+            if remaining != written:
+                msg = (
+                    f"{partition.name} holds {remaining} rows but {written} were "
+                    "archived; leaving the partition attached."
+                )
+                raise RuntimeError(msg)
+            cursor.execute(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{partition.name}"')
+            cursor.execute(f'DROP TABLE "{partition.name}"')
+    logger.info(
+        "audit_partitions.archived",
+        extra={"partition": partition.name, "rows": written, "path": path},
+    )
+    return written
+
+
+def read_archive(path: str) -> list[dict]:
+    """Load an archive written by :func:`archive_partition` (restores, tests)."""
+    with _archive_storage().open(path, "rb") as fh, gzip.GzipFile(fileobj=fh) as gz:
+        return [json.loads(line) for line in gz if line.strip()]
+
+
+# ---------------------------------------------------------------------------
+# Migration helpers
+# ---------------------------------------------------------------------------
+
+
+def _table_ddl(cursor, table: str) -> tuple[list[str], list[tuple[str, str]]]:
+    """Secondary index definitions and FK constraints currently on ``table``."""
+    cursor.execute(
+        """
+        SELECT pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        WHERE i.indrelid = to_regclass(%s) AND NOT i.indisprimary
+        """,
+        [table],
+    )
+    indexes = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = to_regclass(%s) AND contype = 'f'
+        """,
+        [table],
+    )
+    return indexes, list(cursor.fetchall())
+
+
+def _restore_ddl(cursor, indexes, foreign_keys) -> None:
+    for definition in indexes:
+        # Partitioned-parent indexes are reported as ``ON ONLY <table>``.
+        cursor.execute(definition.replace(" ON ONLY ", " ON ", 1))
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{name}" {definition}')
+
+
+def partition_table(schema_editor) -> None:
+    """Convert the plain ``core_auditevent`` heap into a partitioned table."""
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql" or is_partitioned(connection):
+        return
+    legacy = f"{TABLE}_unpartitioned"
+    with connection.cursor() as cursor:
+        indexes, foreign_keys = _table_ddl(cursor, TABLE)
+        cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{legacy}"')
+        cursor.execute(
+            f'ALTER TABLE "{legacy}" RENAME CONSTRAINT "{TABLE}_pkey" TO "{legacy}_pkey"',
+        )
+        cursor.execute(
+            f'CREATE TABLE "{TABLE}" (LIKE "{legacy}" INCLUDING DEFAULTS) '
+            "PARTITION BY RANGE (created_at)",
+        )
+        cursor.execute(
+            f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{TABLE}_pkey" PRIMARY KEY (id, created_at)',
+        )
+        cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT')
+        cursor.execute(f'INSERT INTO "{TABLE}" SELECT * FROM "{legacy}"')  # noqa: S608
+        cursor.execute(f'DROP TABLE "{legacy}"')
+        _restore_ddl(cursor, indexes, foreign_keys)
+    # Historical rows sit in the default partition until split out by month.
+    ensure_partitions(connection=connection)
+
+
+def unpartition_table(schema_editor) -> None:
+    """Reverse of :func:`partition_table`: fold every child back into one heap."""
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql" or not is_partitioned(connection):
+        return
+    partitioned = f"{TABLE}_partitioned"
+    with connection.cursor() as cursor:
+        indexes, foreign_keys = _table_ddl(cursor, TABLE)
+        cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{partitioned}"')
+        cursor.execute(
+            f'ALTER TABLE "{partitioned}" RENAME CONSTRAINT "{TABLE}_pkey" '
+            f'TO "{partitioned}_pkey"',
+        )
+        cursor.execute(f'CREATE TABLE "{TABLE}" (LIKE "{partitioned}" INCLUDING DEFAULTS)')
+        cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{TABLE}_pkey" PRIMARY KEY (id)')
+        cursor.execute(f'INSERT INTO "{TABLE}" SELECT * FROM "{partitioned}"')  # noqa: S608
+        cursor.execute(f'DROP TABLE "{partitioned}" CASCADE')
+        _restore_ddl(cursor, indexes, foreign_keys)
+
+
+def register_periodic_tasks(apps) -> None:
+    """Idempotently install the nightly ``maintain_audit_partitions`` beat row.
+
+    Mirrors :func:`bunk_logs.core.translation.beat.register_periodic_tasks`.
+    """
+    CrontabSchedule = apps.get_model("django_celery_beat", "CrontabSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = CrontabSchedule.objects.get_or_create(
+        minute=str(SCHEDULE_MINUTE),
+        hour=str(SCHEDULE_HOUR),
+        day_of_week="*",
+        day_of_month="*",
+        month_of_year="*",
+    )
+    PeriodicTask.objects.update_or_create(
+        name=PERIODIC_TASK_NAME,
+        defaults={
+            "crontab": schedule,
+            "interval": None,
+            "task": PERIODIC_TASK_PATH,
+            "args": json.dumps([]),
+            "kwargs": json.dumps({}),
+            "enabled": True,
+            "description": (
+                "Create upcoming monthly AuditEvent partitions and drain the "
+                "default partition."
+            ),
+        },
+    )
+
+
+def unregister_periodic_tasks(apps) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name=PERIODIC_TASK_NAME).delete()
@@ -1,14 +1,27 @@
-"""Match CSV rows to existing Person records for Campminder roster imports."""
+"""Match CSV rows to existing Person records for Campminder roster imports.
+
+Campminder ID lookups go through ``external_ids__campminder_id`` (``=`` or
+``IN``), which the ``core_person_cm_id`` expression index on
+``(organization, external_ids -> 'campminder_id')`` answers directly. Bulk
+callers (import preview, roster import) resolve every ID in the CSV with
+one :func:`persons_by_campminder_id` query and pass the map to
+:func:`match_campminder_person` instead of querying once per row.
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from bunk_logs.core.models import Organization
 from bunk_logs.core.models import Person
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
 
 class MatchStrategy(str, Enum):
     CAMPMINDER_ID = "campminder_id"
@@ -31,6 +44,24 @@ def _existing_campminder_id(person: Person) -> str:
     return str(person.external_ids.get("campminder_id") or "").strip()
 
 
+def persons_by_campminder_id(org: Organization, campminder_ids: Iterable[str]) -> dict[str, Person]:
+    """Existing Persons in ``org`` keyed by Campminder ID, in one indexed query.
+
+    When several Persons share an ID the first in default ordering wins, as
+    with ``.first()`` in :func:`match_campminder_person`.
+    """
+    ids = {cm_id for cm_id in campminder_ids if cm_id}
+    if not ids:
+        return {}
+    found: dict[str, Person] = {}
+    for person in Person.all_objects.filter(
+        organization=org,
+        external_ids__campminder_id__in=ids,
+    ):
+        found.setdefault(_existing_campminder_id(person), person)
+    return found
+
+
 def match_campminder_person(
     org: Organization,
     *,
@@ -38,12 +69,20 @@ def match_campminder_person(
     first_name: str,
     last_name: str,
     email: str,
+    known: Mapping[str, Person] | None = None,
 ) -> PersonMatch:
-    """Resolve a CSV row to an existing Person or classify how to create one."""
-    by_id = Person.all_objects.filter(
-        organization=org,
-        external_ids__campminder_id=campminder_id,
-    ).first()
+    """Resolve a CSV row to an existing Person or classify how to create one.
+
+    ``known`` is a :func:`persons_by_campminder_id` map covering
+    ``campminder_id``; when given, the ID match skips its own query.
+    """
+    if known is not None:
+        by_id = known.get(campminder_id)
+    else:
+        by_id = Person.all_objects.filter(
+            organization=org,
+            external_ids__campminder_id=campminder_id,
+        ).first()
     if by_id is not None:
         return PersonMatch(person=by_id, strategy=MatchStrategy.CAMPMINDER_ID)
 
@@ -0,0 +1,98 @@
+"""Celery queue topology helpers: enqueue timestamps, depth/age, worker lines.
+
+The queues and name-based routes live in settings (``CELERY_TASK_QUEUES`` /
+``CELERY_TASK_ROUTES``). This module backs the ``celery_queue_stats``
+command:
+
+* :func:`stamp_enqueued_at` (connected to ``before_task_publish`` in
+  ``config.celery_app``) records when each message was published, since
+  Celery's own message headers carry no publish time;
+* :func:`queue_stats` reads depth and the oldest message's age straight
+  from the Redis broker lists;
+* :func:`worker_commands` renders the ``celery worker`` line for each
+  ``CELERY_QUEUE_WORKERS`` group.
+
+Nothing here imports models -- ``config.celery_app`` loads it before the
+app registry is ready.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+
+ENQUEUED_AT_HEADER = "bunklogs_enqueued_at"
+
+# kombu's Redis transport stores priority N>0 messages in "<queue>\x06\x16N".
+_PRIORITY_SEP = "\x06\x16"
+_PRIORITY_STEPS = (0, 3, 6, 9)
+
+
+def stamp_enqueued_at(sender=None, headers=None, **kwargs) -> None:
+    """``before_task_publish`` receiver: stamp the publish time into headers."""
+    if headers is not None:
+        headers.setdefault(ENQUEUED_AT_HEADER, time.time())
+
+
+def queue_names() -> list[str]:
+    return [q.name for q in settings.CELERY_TASK_QUEUES]
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    name: str
+    depth: int
+    oldest_age_seconds: float | None
+
+
+def _priority_keys(name: str) -> list[str]:
+    return [name if pri == 0 else f"{name}{_PRIORITY_SEP}{pri}" for pri in _PRIORITY_STEPS]
+
+
+def _enqueued_at(raw) -> float | None:
+    try:
+        message = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    value = (message.get("headers") or {}).get(ENQUEUED_AT_HEADER)
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def queue_stats(client, names: list[str] | None = None, *, now: float | None = None) -> list[QueueStats]:
+    """Depth and oldest-message age per queue, from a Redis ``client``.
+
+    kombu LPUSHes and BRPOPs, so the oldest message of each list sits at
+    index -1. Age is ``None`` for an empty queue or for messages published
+    before :func:`stamp_enqueued_at` was connected.
+    """
+    now = time.time() if now is None else now
+    out = []
+    for name in names or queue_names():
+        depth = 0
+        oldest = None
+        for key in _priority_keys(name):
+            length = client.llen(key)
+            if not length:
+                continue
+            depth += length
+            stamped = _enqueued_at(client.lindex(key, -1))
+            if stamped is not None:
+                oldest = stamped if oldest is None else min(oldest, stamped)
+        out.append(QueueStats(name, depth, None if oldest is None else max(now - oldest, 0.0)))
+    return out
+
+
+def worker_commands(app_name: str = "config") -> dict[str, str]:
+    """``group -> celery worker`` command line for each ``CELERY_QUEUE_WORKERS`` entry."""
+    return {
+        group: (
+            f"celery -A {app_name} worker -l info -n {group}@%h "
+            f"-Q {','.join(spec['queues'])} "
+            f"--concurrency={spec['concurrency']} "
+            f"--prefetch-multiplier={spec['prefetch_multiplier']}"
+        )
+        for group, spec in settings.CELERY_QUEUE_WORKERS.items()
+    }
@@ -0,0 +1,58 @@
+"""Change-feed plumbing behind ``GET /api/v1/counselor/sync/``.
+
+The feed serves rows whose ``updated_at`` moved past the client's cursor,
+read through each synced model's ``(organization, updated_at)`` index.
+Deletions are carried by :class:`~bunk_logs.core.models.SyncTombstone`
+rows written from ``post_delete`` (wired in :mod:`bunk_logs.core.signals`).
+
+Anything that changes a synced row must bump ``updated_at``: list it in
+``save(update_fields=...)`` and pass ``updated_at=timezone.now()`` to bulk
+``.update()`` calls, or the change never reaches the feed.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from bunk_logs.core.models import CamperDayState
+from bunk_logs.core.models import Flag
+from bunk_logs.core.models import MaintenanceTicket
+from bunk_logs.core.models import Order
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import SyncTombstone
+
+# Feed label -> model. The labels are the payload keys' singular form and
+# the ``SyncTombstone.model`` values, so they are part of the API.
+SYNCED_MODELS: dict[str, type] = {
+    "reflection": Reflection,
+    "camper_day_state": CamperDayState,
+    "order": Order,
+    "maintenance_ticket": MaintenanceTicket,
+    "flag": Flag,
+}
+
+_LABEL_BY_MODEL = {model: label for label, model in SYNCED_MODELS.items()}
+
+
+def tombstone_retention() -> timedelta:
+    return timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+
+
+def record_tombstone(sender, instance, **kwargs) -> None:
+    """``post_delete`` receiver: remember the deleted row for the change feed."""
+    SyncTombstone.all_objects.create(
+        organization_id=instance.organization_id,
+        program_id=instance.program_id,
+        model=_LABEL_BY_MODEL[sender],
+        object_id=str(instance.pk),
+    )
+
+
+def prune_tombstones(*, now=None) -> dict:
+    """Delete tombstones older than ``SYNC_TOMBSTONE_RETENTION_DAYS``."""
+    cutoff = (now or timezone.now()) - tombstone_retention()
+    deleted, _ = SyncTombstone.all_objects.filter(deleted_at__lt=cutoff).delete()
+    return {"deleted": deleted, "cutoff": cutoff.isoformat()}
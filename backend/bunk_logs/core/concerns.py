@@ -0,0 +1,198 @@
+"""Write-time extraction of Concerns Inbox items (:class:`ConcernItem`).
+
+A reflection's concerns are a pure function of its template schema and
+answers:
+
+* ``open_concern`` -- non-empty text on a ``text`` / ``textarea`` field
+  tagged ``dashboard_role="open_concern"``;
+* ``low_rating`` -- a ``primary_rating`` single rating, or any
+  ``rating_group`` category, at or below :data:`LOW_RATING_THRESHOLD`;
+* ``bunk_concern`` -- each bunk referenced by ``bunk_concerns_bunks`` on a
+  counselor / Unit Head self-reflection.
+
+:func:`sync_concern_items` replaces a reflection's rows and runs from the
+``post_save`` receiver in :mod:`bunk_logs.core.signals`; incomplete
+reflections carry no rows. :func:`backfill_concern_items` (the
+``backfill_concern_items`` command) rebuilds them in bulk for existing
+data, ``.update()`` writes and template schema edits.
+"""
+
+from __future__ import annotations
+
+from django.db import transaction
+
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import ConcernItem
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.template_view import template_view
+
+LOW_RATING_THRESHOLD = 1
+BACKFILL_BATCH_SIZE = 500
+
+# Reflection fields whose change can add, drop or move a concern; saves
+# whose ``update_fields`` miss all of them skip the resync.
+CONCERN_SOURCE_FIELDS = frozenset({
+    "answers",
+    "template",
+    "is_complete",
+    "period_start",
+    "period_end",
+    "subject",
+    "assignment_group",
+    "program",
+})
+
+INBOX_KINDS = (ConcernItem.Kind.OPEN_CONCERN, ConcernItem.Kind.LOW_RATING)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def extract_concerns(r: Reflection) -> list[dict]:
+    """Every concerning item in ``r.answers``, in schema order (via the template view)."""
+    items: list[dict] = []
+    answers = r.answers or {}
+    for f in template_view(r.template).concern_fields:
+        ftype = f.get("type")
+        fkey = f.get("key")
+        role = f.get("dashboard_role")
+        v = answers.get(fkey)
+        if role == "open_concern" and ftype in ("text", "textarea"):
+            if isinstance(v, str) and v.strip():
+                items.append({
+                    "kind": "open_concern",
+                    "field_key": fkey,
+                    "field_label": f.get("prompts", {}).get("en") or fkey,
+                    "value": v.strip()[:1000],
+                })
+        if ftype == "single_rating" and role == "primary_rating":
+            if _is_number(v) and float(v) <= LOW_RATING_THRESHOLD:
+                items.append({
+                    "kind": "low_rating",
+                    "field_key": fkey,
+                    "field_label": f.get("prompts", {}).get("en") or fkey,
+                    "value": float(v),
+                })
+        if ftype == "rating_group":
+            block = v if isinstance(v, dict) else {}
+            for cat in f.get("categories") or []:
+                if not isinstance(cat, dict):
+                    continue
+                ck = cat.get("key")
+                cv = block.get(ck)
+                if _is_number(cv) and float(cv) <= LOW_RATING_THRESHOLD:
+                    items.append({
+                        "kind": "low_rating",
+                        "field_key": f"{fkey}__{ck}",
+                        "field_label": (
+                            cat.get("labels", {}).get("en") or f"{fkey} · {ck}"
+                        ),
+                        "value": float(cv),
+                    })
+    return items
+
+
+def referenced_bunk_ids(r: Reflection) -> list[int]:
+    """Integer entries of ``answers['bunk_concerns_bunks']``, deduplicated, in order."""
+    raw = (r.answers or {}).get("bunk_concerns_bunks") or []
+    if not isinstance(raw, list):
+        return []
+    out: list[int] = []
+    for value in raw:
+        try:
+            bid = int(value)
+        except (ValueError, TypeError):
+            continue
+        if bid not in out:
+            out.append(bid)
+    return out
+
+
+def build_concern_items(r: Reflection) -> list[ConcernItem]:
+    """Unsaved :class:`ConcernItem` rows for ``r`` (none when incomplete)."""
+    if not r.is_complete:
+        return []
+    common = {
+        "organization_id": r.organization_id,
+        "program_id": r.program_id,
+        "reflection_id": r.pk,
+        "subject_id": r.subject_id,
+        "period_start": r.period_start,
+        "date": r.period_end,
+    }
+    rows = []
+    for position, c in enumerate(extract_concerns(r)):
+        is_text = c["kind"] == ConcernItem.Kind.OPEN_CONCERN
+        rows.append(
+            ConcernItem(
+                **common,
+                assignment_group_id=r.assignment_group_id,
+                kind=c["kind"],
+                severity=ConcernItem.Severity.MEDIUM if is_text else ConcernItem.Severity.HIGH,
+                field_key=c["field_key"],
+                field_label=str(c["field_label"])[:255],
+                value_text=c["value"] if is_text else "",
+                value_number=None if is_text else c["value"],
+                position=position,
+            ),
+        )
+    bunk_ids = referenced_bunk_ids(r)
+    if bunk_ids:
+        # Only bunks that exist; stale ids in old answers are dropped.
+        existing = set(
+            AssignmentGroup.all_objects.filter(
+                organization_id=r.organization_id, id__in=bunk_ids,
+            ).values_list("id", flat=True),
+        )
+        start = len(rows)
+        rows.extend(
+            ConcernItem(
+                **common,
+                assignment_group_id=bid,
+                kind=ConcernItem.Kind.BUNK_CONCERN,
+                severity=ConcernItem.Severity.LOW,
+                field_key="bunk_concerns_bunks",
+                field_label="Bunk concerns",
+                value_text=str((r.answers or {}).get("bunk_concerns_note") or "")[:1000],
+                position=start + offset,
+            )
+            for offset, bid in enumerate(b for b in bunk_ids if b in existing)
+        )
+    return rows
+
+
+def sync_concern_items(r: Reflection) -> int:
+    """Replace ``r``'s concern rows with a fresh extraction; returns the count."""
+    rows = build_concern_items(r)
+    with transaction.atomic():
+        ConcernItem.all_objects.filter(reflection_id=r.pk).delete()
+        ConcernItem.all_objects.bulk_create(rows)
+    return len(rows)
+
+
+def backfill_concern_items(
+    queryset=None, *, batch_size: int = BACKFILL_BATCH_SIZE,
+) -> tuple[int, int]:
+    """Rebuild rows for every reflection in ``queryset`` in primary-key batches.
+
+    Each batch deletes and re-inserts its reflections' rows in one
+    transaction. Returns ``(reflections, items)`` processed.
+    """
+    if queryset is None:
+        queryset = Reflection.all_objects.all()
+    queryset = queryset.select_related("template").order_by("pk")
+    reflections = items = 0
+    last_pk = None
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        batch = list(page[:batch_size])
+        if not batch:
+            return reflections, items
+        rows = [row for r in batch for row in build_concern_items(r)]
+        with transaction.atomic():
+            ConcernItem.all_objects.filter(reflection_id__in=[r.pk for r in batch]).delete()
+            ConcernItem.all_objects.bulk_create(rows)
+        reflections += len(batch)
+        items += len(rows)
+        last_pk = batch[-1].pk
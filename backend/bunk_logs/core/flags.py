@@ -4,24 +4,54 @@ Raise ``core.Flag`` rows when upstream content requests Camper Care triage.
 The flagged campers workspace and dashboard badges read these rows only;
 group/bunk dashboards surface help requests directly from reflection
 answers via :func:`camper_care_help_requested_camper_ids_from`.
+
+:func:`raise_flags_for_reflections` is the batch pipeline (a bunk's evening
+submissions, dashboard re-syncs, ``manage.py backfill_camper_care_flags``);
+the single-reflection helper used by the write endpoints delegates to it.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from dataclasses import field
 from datetime import date
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from django.core.cache import cache
+from django.db import transaction
 
+from bunk_logs.core import live_events
 from bunk_logs.core.models import Flag
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import Reflection
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from bunk_logs.core.models import Program
 
 
+@dataclass
+class FlagBatch:
+    """Outcome of :func:`raise_flags_for_reflections`.
+
+    ``flags`` maps each help-requesting reflection id to its open flag
+    (new or reused); ``created`` lists only the rows this call inserted.
+    """
+
+    flags: dict = field(default_factory=dict)
+    created: list[Flag] = field(default_factory=list)
+
+
+HELP_REQUEST_ANSWER_KEY = "request_camper_care_help"
+HELP_REQUEST_DASHBOARD_ROLE = "help_request_camper_care"
+
+_OPEN_STATUSES = (Flag.Status.ACTIVE, Flag.Status.FOLLOWED_UP)
+
+BACKFILL_BATCH_SIZE = 500
+
+
 def _is_truthy_yes_no(value: object) -> bool:
     if isinstance(value, bool):
         return value
@@ -30,37 +60,130 @@ def _is_truthy_yes_no(value: object) -> bool:
     return False
 
 
+def help_request_keys(schema: dict | None) -> frozenset[str]:
+    """Answer keys that request Camper Care help under a template ``schema``."""
+    keys = {HELP_REQUEST_ANSWER_KEY}
+    for spec in (schema or {}).get("fields") or []:
+        if not isinstance(spec, dict):
+            continue
+        if spec.get("dashboard_role") != HELP_REQUEST_DASHBOARD_ROLE:
+            continue
+        key = spec.get("key")
+        if isinstance(key, str):
+            keys.add(key)
+    return frozenset(keys)
+
+
+def _requests_help(reflection: Reflection, keys: frozenset[str]) -> bool:
+    if not reflection.subject_id:
+        return False
+    answers = reflection.answers or {}
+    return any(_is_truthy_yes_no(answers.get(key)) for key in keys)
+
+
 def reflection_requests_camper_care_help(reflection: Reflection) -> bool:
     """True when this reflection's answers request Camper Care help."""
     if not reflection.subject_id:
         return False
-    answers = reflection.answers or {}
-    if _is_truthy_yes_no(answers.get("request_camper_care_help")):
-        return True
     schema = reflection.template.schema if reflection.template_id else {}
-    for field in (schema or {}).get("fields") or []:
-        if not isinstance(field, dict):
-            continue
-        if field.get("dashboard_role") != "help_request_camper_care":
+    return _requests_help(reflection, help_request_keys(schema))
+
+
+def _author_memberships(reflections: list[Reflection]) -> dict[tuple[int, int], Membership]:
+    """Latest active Membership per ``(person_id, program_id)`` of the authors."""
+    person_ids = {r.author_id for r in reflections if r.author_id}
+    if not person_ids:
+        return {}
+    rows = Membership.all_objects.filter(
+        person_id__in=person_ids,
+        program_id__in={r.program_id for r in reflections},
+        is_active=True,
+    ).order_by("created_at")
+    # Ascending, so the newest membership per key wins.
+    return {(m.person_id, m.program_id): m for m in rows}
+
+
+def raise_flags_for_reflections(
+    reflections: Iterable[Reflection],
+    *,
+    raised_by_membership: Membership | None = None,
+) -> FlagBatch:
+    """Create ACTIVE CC flags for every reflection that requests help.
+
+    The batch form of :func:`raise_flag_from_camper_reflection`: help-request
+    fields are resolved once per template, author memberships and existing
+    flags are loaded in one query each, and new flags are written with a
+    single ``bulk_create``. A reflection that already has an active /
+    followed-up flag reuses it; one whose flag was resolved gets none.
+    Affected Camper Care dashboards are invalidated together.
+
+    ``raised_by_membership`` overrides the author lookup for every row (a
+    single submitter acting on their own batch).
+    """
+    keys_by_template: dict[int | None, frozenset[str]] = {}
+    requesting: dict[str, Reflection] = {}
+    for reflection in reflections:
+        if not reflection.subject_id:
             continue
-        key = field.get("key")
-        if isinstance(key, str) and _is_truthy_yes_no(answers.get(key)):
-            return True
-    return False
+        if reflection.template_id not in keys_by_template:
+            schema = reflection.template.schema if reflection.template_id else {}
+            keys_by_template[reflection.template_id] = help_request_keys(schema)
+        if _requests_help(reflection, keys_by_template[reflection.template_id]):
+            requesting.setdefault(str(reflection.id), reflection)
+
+    batch = FlagBatch()
+    if not requesting:
+        return batch
+
+    existing = Flag.all_objects.filter(
+        program_id__in={r.program_id for r in requesting.values()},
+        flagged_for_role="camper_care",
+        trigger_content_type="reflection",
+        trigger_content_id__in=list(requesting),
+    ).order_by("created_at")
+    latest_by_trigger = {flag.trigger_content_id: flag for flag in existing}
 
+    pending: list[Reflection] = []
+    for trigger_id, reflection in requesting.items():
+        flag = latest_by_trigger.get(trigger_id)
+        if flag is None:
+            pending.append(reflection)
+        elif flag.status in _OPEN_STATUSES:
+            batch.flags[reflection.id] = flag
+        # Resolved/reopened history stays tied to its reflection; do not
+        # mint a duplicate ACTIVE row when the flags workspace re-syncs.
+    if not pending:
+        return batch
 
-def _author_membership_for_reflection(reflection: Reflection) -> Membership | None:
-    if not reflection.author_id:
-        return None
-    return (
-        Membership.all_objects.filter(
-            person_id=reflection.author_id,
+    raisers = {} if raised_by_membership else _author_memberships(pending)
+    new_flags = [
+        Flag(
+            organization_id=reflection.organization_id,
             program_id=reflection.program_id,
-            is_active=True,
+            subject_camper_id=reflection.subject_id,
+            raised_by_membership=(
+                raised_by_membership
+                or raisers.get((reflection.author_id, reflection.program_id))
+            ),
+            flagged_for_role="camper_care",
+            trigger_content_type="reflection",
+            trigger_content_id=str(reflection.id),
+            status=Flag.Status.ACTIVE,
         )
-        .order_by("-created_at")
-        .first()
-    )
+        for reflection in pending
+    ]
+    Flag.all_objects.bulk_create(new_flags)
+    for reflection, flag in zip(pending, new_flags, strict=True):
+        batch.flags[reflection.id] = flag
+    batch.created = new_flags
+
+    # ``bulk_create`` skips post_save, so publish the live event here --
+    # once per program rather than once per flag.
+    programs = {(r.organization_id, r.program_id) for r in pending}
+    for organization_id, program_id in programs:
+        live_events.publish(organization_id=organization_id, program_id=program_id, kind="flag")
+    bust_camper_care_dashboard_caches({(r.program_id, r.period_start) for r in pending})
+    return batch
 
 
 def raise_flag_from_camper_reflection(
@@ -73,40 +196,10 @@ def raise_flag_from_camper_reflection(
     Returns ``None`` when the reflection does not request help. Reuses an
     existing active/followed-up flag for the same reflection trigger.
     """
-    if not reflection_requests_camper_care_help(reflection):
-        return None
-
-    trigger_id = str(reflection.id)
-    existing = (
-        Flag.all_objects.filter(
-            program_id=reflection.program_id,
-            flagged_for_role="camper_care",
-            trigger_content_type="reflection",
-            trigger_content_id=trigger_id,
-        )
-        .order_by("-created_at")
-        .first()
-    )
-    if existing is not None:
-        if existing.status in (Flag.Status.ACTIVE, Flag.Status.FOLLOWED_UP):
-            return existing
-        # Resolved/reopened history stays tied to this reflection; do not
-        # mint a duplicate ACTIVE row when the flags workspace re-syncs.
-        return None
-
-    raiser = raised_by_membership or _author_membership_for_reflection(reflection)
-    flag = Flag.all_objects.create(
-        organization_id=reflection.organization_id,
-        program_id=reflection.program_id,
-        subject_camper_id=reflection.subject_id,
-        raised_by_membership=raiser,
-        flagged_for_role="camper_care",
-        trigger_content_type="reflection",
-        trigger_content_id=trigger_id,
-        status=Flag.Status.ACTIVE,
+    batch = raise_flags_for_reflections(
+        [reflection], raised_by_membership=raised_by_membership,
     )
-    bust_camper_care_dashboard_cache_for_program(reflection.program, reflection.period_start)
-    return flag
+    return batch.flags.get(reflection.id)
 
 
 def sync_missing_camper_care_help_flags(
@@ -141,23 +234,37 @@ def sync_missing_camper_care_help_flags(
             period_end__gte=today - timedelta(days=lookback_days),
             period_start__lte=today,
         )
-    reflections = reflections.select_related("template", "author")
+    reflections = reflections.select_related("template")
+    return len(raise_flags_for_reflections(reflections).created)
 
-    created = 0
-    for reflection in reflections:
-        before_ids = set(
-            Flag.all_objects.filter(
-                program=program,
-                trigger_content_type="reflection",
-                trigger_content_id=str(reflection.id),
-                flagged_for_role="camper_care",
-                status__in=(Flag.Status.ACTIVE, Flag.Status.FOLLOWED_UP),
-            ).values_list("id", flat=True),
-        )
-        flag = raise_flag_from_camper_reflection(reflection)
-        if flag is not None and flag.id not in before_ids:
-            created += 1
-    return created
+
+def backfill_camper_care_flags(
+    queryset=None, *, batch_size: int = BACKFILL_BATCH_SIZE,
+) -> tuple[int, int]:
+    """Raise missing CC flags for every reflection in ``queryset``.
+
+    Walks completed reflections with a subject in primary-key batches, one
+    :func:`raise_flags_for_reflections` call (and transaction) per batch.
+    Returns ``(reflections, flags created)``.
+    """
+    if queryset is None:
+        queryset = Reflection.all_objects.all()
+    queryset = (
+        queryset.filter(is_complete=True, subject_id__isnull=False)
+        .select_related("template")
+        .order_by("pk")
+    )
+    reflections = created = 0
+    last_pk = None
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        batch = list(page[:batch_size])
+        if not batch:
+            return reflections, created
+        with transaction.atomic():
+            created += len(raise_flags_for_reflections(batch).created)
+        reflections += len(batch)
+        last_pk = batch[-1].pk
 
 
 def active_flags_for_program_day(*, program: Program, target_date: date):
@@ -199,10 +306,30 @@ def flagged_camper_ids_for_date(
 
 def bust_camper_care_dashboard_cache_for_program(program: Program, target_date: date) -> None:
     """Invalidate cached CC dashboards after flag changes for ``target_date``."""
-    org_id = program.organization_id
-    person_ids = Membership.all_objects.filter(
-        program=program, role="camper_care", is_active=True,
-    ).values_list("person_id", flat=True)
-    key_date = target_date.isoformat()
-    for person_id in person_ids:
-        cache.delete(f"camper_care_dashboard:{org_id}:{person_id}:{key_date}")
+    bust_camper_care_dashboard_caches({(program.id, target_date)})
+
+
+def bust_camper_care_dashboard_caches(program_days: set[tuple[int, date]]) -> None:
+    """Invalidate the CC dashboards of every ``(program_id, camp day)`` pair.
+
+    One Membership query and one ``delete_many`` however many programs and
+    days a flag batch touched.
+    """
+    program_days = {(pid, day) for pid, day in program_days if day is not None}
+    if not program_days:
+        return
+    viewers = Membership.all_objects.filter(
+        program_id__in={pid for pid, _ in program_days},
+        role="camper_care",
+        is_active=True,
+    ).values_list("program_id", "program__organization_id", "person_id")
+    days_by_program: dict[int, set[date]] = {}
+    for program_id, day in program_days:
+        days_by_program.setdefault(program_id, set()).add(day)
+    keys = [
+        f"camper_care_dashboard:{org_id}:{person_id}:{day.isoformat()}"
+        for program_id, org_id, person_id in viewers
+        for day in days_by_program[program_id]
+    ]
+    if keys:
+        cache.delete_many(keys)
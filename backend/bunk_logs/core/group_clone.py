@@ -1,4 +1,10 @@
-"""Clone an assignment group (structure + roster) to another program."""
+"""Clone an assignment group (structure + roster) to another program.
+
+The roster and program-membership copies are set-based (one read and one
+``bulk_create`` / ``bulk_update`` each) so :mod:`bunk_logs.core.program_rollover`
+can reuse them for a whole group tree. ``bulk_create`` skips the roster and
+audience receivers, so callers finish with :func:`refresh_derived_rows`.
+"""
 
 from __future__ import annotations
 
@@ -7,11 +13,16 @@ from dataclasses import field
 
 from django.utils.text import slugify
 
+from bunk_logs.core import assignment_audience
+from bunk_logs.core.models import ROLE_TO_CAPABILITY
 from bunk_logs.core.models import AssignmentGroup
 from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import Organization
 from bunk_logs.core.models import Program
+from bunk_logs.core.roster_snapshot import invalidate_roster_snapshot
+
+MAX_SLUG_SUFFIX = 1000
 
 
 class GroupCloneError(Exception):
@@ -23,20 +34,139 @@ class GroupCloneError(Exception):
         self.message = message
 
 
-def unique_group_slug(program: Program, base_slug: str) -> str:
-    """Return a slug unique within the program, suffixing -2, -3, … on collision."""
+def resolve_slug(base_slug: str, taken: set[str]) -> str:
+    """First of ``base``, ``base-2``, ``base-3``, … not in ``taken``; adds it.
+
+    ``taken`` is the program's prefetched slug set, so resolving a whole
+    tree's slugs costs no queries.
+    """
     slug = (base_slug or "group").strip("-")[:100] or "group"
-    if not AssignmentGroup.all_objects.filter(program=program, slug=slug).exists():
+    if slug not in taken:
+        taken.add(slug)
         return slug
     stem = slug[:95] if len(slug) > 95 else slug
-    for n in range(2, 1000):
+    for n in range(2, MAX_SLUG_SUFFIX):
         candidate = f"{stem}-{n}"
-        if not AssignmentGroup.all_objects.filter(program=program, slug=candidate).exists():
+        if candidate not in taken:
+            taken.add(candidate)
             return candidate
     msg = "Could not generate a unique slug for this program."
     raise GroupCloneError(msg, field_name="slug")
 
 
+def unique_group_slug(program: Program, base_slug: str) -> str:
+    """Return a slug unique within the program, suffixing -2, -3, … on collision."""
+    stem = (base_slug or "group").strip("-")[:95] or "group"
+    taken = set(
+        AssignmentGroup.all_objects.filter(
+            program=program, slug__startswith=stem,
+        ).values_list("slug", flat=True),
+    )
+    return resolve_slug(base_slug, taken)
+
+
+def copy_rosters(group_map: dict[int, AssignmentGroup]) -> int:
+    """Copy active roster rows of each source group id onto its target group.
+
+    Rows already on a target group are reactivated with the source's dates
+    and metadata. Returns the number of source rows copied.
+    """
+    if not group_map:
+        return 0
+    source_rows = list(
+        AssignmentGroupMembership.all_objects.filter(
+            group_id__in=list(group_map), is_active=True,
+        ),
+    )
+    existing = {
+        (row.group_id, row.person_id, row.role_in_group): row
+        for row in AssignmentGroupMembership.all_objects.filter(
+            group__in=list(group_map.values()),
+        )
+    }
+    to_create: list[AssignmentGroupMembership] = []
+    to_update: list[AssignmentGroupMembership] = []
+    for src in source_rows:
+        target = group_map[src.group_id]
+        row = existing.get((target.pk, src.person_id, src.role_in_group))
+        if row is None:
+            row = AssignmentGroupMembership(
+                group=target, person_id=src.person_id, role_in_group=src.role_in_group,
+            )
+            to_create.append(row)
+        else:
+            to_update.append(row)
+        row.is_active = True
+        row.start_date = src.start_date
+        row.end_date = src.end_date
+        row.metadata = dict(src.metadata or {})
+    AssignmentGroupMembership.all_objects.bulk_create(to_create)
+    AssignmentGroupMembership.all_objects.bulk_update(
+        to_update, ["is_active", "start_date", "end_date", "metadata"],
+    )
+    return len(source_rows)
+
+
+def copy_program_memberships(
+    *,
+    source_program_id: int,
+    target_program: Program,
+    person_ids: set[int],
+) -> dict[int, int]:
+    """Copy ``person_ids``' active Memberships into ``target_program``.
+
+    Existing target rows for the same (person, role) are reactivated and
+    refreshed. Returns ``{source membership id: target membership id}``.
+    """
+    if not person_ids:
+        return {}
+    sources = list(
+        Membership.all_objects.filter(
+            program_id=source_program_id, person_id__in=person_ids, is_active=True,
+        ),
+    )
+    existing = {
+        (m.person_id, m.role): m
+        for m in Membership.all_objects.filter(
+            program=target_program, person_id__in={m.person_id for m in sources},
+        )
+    }
+    pairs: list[tuple[Membership, Membership]] = []
+    to_create: list[Membership] = []
+    to_update: list[Membership] = []
+    for src in sources:
+        target = existing.get((src.person_id, src.role))
+        if target is None:
+            target = Membership(
+                program=target_program,
+                person_id=src.person_id,
+                role=src.role,
+                # bulk_create skips save(), which normally derives this.
+                capability=ROLE_TO_CAPABILITY[src.role],
+            )
+            to_create.append(target)
+        else:
+            to_update.append(target)
+        target.is_active = True
+        target.start_date = src.start_date
+        target.end_date = src.end_date
+        target.tags = list(src.tags or [])
+        target.metadata = dict(src.metadata or {})
+        target.grade_level = src.grade_level
+        pairs.append((src, target))
+    Membership.all_objects.bulk_create(to_create)
+    Membership.all_objects.bulk_update(
+        to_update, ["is_active", "start_date", "end_date", "tags", "metadata", "grade_level"],
+    )
+    return {src.pk: target.pk for src, target in pairs}
+
+
+def refresh_derived_rows(program_id: int) -> None:
+    """Catch the roster snapshot and assignment audiences up after bulk copies."""
+    invalidate_roster_snapshot(program_id)
+    assignment_audience.rebuild_program(program_id)
+
+
 @dataclass
 class CloneResult:
     group: AssignmentGroup
@@ -108,80 +238,22 @@ def clone_assignment_group(
         is_active=True,
     )
 
-    source_memberships = AssignmentGroupMembership.all_objects.filter(
-        group=source,
-        is_active=True,
-    ).select_related("person")
-
-    roster_person_ids: set[int] = set()
-    memberships_copied = 0
-
-    for src_mem in source_memberships:
-        roster_person_ids.add(src_mem.person_id)
-        membership, created = AssignmentGroupMembership.all_objects.get_or_create(
-            group=cloned_group,
-            person=src_mem.person,
-            role_in_group=src_mem.role_in_group,
-            defaults={
-                "is_active": True,
-                "start_date": src_mem.start_date,
-                "end_date": src_mem.end_date,
-                "metadata": dict(src_mem.metadata or {}),
-            },
-        )
-        if not created:
-            membership.is_active = True
-            membership.start_date = src_mem.start_date
-            membership.end_date = src_mem.end_date
-            membership.metadata = dict(src_mem.metadata or {})
-            membership.save(
-                update_fields=["is_active", "start_date", "end_date", "metadata"],
-            )
-        memberships_copied += 1
-
-    program_memberships_copied = 0
-    if roster_person_ids:
-        source_program_memberships = Membership.all_objects.filter(
-            program=source.program,
-            person_id__in=roster_person_ids,
-            is_active=True,
-        )
-        for src_prog_mem in source_program_memberships:
-            prog_mem, created = Membership.all_objects.get_or_create(
-                program=target_program,
-                person=src_prog_mem.person,
-                role=src_prog_mem.role,
-                defaults={
-                    "is_active": True,
-                    "start_date": src_prog_mem.start_date,
-                    "end_date": src_prog_mem.end_date,
-                    "tags": list(src_prog_mem.tags or []),
-                    "metadata": dict(src_prog_mem.metadata or {}),
-                    "grade_level": src_prog_mem.grade_level,
-                },
-            )
-            if not created:
-                prog_mem.is_active = True
-                prog_mem.start_date = src_prog_mem.start_date
-                prog_mem.end_date = src_prog_mem.end_date
-                prog_mem.tags = list(src_prog_mem.tags or [])
-                prog_mem.metadata = dict(src_prog_mem.metadata or {})
-                prog_mem.grade_level = src_prog_mem.grade_level
-                prog_mem.save(
-                    update_fields=[
-                        "is_active",
-                        "start_date",
-                        "end_date",
-                        "tags",
-                        "metadata",
-                        "grade_level",
-                    ],
-                )
-            program_memberships_copied += 1
+    memberships_copied = copy_rosters({source.pk: cloned_group})
+    roster_person_ids = set(
+        AssignmentGroupMembership.all_objects.filter(
+            group=cloned_group, is_active=True,
+        ).values_list("person_id", flat=True),
+    )
+    program_memberships = copy_program_memberships(
+        source_program_id=source.program_id,
+        target_program=target_program,
+        person_ids=roster_person_ids,
+    )
+    refresh_derived_rows(target_program.pk)
 
     return CloneResult(
         group=cloned_group,
         memberships_copied=memberships_copied,
-        program_memberships_copied=program_memberships_copied,
+        program_memberships_copied=len(program_memberships),
         warnings=warnings,
     )
@@ -0,0 +1,112 @@
+"""Dashboard invalidation events for the live push channel.
+
+Writes that change what a dashboard shows publish a small JSON event on the
+organization's Redis pub/sub channel::
+
+    {"kind": "order", "program_id": 7, "group_ids": [41]}
+
+``GET /api/v1/live/events/`` (see :mod:`bunk_logs.api.live`) relays the
+events relevant to each open tab as Server-Sent Events, so the SPA refetches
+when something changed instead of polling on a timer. Events carry ids only;
+clients always refetch through the ordinary, visibility-filtered endpoints.
+
+Publishing happens from ``post_save`` (wired in :mod:`bunk_logs.core.signals`)
+and is deferred to ``transaction.on_commit`` so a tab never refetches before
+the row is visible. It is best-effort: a Redis outage is logged and the write
+carries on -- clients fall back to their slow poll. Every publish goes
+through one process-wide client built with ``LIVE_REDIS_OPTIONS`` (short
+socket timeouts, and the same TLS options as the cache and broker).
+
+Off unless ``LIVE_EVENTS_ENABLED`` is set, which waits on the ASGI service
+and SPA subscriber described in :mod:`bunk_logs.api.live`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import redis
+from django.conf import settings
+from django.db import transaction
+
+from bunk_logs.core.models import Flag
+from bunk_logs.core.models import MaintenanceTicket
+from bunk_logs.core.models import Order
+from bunk_logs.core.models import Reflection
+from bunk_logs.notes.models import ObservationReply
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "live:org:"
+
+# Model -> event ``kind``. The kinds are part of the SSE payload.
+EVENT_KINDS: dict[type, str] = {
+    Reflection: "reflection",
+    Flag: "flag",
+    Order: "order",
+    MaintenanceTicket: "maintenance_ticket",
+    ObservationReply: "observation_reply",
+}
+
+_client: redis.Redis | None = None
+
+
+def channel_for(organization_id) -> str:
+    return f"{CHANNEL_PREFIX}{organization_id}"
+
+
+def _redis() -> redis.Redis:
+    global _client  # noqa: PLW0603
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL, **settings.LIVE_REDIS_OPTIONS)
+    return _client
+
+
+def _send(channel: str, message: str) -> None:
+    try:
+        _redis().publish(channel, message)
+    except redis.RedisError:
+        logger.warning("Live event publish to %s failed", channel, exc_info=True)
+
+
+def publish(*, organization_id, program_id, kind: str, group_ids=()) -> None:
+    """Publish an invalidation event once the current transaction commits."""
+    if not settings.LIVE_EVENTS_ENABLED:
+        return
+    message = json.dumps(
+        {
+            "kind": kind,
+            "program_id": program_id,
+            "group_ids": [g for g in group_ids if g is not None],
+        },
+    )
+    channel = channel_for(organization_id)
+    transaction.on_commit(lambda: _send(channel, message))
+
+
+def _event_scope(instance) -> tuple:
+    """``(organization_id, program_id, group_ids)`` for a published row."""
+    if isinstance(instance, ObservationReply):
+        observation = instance.observation
+        return observation.organization_id, observation.program_id, ()
+    if isinstance(instance, Reflection):
+        return instance.organization_id, instance.program_id, (instance.assignment_group_id,)
+    if isinstance(instance, Order):
+        return instance.organization_id, instance.program_id, (instance.submitted_from_bunk_id,)
+    return instance.organization_id, instance.program_id, ()
+
+
+def publish_on_save(sender, instance, created, raw=False, **kwargs) -> None:
+    """``post_save`` receiver for the models in :data:`EVENT_KINDS`."""
+    if raw:
+        return
+    if sender is ObservationReply and not created:
+        return
+    organization_id, program_id, group_ids = _event_scope(instance)
+    publish(
+        organization_id=organization_id,
+        program_id=program_id,
+        kind=EVENT_KINDS[sender],
+        group_ids=group_ids,
+    )
@@ -0,0 +1,87 @@
+"""Archive closed monthly ``AuditEvent`` partitions to storage and drop them.
+
+Each partition older than the retention window is streamed to
+``<AUDIT_ARCHIVE_PREFIX>/core_auditevent_pYYYYMM.jsonl.gz`` in the
+``AUDIT_ARCHIVE_STORAGE`` backend (one ``row_to_json`` object per line),
+then detached and dropped. The drop is skipped if the archived line count
+does not match the partition's row count.
+
+Usage::
+
+    # Default: dry-run, lists partitions past AUDIT_ARCHIVE_AFTER_MONTHS
+    python manage.py archive_audit_partitions
+
+    # Archive and drop
+    python manage.py archive_audit_partitions --apply
+
+    # Keep only the last 6 closed months online; write archives but keep tables
+    python manage.py archive_audit_partitions --keep-months 6 --apply --no-drop
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from bunk_logs.core import audit_partitions
+
+
+class Command(BaseCommand):
+    help = "Move AuditEvent partitions past the retention window to compressed JSONL."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--apply",
+            action="store_true",
+            help="Write archives and drop partitions. Without this flag the command only reports.",
+        )
+        parser.add_argument(
+            "--keep-months",
+            dest="keep_months",
+            type=int,
+            default=None,
+            help="Months kept online before the current one (default: AUDIT_ARCHIVE_AFTER_MONTHS).",
+        )
+        parser.add_argument(
+            "--no-drop",
+            dest="drop",
+            action="store_false",
+            help="Write archives but leave the partitions attached.",
+        )
+
+    def handle(self, *args, **options):
+        if not audit_partitions.is_partitioned():
+            msg = f"{audit_partitions.TABLE} is not a partitioned table on this database."
+            raise CommandError(msg)
+        keep_months = options["keep_months"]
+        if keep_months is None:
+            keep_months = getattr(settings, "AUDIT_ARCHIVE_AFTER_MONTHS", 13)
+        if keep_months < 1:
+            msg = "--keep-months must be at least 1; the current month is never archived."
+            raise CommandError(msg)
+
+        apply = options["apply"]
+        partitions = audit_partitions.closed_partitions(keep_months=keep_months)
+        total = 0
+        for partition in partitions:
+            path = audit_partitions.archive_path(partition)
+            if not apply:
+                self.stdout.write(f"{partition.name} -> {path}")
+                continue
+            rows = audit_partitions.archive_partition(partition, drop=options["drop"])
+            total += rows
+            self.stdout.write(f"{partition.name}: {rows} row(s) -> {path}")
+
+        if apply:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Archived {len(partitions)} partition(s), {total} row(s).",
+                ),
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"Would archive {len(partitions)} partition(s)."),
+            )
+            if partitions:
+                self.stdout.write("Re-run with --apply to write these archives.")
@@ -0,0 +1,55 @@
+"""Rebuild ``AssignmentAudience`` rows and TemplateAssignment counters.
+
+Migration 0072 fills the table once on deploy; run this after any
+bulk ``.update()`` / ``bulk_create`` of memberships, roster rows,
+assignments or reflections that bypassed ``save()``. Idempotent: each
+assignment's audience is diffed against ``resolve_members``.
+
+Usage::
+
+    # Every assignment
+    python manage.py backfill_assignment_audience
+
+    # One organization / one program
+    python manage.py backfill_assignment_audience --org crane-lake
+    python manage.py backfill_assignment_audience --program 7
+"""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from bunk_logs.core.assignment_audience import rebuild_all
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import TemplateAssignment
+
+
+class Command(BaseCommand):
+    help = "Rebuild materialized assignment audiences and compliance counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--org", default=None, help="Organization slug to limit to.")
+        parser.add_argument("--program", type=int, default=None, help="Program id to limit to.")
+
+    def handle(self, *args, **options):
+        qs = TemplateAssignment.all_objects.all()
+        if options["org"]:
+            org = Organization.objects.filter(slug=options["org"]).first()
+            if org is None:
+                msg = f"Organization '{options['org']}' not found."
+                raise CommandError(msg)
+            qs = qs.filter(organization=org)
+        if options["program"]:
+            qs = qs.filter(program_id=options["program"])
+
+        started = time.monotonic()
+        count = rebuild_all(qs)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt the audience of {count} assignment(s) "
+                f"in {time.monotonic() - started:.1f}s.",
+            ),
+        )
@@ -0,0 +1,78 @@
+"""Raise Camper Care flags for reflections that requested help.
+
+The Camper Care dashboard and flags workspace already re-sync a recent
+window on load; run this after importing reflections in bulk, after a
+template gains a ``dashboard_role="help_request_camper_care"`` field, or to
+cover days older than the workspace's lookback. Idempotent: reflections
+that already have a flag (open or resolved) are skipped.
+
+Usage::
+
+    # Every reflection
+    python manage.py backfill_camper_care_flags
+
+    # One organization / one program / a recent window
+    python manage.py backfill_camper_care_flags --org crane-lake
+    python manage.py backfill_camper_care_flags --program 7
+    python manage.py backfill_camper_care_flags --since 2026-06-01
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from bunk_logs.core.flags import BACKFILL_BATCH_SIZE
+from bunk_logs.core.flags import backfill_camper_care_flags
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Reflection
+
+
+class Command(BaseCommand):
+    help = "Raise missing Camper Care flags for help-requesting reflections."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--org", default=None, help="Organization slug to limit to.")
+        parser.add_argument("--program", type=int, default=None, help="Program id to limit to.")
+        parser.add_argument(
+            "--since",
+            default=None,
+            help="Only reflections whose period ends on/after this ISO date.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=int,
+            default=BACKFILL_BATCH_SIZE,
+            help=f"Reflections per transaction (default: {BACKFILL_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        qs = Reflection.all_objects.all()
+        if options["org"]:
+            org = Organization.objects.filter(slug=options["org"]).first()
+            if org is None:
+                msg = f"Organization '{options['org']}' not found."
+                raise CommandError(msg)
+            qs = qs.filter(organization=org)
+        if options["program"]:
+            qs = qs.filter(program_id=options["program"])
+        if options["since"]:
+            try:
+                since = date.fromisoformat(options["since"])
+            except ValueError as exc:
+                msg = "--since must be an ISO date (YYYY-MM-DD)."
+                raise CommandError(msg) from exc
+            qs = qs.filter(period_end__gte=since)
+
+        started = time.monotonic()
+        reflections, created = backfill_camper_care_flags(qs, batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Raised {created} flag(s) across {reflections} reflection(s) "
+                f"in {time.monotonic() - started:.1f}s.",
+            ),
+        )
@@ -0,0 +1,80 @@
+"""Rebuild the Concerns Inbox ``ConcernItem`` rows from reflection answers.
+
+Run once after deploying the ``ConcernItem`` table, after any bulk
+``.update()`` / ``bulk_create`` of reflections that bypassed ``save()``, and
+after editing a template's schema (a field gaining or losing
+``dashboard_role="open_concern"`` changes what counts as a concern).
+Idempotent: each reflection's rows are replaced, never appended.
+
+Usage::
+
+    # Every reflection
+    python manage.py backfill_concern_items
+
+    # One organization / one template / a recent window
+    python manage.py backfill_concern_items --org crane-lake
+    python manage.py backfill_concern_items --template 12
+    python manage.py backfill_concern_items --since 2026-06-01
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from bunk_logs.core.concerns import BACKFILL_BATCH_SIZE
+from bunk_logs.core.concerns import backfill_concern_items
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Reflection
+
+
+class Command(BaseCommand):
+    help = "Re-extract Concerns Inbox items for existing reflections."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--org", default=None, help="Organization slug to limit to.")
+        parser.add_argument(
+            "--template", type=int, default=None, help="ReflectionTemplate id to limit to.",
+        )
+        parser.add_argument(
+            "--since",
+            default=None,
+            help="Only reflections whose period ends on/after this ISO date.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=int,
+            default=BACKFILL_BATCH_SIZE,
+            help=f"Reflections per transaction (default: {BACKFILL_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        qs = Reflection.all_objects.all()
+        if options["org"]:
+            org = Organization.objects.filter(slug=options["org"]).first()
+            if org is None:
+                msg = f"Organization '{options['org']}' not found."
+                raise CommandError(msg)
+            qs = qs.filter(organization=org)
+        if options["template"]:
+            qs = qs.filter(template_id=options["template"])
+        if options["since"]:
+            try:
+                since = date.fromisoformat(options["since"])
+            except ValueError as exc:
+                msg = "--since must be an ISO date (YYYY-MM-DD)."
+                raise CommandError(msg) from exc
+            qs = qs.filter(period_end__gte=since)
+
+        started = time.monotonic()
+        reflections, items = backfill_concern_items(qs, batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {items} concern item(s) across {reflections} reflection(s) "
+                f"in {time.monotonic() - started:.1f}s.",
+            ),
+        )
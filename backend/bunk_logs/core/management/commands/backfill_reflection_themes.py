@@ -19,7 +19,13 @@ Usage::
     # Re-tag everything after bumping the taxonomy or fixing a roster grade
     python manage.py backfill_reflection_themes --org-slug tbe --apply --retag
 
-Defaults to a dry run because each reflection costs an LLM call.
+    # One Anthropic call per reflection (the pre-batching behaviour)
+    python manage.py backfill_reflection_themes --org-slug tbe --apply --batch-size 1
+
+Defaults to a dry run because every batch costs an LLM call. Reflections are
+tagged ``THEME_TAGGING_BATCH_SIZE`` at a time per call unless ``--batch-size``
+overrides it; the taxonomy prefix is prompt-cached, so the token estimate is
+split into cached and uncached input.
 """
 
 from __future__ import annotations
@@ -34,10 +40,14 @@ from bunk_logs.core.context import organization_context
 from bunk_logs.core.models import Organization
 from bunk_logs.core.models import Reflection
 from bunk_logs.core.models import ReflectionThemeTagging
+from bunk_logs.core.theme_tagging.client import TokenEstimate
 from bunk_logs.core.theme_tagging.client import estimate_tokens
+from bunk_logs.core.theme_tagging.tasks import batch_size as default_batch_size
+from bunk_logs.core.theme_tagging.tasks import enqueue_theme_tagging_batch
 from bunk_logs.core.theme_tagging.tasks import extract_taggable_items
 from bunk_logs.core.theme_tagging.tasks import is_taggable_reflection
 from bunk_logs.core.theme_tagging.tasks import tag_reflection_themes
+from bunk_logs.core.theme_tagging.tasks import tag_reflection_themes_batch
 from bunk_logs.core.theme_tagging.taxonomy import TAXONOMY_VERSION
 
 CHUNK_SIZE = 200
@@ -94,6 +104,15 @@ class Command(BaseCommand):
             action="store_true",
             help="Re-tag reflections that already have completed tags.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help=(
+                "Reflections per Anthropic call (default: "
+                "THEME_TAGGING_BATCH_SIZE). 1 tags each reflection separately."
+            ),
+        )
 
     def handle(self, *args, **options):
         org_slug = options["org_slug"]
@@ -108,13 +127,17 @@ class Command(BaseCommand):
         apply_changes = options["apply"]
         run_sync = options["sync"]
         retag = options["retag"]
+        batch_size = options.get("batch_size") or default_batch_size()
+        if batch_size < 1:
+            msg = "--batch-size must be at least 1."
+            raise CommandError(msg)
 
         with organization_context(org):
             candidates = self._candidates(org, options.get("program_id"), since)
             already_tagged = self._completed_reflection_ids(org)
 
             selected: list[Reflection] = []
-            estimated_tokens = 0
+            selected_items: list[list[tuple[str, str]]] = []
             skipped_untaggable = 0
             skipped_already = 0
 
@@ -130,7 +153,7 @@ class Command(BaseCommand):
                     skipped_untaggable += 1
                     continue
                 selected.append(reflection)
-                estimated_tokens += estimate_tokens(items)
+                selected_items.append(items)
                 if limit and len(selected) >= limit:
                     break
 
@@ -139,7 +162,7 @@ class Command(BaseCommand):
                 selected=len(selected),
                 skipped_untaggable=skipped_untaggable,
                 skipped_already=skipped_already,
-                estimated_tokens=estimated_tokens,
+                estimate=self._estimate(selected_items, batch_size),
                 retag=retag,
             )
 
@@ -160,7 +183,12 @@ class Command(BaseCommand):
                     taxonomy_version=TAXONOMY_VERSION,
                 ).delete()
 
-            self._dispatch(selected, run_sync=run_sync)
+            if batch_size == 1:
+                self._dispatch(selected, run_sync=run_sync)
+            else:
+                self._dispatch_batches(
+                    selected, batch_size=batch_size, run_sync=run_sync,
+                )
 
     def _candidates(self, org, program_id: int | None, since: date_type | None):
         qs = (
@@ -183,6 +211,18 @@ class Command(BaseCommand):
             ).values_list("reflection_id", flat=True),
         )
 
+    def _estimate(
+        self, selected_items: list[list[tuple[str, str]]], batch_size: int,
+    ) -> TokenEstimate:
+        estimate = TokenEstimate()
+        for start in range(0, len(selected_items), batch_size):
+            chunk = selected_items[start:start + batch_size]
+            estimate += estimate_tokens(
+                [item for items in chunk for item in items],
+                reflection_count=len(chunk),
+            )
+        return estimate
+
     def _report(
         self,
         *,
@@ -190,7 +230,7 @@ class Command(BaseCommand):
         selected: int,
         skipped_untaggable: int,
         skipped_already: int,
-        estimated_tokens: int,
+        estimate: TokenEstimate,
         retag: bool,
     ) -> None:
         self.stdout.write(f"Organization:        {org_slug}")
@@ -200,9 +240,12 @@ class Command(BaseCommand):
         if not retag:
             self.stdout.write(f"Skipped (tagged):    {skipped_already}")
         self.stdout.write(
-            f"Estimated tokens:    ~{estimated_tokens:,} "
-            f"({selected} Anthropic call{'s' if selected != 1 else ''})",
+            f"Estimated tokens:    ~{estimate.total:,} "
+            f"({estimate.calls} Anthropic call{'s' if estimate.calls != 1 else ''})",
         )
+        self.stdout.write(f"  cached prefix:     ~{estimate.cached_input:,}")
+        self.stdout.write(f"  uncached input:    ~{estimate.uncached_input:,}")
+        self.stdout.write(f"  output ceiling:    ~{estimate.output:,}")
 
     def _dispatch(self, selected: list[Reflection], *, run_sync: bool) -> None:
         failures = 0
@@ -227,3 +270,35 @@ class Command(BaseCommand):
         )
         if failures:
             self.stdout.write(self.style.ERROR(f"{failures} failed."))
+
+    def _dispatch_batches(
+        self, selected: list[Reflection], *, batch_size: int, run_sync: bool,
+    ) -> None:
+        failures = 0
+        batches = 0
+        for start in range(0, len(selected), batch_size):
+            ids = [reflection.pk for reflection in selected[start:start + batch_size]]
+            batches += 1
+            if not run_sync:
+                enqueue_theme_tagging_batch(ids)
+                continue
+            try:
+                summary = tag_reflection_themes_batch.run(ids)
+            except Exception as exc:
+                # One bad batch shouldn't abandon the rest of the backfill.
+                failures += len(ids)
+                self.stderr.write(
+                    self.style.ERROR(f"Batch {ids[0]}..{ids[-1]} failed: {exc}"),
+                )
+                continue
+            failures += summary["failed"]
+
+        verb = "tagged" if run_sync else "enqueued"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(selected) - failures} reflections {verb} "
+                f"in {batches} batch{'es' if batches != 1 else ''}.",
+            ),
+        )
+        if failures:
+            self.stdout.write(self.style.ERROR(f"{failures} failed."))
@@ -0,0 +1,68 @@
+"""Populate the stored admin-search vectors.
+
+Run once after deploying the ``search_vector`` columns, and after any bulk
+``.update()`` / ``bulk_create`` import that bypassed ``save()``. Batched,
+set-based ``UPDATE``s (see :func:`bunk_logs.core.search_vectors.backfill_search_vectors`).
+
+Usage::
+
+    # Everything
+    python manage.py backfill_search_vectors
+
+    # Only rows never indexed (resume an interrupted run)
+    python manage.py backfill_search_vectors --only-missing
+
+    # One model
+    python manage.py backfill_search_vectors --model reflection
+"""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from bunk_logs.core.search_vectors import BACKFILL_BATCH_SIZE
+from bunk_logs.core.search_vectors import SEARCHABLE_FIELDS
+from bunk_logs.core.search_vectors import backfill_search_vectors
+
+MODELS = {model._meta.model_name: model for model in SEARCHABLE_FIELDS}
+
+
+class Command(BaseCommand):
+    help = "Recompute stored full-text search vectors used by admin global search."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            choices=sorted(MODELS),
+            default=None,
+            help="Limit to one model (default: all searchable models).",
+        )
+        parser.add_argument(
+            "--only-missing",
+            dest="only_missing",
+            action="store_true",
+            help="Skip rows that already have a vector.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=int,
+            default=BACKFILL_BATCH_SIZE,
+            help=f"Rows per UPDATE (default: {BACKFILL_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        names = [options["model"]] if options["model"] else sorted(MODELS)
+        total = 0
+        for name in names:
+            started = time.monotonic()
+            count = backfill_search_vectors(
+                MODELS[name],
+                only_missing=options["only_missing"],
+                batch_size=options["batch_size"],
+            )
+            total += count
+            self.stdout.write(f"{name}: {count} row(s) in {time.monotonic() - started:.1f}s")
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} row(s)."))
@@ -0,0 +1,55 @@
+"""Report Celery queue depth and the age of the oldest waiting message.
+
+Reads the Redis broker directly, so it works even when every worker is
+busy or down. Ages come from the publish timestamp stamped by
+``config.celery_app``; messages queued before that was deployed show no age.
+
+Usage::
+
+    python manage.py celery_queue_stats
+    python manage.py celery_queue_stats --json
+
+    # The worker command line for each queue group (CELERY_QUEUE_WORKERS)
+    python manage.py celery_queue_stats --workers
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from bunk_logs.core.celery_queues import queue_stats
+from bunk_logs.core.celery_queues import worker_commands
+
+
+class Command(BaseCommand):
+    help = "Show depth and oldest-message age for each Celery queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+        parser.add_argument(
+            "--workers", action="store_true", help="Print the worker command per queue group.",
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"]:
+            for group, command in worker_commands().items():
+                self.stdout.write(f"{group}: {command}")
+            return
+
+        from config.celery_app import app
+
+        with app.connection_for_read() as conn:
+            stats = queue_stats(conn.default_channel.client)
+
+        if options["json"]:
+            self.stdout.write(json.dumps([
+                {"queue": s.name, "depth": s.depth, "oldest_age_seconds": s.oldest_age_seconds}
+                for s in stats
+            ]))
+            return
+        self.stdout.write(f"{'queue':<16}{'depth':>8}{'oldest age':>14}")
+        for s in stats:
+            age = "-" if s.oldest_age_seconds is None else f"{s.oldest_age_seconds:.0f}s"
+            self.stdout.write(f"{s.name:<16}{s.depth:>8}{age:>14}")
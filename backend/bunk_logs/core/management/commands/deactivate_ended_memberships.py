@@ -9,7 +9,8 @@ and backfills ``end_date`` from the program when it wasn't set.
 
 Only the ``is_active`` / ``end_date`` fields are touched (never
 ``role``), so the bulk ``.update()`` is safe despite bypassing
-``Membership.save()``'s capability sync.
+``Membership.save()``'s capability sync. The program's assignment
+audiences are rebuilt afterwards since the update skips their receivers.
 
 ``admin``-capability memberships are exempt: admin is an org-wide role,
 not a session-scoped one, so its membership must survive a program's end
@@ -36,6 +37,7 @@ from django.core.management.base import CommandError
 from django.db import transaction
 from django.utils import timezone
 
+from bunk_logs.core.assignment_audience import rebuild_program
 from bunk_logs.core.models import Membership
 from bunk_logs.core.models import Program
 
@@ -88,6 +90,8 @@ class Command(BaseCommand):
                         end_date=program.end_date,
                     )
                     active.update(is_active=False)
+                    # ``.update()`` skips the audience receivers.
+                    rebuild_program(program.id)
 
         verb = "Deactivated" if apply else "Would deactivate"
         self.stdout.write(
@@ -0,0 +1,55 @@
+"""Create upcoming monthly ``AuditEvent`` partitions.
+
+The nightly ``maintain_audit_partitions`` beat task does this
+automatically; the command is for ops runs (e.g. before a bulk import
+with back-dated rows) and for creating months further ahead than
+``AUDIT_PARTITION_MONTHS_AHEAD``. Any rows sitting in the default
+partition are moved into their month as a side effect.
+
+Usage::
+
+    python manage.py ensure_audit_partitions
+    python manage.py ensure_audit_partitions --months-ahead 12
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from bunk_logs.core import audit_partitions
+
+
+class Command(BaseCommand):
+    help = "Create missing monthly AuditEvent partitions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            dest="months_ahead",
+            type=int,
+            default=None,
+            help="Future months to cover (default: AUDIT_PARTITION_MONTHS_AHEAD).",
+        )
+
+    def handle(self, *args, **options):
+        if not audit_partitions.is_partitioned():
+            msg = f"{audit_partitions.TABLE} is not a partitioned table on this database."
+            raise CommandError(msg)
+        months_ahead = options["months_ahead"]
+        if months_ahead is None:
+            months_ahead = getattr(settings, "AUDIT_PARTITION_MONTHS_AHEAD", 3)
+        through = audit_partitions.add_months(
+            audit_partitions.month_start(timezone.now()), months_ahead,
+        )
+        created = audit_partitions.ensure_partitions(through=through)
+        for name in created:
+            self.stdout.write(f"created {name}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {len(created)} partition(s); covered through "
+                f"{through:%Y-%m}.",
+            ),
+        )
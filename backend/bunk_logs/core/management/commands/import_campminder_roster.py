@@ -22,12 +22,14 @@ from django.core.management.base import CommandError
 from django.db import transaction
 from django.utils.text import slugify
 
+from bunk_logs.core.assignment_audience import sync_person
 from bunk_logs.core.campminder_csv import format_csv_headers
 from bunk_logs.core.campminder_csv import normalize_campminder_row
 from bunk_logs.core.campminder_csv import parse_optional_iso_date
 from bunk_logs.core.campminder_csv import read_campminder_csv_rows
 from bunk_logs.core.campminder_person_match import MatchStrategy
 from bunk_logs.core.campminder_person_match import match_campminder_person
+from bunk_logs.core.campminder_person_match import persons_by_campminder_id
 from bunk_logs.core.campminder_person_match import strategy_is_duplicate
 from bunk_logs.core.campminder_user_link import UserLinkAction
 from bunk_logs.core.campminder_user_link import ensure_user_for_imported_person
@@ -40,6 +42,7 @@ from bunk_logs.core.models import Organization
 from bunk_logs.core.models import Person
 from bunk_logs.core.models import Program
 from bunk_logs.core.models import RosterImportLog
+from bunk_logs.core.roster_snapshot import invalidate_roster_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +152,7 @@ def _upsert_person(
     campminder_id: str,
     *,
     row_number: int,
+    known: dict[str, Person] | None = None,
 ) -> tuple[Person | None, bool, bool, bool, MatchStrategy, list[int]]:
     """Return (person, created, updated, merged, strategy, candidate_ids)."""
     first_name = (row.get("first_name") or "").strip()
@@ -162,6 +166,7 @@ def _upsert_person(
         first_name=first_name,
         last_name=last_name,
         email=email,
+        known=known,
     )
     if strategy_is_duplicate(person_match.strategy):
         if person_match.strategy == MatchStrategy.DUPLICATE_NAME_DIFFERENT_ID:
@@ -353,6 +358,17 @@ class Command(BaseCommand):
         # Track (group_pk, role_in_group) → set of person_pks seen in this CSV
         seen_group_members: dict[tuple[int, str], set[int]] = {}
 
+        # Every Campminder ID in the file (row + caseload owner) resolved in
+        # one query; rows that create or merge a Person add themselves.
+        known_by_id: dict[str, Person] = {}
+        if not dry_run:
+            normalized = [normalize_campminder_row(r) for r in rows]
+            known_by_id = persons_by_campminder_id(
+                org,
+                [r["campminder_id"] for r in normalized]
+                + [r["caseload_owner_campminder_id"] for r in normalized],
+            )
+
         for i, raw_row in enumerate(rows, start=2):
             row = normalize_campminder_row(raw_row)
             campminder_id = row["campminder_id"]
@@ -409,7 +425,10 @@ class Command(BaseCommand):
                     row,
                     campminder_id,
                     row_number=i,
+                    known=known_by_id,
                 )
+                if person is not None:
+                    known_by_id.setdefault(campminder_id, person)
                 full_name = f"{row['first_name']} {row['last_name']}".strip()
                 if person is None:
                     msg = _duplicate_message(
@@ -546,10 +565,7 @@ class Command(BaseCommand):
                             f"Row {i}: caseload_name set but caseload_owner_campminder_id missing — skipped",
                         )
                     else:
-                        owner = Person.all_objects.filter(
-                            organization=org,
-                            external_ids__campminder_id=caseload_owner_id,
-                        ).first()
+                        owner = known_by_id.get(caseload_owner_id)
                         if owner is None:
                             warnings.append(
                                 f"Row {i}: caseload owner with campminder_id={caseload_owner_id!r} not found — skipped",
@@ -582,8 +598,13 @@ class Command(BaseCommand):
                     role_in_group=role_in_group,
                     is_active=True,
                 ).exclude(person_id__in=present_person_ids)
+                stale_person_ids = list(stale.values_list("person_id", flat=True))
                 deactivated = stale.update(is_active=False)
                 memberships_deactivated += deactivated
+                # ``.update()`` skips the audience / roster receivers.
+                for person_id in stale_person_ids:
+                    sync_person(person_id, allow_additions=False)
+            invalidate_roster_snapshot(program.pk)
 
         summary: dict[str, Any] = {
             "persons_created": persons_created,
@@ -12,12 +12,30 @@ Safe to run repeatedly: dry-run by default (pass ``--commit`` to write), one
 transaction per row, and idempotent (rewritten rows no longer contain
 ``data:image`` so a second pass is a no-op). Malformed data URIs are skipped,
 not deleted. Run as a Render one-off job after a DB backup.
+
+Candidate rows are filtered in SQL and streamed in primary-key order through
+a server-side cursor, ``--batch-size`` rows at a time, fetching only the
+rich-text columns. Each batch's images are uploaded through a pool of
+``--workers`` threads (storage only -- DB writes stay on the main thread),
+then each row is rewritten in its own transaction. With ``--commit`` the
+last finished primary key per model is checkpointed in the Django cache, so
+an interrupted run resumes after it; ``--restart`` ignores the checkpoints.
+The checkpoint never moves past a row with a failed upload: that row keeps
+its ``data:image`` and is retried by the next run.
+Throughput (rows, images, MB/s) is reported per batch and per model.
 """
 
 from __future__ import annotations
 
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from django.core.cache import cache
 from django.core.files.base import ContentFile
 from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
 from django.db import transaction
 from django.db.models import Q
 from django.db.models import TextField
@@ -27,9 +45,41 @@ from bunk_logs.bunklogs.models import BunkLog
 from bunk_logs.bunklogs.models import StaffLog
 from bunk_logs.core.models import Reflection
 from bunk_logs.core.models import RichTextImage
-from bunk_logs.core.rich_text import contains_inline_base64_image
+from bunk_logs.core.rich_text import iter_inline_images
 from bunk_logs.core.rich_text import replace_inline_images
 
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY = "migrate_inline_images:{label}:last_pk"
+# A week: long enough to span a re-run after an interrupted weekend job.
+CHECKPOINT_TIMEOUT = 7 * 24 * 60 * 60
+
+
+@dataclass
+class _Source:
+    label: str
+    manager: object
+    queryset: object
+    fields: tuple[str, ...]
+    # JSON sources hold a dict of answers; each string value is scanned.
+    is_json: bool = False
+
+
+@dataclass
+class _Stats:
+    rows: int = 0
+    images: int = 0
+    bytes: int = 0
+    failed: int = 0
+    started: float = 0.0
+
+    def rate(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        return (
+            f"{self.rows / elapsed:.1f} rows/s, {self.images / elapsed:.1f} images/s, "
+            f"{self.bytes / elapsed / 1_000_000:.2f} MB/s"
+        )
+
 
 class Command(BaseCommand):
     help = "Extract base64 inline images from rich-text fields and upload to S3."
@@ -40,117 +90,237 @@ class Command(BaseCommand):
             action="store_true",
             help="Persist changes. Without this flag the command only reports.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Concurrent image uploads (default: 4; 1 uploads serially).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=int,
+            default=20,
+            help="Rows streamed and uploaded per batch (default: 20).",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore saved checkpoints and rescan every model from the start.",
+        )
 
     def handle(self, *args, **options):
         commit = options["commit"]
         self.commit = commit
+        workers = options["workers"]
+        batch_size = options["batch_size"]
+        if workers < 1 or batch_size < 1:
+            msg = "--workers and --batch-size must be at least 1."
+            raise CommandError(msg)
         mode = "COMMIT" if commit else "DRY-RUN"
-        self.stdout.write(f"[migrate_inline_images] mode={mode}")
-
-        totals = {"rows": 0, "images": 0}
+        self.stdout.write(f"[migrate_inline_images] mode={mode} workers={workers}")
 
-        self._process_stafflogs(totals)
-        self._process_bunklogs(totals)
-        self._process_reflections(totals)
+        totals = _Stats(started=time.monotonic())
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for source in self._sources():
+                self._process(
+                    source, pool, totals, batch_size=batch_size, restart=options["restart"],
+                )
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"[migrate_inline_images] {mode}: {totals['images']} image(s) "
-                f"across {totals['rows']} row(s)"
+                f"[migrate_inline_images] {mode}: {totals.images} image(s) "
+                f"across {totals.rows} row(s) ({totals.rate()})"
+                + (f"; {totals.failed} upload(s) failed" if totals.failed else "")
                 + ("" if commit else " -- re-run with --commit to apply."),
             ),
         )
 
+    def _sources(self) -> list[_Source]:
+        return [
+            _Source(
+                "StaffLog",
+                StaffLog.objects,
+                StaffLog.objects.filter(
+                    Q(elaboration__contains="data:image/")
+                    | Q(values_reflection__contains="data:image/"),
+                ),
+                ("elaboration", "values_reflection"),
+            ),
+            _Source(
+                "BunkLog",
+                BunkLog.objects,
+                BunkLog.objects.filter(description__contains="data:image/"),
+                ("description",),
+            ),
+            # answers is a JSONField; cast to text so a substring match works
+            # reliably across the whole JSON blob.
+            _Source(
+                "Reflection",
+                Reflection.all_objects,
+                Reflection.all_objects.annotate(
+                    _answers_text=Cast("answers", TextField()),
+                ).filter(_answers_text__icontains="data:image/"),
+                ("answers",),
+                is_json=True,
+            ),
+        ]
+
     # -- per-image upload -------------------------------------------------
 
-    def _make_uploader(self):
-        """Build an ``upload(image) -> url`` callback that persists a RichTextImage."""
+    def _store(self, image, data: bytes) -> tuple[RichTextImage | None, int]:
+        """Upload one decoded image to storage (worker thread); no DB access.
 
-        def upload(image) -> str:
-            data = image.decode()
-            if not self.commit:
-                # Dry-run: don't write to storage; a placeholder URL is enough
-                # for replace_inline_images to count the replacement.
-                return "DRYRUN"
-            obj = RichTextImage()
-            obj.image.save(f"{obj.id}{image.extension}", ContentFile(data), save=True)
-            return obj.image.url
+        Returns the unsaved :class:`RichTextImage` (``None`` in dry-run) and
+        the decoded size.
+        """
+        if not self.commit:
+            return None, len(data)
+        obj = RichTextImage()
+        obj.image.save(f"{obj.id}{image.extension}", ContentFile(data), save=False)
+        return obj, len(data)
 
-        return upload
+    def _upload_batch(self, pool, jobs):
+        def run(job):
+            key, image, data = job
+            try:
+                return key, *self._store(image, data)
+            except Exception:
+                logger.exception("migrate_inline_images: upload failed for %s", key)
+                return key, None, -1
 
-    # -- scanners ---------------------------------------------------------
+        return list(pool.map(run, jobs))
 
-    def _process_stafflogs(self, totals):
-        qs = StaffLog.objects.filter(
-            Q(elaboration__contains="data:image/")
-            | Q(values_reflection__contains="data:image/"),
-        )
-        for row in qs.iterator():
-            changed = 0
-            with transaction.atomic():
-                for field in ("elaboration", "values_reflection"):
-                    value = getattr(row, field) or ""
-                    if not contains_inline_base64_image(value):
-                        continue
-                    new_value, n = replace_inline_images(value, self._make_uploader())
-                    if n:
-                        setattr(row, field, new_value)
-                        changed += n
-                if changed and self.commit:
-                    # .update() bypasses StaffLog.save()'s full_clean(), which
-                    # would reject these legacy rows via the "no logs older than
-                    # 30 days" rule. This backfill only swaps base64 for URLs.
-                    StaffLog.objects.filter(pk=row.pk).update(
-                        elaboration=row.elaboration,
-                        values_reflection=row.values_reflection,
+    # -- scanning ---------------------------------------------------------
+
+    @staticmethod
+    def _slots(source: _Source, values: dict) -> list[tuple[str, str | None, str]]:
+        """``(field, answers_key, text)`` for every string that may hold images."""
+        slots = []
+        for field in source.fields:
+            value = values[field]
+            if source.is_json:
+                if isinstance(value, dict):
+                    slots.extend(
+                        (field, key, text) for key, text in value.items() if isinstance(text, str)
                     )
-            if changed:
-                totals["rows"] += 1
-                totals["images"] += changed
-                self.stdout.write(f"  StaffLog {row.pk}: {changed} image(s)")
-
-    def _process_bunklogs(self, totals):
-        qs = BunkLog.objects.filter(description__contains="data:image/")
-        for row in qs.iterator():
-            value = row.description or ""
-            if not contains_inline_base64_image(value):
-                continue
-            with transaction.atomic():
-                new_value, n = replace_inline_images(value, self._make_uploader())
-                if n and self.commit:
-                    # .update() bypasses model validation/signals; backfill only.
-                    BunkLog.objects.filter(pk=row.pk).update(description=new_value)
-            if n:
-                totals["rows"] += 1
-                totals["images"] += n
-                self.stdout.write(f"  BunkLog {row.pk}: {n} image(s)")
-
-    def _process_reflections(self, totals):
-        # answers is a JSONField; cast to text so a substring match works
-        # reliably across the whole JSON blob.
-        qs = (
-            Reflection.all_objects.annotate(
-                _answers_text=Cast("answers", TextField()),
-            )
-            .filter(_answers_text__icontains="data:image/")
-        )
-        for row in qs.iterator():
-            answers = row.answers
-            if not isinstance(answers, dict):
+            elif isinstance(value, str):
+                slots.append((field, None, value))
+        return slots
+
+    def _stream(self, source: _Source, after_pk, batch_size: int):
+        qs = source.queryset.order_by("pk")
+        if after_pk is not None:
+            qs = qs.filter(pk__gt=after_pk)
+        batch = []
+        for pk, *values in qs.values_list("pk", *source.fields).iterator(chunk_size=batch_size):
+            batch.append((pk, dict(zip(source.fields, values, strict=True))))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _process(self, source: _Source, pool, totals: _Stats, *, batch_size: int, restart: bool):
+        key = CHECKPOINT_KEY.format(label=source.label)
+        if restart:
+            cache.delete(key)
+        after_pk = cache.get(key) if self.commit else None
+        if after_pk is not None:
+            self.stdout.write(f"  {source.label}: resuming after pk={after_pk}")
+
+        stats = _Stats(started=time.monotonic())
+        # Set by the first row with a failed upload; the checkpoint stays
+        # before it for the rest of the run.
+        stalled = False
+        for batch in self._stream(source, after_pk, batch_size):
+            jobs = []
+            for pk, values in batch:
+                for field, answer_key, text in self._slots(source, values):
+                    for image in iter_inline_images(text):
+                        try:
+                            data = image.decode()
+                        except ValueError:  # binascii.Error subclasses ValueError
+                            continue  # malformed; replace_inline_images skips it too
+                        jobs.append(((pk, field, answer_key, image.start), image, data))
+
+            uploaded = {}
+            failed_pks = set()
+            for job_key, obj, size in self._upload_batch(pool, jobs):
+                if size < 0:
+                    stats.failed += 1
+                    failed_pks.add(job_key[0])
+                    continue
+                uploaded[job_key] = obj
+                stats.bytes += size
+
+            for pk, values in batch:
+                changed = self._rewrite_row(source, pk, values, uploaded)
+                if changed:
+                    stats.rows += 1
+                    stats.images += changed
+                    self.stdout.write(f"  {source.label} {pk}: {changed} image(s)")
+            if failed_pks:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"  {source.label}: upload failed for pk(s) {sorted(failed_pks)}; "
+                        "left in place for the next run",
+                    ),
+                )
+            if self.commit and not stalled:
+                done = None
+                for pk, _values in batch:
+                    if pk in failed_pks:
+                        stalled = True
+                        break
+                    done = pk
+                if done is not None:
+                    cache.set(key, done, CHECKPOINT_TIMEOUT)
+            self.stdout.write(f"  {source.label}: through pk={batch[-1][0]} ({stats.rate()})")
+
+        if self.commit and not stalled:
+            # Finished cleanly: the next run should rescan (cheap -- rewritten
+            # rows no longer match the SQL filter).
+            cache.delete(key)
+        totals.rows += stats.rows
+        totals.images += stats.images
+        totals.bytes += stats.bytes
+        totals.failed += stats.failed
+
+    def _rewrite_row(self, source: _Source, pk, values: dict, uploaded: dict) -> int:
+        created: list[RichTextImage] = []
+        changed = 0
+        updates = {}
+
+        for field, answer_key, text in self._slots(source, values):
+
+            def url_for(image, field=field, answer_key=answer_key):
+                job_key = (pk, field, answer_key, image.start)
+                if job_key not in uploaded:
+                    return None
+                obj = uploaded[job_key]
+                if obj is None:
+                    # Dry-run: a placeholder URL is enough for
+                    # replace_inline_images to count the replacement.
+                    return "DRYRUN"
+                created.append(obj)
+                return obj.image.url
+
+            new_text, n = replace_inline_images(text, url_for)
+            if not n:
                 continue
-            changed = 0
+            changed += n
+            if answer_key is None:
+                updates[field] = new_text
+            else:
+                updates.setdefault(field, dict(values[field]))[answer_key] = new_text
+
+        if changed and self.commit:
             with transaction.atomic():
-                for key, value in list(answers.items()):
-                    if not contains_inline_base64_image(value):
-                        continue
-                    new_value, n = replace_inline_images(value, self._make_uploader())
-                    if n:
-                        answers[key] = new_value
-                        changed += n
-                if changed and self.commit:
-                    # .update() bypasses model validation/signals; backfill only.
-                    Reflection.all_objects.filter(pk=row.pk).update(answers=answers)
-            if changed:
-                totals["rows"] += 1
-                totals["images"] += changed
-                self.stdout.write(f"  Reflection {row.pk}: {changed} image(s)")
+                RichTextImage.objects.bulk_create(created)
+                # .update() bypasses model save()/validation/signals (StaffLog's
+                # full_clean would reject these legacy rows via the "no logs
+                # older than 30 days" rule). This backfill only swaps base64
+                # for URLs.
+                source.manager.filter(pk=pk).update(**updates)
+        return changed
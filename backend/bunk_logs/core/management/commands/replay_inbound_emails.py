@@ -0,0 +1,79 @@
+"""Re-run stored Mailgun inbound payloads (``InboundEmail`` rows).
+
+Rows are stored when ``MAILGUN_INBOUND_ASYNC`` is on. Use this to drain
+pending rows whose task never ran (broker outage), or to retry ``failed``
+rows once the underlying error is fixed. Processing is synchronous and
+goes through the same code path as the ``process_inbound_emails`` task.
+
+Usage::
+
+    # Pending rows (the default)
+    python manage.py replay_inbound_emails
+
+    # Retry failures, or specific rows
+    python manage.py replay_inbound_emails --status failed
+    python manage.py replay_inbound_emails --id 41 --id 42 --status rejected
+
+    # See what would run
+    python manage.py replay_inbound_emails --status failed --dry-run
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from bunk_logs.api.webhooks.mailgun_inbound import process_stored_inbound
+from bunk_logs.core.models import InboundEmail
+
+
+class Command(BaseCommand):
+    help = "Process or re-process stored Mailgun inbound payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--status",
+            choices=InboundEmail.Status.values,
+            default=InboundEmail.Status.PENDING,
+            help="Rows in this status are replayed (default: pending).",
+        )
+        parser.add_argument(
+            "--id", dest="ids", type=int, action="append", default=None,
+            help="Limit to this InboundEmail id (repeatable).",
+        )
+        parser.add_argument(
+            "--since",
+            default=None,
+            help="Only rows received on/after this ISO date.",
+        )
+        parser.add_argument("--batch-size", dest="batch_size", type=int, default=None)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        qs = InboundEmail.objects.filter(status=options["status"])
+        if options["ids"]:
+            qs = qs.filter(pk__in=options["ids"])
+        if options["since"]:
+            try:
+                since = date.fromisoformat(options["since"])
+            except ValueError as exc:
+                msg = "--since must be an ISO date (YYYY-MM-DD)."
+                raise CommandError(msg) from exc
+            qs = qs.filter(received_at__date__gte=since)
+
+        ids = list(qs.values_list("pk", flat=True))
+        if options["dry_run"]:
+            self.stdout.write(f"Would replay {len(ids)} inbound email(s).")
+            return
+        if options["status"] != InboundEmail.Status.PENDING:
+            InboundEmail.objects.filter(pk__in=ids).update(status=InboundEmail.Status.PENDING)
+
+        counts = process_stored_inbound(ids, batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Replayed {total} inbound email(s): {processed} processed, "
+                "{rejected} rejected, {failed} failed.".format(total=len(ids), **counts),
+            ),
+        )
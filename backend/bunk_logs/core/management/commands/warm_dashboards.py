@@ -0,0 +1,46 @@
+"""Build role home dashboards into the cache now and report build times.
+
+The ``dispatch_dashboard_warmup`` beat task does this automatically inside
+each org's warm-up windows. Use this to warm by hand (e.g. right after a
+deploy flushed the cache) or to measure cold-build cost per role.
+
+Usage::
+
+    python manage.py warm_dashboards --org crane-lake
+    python manage.py warm_dashboards --org crane-lake --role unit_head
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from bunk_logs.api.dashboards.warmup import DASHBOARDS
+from bunk_logs.api.dashboards.warmup import active_viewers
+from bunk_logs.api.dashboards.warmup import warm_viewers
+from bunk_logs.core.models import Organization
+
+
+class Command(BaseCommand):
+    help = "Precompute cached role home dashboards for an organization's active viewers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--org", required=True, help="Organization slug.")
+        parser.add_argument(
+            "--role", choices=sorted(DASHBOARDS), action="append", default=None,
+            help="Dashboard to warm (repeatable; default: all).",
+        )
+
+    def handle(self, *args, **options):
+        org = Organization.objects.filter(slug=options["org"]).first()
+        if org is None:
+            msg = f"Organization '{options['org']}' not found."
+            raise CommandError(msg)
+
+        for role in options["role"] or DASHBOARDS:
+            report = warm_viewers(org, role, active_viewers(org, role))
+            avg = report["total_ms"] / report["warmed"] if report["warmed"] else 0
+            self.stdout.write(
+                f"{role}: {report['warmed']} warmed, {report['failed']} failed, "
+                f"avg {avg:.0f} ms, max {report['max_ms']} ms",
+            )
@@ -0,0 +1,59 @@
+"""Partition ``core_auditevent`` by month on ``created_at``.
+
+The conversion itself lives in :mod:`bunk_logs.core.audit_partitions`:
+the plain table is swapped for a ``PARTITION BY RANGE (created_at)``
+parent with a default partition, existing rows are copied across and split
+into monthly children, and the original indexes / FKs are recreated on the
+parent (Postgres cascades them to every child). The physical primary key
+becomes ``(id, created_at)`` because a partitioned table's unique
+constraints must include the partition key.
+
+``created_at`` switches from ``auto_now_add`` to ``default=timezone.now``
+so buffered events keep their emit time across an async flush.
+
+Also registers the nightly ``maintain_audit_partitions`` beat row, which
+keeps future months pre-created. Non-Postgres databases skip the
+conversion.
+"""
+
+import django.utils.timezone
+from django.db import migrations
+from django.db import models
+
+
+def _partition(apps, schema_editor):
+    from bunk_logs.core.audit_partitions import partition_table
+    partition_table(schema_editor)
+
+
+def _unpartition(apps, schema_editor):
+    from bunk_logs.core.audit_partitions import unpartition_table
+    unpartition_table(schema_editor)
+
+
+def _register(apps, schema_editor):
+    from bunk_logs.core.audit_partitions import register_periodic_tasks
+    register_periodic_tasks(apps)
+
+
+def _unregister(apps, schema_editor):
+    from bunk_logs.core.audit_partitions import unregister_periodic_tasks
+    unregister_periodic_tasks(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0061_entry_threads_and_cohort_shares"),
+        ("django_celery_beat", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="auditevent",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.RunPython(_partition, reverse_code=_unpartition),
+        migrations.RunPython(_register, reverse_code=_unregister),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.0.13 on 2026-10-19 02:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0062_partition_auditevent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='maintenanceticket',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Maintained by bunk_logs.core.search_vectors; backs admin global search.', null=True),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Maintained by bunk_logs.core.search_vectors; backs admin global search.', null=True),
+        ),
+        migrations.AddField(
+            model_name='reflection',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Maintained by bunk_logs.core.search_vectors; backs admin global search.', null=True),
+        ),
+        migrations.AddField(
+            model_name='reflectiontemplate',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Maintained by bunk_logs.core.search_vectors; backs admin global search.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='maintenanceticket',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='core_ticket_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='core_order_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='reflection',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='core_reflection_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='reflectiontemplate',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='core_refltpl_search_gin'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.0.13 on 2026-10-19 02:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0064_person_name_trigram'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConcernItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('open_concern', 'Open concern'), ('low_rating', 'Low rating'), ('bunk_concern', 'Bunk concern')], max_length=16)),
+                ('severity', models.PositiveSmallIntegerField(choices=[(1, 'Low'), (2, 'Medium'), (3, 'High')])),
+                ('field_key', models.CharField(help_text="Matches ConcernReadState.field_key ('<field>__<category>' for rating groups).", max_length=64)),
+                ('field_label', models.CharField(blank=True, max_length=255)),
+                ('value_text', models.TextField(blank=True)),
+                ('value_number', models.FloatField(blank=True, null=True)),
+                ('position', models.PositiveSmallIntegerField(default=0, help_text='Order within the reflection (template schema order).')),
+                ('period_start', models.DateField()),
+                ('date', models.DateField(help_text="The reflection's period_end.")),
+                ('assignment_group', models.ForeignKey(blank=True, help_text="The reflection's group for open concerns / low ratings; the referenced bunk for bunk concerns.", null=True, on_delete=django.db.models.deletion.CASCADE, related_name='concern_items', to='core.assignmentgroup')),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='concern_items', to='core.organization')),
+                ('program', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='concern_items', to='core.program')),
+                ('reflection', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='concern_items', to='core.reflection')),
+                ('subject', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='concern_items', to='core.person')),
+            ],
+            options={
+                'ordering': ['-date', 'reflection_id', 'position'],
+                'indexes': [models.Index(fields=['organization', 'kind', 'date'], name='core_concern_org_kind_date'), models.Index(fields=['assignment_group', 'kind', 'date'], name='core_concern_group_kind_date'), models.Index(fields=['subject', 'date'], name='core_concern_subject_date')],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+"""Register the minutely role-dashboard warm-up dispatcher PeriodicTask.
+
+``bunk_logs.core.tasks.dispatch_dashboard_warmup`` is a no-op outside each
+organization's rollover / evening warm-up windows (see
+``bunk_logs.api.dashboards.warmup``), so running it every minute is cheap.
+
+Idempotent: uses ``update_or_create`` keyed on the well-known PeriodicTask
+name so re-runs simply refresh the row in place.
+"""
+from __future__ import annotations
+
+import json
+
+from django.db import migrations
+
+PERIODIC_TASK_NAME = "dashboards.warmup.dispatch.minutely"
+PERIODIC_TASK_PATH = "bunk_logs.core.tasks.dispatch_dashboard_warmup"
+
+
+def _register(apps, schema_editor):
+    CrontabSchedule = apps.get_model("django_celery_beat", "CrontabSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = CrontabSchedule.objects.get_or_create(
+        minute="*",
+        hour="*",
+        day_of_week="*",
+        day_of_month="*",
+        month_of_year="*",
+    )
+    PeriodicTask.objects.update_or_create(
+        name=PERIODIC_TASK_NAME,
+        defaults={
+            "crontab": schedule,
+            "interval": None,
+            "task": PERIODIC_TASK_PATH,
+            "args": json.dumps([]),
+            "kwargs": json.dumps({}),
+            "enabled": True,
+            "description": (
+                "Precompute Counselor / Unit Head / Camper Care / Leadership "
+                "Team home dashboards after each org's rollover hour and "
+                "through the evening submission peak."
+            ),
+        },
+    )
+
+
+def _unregister(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name=PERIODIC_TASK_NAME).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0066_inbound_email"),
+        ("django_celery_beat", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(_register, reverse_code=_unregister),
+    ]
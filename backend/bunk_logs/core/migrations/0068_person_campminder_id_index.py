@@ -0,0 +1,20 @@
+# Generated by Django 5.0.13 on 2026-10-19 03:53
+
+import django.db.models.fields.json
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0067_register_dashboard_warmup_dispatcher'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(models.F('organization'), django.db.models.fields.json.KeyTransform('campminder_id', 'external_ids'), name='core_person_cm_id'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.0.13 on 2026-10-19 04:09
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0068_person_campminder_id_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=32)),
+                ('object_id', models.CharField(max_length=64)),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+            ],
+            options={
+                'ordering': ['deleted_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='camperdaystate',
+            index=models.Index(fields=['organization', 'updated_at'], name='core_camper_organiz_7789a4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='flag',
+            index=models.Index(fields=['organization', 'updated_at'], name='core_flag_organiz_04ea04_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenanceticket',
+            index=models.Index(fields=['organization', 'updated_at'], name='core_mainte_organiz_6bbc79_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['organization', 'updated_at'], name='core_order_organiz_3af5cd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reflection',
+            index=models.Index(fields=['organization', 'updated_at'], name='core_reflec_organiz_5f7f17_idx'),
+        ),
+        migrations.AddField(
+            model_name='synctombstone',
+            name='organization',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.organization'),
+        ),
+        migrations.AddField(
+            model_name='synctombstone',
+            name='program',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.program'),
+        ),
+        migrations.AddIndex(
+            model_name='synctombstone',
+            index=models.Index(fields=['organization', 'deleted_at'], name='core_syncto_organiz_d01670_idx'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+"""Register the nightly change-feed tombstone prune PeriodicTask.
+
+``bunk_logs.core.tasks.prune_sync_tombstones`` drops ``SyncTombstone`` rows
+older than ``SYNC_TOMBSTONE_RETENTION_DAYS``; the counselor change feed
+answers ``reset: true`` to cursors older than that, so nothing still
+needed is lost.
+
+Idempotent: uses ``update_or_create`` keyed on the well-known PeriodicTask
+name so re-runs simply refresh the row in place.
+"""
+from __future__ import annotations
+
+import json
+
+from django.db import migrations
+
+PERIODIC_TASK_NAME = "sync.tombstones.prune.nightly"
+PERIODIC_TASK_PATH = "bunk_logs.core.tasks.prune_sync_tombstones"
+
+
+def _register(apps, schema_editor):
+    CrontabSchedule = apps.get_model("django_celery_beat", "CrontabSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = CrontabSchedule.objects.get_or_create(
+        minute="30",
+        hour="3",
+        day_of_week="*",
+        day_of_month="*",
+        month_of_year="*",
+    )
+    PeriodicTask.objects.update_or_create(
+        name=PERIODIC_TASK_NAME,
+        defaults={
+            "crontab": schedule,
+            "interval": None,
+            "task": PERIODIC_TASK_PATH,
+            "args": json.dumps([]),
+            "kwargs": json.dumps({}),
+            "enabled": True,
+            "description": (
+                "Delete counselor change-feed tombstones older than "
+                "SYNC_TOMBSTONE_RETENTION_DAYS."
+            ),
+        },
+    )
+
+
+def _unregister(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name=PERIODIC_TASK_NAME).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0069_sync_change_feed"),
+        ("django_celery_beat", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(_register, reverse_code=_unregister),
+    ]
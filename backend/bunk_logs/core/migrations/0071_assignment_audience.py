@@ -0,0 +1,39 @@
+# Generated by Django 5.0.13 on 2026-10-19 05:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0070_register_sync_tombstone_prune'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='templateassignment',
+            name='expected_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='templateassignment',
+            name='submitted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.CreateModel(
+            name='AssignmentAudience',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField(blank=True, null=True)),
+                ('assignment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='audience', to='core.templateassignment')),
+                ('membership', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignment_audience', to='core.membership')),
+                ('program', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.program')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['membership', 'start_date', 'end_date'], name='core_audience_membership_idx')],
+                'constraints': [models.UniqueConstraint(fields=('assignment', 'membership'), name='core_assignment_audience_unique')],
+            },
+        ),
+    ]
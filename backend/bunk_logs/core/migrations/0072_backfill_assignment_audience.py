@@ -0,0 +1,115 @@
+"""Backfill ``AssignmentAudience`` rows and the TemplateAssignment counters.
+
+0071 created the table and the ``expected_count`` / ``submitted_count``
+columns empty, while the per-role dashboards, the optional-assignment list
+and the Leadership Team assignment list read only those.
+
+Mirrors ``resolve_members`` and ``count_submitted`` from
+:mod:`bunk_logs.core.assignment_audience` against the historical models, so
+a fresh ``migrate`` keeps working as those models change. After deploy,
+``manage.py backfill_assignment_audience`` remains the way to rebuild from
+the live code.
+
+Non-atomic so each assignment commits on its own instead of holding one
+transaction over the whole table. Idempotent: an assignment's rows are
+replaced, not appended. Reversing is a no-op: unapplying 0071 drops the
+rows and columns.
+"""
+
+from django.db import migrations
+from django.db import transaction
+
+
+def _author_roles(template) -> list[str]:
+    roles = [r for r in (template.author_role_filter or []) if r]
+    if roles:
+        return roles
+    return [template.role] if template.role else []
+
+
+def _roster_roles(template) -> tuple[str, ...]:
+    return ("author", "subject") if template.subject_mode == "self" else ("author",)
+
+
+def _audience_ids(apps, assignment) -> set[int]:
+    if assignment.status == "cancelled":
+        return set()
+    Membership = apps.get_model("core", "Membership")
+    AssignmentGroupMembership = apps.get_model("core", "AssignmentGroupMembership")
+
+    payload = assignment.target_payload or {}
+    base = Membership.objects.filter(program_id=assignment.program_id, is_active=True)
+    target_type = assignment.target_type
+    if target_type == "role":
+        role = payload.get("role")
+        qs = base.filter(role=role) if role else base.none()
+    elif target_type == "individuals":
+        ids = payload.get("membership_ids") or []
+        qs = base.filter(pk__in=ids) if isinstance(ids, list) else base.none()
+    elif target_type == "tag_group":
+        tag = payload.get("tag")
+        qs = base.filter(tags__contains=[tag]) if tag else base.none()
+    elif target_type == "assignment_group" and assignment.assignment_group_id:
+        author_roles = _author_roles(assignment.template)
+        person_ids = AssignmentGroupMembership.objects.filter(
+            group_id=assignment.assignment_group_id,
+            role_in_group__in=_roster_roles(assignment.template),
+            is_active=True,
+        ).values_list("person_id", flat=True)
+        qs = base.filter(person_id__in=person_ids, role__in=author_roles) if author_roles else base.none()
+    else:
+        qs = base.none()
+    return set(qs.values_list("pk", flat=True))
+
+
+def _submitted(apps, assignment) -> int:
+    Reflection = apps.get_model("core", "Reflection")
+    qs = Reflection.objects.filter(
+        template_id=assignment.template_id,
+        program_id=assignment.program_id,
+        period_start__gte=assignment.start_date,
+    )
+    if assignment.end_date:
+        qs = qs.filter(period_end__lte=assignment.end_date)
+    if assignment.target_type == "assignment_group" and assignment.assignment_group_id:
+        qs = qs.filter(assignment_group_id=assignment.assignment_group_id)
+    return qs.count()
+
+
+def _backfill(apps, schema_editor):
+    TemplateAssignment = apps.get_model("core", "TemplateAssignment")
+    AssignmentAudience = apps.get_model("core", "AssignmentAudience")
+
+    assignments = TemplateAssignment.objects.select_related("template").order_by("pk")
+    for assignment in assignments.iterator(chunk_size=200):
+        members = _audience_ids(apps, assignment)
+        with transaction.atomic():
+            AssignmentAudience.objects.filter(assignment_id=assignment.pk).delete()
+            AssignmentAudience.objects.bulk_create(
+                [
+                    AssignmentAudience(
+                        assignment_id=assignment.pk,
+                        membership_id=membership_id,
+                        program_id=assignment.program_id,
+                        start_date=assignment.start_date,
+                        end_date=assignment.end_date,
+                    )
+                    for membership_id in members
+                ],
+            )
+            TemplateAssignment.objects.filter(pk=assignment.pk).update(
+                expected_count=len(members),
+                submitted_count=_submitted(apps, assignment),
+            )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("core", "0071_assignment_audience"),
+    ]
+
+    operations = [
+        migrations.RunPython(_backfill, reverse_code=migrations.RunPython.noop),
+    ]
@@ -2,11 +2,17 @@ import uuid
 from typing import Any
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db import transaction
 from django.db.models import F
 from django.db.models import Q
+from django.db.models.fields.json import KeyTransform
+from django.db.models.functions import Upper
+from django.utils import timezone
 
 from bunk_logs.core.managers import AssignmentGroupMembershipScopedManager
 from bunk_logs.core.managers import AuditEventAllManager
@@ -355,6 +361,22 @@ class Person(models.Model):
                 name="uniq_person_org_user",
             ),
         ]
+        # Trigram indexes on the exact expression ``icontains`` compiles to
+        # (``UPPER(col::text) LIKE ...``); see bunk_logs.core.person_search.
+        indexes = [
+            GinIndex(OpClass(Upper("first_name"), name="gin_trgm_ops"), name="core_person_first_trgm"),
+            GinIndex(OpClass(Upper("last_name"), name="gin_trgm_ops"), name="core_person_last_trgm"),
+            GinIndex(OpClass(Upper("preferred_name"), name="gin_trgm_ops"), name="core_person_pref_trgm"),
+            # ``external_ids__campminder_id=`` / ``__in=`` compile to
+            # ``(external_ids -> 'campminder_id') = '"…"'::jsonb``; roster
+            # matching by Campminder ID is an index scan on this expression
+            # (see bunk_logs.core.campminder_person_match).
+            models.Index(
+                F("organization"),
+                KeyTransform("campminder_id", "external_ids"),
+                name="core_person_cm_id",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.full_name
@@ -507,6 +529,7 @@ class AssignmentGroup(models.Model):
         indexes = [
             models.Index(fields=["program", "group_type", "is_active"]),
             models.Index(fields=["parent"]),
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="core_group_name_trgm"),
         ]
 
     def __str__(self) -> str:
@@ -752,6 +775,11 @@ class ReflectionTemplate(models.Model):
             "future annotations don't require a column migration."
         ),
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Maintained by bunk_logs.core.search_vectors; backs admin global search.",
+    )
 
     objects = ReflectionTemplateScopedManager()
     all_objects = models.Manager()  # noqa: DJ012
@@ -759,6 +787,9 @@ class ReflectionTemplate(models.Model):
     class Meta:
         unique_together = [("organization", "slug", "version")]
         ordering = ["organization_id", "slug", "-version"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="core_refltpl_search_gin"),
+        ]
 
     def __str__(self) -> str:
         org = self.organization.slug if self.organization else "global"
@@ -888,6 +919,12 @@ class TemplateAssignment(models.Model):
         blank=True,
         related_name="template_assignments_created",
     )
+    # Compliance counters maintained by ``core.assignment_audience``; never
+    # edit by hand. ``expected_count`` is the materialized audience size,
+    # ``submitted_count`` the Reflections filed under this assignment's
+    # template / program / window (and group, for assignment_group rows).
+    expected_count = models.PositiveIntegerField(default=0, editable=False)
+    submitted_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -909,6 +946,55 @@ class TemplateAssignment(models.Model):
         )
 
 
+class AssignmentAudience(models.Model):
+    """Materialized audience of a :class:`TemplateAssignment`.
+
+    One row per (assignment, active Membership) that
+    ``assignment_resolution.resolve_members`` would return, carrying a copy
+    of the assignment's date window so "what is assigned to me on this
+    date" and "who is this assigned to" are index reads instead of
+    per-assignment audience resolution.
+
+    Maintained by :mod:`bunk_logs.core.assignment_audience` from signals on
+    assignments, templates, memberships and roster rows. Cancelled
+    assignments have no rows. Bulk ``.update()`` paths must call its
+    refresh helpers; ``manage.py backfill_assignment_audience`` rebuilds
+    everything.
+    """
+
+    assignment = models.ForeignKey(
+        TemplateAssignment, on_delete=models.CASCADE, related_name="audience",
+    )
+    membership = models.ForeignKey(
+        Membership, on_delete=models.CASCADE, related_name="assignment_audience",
+    )
+    program = models.ForeignKey(
+        Program, on_delete=models.CASCADE, related_name="+",
+    )
+    start_date = models.DateField()
+    end_date = models.DateField(null=True, blank=True)
+
+    objects = ProgramScopedManager()
+    all_objects = models.Manager()  # noqa: DJ012
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["assignment", "membership"],
+                name="core_assignment_audience_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["membership", "start_date", "end_date"],
+                name="core_audience_membership_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"assignment:{self.assignment_id} -> membership:{self.membership_id}"
+
+
 class AssignmentDashboardGrant(models.Model):
     """Admin-only per-case override granting a Membership access to one assignment.
 
@@ -1068,6 +1154,11 @@ class Reflection(models.Model):
             "Null for server-side / legacy creations."
         ),
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Maintained by bunk_logs.core.search_vectors; backs admin global search.",
+    )
 
     objects = OrgScopedManager()
     all_objects = models.Manager()  # noqa: DJ012
@@ -1082,6 +1173,8 @@ class Reflection(models.Model):
             models.Index(fields=["author", "period_end"]),
             models.Index(fields=["template", "is_complete"]),
             models.Index(fields=["submission_id"]),
+            models.Index(fields=["organization", "updated_at"]),
+            GinIndex(fields=["search_vector"], name="core_reflection_search_gin"),
         ]
         constraints = [
             models.CheckConstraint(
@@ -1122,6 +1215,93 @@ class Reflection(models.Model):
             self.validate_answers()
 
 
+class ConcernItem(models.Model):
+    """One concern surfaced by a completed Reflection, extracted at write time.
+
+    :mod:`bunk_logs.core.concerns` walks the template schema once, when the
+    reflection is saved, and writes a row per ``open_concern`` answer, low
+    rating and ``bunk_concerns_bunks`` reference. The Concerns Inbox and the
+    Unit Head "bunk concerns" badges read these indexed rows (joined to
+    :class:`ConcernReadState` in SQL) instead of re-parsing ``answers`` on
+    every load. Rows are replaced wholesale whenever the reflection changes;
+    ``manage.py backfill_concern_items`` rebuilds them after bulk writes or a
+    template schema edit.
+    """
+
+    class Kind(models.TextChoices):
+        OPEN_CONCERN = "open_concern", "Open concern"
+        LOW_RATING = "low_rating", "Low rating"
+        BUNK_CONCERN = "bunk_concern", "Bunk concern"
+
+    class Severity(models.IntegerChoices):
+        LOW = 1, "Low"
+        MEDIUM = 2, "Medium"
+        HIGH = 3, "High"
+
+    organization = models.ForeignKey(
+        Organization,
+        on_delete=models.CASCADE,
+        related_name="concern_items",
+    )
+    program = models.ForeignKey(
+        Program,
+        on_delete=models.CASCADE,
+        related_name="concern_items",
+    )
+    reflection = models.ForeignKey(
+        Reflection,
+        on_delete=models.CASCADE,
+        related_name="concern_items",
+    )
+    subject = models.ForeignKey(
+        Person,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="concern_items",
+    )
+    assignment_group = models.ForeignKey(
+        AssignmentGroup,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="concern_items",
+        help_text=(
+            "The reflection's group for open concerns / low ratings; the "
+            "referenced bunk for bunk concerns."
+        ),
+    )
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    severity = models.PositiveSmallIntegerField(choices=Severity.choices)
+    field_key = models.CharField(
+        max_length=64,
+        help_text="Matches ConcernReadState.field_key ('<field>__<category>' for rating groups).",
+    )
+    field_label = models.CharField(max_length=255, blank=True)
+    value_text = models.TextField(blank=True)
+    value_number = models.FloatField(null=True, blank=True)
+    position = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Order within the reflection (template schema order).",
+    )
+    period_start = models.DateField()
+    date = models.DateField(help_text="The reflection's period_end.")
+
+    objects = OrgScopedManager()
+    all_objects = models.Manager()  # noqa: DJ012
+
+    class Meta:
+        ordering = ["-date", "reflection_id", "position"]
+        indexes = [
+            models.Index(fields=["organization", "kind", "date"], name="core_concern_org_kind_date"),
+            models.Index(fields=["assignment_group", "kind", "date"], name="core_concern_group_kind_date"),
+            models.Index(fields=["subject", "date"], name="core_concern_subject_date"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind} {self.reflection_id}/{self.field_key}"
+
+
 class ConcernReadState(models.Model):
     """Tracks per-user "I've read this concern" state for the Concerns Inbox.
 
@@ -1130,8 +1310,9 @@ class ConcernReadState(models.Model):
     OR the answer crosses a numeric threshold (rating ≤ 1 in the prior 14d
     window — surfaced in the per-subject view too).
 
-    We don't denormalize the concern itself; instead the dashboard query joins
-    this table to filter out already-read items per viewer.
+    Keyed by (reflection, field_key) rather than by :class:`ConcernItem` so
+    read state survives the items being rebuilt; the inbox query joins the
+    two in SQL to filter out already-read items per viewer.
     """
 
     user = models.ForeignKey(
@@ -1318,7 +1499,7 @@ class OrderableContent(models.Model):
             self.status = plan.to_state
             self.last_transition_at = event.created_at
             self.last_transition_by = actor_membership
-            self.save(update_fields=["status", "last_transition_at", "last_transition_by"])
+            self.save(update_fields=["status", "last_transition_at", "last_transition_by", "updated_at"])
             # Cross-cutting audit row (Step 7_4). Dual-write alongside
             # ``OrderActivityEvent`` until the 7_2 activity table is backfilled
             # and retired.
@@ -1390,7 +1571,7 @@ class OrderableContent(models.Model):
             )
             self.last_transition_at = prior.created_at if prior else None
             self.last_transition_by = prior.actor_membership if prior else None
-            self.save(update_fields=["status", "last_transition_at", "last_transition_by"])
+            self.save(update_fields=["status", "last_transition_at", "last_transition_by", "updated_at"])
 
             correction_event = OrderActivityEvent.all_objects.create(
                 organization=self.organization,
@@ -1531,6 +1712,11 @@ class Order(OrderableContent):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Maintained by bunk_logs.core.search_vectors; backs admin global search.",
+    )
 
     objects = OrgScopedManager()
     all_objects = models.Manager()  # noqa: DJ012
@@ -1542,6 +1728,8 @@ class Order(OrderableContent):
         indexes = [
             models.Index(fields=["organization", "program", "status"]),
             models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["organization", "updated_at"]),
+            GinIndex(fields=["search_vector"], name="core_order_search_gin"),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -1840,6 +2028,11 @@ class MaintenanceTicket(OrderableContent):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Maintained by bunk_logs.core.search_vectors; backs admin global search.",
+    )
 
     objects = OrgScopedManager()
     all_objects = models.Manager()  # noqa: DJ012
@@ -1851,6 +2044,8 @@ class MaintenanceTicket(OrderableContent):
         indexes = [
             models.Index(fields=["organization", "program", "status"]),
             models.Index(fields=["urgency", "status", "created_at"]),
+            models.Index(fields=["organization", "updated_at"]),
+            GinIndex(fields=["search_vector"], name="core_ticket_search_gin"),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -2135,6 +2330,7 @@ class CamperDayState(models.Model):
         indexes = [
             models.Index(fields=["program", "date", "is_off_camp"]),
             models.Index(fields=["camper", "date"]),
+            models.Index(fields=["organization", "updated_at"]),
         ]
 
     def __str__(self) -> str:
@@ -2228,6 +2424,48 @@ class OrderActivityEvent(models.Model):
         return f"{self.event_type} on {self.content_type}:{self.content_id}"
 
 
+class InboundEmail(models.Model):
+    """A signature-verified Mailgun inbound POST, stored before processing.
+
+    With ``MAILGUN_INBOUND_ASYNC`` on, the webhook only verifies the
+    signature, stores the raw form fields here and acks; the
+    ``process_inbound_emails`` task turns pending rows into ticket notes.
+    ``dedup_key`` (the Message-Id, else the Mailgun token) is unique, so a
+    Mailgun retry of the same reply is acknowledged without a second note.
+    Not org-scoped: the organization is only known once the ticket address
+    is resolved, which is the processing step's job.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        PROCESSED = "processed", "Processed"
+        REJECTED = "rejected", "Rejected"
+        FAILED = "failed", "Failed"
+
+    dedup_key = models.CharField(max_length=512, unique=True)
+    token = models.CharField(max_length=128, blank=True)
+    message_id = models.CharField(max_length=512, blank=True)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=16, choices=Status.choices, default=Status.PENDING,
+    )
+    ticket_id = models.UUIDField(null=True, blank=True)
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    detail = models.CharField(max_length=255, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["received_at"]
+        indexes = [
+            models.Index(fields=["status", "received_at"], name="core_inbound_status_recv"),
+        ]
+
+    def __str__(self) -> str:
+        return f"inbound email {self.dedup_key} ({self.status})"
+
+
 # ---------------------------------------------------------------------------
 # Flag (Step 7_8) — Camper Care triage primitive
 # ---------------------------------------------------------------------------
@@ -2330,6 +2568,7 @@ class Flag(models.Model):
             models.Index(fields=["organization", "program", "status"]),
             models.Index(fields=["subject_camper", "status"]),
             models.Index(fields=["flagged_for_role", "status", "created_at"]),
+            models.Index(fields=["organization", "updated_at"]),
         ]
 
     def __str__(self) -> str:
@@ -2863,6 +3102,11 @@ class AuditEvent(models.Model):
     ``reflection``, ``note``); ``content_id`` is the related row's UUID --
     audit rows for legacy int-PK content are out of scope until those
     models migrate to UUIDs.
+
+    On Postgres the table is range-partitioned by month on ``created_at``
+    (see :py:mod:`bunk_logs.core.audit_partitions`); filter on a
+    ``created_at`` range wherever possible so only the matching months are
+    scanned.
     """
 
     class EventType(models.TextChoices):
@@ -2878,7 +3122,10 @@ class AuditEvent(models.Model):
         EXPORT = "export", "Export"
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Stamped when the event object is built, not at INSERT, so buffered and
+    # async-flushed events keep their real time and a retried flush reuses
+    # the same ``(id, created_at)`` physical key. Also the partition key.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
     actor_membership = models.ForeignKey(
         Membership,
         null=True,
@@ -3910,3 +4157,49 @@ class ReflectionThemeTag(models.Model):
 
     def __str__(self) -> str:
         return f"{self.theme_key} on {self.field_key} (grade {self.grade_level})"
+
+
+class SyncTombstone(models.Model):
+    """Deletion marker for a row served by the counselor change feed.
+
+    ``GET /api/v1/counselor/sync/`` answers "what changed since this cursor"
+    from the synced models' ``(organization, updated_at)`` indexes; a
+    deleted row leaves nothing to index, so a ``post_delete`` receiver
+    (see :mod:`bunk_logs.core.change_feed`) records one of these instead.
+    ``model`` is the change-feed label (``reflection``, ``order``, ...) and
+    ``object_id`` the deleted PK as a string.
+
+    Rows outlive their organization / program on purpose -- a cascade
+    delete writes tombstones for everything it removes -- so both FKs skip
+    the database constraint. ``prune_sync_tombstones`` drops rows older than
+    ``SYNC_TOMBSTONE_RETENTION_DAYS``; clients whose cursor predates that
+    are told to resync from scratch.
+    """
+
+    organization = models.ForeignKey(
+        Organization,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    program = models.ForeignKey(
+        Program,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    model = models.CharField(max_length=32)
+    object_id = models.CharField(max_length=64)
+    deleted_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    objects = OrgScopedManager()
+    all_objects = models.Manager()  # noqa: DJ012
+
+    class Meta:
+        ordering = ["deleted_at"]
+        indexes = [
+            models.Index(fields=["organization", "deleted_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.model} {self.object_id} deleted {self.deleted_at:%Y-%m-%d %H:%M}"
@@ -26,6 +26,7 @@ from bunk_logs.core.models import Reflection
 from bunk_logs.core.permissions.super_admin import is_super_admin
 from bunk_logs.core.program_scope import operational_program_q
 from bunk_logs.core.time_utils import get_today
+from bunk_logs.utils.instrumentation import hot_path
 
 User = get_user_model()
 
@@ -424,6 +425,7 @@ def supervised_person_ids(
     return person_ids
 
 
+@hot_path("visibility.compile")
 def reflections_visible_to(
     user,
     queryset: QuerySet[Reflection] | None = None,
@@ -0,0 +1,216 @@
+"""Find likely-duplicate Person records within an organization.
+
+Feeds the Admin "likely duplicates" list that sits in front of
+:func:`bunk_logs.core.person_merge.plan_dedupe`. Rather than comparing
+every pair (or issuing a query per person), each Person is loaded once
+and assigned a handful of *blocking keys*:
+
+* normalized full name (accents, punctuation and case stripped; the
+  preferred name is keyed as an alternate first name),
+* phonetic key -- Soundex of first + last, order-insensitive so swapped
+  first/last names still collide,
+* email local part (``+tags`` and dots removed),
+* birthdate + first initial.
+
+Only Persons sharing at least one key are scored, in memory, on name
+similarity, email, birthdate and Campminder id agreement. Pairs whose
+Campminder ids differ are dropped -- ``plan_person_merge`` would block
+them anyway. Oversized blocks (a very common name) are capped so one
+popular key can't turn the pass quadratic.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from dataclasses import field
+from difflib import SequenceMatcher
+from itertools import combinations
+from typing import Any
+
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+
+# Pairs scoring below this are not reported.
+DEFAULT_MIN_SCORE = 0.6
+
+# Blocks larger than this are skipped: the key is too common to be a
+# useful duplicate signal and would cost O(n^2) comparisons.
+MAX_BLOCK_SIZE = 40
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+@dataclass
+class _Row:
+    id: int
+    first: str
+    last: str
+    preferred: str
+    email_local: str
+    email: str
+    date_of_birth: Any
+    campminder_id: str
+
+
+@dataclass
+class DuplicateCandidate:
+    person_id: int
+    other_person_id: int
+    score: float
+    reasons: list[str] = field(default_factory=list)
+
+
+def normalize_name(value: str) -> str:
+    """Lowercase ASCII letters only (``"José-Luis "`` -> ``"joseluis"``)."""
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    return "".join(ch for ch in decomposed.lower() if "a" <= ch <= "z")
+
+
+def soundex(value: str) -> str:
+    """American Soundex of an already-normalized name ("" for empty input)."""
+    if not value:
+        return ""
+    first = value[0]
+    digits = []
+    previous = _SOUNDEX_CODES.get(first, "")
+    for ch in value[1:]:
+        code = _SOUNDEX_CODES.get(ch, "")
+        if code and code != previous:
+            digits.append(code)
+        # "h" and "w" don't separate equal codes; vowels do.
+        if ch not in "hw":
+            previous = code
+    return (first.upper() + "".join(digits) + "000")[:4]
+
+
+def email_local_part(email: str) -> str:
+    local, _, _domain = (email or "").strip().lower().partition("@")
+    return local.split("+", 1)[0].replace(".", "")
+
+
+def _load_rows(org: Organization) -> list[_Row]:
+    rows = Person.all_objects.filter(organization=org).values_list(
+        "id", "first_name", "last_name", "preferred_name",
+        "email", "date_of_birth", "external_ids",
+    )
+    return [
+        _Row(
+            id=pk,
+            first=normalize_name(first),
+            last=normalize_name(last),
+            preferred=normalize_name(preferred),
+            email=(email or "").strip().lower(),
+            email_local=email_local_part(email),
+            date_of_birth=dob,
+            campminder_id=str((external_ids or {}).get("campminder_id") or "").strip(),
+        )
+        for pk, first, last, preferred, email, dob, external_ids in rows
+    ]
+
+
+def blocking_keys(row: _Row) -> set[tuple[str, str]]:
+    keys: set[tuple[str, str]] = set()
+    firsts = {name for name in (row.first, row.preferred) if name}
+    for first in firsts:
+        if row.last:
+            keys.add(("name", f"{first}|{row.last}"))
+            keys.add(("phonetic", "|".join(sorted((soundex(first), soundex(row.last))))))
+        if row.date_of_birth:
+            keys.add(("dob", f"{row.date_of_birth.isoformat()}|{first[0]}"))
+    if row.email_local:
+        keys.add(("email", row.email_local))
+    return keys
+
+
+def _similarity(a: str, b: str) -> float:
+    if not a or not b:
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def score_pair(a: _Row, b: _Row) -> tuple[float, list[str]]:
+    """Score in ``[0, 1]`` plus the human-readable reasons behind it."""
+    reasons: list[str] = []
+    first = max(
+        _similarity(x, y)
+        for x in (a.first, a.preferred or a.first)
+        for y in (b.first, b.preferred or b.first)
+    )
+    last = _similarity(a.last, b.last)
+    swapped = min(_similarity(a.first, b.last), _similarity(a.last, b.first))
+    name = max((first + last) / 2, swapped)
+    score = 0.6 * name
+    if name == 1.0:
+        reasons.append("same_name")
+    elif swapped > (first + last) / 2:
+        reasons.append("swapped_name")
+    elif name >= 0.8:
+        reasons.append("similar_name")
+
+    if a.email and a.email == b.email:
+        score += 0.3
+        reasons.append("same_email")
+    elif a.email_local and a.email_local == b.email_local:
+        score += 0.15
+        reasons.append("same_email_local_part")
+
+    if a.date_of_birth and b.date_of_birth:
+        if a.date_of_birth == b.date_of_birth:
+            score += 0.25
+            reasons.append("same_birthdate")
+        else:
+            score -= 0.3
+
+    if a.campminder_id and a.campminder_id == b.campminder_id:
+        score += 0.4
+        reasons.append("same_campminder_id")
+    return max(0.0, min(score, 1.0)), reasons
+
+
+def find_duplicate_candidates(
+    org: Organization, *, min_score: float = DEFAULT_MIN_SCORE,
+) -> list[DuplicateCandidate]:
+    """All likely-duplicate pairs in ``org``, best match first.
+
+    One query loads the org's Persons; everything else is in memory.
+    """
+    rows = _load_rows(org)
+    blocks: dict[tuple[str, str], list[_Row]] = defaultdict(list)
+    for row in rows:
+        for key in blocking_keys(row):
+            blocks[key].append(row)
+
+    pairs: set[tuple[int, int]] = set()
+    by_id = {row.id: row for row in rows}
+    for members in blocks.values():
+        if len(members) < 2 or len(members) > MAX_BLOCK_SIZE:
+            continue
+        for a, b in combinations(members, 2):
+            pairs.add((min(a.id, b.id), max(a.id, b.id)))
+
+    candidates = []
+    for a_id, b_id in pairs:
+        a, b = by_id[a_id], by_id[b_id]
+        if a.campminder_id and b.campminder_id and a.campminder_id != b.campminder_id:
+            continue
+        score, reasons = score_pair(a, b)
+        if score >= min_score:
+            candidates.append(
+                DuplicateCandidate(
+                    person_id=a_id,
+                    other_person_id=b_id,
+                    score=round(score, 3),
+                    reasons=reasons,
+                ),
+            )
+    candidates.sort(key=lambda c: (-c.score, c.person_id, c.other_person_id))
+    return candidates
@@ -473,7 +473,7 @@ def _merge_camper_day_states(*, winner: Person, loser: Person) -> int:
             state.delete()
         else:
             state.camper = winner
-            state.save(update_fields=["camper"])
+            state.save(update_fields=["camper", "updated_at"])
             moved += 1
     return moved
 
@@ -496,8 +496,10 @@ def merge_persons(
 
     _merge_memberships(winner=winner, loser=loser)
     _merge_assignment_group_memberships(winner=winner, loser=loser)
-    Reflection.all_objects.filter(subject=loser).update(subject=winner)
-    Reflection.all_objects.filter(author=loser).update(author=winner)
+    # Synced models bump ``updated_at`` so the counselor change feed sees the move.
+    now = timezone.now()
+    Reflection.all_objects.filter(subject=loser).update(subject=winner, updated_at=now)
+    Reflection.all_objects.filter(author=loser).update(author=winner, updated_at=now)
     Observation.all_objects.filter(author=loser).update(author=winner)
     ObservationReply.objects.filter(author=loser).update(author=winner)
     _merge_observation_m2m(model=ObservationSubject, fk="subject", winner=winner, loser=loser)
@@ -505,8 +507,8 @@ def merge_persons(
     _merge_observation_m2m(model=ObservationReadReceipt, fk="person", winner=winner, loser=loser)
     _merge_observation_m2m(model=ObservationArchive, fk="person", winner=winner, loser=loser)
     _merge_camper_day_states(winner=winner, loser=loser)
-    Order.all_objects.filter(subject=loser).update(subject=winner)
-    Flag.all_objects.filter(subject_camper=loser).update(subject_camper=winner)
+    Order.all_objects.filter(subject=loser).update(subject=winner, updated_at=now)
+    Flag.all_objects.filter(subject_camper=loser).update(subject_camper=winner, updated_at=now)
 
     if not winner.user_id and loser.user_id:
         winner.user = loser.user
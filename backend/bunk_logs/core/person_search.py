@@ -1,30 +1,84 @@
-"""Shared name search helpers for Person querysets."""
+"""Shared name search helpers for Person querysets.
+
+``icontains`` compiles to ``UPPER(col::text) LIKE UPPER('%tok%')``; the
+``UPPER(...) gin_trgm_ops`` indexes on Person's name columns and
+AssignmentGroup.name (Step 7_17) let Postgres answer that from pg_trgm
+instead of scanning every Person the org has ever had. Tokens shorter than
+three characters carry no trigram and fall back to a scan, so autocomplete
+callers should require at least two characters and a limit.
+"""
 
 from __future__ import annotations
 
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Case
+from django.db.models import IntegerField
 from django.db.models import Q
+from django.db.models import Value
+from django.db.models import When
+from django.db.models.functions import Concat
+from django.db.models.functions import Greatest
 
+NAME_FIELDS = ("first_name", "last_name", "preferred_name")
 
-def filter_persons_by_name_query(qs, q: str):
-    """Match name tokens against first, last, and preferred name fields."""
-    q = q.strip()
-    if not q:
-        return qs
-    tokens = [t for t in q.split() if t]
-    if not tokens:
-        return qs
-    if len(tokens) == 1:
-        token = tokens[0]
-        return qs.filter(
-            Q(first_name__icontains=token)
-            | Q(last_name__icontains=token)
-            | Q(preferred_name__icontains=token),
-        )
+
+def person_name_q(q: str) -> Q:
+    """Every token of ``q`` in first, last, or preferred name; empty ``Q`` for a blank query."""
     combined = Q()
-    for token in tokens:
+    for token in q.split():
         combined &= (
             Q(first_name__icontains=token)
             | Q(last_name__icontains=token)
             | Q(preferred_name__icontains=token)
         )
-    return qs.filter(combined)
+    return combined
+
+
+def filter_persons_by_name_query(qs, q: str):
+    """Match name tokens against first, last, and preferred name fields."""
+    q = q.strip()
+    if not q:
+        return qs
+    return qs.filter(person_name_q(q))
+
+
+def _prefix_rank(q: str, fields: tuple[str, ...]) -> Case:
+    """0 when the query's first token starts one of ``fields``, else 1."""
+    token = q.split(maxsplit=1)[0]
+    starts = Q()
+    for field in fields:
+        starts |= Q(**{f"{field}__istartswith": token})
+    return Case(When(starts, then=Value(0)), default=Value(1), output_field=IntegerField())
+
+
+def rank_persons_by_name(qs, q: str):
+    """``filter_persons_by_name_query`` ordered best match first.
+
+    Prefix matches ("Sam" -> "Samuel") sort ahead of infix ones ("Sam" ->
+    "Rosamund"); ties break on trigram similarity against each name and the
+    full name, then alphabetically.
+    """
+    q = q.strip()
+    qs = filter_persons_by_name_query(qs, q)
+    if not q:
+        return qs.order_by("last_name", "first_name")
+    return qs.annotate(
+        name_prefix=_prefix_rank(q, NAME_FIELDS),
+        name_similarity=Greatest(
+            *(TrigramSimilarity(field, q) for field in NAME_FIELDS),
+            TrigramSimilarity(Concat("first_name", Value(" "), "last_name"), q),
+        ),
+    ).order_by("name_prefix", "-name_similarity", "last_name", "first_name")
+
+
+def rank_groups_by_name(qs, q: str):
+    """AssignmentGroups whose name contains every token, best match first."""
+    q = q.strip()
+    for token in q.split():
+        qs = qs.filter(name__icontains=token)
+    if not q:
+        return qs.order_by("name")
+    return qs.annotate(
+        name_prefix=_prefix_rank(q, ("name",)),
+        name_similarity=TrigramSimilarity("name", q),
+    ).order_by("name_prefix", "-name_similarity", "name")
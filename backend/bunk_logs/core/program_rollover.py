@@ -0,0 +1,382 @@
+"""Roll a program's group tree into another program (session changeover).
+
+Cloning bunks one at a time from the admin took a query per roster row and
+up to a thousand slug probes per collision. :func:`plan_rollover` reads the
+source tree, its rosters and the target program's slugs once and works out
+everything in memory; :func:`execute_rollover` then writes it with one
+``bulk_create`` per tree level plus one per row type:
+
+* every active group of the source program (or the sub-trees under
+  ``root_group_ids``), parents before children, slugs resolved against the
+  target's prefetched slug set;
+* their active roster rows (:func:`~bunk_logs.core.group_clone.copy_rosters`);
+* optionally the rostered people's program Memberships;
+* optionally the source's scheduled / active TemplateAssignments, moved by
+  the gap between the two programs' start dates and retargeted at the
+  cloned groups / memberships (individual targets keep only the members
+  who were rolled over).
+
+Re-running is safe: groups already cloned into the target (``metadata
+["cloned_from"]``) are reused rather than duplicated, and an assignment
+identical to one already in the target is skipped.
+
+:meth:`RolloverPlan.as_summary` is the dry-run diff the admin previews; a
+commit runs :func:`~bunk_logs.core.tasks.rollover_program_task` on the bulk
+queue and records progress in a ``RosterImportLog``.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+
+from django.db import transaction
+from django.utils.text import slugify
+
+from bunk_logs.core.group_clone import GroupCloneError
+from bunk_logs.core.group_clone import copy_program_memberships
+from bunk_logs.core.group_clone import copy_rosters
+from bunk_logs.core.group_clone import refresh_derived_rows
+from bunk_logs.core.group_clone import resolve_slug
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Program
+from bunk_logs.core.models import TemplateAssignment
+
+IMPORTER_TYPE = "program_rollover"
+
+_COPIED_STATUSES = (TemplateAssignment.Status.SCHEDULED, TemplateAssignment.Status.ACTIVE)
+_TargetType = TemplateAssignment.TargetType
+
+
+@dataclass
+class PlannedGroup:
+    source: AssignmentGroup
+    slug: str
+    depth: int
+    # Parent outside the rolled-over tree, matched in the target by slug.
+    external_parent_id: int | None = None
+
+
+@dataclass
+class RolloverPlan:
+    source_program: Program
+    target_program: Program
+    include_memberships: bool
+    include_assignments: bool
+    creates: list[PlannedGroup] = field(default_factory=list)
+    reused: dict[int, AssignmentGroup] = field(default_factory=dict)
+    source_group_ids: list[int] = field(default_factory=list)
+    roster_rows: int = 0
+    roster_person_ids: set[int] = field(default_factory=set)
+    memberships_to_create: int = 0
+    memberships_to_reactivate: int = 0
+    assignments: list[TemplateAssignment] = field(default_factory=list)
+    assignments_existing: int = 0
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def day_shift(self):
+        return self.target_program.start_date - self.source_program.start_date
+
+    def as_summary(self) -> dict:
+        """JSON-safe dry-run diff."""
+        return {
+            "source_program": self.source_program.pk,
+            "target_program": self.target_program.pk,
+            "groups_to_create": [
+                {
+                    "source_id": planned.source.pk,
+                    "name": planned.source.name,
+                    "group_type": planned.source.group_type,
+                    "slug": planned.slug,
+                }
+                for planned in self.creates
+            ],
+            "groups_reused": [
+                {"source_id": source_id, "target_id": group.pk, "slug": group.slug}
+                for source_id, group in self.reused.items()
+            ],
+            "roster_rows": self.roster_rows,
+            "memberships_to_create": self.memberships_to_create,
+            "memberships_to_reactivate": self.memberships_to_reactivate,
+            "assignments_to_copy": len(self.assignments),
+            "assignments_already_present": self.assignments_existing,
+            "warnings": list(self.warnings),
+        }
+
+
+@dataclass
+class RolloverResult:
+    groups_created: int = 0
+    groups_reused: int = 0
+    roster_rows_copied: int = 0
+    program_memberships_copied: int = 0
+    assignments_copied: int = 0
+
+    def as_summary(self) -> dict:
+        return asdict(self)
+
+
+def _subtree_ids(children: dict[int | None, list[int]], root_ids) -> set[int]:
+    out: set[int] = set()
+    stack = list(root_ids)
+    while stack:
+        group_id = stack.pop()
+        if group_id in out:
+            continue
+        out.add(group_id)
+        stack.extend(children.get(group_id, ()))
+    return out
+
+
+def _assignment_key(assignment: TemplateAssignment, start_date, group_id: int | None) -> tuple:
+    """Identity of an assignment for re-run detection.
+
+    Individual targets are compared without their payload, since the
+    membership ids differ between programs.
+    """
+    payload = {} if assignment.target_type == _TargetType.INDIVIDUALS else assignment.target_payload
+    return (
+        assignment.template_id,
+        assignment.target_type,
+        json.dumps(payload or {}, sort_keys=True),
+        group_id,
+        start_date,
+    )
+
+
+def plan_rollover(
+    *,
+    source_program: Program,
+    target_program: Program,
+    root_group_ids: list[int] | None = None,
+    include_memberships: bool = True,
+    include_assignments: bool = False,
+) -> RolloverPlan:
+    """Work out a rollover without writing anything."""
+    if source_program.organization_id != target_program.organization_id:
+        msg = "Target program must belong to the source program's organization."
+        raise GroupCloneError(msg, field_name="target_program")
+    if source_program.pk == target_program.pk:
+        msg = "Target program must differ from the source program."
+        raise GroupCloneError(msg, field_name="target_program")
+
+    plan = RolloverPlan(
+        source_program=source_program,
+        target_program=target_program,
+        include_memberships=include_memberships,
+        include_assignments=include_assignments,
+    )
+
+    groups = {
+        g.pk: g
+        for g in AssignmentGroup.all_objects.filter(program=source_program, is_active=True)
+    }
+    children: dict[int | None, list[int]] = {}
+    for g in groups.values():
+        children.setdefault(g.parent_id, []).append(g.pk)
+    if root_group_ids:
+        missing = set(root_group_ids) - set(groups)
+        if missing:
+            msg = "Root groups must be active groups of the source program."
+            raise GroupCloneError(msg, field_name="root_group_ids")
+        selected = _subtree_ids(children, root_group_ids)
+    else:
+        selected = set(groups)
+
+    target_groups = list(AssignmentGroup.all_objects.filter(program=target_program))
+    taken = {g.slug for g in target_groups}
+    cloned_from = {}
+    for g in target_groups:
+        origin = (g.metadata or {}).get("cloned_from") or {}
+        if g.is_active and origin.get("group_id") in selected:
+            cloned_from.setdefault(origin["group_id"], g)
+    active_target_by_slug = {g.slug: g for g in target_groups if g.is_active}
+
+    def depth(group_id: int) -> int:
+        n = 0
+        parent_id = groups[group_id].parent_id
+        while parent_id in selected and n < len(selected):
+            n += 1
+            parent_id = groups[parent_id].parent_id
+        return n
+
+    for group_id in sorted(selected, key=lambda pk: (depth(pk), groups[pk].name, pk)):
+        source = groups[group_id]
+        if group_id in cloned_from:
+            plan.reused[group_id] = cloned_from[group_id]
+            continue
+        planned = PlannedGroup(
+            source=source,
+            slug=resolve_slug(source.slug or slugify(source.name)[:100], taken),
+            depth=depth(group_id),
+        )
+        if source.parent_id and source.parent_id not in selected:
+            parent = groups.get(source.parent_id)
+            match = active_target_by_slug.get(parent.slug) if parent else None
+            if match is not None:
+                planned.external_parent_id = match.pk
+            else:
+                plan.warnings.append(
+                    f"Parent of '{source.name}' was not found in the target program; "
+                    "its clone has no parent.",
+                )
+        plan.creates.append(planned)
+    plan.source_group_ids = [p.source.pk for p in plan.creates] + list(plan.reused)
+
+    roster = AssignmentGroupMembership.all_objects.filter(
+        group_id__in=plan.source_group_ids, is_active=True,
+    ).values_list("person_id", flat=True)
+    roster_person_ids = list(roster)
+    plan.roster_rows = len(roster_person_ids)
+    plan.roster_person_ids = set(roster_person_ids)
+
+    if include_memberships and plan.roster_person_ids:
+        wanted = set(
+            Membership.all_objects.filter(
+                program=source_program, person_id__in=plan.roster_person_ids, is_active=True,
+            ).values_list("person_id", "role"),
+        )
+        present = {
+            (person_id, role): is_active
+            for person_id, role, is_active in Membership.all_objects.filter(
+                program=target_program, person_id__in=plan.roster_person_ids,
+            ).values_list("person_id", "role", "is_active")
+        }
+        plan.memberships_to_create = sum(1 for key in wanted if key not in present)
+        plan.memberships_to_reactivate = sum(1 for key in wanted if present.get(key) is False)
+
+    if include_assignments:
+        _plan_assignments(plan, selected)
+    return plan
+
+
+def _plan_assignments(plan: RolloverPlan, selected: set[int]) -> None:
+    shift = plan.day_shift
+    existing = {
+        _assignment_key(a, a.start_date, a.assignment_group_id)
+        for a in TemplateAssignment.all_objects.filter(program=plan.target_program).exclude(
+            status=TemplateAssignment.Status.CANCELLED,
+        )
+    }
+    reused_ids = {src: g.pk for src, g in plan.reused.items()}
+    for assignment in TemplateAssignment.all_objects.filter(
+        program=plan.source_program, status__in=_COPIED_STATUSES,
+    ):
+        group_id = None
+        if assignment.target_type == _TargetType.ASSIGNMENT_GROUP:
+            if assignment.assignment_group_id not in selected:
+                plan.warnings.append(
+                    f"Assignment {assignment.pk} targets a group outside the rollover; skipped.",
+                )
+                continue
+            group_id = reused_ids.get(assignment.assignment_group_id)
+            if group_id is None:
+                # Its group is created by this run; nothing to collide with.
+                plan.assignments.append(assignment)
+                continue
+        elif assignment.target_type == _TargetType.INDIVIDUALS and not plan.include_memberships:
+            plan.warnings.append(
+                f"Assignment {assignment.pk} targets individual memberships, which are "
+                "only copied with include_memberships; skipped.",
+            )
+            continue
+        if _assignment_key(assignment, assignment.start_date + shift, group_id) in existing:
+            plan.assignments_existing += 1
+            continue
+        plan.assignments.append(assignment)
+
+
+def _create_groups(plan: RolloverPlan) -> dict[int, AssignmentGroup]:
+    """``bulk_create`` the planned groups level by level; returns source id -> target."""
+    group_map: dict[int, AssignmentGroup] = dict(plan.reused)
+    by_depth: dict[int, list[PlannedGroup]] = {}
+    for planned in plan.creates:
+        by_depth.setdefault(planned.depth, []).append(planned)
+    for level in sorted(by_depth):
+        rows = []
+        for planned in by_depth[level]:
+            source = planned.source
+            parent = group_map.get(source.parent_id)
+            rows.append(
+                AssignmentGroup(
+                    organization_id=plan.target_program.organization_id,
+                    program=plan.target_program,
+                    name=source.name,
+                    slug=planned.slug,
+                    group_type=source.group_type,
+                    parent_id=parent.pk if parent else planned.external_parent_id,
+                    metadata={
+                        **(source.metadata or {}),
+                        "cloned_from": {"group_id": source.pk, "program_id": source.program_id},
+                    },
+                    is_active=True,
+                ),
+            )
+        AssignmentGroup.all_objects.bulk_create(rows)
+        for planned, row in zip(by_depth[level], rows, strict=True):
+            group_map[planned.source.pk] = row
+    return group_map
+
+
+def _copy_assignments(
+    plan: RolloverPlan,
+    group_map: dict[int, AssignmentGroup],
+    membership_map: dict[int, int],
+) -> int:
+    shift = plan.day_shift
+    rows = []
+    for assignment in plan.assignments:
+        payload = dict(assignment.target_payload or {})
+        group = None
+        if assignment.target_type == _TargetType.ASSIGNMENT_GROUP:
+            group = group_map[assignment.assignment_group_id]
+        elif assignment.target_type == _TargetType.INDIVIDUALS:
+            ids = payload.get("membership_ids") or []
+            payload["membership_ids"] = [
+                membership_map[int(i)] for i in ids
+                if str(i).isdigit() and int(i) in membership_map
+            ]
+        rows.append(
+            TemplateAssignment(
+                organization_id=plan.target_program.organization_id,
+                program=plan.target_program,
+                template_id=assignment.template_id,
+                target_type=assignment.target_type,
+                target_payload=payload,
+                assignment_group=group,
+                start_date=assignment.start_date + shift,
+                end_date=assignment.end_date + shift if assignment.end_date else None,
+                cadence_override=assignment.cadence_override,
+                is_required=assignment.is_required,
+                title=assignment.title,
+                status=TemplateAssignment.Status.SCHEDULED,
+            ),
+        )
+    TemplateAssignment.all_objects.bulk_create(rows)
+    return len(rows)
+
+
+def execute_rollover(plan: RolloverPlan) -> RolloverResult:
+    """Write ``plan`` in one transaction and refresh derived rows."""
+    result = RolloverResult(groups_reused=len(plan.reused))
+    with transaction.atomic():
+        group_map = _create_groups(plan)
+        result.groups_created = len(plan.creates)
+        result.roster_rows_copied = copy_rosters(group_map)
+        membership_map: dict[int, int] = {}
+        if plan.include_memberships:
+            membership_map = copy_program_memberships(
+                source_program_id=plan.source_program.pk,
+                target_program=plan.target_program,
+                person_ids=plan.roster_person_ids,
+            )
+            result.program_memberships_copied = len(membership_map)
+        if plan.include_assignments:
+            result.assignments_copied = _copy_assignments(plan, group_map, membership_map)
+        refresh_derived_rows(plan.target_program.pk)
+    return result
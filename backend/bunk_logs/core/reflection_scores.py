@@ -74,10 +74,9 @@ def find_field_by_dashboard_role(
     Camper Dashboard payload work across templates that use different
     field keys.
     """
-    for f in (template.schema or {}).get("fields") or []:
-        if isinstance(f, dict) and f.get("dashboard_role") == role:
-            return f
-    return None
+    from bunk_logs.core.template_view import template_view
+
+    return template_view(template).by_dashboard_role.get(role)
 
 
 def iter_scored_fields(
@@ -96,26 +95,9 @@ def iter_scored_fields(
     render columns in a stable, template-author-controlled sequence
     (Story 12 criterion 7 forbids reordering by the viewer).
     """
-    for field in (template.schema or {}).get("fields") or []:
-        if not isinstance(field, dict):
-            continue
-        ftype = field.get("type")
-        if ftype not in SCORED_FIELD_TYPES:
-            continue
-        fkey = field.get("key")
-        if not isinstance(fkey, str):
-            continue
-        sm = scale_max(field)
-        if ftype == "single_rating":
-            yield field, fkey, sm
-        else:
-            for cat in field.get("categories") or []:
-                if not isinstance(cat, dict):
-                    continue
-                ck = cat.get("key")
-                if not isinstance(ck, str):
-                    continue
-                yield field, f"{fkey}__{ck}", sm
+    from bunk_logs.core.template_view import template_view
+
+    yield from template_view(template).scored_fields
 
 
 def iter_grid_fields(
@@ -128,29 +110,9 @@ def iter_grid_fields(
     yield one column keyed by the field key with ``scale_max=None``.
     Section headers and instructions are skipped.
     """
-    for field in (template.schema or {}).get("fields") or []:
-        if not isinstance(field, dict):
-            continue
-        ftype = field.get("type")
-        if ftype in GRID_META_FIELD_TYPES:
-            continue
-        fkey = field.get("key")
-        if not isinstance(fkey, str):
-            continue
-        if ftype in SCORED_FIELD_TYPES:
-            sm = scale_max(field)
-            if ftype == "single_rating":
-                yield field, fkey, sm
-            else:
-                for cat in field.get("categories") or []:
-                    if not isinstance(cat, dict):
-                        continue
-                    ck = cat.get("key")
-                    if not isinstance(ck, str):
-                        continue
-                    yield field, f"{fkey}__{ck}", sm
-        else:
-            yield field, fkey, None
+    from bunk_logs.core.template_view import template_view
+
+    yield from template_view(template).grid_fields
 
 
 def resolve_grid_cells(field: dict, answers: dict) -> dict[str, float | str | None]:
@@ -24,6 +24,7 @@ from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import CohortShare
 from bunk_logs.core.models import EntryThread
 from bunk_logs.core.models import ThreadRead
+from bunk_logs.core.template_view import template_view
 
 if TYPE_CHECKING:
     from bunk_logs.core.models import Person
@@ -47,9 +48,7 @@ def excerpt(text: str, limit: int = EXCERPT_LEN) -> str:
 
 
 def schema_fields(template) -> list[dict]:
-    schema = getattr(template, "schema", None) or {}
-    fields = schema.get("fields")
-    return [f for f in fields if isinstance(f, dict)] if isinstance(fields, list) else []
+    return list(template_view(template).fields)
 
 
 def field_prompt(field: dict, language: str = "en") -> str:
@@ -62,7 +61,7 @@ def field_prompt(field: dict, language: str = "en") -> str:
 
 def trend_fields(template) -> list[dict]:
     """``rating_group`` fields on a template, in schema order."""
-    return [f for f in schema_fields(template) if f.get("type") == "rating_group"]
+    return list(template_view(template).trend_fields)
 
 
 def trend_key_for(field: dict) -> str:
@@ -74,7 +73,7 @@ def trend_key_for(field: dict) -> str:
 
 
 def threaded_fields(template) -> list[dict]:
-    return [f for f in schema_fields(template) if f.get("thread_enabled") is True]
+    return list(template_view(template).threaded_fields)
 
 
 def _answer_entries(field: dict, value: Any) -> list[tuple[int | None, str]]:
@@ -131,9 +130,7 @@ def shareable_entries(reflection: Reflection) -> list[dict]:
     """Entries flagged ``share_with_cohort`` with a non-empty answer."""
     answers = reflection.answers or {}
     entries: list[dict] = []
-    for field in schema_fields(reflection.template):
-        if field.get("share_with_cohort") is not True:
-            continue
+    for field in template_view(reflection.template).shared_fields:
         key = field.get("key")
         if not key:
             continue
@@ -49,6 +49,9 @@ class InlineImage:
 
     def __init__(self, match: re.Match):
         self._match = match
+        # Offset within the scanned string: identifies the image across two
+        # passes over the same text (upload first, rewrite later).
+        self.start = match.start()
         self.mime = match.group("mime").lower()
         self._raw_data = match.group("data")
 
@@ -0,0 +1,166 @@
+"""Program-level roster snapshot: who is in which group, by id.
+
+Dashboards ask the same roster questions many times per request -- the
+campers on a bunk, its counselors, the bunks a viewer authors on -- and
+each used to be its own ``AssignmentGroupMembership`` query. The answers
+change only when a roster row or group is written, so
+:func:`roster_snapshot` builds them for a whole program in two queries and
+caches the result::
+
+    snapshot = roster_snapshot(bunk.program_id)
+    snapshot.subject_ids(bunk.id)        # [camper person ids, name order]
+    snapshot.author_ids(bunk.id)         # [counselor person ids, name order]
+    snapshot.author_group_ids(person.id, group_type="bunk")
+
+The snapshot holds ids only; callers load the Person / AssignmentGroup rows
+they render. It is stored in the Django cache under a per-program version
+token and kept in process memory alongside that token, so a repeat lookup
+costs one small cache read. Either copy is used only while the token
+matches and for ``ROSTER_SNAPSHOT_CACHE_SECONDS`` after the snapshot was
+built. The receivers in :mod:`bunk_logs.core.signals`
+call :func:`invalidate_roster_snapshot` on every ``AssignmentGroup`` /
+``AssignmentGroupMembership`` save or delete; bulk ``.update()`` paths call
+it themselves. Person renames re-sort the name order at the next roster
+write or after ``ROSTER_SNAPSHOT_CACHE_SECONDS``.
+
+Rows are read through ``all_objects``: the snapshot is keyed by program, so
+callers must already hold a group / program from a tenant-scoped query.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
+
+VERSION_KEY = "roster_snapshot:version:{program_id}"
+SNAPSHOT_KEY = "roster_snapshot:{program_id}:{version}"
+
+# program_id -> (version token, snapshot) for this process.
+_local: dict[int, tuple[str, RosterSnapshot]] = {}
+
+
+@dataclass(frozen=True)
+class RosterSnapshot:
+    """Id-only roster of one program.
+
+    ``groups`` maps every group id to ``(group_type, parent_id, is_active)``;
+    ``subjects`` / ``authors`` map group ids to the person ids of their
+    active rows of that role, ordered by last name, first name, id.
+    """
+
+    program_id: int
+    groups: dict[int, tuple[str, int | None, bool]]
+    subjects: dict[int, tuple[int, ...]]
+    authors: dict[int, tuple[int, ...]]
+    groups_by_author: dict[int, tuple[int, ...]]
+    built_at: float = 0.0
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.built_at + settings.ROSTER_SNAPSHOT_CACHE_SECONDS
+
+    def subject_ids(self, group_id: int) -> list[int]:
+        return list(self.subjects.get(group_id, ()))
+
+    def author_ids(self, group_id: int) -> list[int]:
+        return list(self.authors.get(group_id, ()))
+
+    def parent_id(self, group_id: int) -> int | None:
+        info = self.groups.get(group_id)
+        return info[1] if info else None
+
+    def author_group_ids(
+        self, person_id: int, *, group_type: str | None = None, active_only: bool = True,
+    ) -> list[int]:
+        """Groups ``person_id`` authors on, optionally of one ``group_type``."""
+        out = []
+        for group_id in self.groups_by_author.get(person_id, ()):
+            kind, _, is_active = self.groups[group_id]
+            if active_only and not is_active:
+                continue
+            if group_type is not None and kind != group_type:
+                continue
+            out.append(group_id)
+        return out
+
+
+def build_roster_snapshot(program_id: int) -> RosterSnapshot:
+    """Load a program's roster from the database (two queries)."""
+    groups = {
+        group_id: (group_type, parent_id, is_active)
+        for group_id, group_type, parent_id, is_active in AssignmentGroup.all_objects.filter(
+            program_id=program_id,
+        ).values_list("id", "group_type", "parent_id", "is_active")
+    }
+    subjects: dict[int, list[int]] = {}
+    authors: dict[int, list[int]] = {}
+    groups_by_author: dict[int, list[int]] = {}
+    rows = (
+        AssignmentGroupMembership.all_objects.filter(
+            group__program_id=program_id, is_active=True,
+        )
+        .order_by("person__last_name", "person__first_name", "person_id")
+        .values_list("group_id", "person_id", "role_in_group")
+    )
+    for group_id, person_id, role_in_group in rows:
+        if role_in_group == "subject":
+            subjects.setdefault(group_id, []).append(person_id)
+        elif role_in_group == "author":
+            authors.setdefault(group_id, []).append(person_id)
+            groups_by_author.setdefault(person_id, []).append(group_id)
+    return RosterSnapshot(
+        program_id=program_id,
+        groups=groups,
+        subjects={k: tuple(v) for k, v in subjects.items()},
+        authors={k: tuple(v) for k, v in authors.items()},
+        groups_by_author={k: tuple(v) for k, v in groups_by_author.items()},
+        built_at=time.time(),
+    )
+
+
+def _version(program_id: int) -> str:
+    key = VERSION_KEY.format(program_id=program_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def roster_snapshot(program_id: int) -> RosterSnapshot:
+    """The current roster snapshot of ``program_id``."""
+    version = _version(program_id)
+    local = _local.get(program_id)
+    if local is not None and local[0] == version and local[1].is_fresh():
+        return local[1]
+    key = SNAPSHOT_KEY.format(program_id=program_id, version=version)
+    snapshot = cache.get(key)
+    if snapshot is None or not snapshot.is_fresh():
+        snapshot = build_roster_snapshot(program_id)
+        cache.set(key, snapshot, settings.ROSTER_SNAPSHOT_CACHE_SECONDS)
+    _local[program_id] = (version, snapshot)
+    return snapshot
+
+
+def _bump(program_id: int) -> None:
+    cache.set(VERSION_KEY.format(program_id=program_id), uuid4().hex, None)
+
+
+def invalidate_roster_snapshot(program_id: int | None) -> None:
+    """Retire ``program_id``'s snapshot now and again once the write commits.
+
+    The immediate bump lets the writing request read its own changes; the
+    post-commit bump drops any snapshot another process rebuilt from
+    pre-commit rows in between.
+    """
+    if program_id is None:
+        return
+    _bump(program_id)
+    transaction.on_commit(lambda: _bump(program_id))
@@ -0,0 +1,156 @@
+"""Stored full-text search vectors for admin global search (Step 7_17).
+
+Reflection, Order, MaintenanceTicket and ReflectionTemplate each carry a
+GIN-indexed ``search_vector`` column so
+:mod:`bunk_logs.api.admin_flow.search` matches with ``search_vector @@
+query`` instead of re-tokenising every row's text on each request.
+
+Every vector is the concatenation of
+
+* the text under a language-appropriate config (``english`` / ``spanish``
+  by the content's language; ``simple`` where Postgres has no stemmer,
+  e.g. Hebrew), so stemmed matches work, and
+* the same text under ``simple``, so exact words still match whatever the
+  content language and the query's config.
+
+Reflections index every string leaf of ``answers`` plus the English
+``TranslationRecord.translated_text`` (weight B), so an English query finds a
+Spanish reflection once its translation lands.
+
+Vectors are computed in SQL (one ``UPDATE`` per row on save, set-based
+batches for the backfill), so the Python side never materialises the text.
+``bunk_logs.core.signals`` refreshes them after each save that touches a
+searchable field; ``.update()`` / ``bulk_create`` paths rely on
+``manage.py backfill_search_vectors``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchVector
+from django.db.models.expressions import RawSQL
+
+from bunk_logs.core.models import MaintenanceTicket
+from bunk_logs.core.models import Order
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import ReflectionTemplate
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Postgres text-search configs per content language. Anything unlisted
+# (Hebrew today) falls back to ``simple``: lowercase, no stemming.
+LANGUAGE_CONFIGS = {"en": "english", "es": "spanish"}
+
+# Fields whose change requires recomputing the vector; saves with
+# ``update_fields`` outside this set skip the refresh.
+SEARCHABLE_FIELDS: dict[type[Model], frozenset[str]] = {
+    Reflection: frozenset({"answers", "language"}),
+    Order: frozenset({"item", "item_note", "description"}),
+    MaintenanceTicket: frozenset({"title", "location", "description"}),
+    ReflectionTemplate: frozenset({"name", "description"}),
+}
+
+
+def _columns_vector(primary: str, *secondary: str):
+    """Weighted english vector over text columns, plus an unstemmed copy."""
+    fields = (primary, *secondary)
+    vector = SearchVector(primary, config="english", weight="A")
+    if secondary:
+        vector += SearchVector(*secondary, config="english", weight="B")
+    return vector + SearchVector(*fields, config="simple", weight="D")
+
+
+# Every string leaf of ``answers`` (free-text fields, but also list items
+# and nested values), space-joined.
+_REFLECTION_ANSWERS_SQL = """
+(SELECT string_agg(leaf #>> '{}', ' ')
+   FROM jsonb_path_query("core_reflection"."answers",
+                         'strict $.** ? (@.type() == "string")') AS leaf)
+"""
+
+# Latest completed English translation of the reflection, if any.
+_REFLECTION_TRANSLATION_SQL = """
+(SELECT tr.translated_text
+   FROM core_translationrecord tr
+  WHERE tr.content_type = 'reflection'
+    AND tr.content_id = "core_reflection"."id"::text
+    AND tr.status = 'completed'
+    AND tr.target_language = 'en'
+  ORDER BY tr.created_at DESC
+  LIMIT 1)
+"""
+
+
+def _reflection_vector() -> RawSQL:
+    language_config = " ".join(
+        f"WHEN '{code}' THEN '{config}'::regconfig" for code, config in LANGUAGE_CONFIGS.items()
+    )
+    answers = f"coalesce({_REFLECTION_ANSWERS_SQL}, '')"
+    translation = f"coalesce({_REFLECTION_TRANSLATION_SQL}, '')"
+    sql = (
+        "setweight(to_tsvector("
+        f"""CASE "core_reflection"."language" {language_config} ELSE 'simple'::regconfig END, """
+        f"{answers}), 'A') "
+        f"|| setweight(to_tsvector('simple', {answers}), 'A') "
+        f"|| setweight(to_tsvector('english', {translation}), 'B')"
+    )
+    return RawSQL(sql, [])  # noqa: S611 -- static SQL, no user input
+
+
+def vector_expression(model: type[Model]):
+    """SQL expression computing ``model``'s ``search_vector`` from its own row."""
+    if model is Reflection:
+        return _reflection_vector()
+    if model is Order:
+        return _columns_vector("item", "item_note", "description")
+    if model is MaintenanceTicket:
+        return _columns_vector("title", "location", "description")
+    if model is ReflectionTemplate:
+        return _columns_vector("name", "description")
+    msg = f"{model.__name__} has no search vector."
+    raise ValueError(msg)
+
+
+def search_query(raw: str) -> SearchQuery:
+    """Match against both the stemmed (english) and unstemmed lexemes."""
+    return SearchQuery(raw, config="english") | SearchQuery(raw, config="simple")
+
+
+def refresh_search_vector(instance: Model) -> None:
+    """Recompute one row's vector (one ``UPDATE``; no signals fire)."""
+    model = type(instance)
+    model._base_manager.filter(pk=instance.pk).update(
+        search_vector=vector_expression(model),
+    )
+
+
+def backfill_search_vectors(
+    model: type[Model], *, only_missing: bool = False, batch_size: int = BACKFILL_BATCH_SIZE,
+) -> int:
+    """Recompute vectors for every row of ``model`` in primary-key batches.
+
+    Each batch is a single set-based ``UPDATE`` in its own transaction, so
+    locks are short and an interrupted run can be resumed with
+    ``only_missing``. Returns the number of rows updated.
+    """
+    manager = model._base_manager
+    base = manager.all()
+    if only_missing:
+        base = base.filter(search_vector__isnull=True)
+    expression = vector_expression(model)
+    updated = 0
+    last_pk = None
+    while True:
+        page = base.order_by("pk")
+        if last_pk is not None:
+            page = page.filter(pk__gt=last_pk)
+        pks = list(page.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return updated
+        updated += manager.filter(pk__in=pks).update(search_vector=expression)
+        last_pk = pks[-1]
@@ -0,0 +1,191 @@
+"""Signal receivers for the ``core`` app.
+
+Keeps write-time derived data in step with ordinary ``save()`` calls:
+
+* the stored full-text ``search_vector`` columns (see
+  :mod:`bunk_logs.core.search_vectors`);
+* the Concerns Inbox :class:`~bunk_logs.core.models.ConcernItem` rows (see
+  :mod:`bunk_logs.core.concerns`);
+* :class:`~bunk_logs.core.models.SyncTombstone` rows for deleted change-feed
+  models (see :mod:`bunk_logs.core.change_feed`);
+* dashboard invalidation events on the live push channel (see
+  :mod:`bunk_logs.core.live_events`);
+* the materialized :class:`~bunk_logs.core.models.AssignmentAudience` rows
+  and assignment counters (see :mod:`bunk_logs.core.assignment_audience`);
+* the cached program roster snapshots (see
+  :mod:`bunk_logs.core.roster_snapshot`).
+
+Bulk ``.update()`` / ``bulk_create`` bypass these receivers; run
+``manage.py backfill_search_vectors`` / ``backfill_concern_items`` after
+such backfills.
+
+Wiring lives in :mod:`bunk_logs.core.apps`. Don't import this module from
+anywhere else.
+"""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from bunk_logs.core import assignment_audience
+from bunk_logs.core.change_feed import SYNCED_MODELS
+from bunk_logs.core.change_feed import record_tombstone
+from bunk_logs.core.concerns import CONCERN_SOURCE_FIELDS
+from bunk_logs.core.concerns import sync_concern_items
+from bunk_logs.core.live_events import EVENT_KINDS
+from bunk_logs.core.live_events import publish_on_save
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import ReflectionTemplate
+from bunk_logs.core.models import TemplateAssignment
+from bunk_logs.core.models import TranslationRecord
+from bunk_logs.core.roster_snapshot import invalidate_roster_snapshot
+from bunk_logs.core.search_vectors import SEARCHABLE_FIELDS
+from bunk_logs.core.search_vectors import refresh_search_vector
+from bunk_logs.core.template_view import evict_template_view
+
+
+def _refresh_on_save(sender, instance, created, update_fields, raw=False, **kwargs):
+    if raw:
+        return  # fixture loading; the backfill command covers it
+    if update_fields is not None and not (set(update_fields) & SEARCHABLE_FIELDS[sender]):
+        return
+    refresh_search_vector(instance)
+
+
+for _model in SEARCHABLE_FIELDS:
+    post_save.connect(
+        _refresh_on_save,
+        sender=_model,
+        dispatch_uid=f"core.search_vector.{_model._meta.label_lower}",
+    )
+
+
+@receiver(post_save, sender=TranslationRecord, dispatch_uid="core.search_vector.translation")
+def refresh_reflection_on_translation(sender, instance, raw=False, **kwargs):
+    """A completed English translation becomes searchable on its reflection."""
+    if raw or instance.content_type != "reflection":
+        return
+    if instance.status != TranslationRecord.Status.COMPLETED:
+        return
+    refresh_search_vector(Reflection(pk=int(instance.content_id)))
+
+
+@receiver(post_save, sender=Reflection, dispatch_uid="core.concern_items.reflection")
+def sync_concerns_on_save(sender, instance, update_fields, raw=False, **kwargs):
+    """Re-extract the reflection's concern items after answers/shape changes."""
+    if raw:
+        return  # fixture loading; the backfill command covers it
+    if update_fields is not None and not (set(update_fields) & CONCERN_SOURCE_FIELDS):
+        return
+    sync_concern_items(instance)
+
+
+for _label, _model in SYNCED_MODELS.items():
+    post_delete.connect(
+        record_tombstone,
+        sender=_model,
+        dispatch_uid=f"core.sync_tombstone.{_label}",
+    )
+
+
+for _model, _kind in EVENT_KINDS.items():
+    post_save.connect(
+        publish_on_save,
+        sender=_model,
+        dispatch_uid=f"core.live_event.{_kind}",
+    )
+
+
+# Template fields that decide who an assignment_group assignment reaches.
+_AUDIENCE_TEMPLATE_FIELDS = frozenset({"author_role_filter", "role", "subject_mode"})
+
+
+@receiver(post_save, sender=TemplateAssignment, dispatch_uid="core.assignment_audience.assignment")
+def rebuild_audience_on_assignment_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return  # fixture loading; the backfill command covers it
+    assignment_audience.rebuild_assignment(instance)
+
+
+@receiver(post_save, sender=ReflectionTemplate, dispatch_uid="core.assignment_audience.template")
+def rebuild_audience_on_template_save(sender, instance, created, update_fields, raw=False, **kwargs):
+    if raw or created:
+        return
+    if update_fields is not None and not (set(update_fields) & _AUDIENCE_TEMPLATE_FIELDS):
+        return
+    for assignment in TemplateAssignment.all_objects.filter(
+        template=instance,
+        target_type=TemplateAssignment.TargetType.ASSIGNMENT_GROUP,
+    ).select_related("template"):
+        assignment_audience.rebuild_assignment(assignment)
+
+
+@receiver(post_save, sender=ReflectionTemplate, dispatch_uid="core.template_view.template")
+@receiver(post_delete, sender=ReflectionTemplate, dispatch_uid="core.template_view.template_delete")
+def evict_template_view_on_write(sender, instance, **kwargs):
+    # Drafts are edited in place without a version bump.
+    evict_template_view(instance.pk)
+
+
+@receiver(post_save, sender=Membership, dispatch_uid="core.assignment_audience.membership")
+def sync_audience_on_membership_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    assignment_audience.sync_membership(instance)
+
+
+@receiver(pre_delete, sender=Membership, dispatch_uid="core.assignment_audience.membership_delete")
+def forget_audience_on_membership_delete(sender, instance, **kwargs):
+    assignment_audience.forget_membership(instance)
+
+
+@receiver(post_save, sender=AssignmentGroupMembership, dispatch_uid="core.assignment_audience.roster")
+def sync_audience_on_roster_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    assignment_audience.sync_person(instance.person_id)
+
+
+@receiver(post_delete, sender=AssignmentGroupMembership, dispatch_uid="core.assignment_audience.roster_delete")
+def sync_audience_on_roster_delete(sender, instance, **kwargs):
+    assignment_audience.sync_person(instance.person_id, allow_additions=False)
+
+
+@receiver(post_save, sender=Reflection, dispatch_uid="core.assignment_audience.reflection")
+def count_submission_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw or not created:
+        return
+    assignment_audience.bump_submitted_counts(instance, 1)
+
+
+@receiver(post_delete, sender=Reflection, dispatch_uid="core.assignment_audience.reflection_delete")
+def count_submission_on_delete(sender, instance, **kwargs):
+    assignment_audience.bump_submitted_counts(instance, -1)
+
+
+@receiver(post_save, sender=AssignmentGroup, dispatch_uid="core.roster_snapshot.group")
+@receiver(post_delete, sender=AssignmentGroup, dispatch_uid="core.roster_snapshot.group_delete")
+def invalidate_roster_on_group_write(sender, instance, **kwargs):
+    invalidate_roster_snapshot(instance.program_id)
+
+
+@receiver(post_save, sender=AssignmentGroupMembership, dispatch_uid="core.roster_snapshot.roster")
+@receiver(post_delete, sender=AssignmentGroupMembership, dispatch_uid="core.roster_snapshot.roster_delete")
+def invalidate_roster_on_roster_write(sender, instance, **kwargs):
+    if AssignmentGroupMembership.group.is_cached(instance):
+        program_id = instance.group.program_id
+    else:
+        # Mid-cascade the group may already be gone; its own receiver
+        # covers that case.
+        program_id = (
+            AssignmentGroup.all_objects.filter(pk=instance.group_id)
+            .values_list("program_id", flat=True)
+            .first()
+        )
+    invalidate_roster_snapshot(program_id)
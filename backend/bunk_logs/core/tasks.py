@@ -1,4 +1,4 @@
-"""Celery tasks for reflection reminder emails and roster imports."""
+"""Celery tasks for reflection reminder emails, roster imports, program rollovers and audit-trail upkeep."""
 
 from __future__ import annotations
 
@@ -385,3 +385,135 @@ def import_roster_task(
             Path(tmp_path).unlink()
         except OSError:
             pass
+
+
+@shared_task(name="bunk_logs.core.tasks.rollover_program_task")
+def rollover_program_task(log_id: int, options: dict[str, Any]) -> dict[str, Any]:
+    """Run a program rollover and record it in its RosterImportLog.
+
+    The plan is rebuilt here rather than trusted from the preview, so a
+    rollover queued twice or after other edits still writes only what is
+    missing.
+
+    Args:
+        log_id: PK of the RosterImportLog (``importer_type="program_rollover"``).
+        options: ``source_program_id`` plus :func:`plan_rollover` keyword
+            arguments (``root_group_ids``, ``include_memberships``,
+            ``include_assignments``).
+    """
+    from bunk_logs.core.program_rollover import execute_rollover
+    from bunk_logs.core.program_rollover import plan_rollover
+
+    try:
+        log = RosterImportLog.all_objects.select_related("program").get(pk=log_id)
+    except RosterImportLog.DoesNotExist:
+        logger.exception("rollover_program_task: RosterImportLog %s not found", log_id)
+        return {"error": f"RosterImportLog {log_id} not found"}
+
+    log.status = "running"
+    log.save(update_fields=["status"])
+
+    try:
+        plan = plan_rollover(
+            source_program=Program.all_objects.get(pk=options["source_program_id"]),
+            target_program=log.program,
+            root_group_ids=options.get("root_group_ids") or None,
+            include_memberships=options.get("include_memberships", True),
+            include_assignments=options.get("include_assignments", False),
+        )
+        result = execute_rollover(plan)
+    except Exception as exc:
+        logger.exception("rollover_program_task failed for log %s", log_id)
+        log.status = "failed"
+        log.summary = {**log.summary, "error": str(exc)}
+        log.completed_at = timezone.now()
+        log.save(update_fields=["status", "summary", "completed_at"])
+        # Not retried: a partial plan is rolled back; rerun by hand.
+        raise
+
+    log.status = "completed"
+    log.summary = {**log.summary, "plan": plan.as_summary(), "result": result.as_summary()}
+    log.completed_at = timezone.now()
+    log.save(update_fields=["status", "summary", "completed_at"])
+    return {"log_id": log_id, "status": log.status, "summary": log.summary}
+
+
+@shared_task(
+    bind=True,
+    name="bunk_logs.core.tasks.flush_audit_events",
+    max_retries=5,
+    default_retry_delay=30,
+)
+def flush_audit_events(self, payload: list[dict[str, Any]]) -> dict[str, int]:
+    """Write a batch of audit events buffered by :func:`bunk_logs.core.audit.buffered`.
+
+    Only enqueued from ``transaction.on_commit``, so the business write is
+    already durable. Retries on DB errors; the insert ignores UUID conflicts
+    so a retry after a partial success cannot duplicate rows.
+    """
+    from bunk_logs.core import audit as audit_module
+
+    try:
+        written = audit_module.flush_events(audit_module.deserialize_events(payload))
+    except Exception as exc:
+        logger.exception("flush_audit_events: failed to write %d events", len(payload))
+        raise self.retry(exc=exc)
+    return {"written": written}
+
+
+@shared_task(name="bunk_logs.core.tasks.maintain_audit_partitions")
+def maintain_audit_partitions() -> dict[str, list[str]]:
+    """Pre-create upcoming monthly ``AuditEvent`` partitions (nightly beat).
+
+    Also drains rows that fell into the default partition. Archival of
+    closed months stays a deliberate ops step (``archive_audit_partitions``).
+    """
+    from bunk_logs.core.audit_partitions import ensure_partitions
+
+    return {"created": ensure_partitions()}
+
+
+@shared_task(
+    bind=True,
+    name="bunk_logs.core.tasks.process_inbound_emails",
+    max_retries=3,
+    default_retry_delay=30,
+)
+def process_inbound_emails(self, ids: list[int] | None = None) -> dict[str, int]:
+    """Create ticket notes from stored Mailgun payloads (``MAILGUN_INBOUND_ASYNC``).
+
+    Enqueued by the webhook on commit with the new row's id; ``ids=None``
+    drains every pending row. Per-payload errors are recorded on the row,
+    so only a failure to claim or save a batch is retried.
+    """
+    from bunk_logs.api.webhooks.mailgun_inbound import process_stored_inbound
+
+    try:
+        return process_stored_inbound(ids)
+    except Exception as exc:
+        logger.exception("process_inbound_emails: batch failed")
+        raise self.retry(exc=exc)
+
+
+@shared_task(name="bunk_logs.core.tasks.dispatch_dashboard_warmup")
+def dispatch_dashboard_warmup(force: bool = False) -> dict:
+    """Minutely beat: queue dashboard warm-up chunks for orgs in a warm-up window."""
+    from bunk_logs.api.dashboards.warmup import dispatch_warmup
+
+    return dispatch_warmup(force=force)
+
+
+@shared_task(name="bunk_logs.core.tasks.warm_dashboards")
+def warm_dashboards(organization_id: str, role: str, viewers: list[list[int]]) -> dict:
+    """Build and cache one chunk of role home dashboards (see ``api.dashboards.warmup``)."""
+    from bunk_logs.api.dashboards.warmup import warm_chunk
+
+    return warm_chunk(organization_id, role, viewers)
+
+
+@shared_task(name="bunk_logs.core.tasks.prune_sync_tombstones")
+def prune_sync_tombstones() -> dict:
+    """Nightly beat: drop change-feed tombstones past their retention window."""
+    from bunk_logs.core.change_feed import prune_tombstones
+
+    return prune_tombstones()
@@ -0,0 +1,213 @@
+"""Compiled, per-process memoized views of ``ReflectionTemplate.schema``.
+
+Score grids, trend graphs, the concerns extractor, thread materialization
+and the localized schema payload all walk ``schema['fields']``, and
+several dashboards do it once per reflection inside their row loops.
+:func:`template_view` walks a schema once and returns a
+:class:`TemplateView` holding every projection those helpers need:
+
+* ``fields`` -- the dict fields, in schema order;
+* ``scored_fields`` / ``grid_fields`` -- the ``(field, label, scale_max)``
+  column triples behind :func:`~bunk_logs.core.reflection_scores.iter_scored_fields`
+  and :func:`~bunk_logs.core.reflection_scores.iter_grid_fields`;
+* ``by_dashboard_role`` -- first field per ``dashboard_role``;
+* ``concern_fields`` -- fields :func:`~bunk_logs.core.concerns.extract_concerns`
+  can pull an item from;
+* ``trend_fields`` / ``threaded_fields`` / ``shared_fields`` -- thread and
+  cohort-share flags;
+* :meth:`TemplateView.localized_schema` -- the single-language schema the
+  reflection form payload ships, built once per language.
+
+Views are cached per process on ``(template id, version)``. Draft
+templates are edited in place without a version bump, so saving a template
+evicts its entries in the saving process (see ``core.signals``) and every
+entry expires after ``CACHE_TTL_SECONDS``, which bounds how long another
+worker can serve a pre-edit view. Unsaved templates are compiled without
+caching. Treat the returned field dicts as read-only -- they are shared by
+every caller; :meth:`TemplateView.localized_schema` hands out a copy since
+its result goes straight into API payloads.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from bunk_logs.core.reflection_scores import GRID_META_FIELD_TYPES
+from bunk_logs.core.reflection_scores import SCORED_FIELD_TYPES
+from bunk_logs.core.reflection_scores import scale_max
+from bunk_logs.utils.instrumentation import hot_path
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+CACHE_MAX_ENTRIES = 512
+CACHE_TTL_SECONDS = 300
+_INSTANCE_ATTR = "_compiled_template_view"
+
+_cache: dict[tuple, tuple[TemplateView, float]] = {}
+_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class TemplateView:
+    """Everything the dashboard helpers read from one template schema."""
+
+    fields: tuple[dict, ...]
+    scored_fields: tuple[tuple[dict, str, int], ...]
+    grid_fields: tuple[tuple[dict, str, int | None], ...]
+    by_dashboard_role: Mapping[str, dict]
+    concern_fields: tuple[dict, ...]
+    trend_fields: tuple[dict, ...]
+    threaded_fields: tuple[dict, ...]
+    shared_fields: tuple[dict, ...]
+    _localized: dict[str, dict] = dataclass_field(default_factory=dict, compare=False, repr=False)
+
+    @hot_path("schema.localize")
+    def localized_schema(self, lang: str) -> dict:
+        """A fresh copy of the schema trimmed to ``lang`` (see :func:`localize_schema`).
+
+        The trimmed schema is built once per language; callers get their own
+        copy so a payload tweak cannot leak into the next response.
+        """
+        cached = self._localized.get(lang)
+        if cached is None:
+            cached = self._localized[lang] = localize_schema({"fields": list(self.fields)}, lang)
+        return copy.deepcopy(cached)
+
+
+def _rating_cells(field: dict, fkey: str, sm: int) -> list[tuple[dict, str, int]]:
+    if field.get("type") == "single_rating":
+        return [(field, fkey, sm)]
+    cells = []
+    for cat in field.get("categories") or []:
+        if not isinstance(cat, dict):
+            continue
+        ck = cat.get("key")
+        if isinstance(ck, str):
+            cells.append((field, f"{fkey}__{ck}", sm))
+    return cells
+
+
+def _is_concern_field(field: dict) -> bool:
+    ftype = field.get("type")
+    role = field.get("dashboard_role")
+    return (
+        (role == "open_concern" and ftype in ("text", "textarea"))
+        or (role == "primary_rating" and ftype == "single_rating")
+        or ftype == "rating_group"
+    )
+
+
+def compile_template_view(schema: dict | None) -> TemplateView:
+    """Walk ``schema`` once and build its :class:`TemplateView` (uncached)."""
+    raw = (schema or {}).get("fields") if isinstance(schema, dict) else None
+    fields = tuple(f for f in raw if isinstance(f, dict)) if isinstance(raw, list) else ()
+
+    scored: list[tuple[dict, str, int]] = []
+    grid: list[tuple[dict, str, int | None]] = []
+    by_role: dict[str, dict] = {}
+    for f in fields:
+        role = f.get("dashboard_role")
+        if role is not None and role not in by_role:
+            by_role[role] = f
+        ftype = f.get("type")
+        fkey = f.get("key")
+        if not isinstance(fkey, str):
+            continue
+        if ftype in SCORED_FIELD_TYPES:
+            cells = _rating_cells(f, fkey, scale_max(f))
+            scored.extend(cells)
+            grid.extend(cells)
+        elif ftype not in GRID_META_FIELD_TYPES:
+            grid.append((f, fkey, None))
+
+    return TemplateView(
+        fields=fields,
+        scored_fields=tuple(scored),
+        grid_fields=tuple(grid),
+        by_dashboard_role=MappingProxyType(by_role),
+        concern_fields=tuple(f for f in fields if _is_concern_field(f)),
+        trend_fields=tuple(f for f in fields if f.get("type") == "rating_group"),
+        threaded_fields=tuple(f for f in fields if f.get("thread_enabled") is True),
+        shared_fields=tuple(f for f in fields if f.get("share_with_cohort") is True),
+    )
+
+
+def template_view(template) -> TemplateView:
+    """The memoized :class:`TemplateView` for ``template`` (a ``ReflectionTemplate``)."""
+    schema = getattr(template, "schema", None)
+    memo = getattr(template, "__dict__", {}).get(_INSTANCE_ATTR)
+    if memo is not None and memo[0] is schema:
+        return memo[1]
+
+    pk = getattr(template, "pk", None)
+    if pk is None:
+        view = compile_template_view(schema)
+    else:
+        key = (pk, getattr(template, "version", None))
+        now = time.monotonic()
+        entry = _cache.get(key)
+        if entry is not None and entry[1] > now:
+            view = entry[0]
+        else:
+            view = compile_template_view(schema)
+            with _cache_lock:
+                if len(_cache) >= CACHE_MAX_ENTRIES:
+                    _cache.clear()
+                _cache[key] = (view, now + CACHE_TTL_SECONDS)
+    if hasattr(template, "__dict__"):
+        template.__dict__[_INSTANCE_ATTR] = (schema, view)
+    return view
+
+
+def clear_template_view_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def evict_template_view(template_id: int) -> None:
+    """Drop every cached version of ``template_id`` in this process."""
+    with _cache_lock:
+        for key in [k for k in _cache if k[0] == template_id]:
+            del _cache[key]
+
+
+def localize_schema(schema: dict, lang: str) -> dict:
+    """Copy of ``schema`` keeping only ``lang`` in prompts / labels where present."""
+    out: dict = {"fields": []}
+    for field in schema.get("fields") or []:
+        if not isinstance(field, dict):
+            continue
+        f = dict(field)
+        ftype = f.get("type")
+        if ftype == "rating_group":
+            sl = f.get("scale_labels") or {}
+            if lang in sl:
+                f["scale_labels"] = {lang: sl[lang]}
+            cats = []
+            for c in f.get("categories") or []:
+                if not isinstance(c, dict):
+                    cats.append(c)
+                    continue
+                nc = dict(c)
+                lbls = c.get("labels") or {}
+                if lang in lbls:
+                    nc["labels"] = {lang: lbls[lang]}
+                cats.append(nc)
+            f["categories"] = cats
+        elif ftype == "single_rating":
+            sl = f.get("scale_labels") or {}
+            if lang in sl:
+                f["scale_labels"] = {lang: sl[lang]}
+        else:
+            pr = f.get("prompts") or {}
+            if lang in pr:
+                f["prompts"] = {lang: pr[lang]}
+        out["fields"].append(f)
+    return out
@@ -0,0 +1,210 @@
+"""Tests for ``bunk_logs.core.assignment_audience``.
+
+Covers
+------
+* Creating an assignment materializes its audience and counters.
+* Membership role / tag / active changes move a member in or out.
+* Roster rows joining or leaving an assignment group update its audience.
+* Cancelled assignments have no audience.
+* Reflections bump ``submitted_count``.
+* ``rebuild_all`` (the backfill command) repairs empty audiences and counters.
+* The incremental per-membership sync agrees with a full rebuild.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from bunk_logs.core.assignment_audience import rebuild_all
+from bunk_logs.core.assignment_audience import rebuild_assignment
+from bunk_logs.core.assignment_resolution import resolve_members
+from bunk_logs.core.models import AssignmentAudience
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import ReflectionTemplate
+from bunk_logs.core.models import TemplateAssignment
+
+User = get_user_model()
+pytestmark = pytest.mark.django_db
+
+TODAY = date(2026, 6, 15)
+SCHEMA = {"fields": [{"key": "note", "type": "textarea", "required": False, "prompts": {"en": "Notes"}}]}
+
+
+@pytest.fixture
+def org():
+    return Organization.objects.create(name="Audience Camp", slug="audience-camp")
+
+
+@pytest.fixture
+def program(org):
+    return Program.all_objects.create(
+        organization=org, name="Audience Summer 2026", slug="summer-2026",
+        program_type="summer_camp",
+        start_date=date(2026, 6, 1), end_date=date(2026, 8, 31),
+    )
+
+
+@pytest.fixture
+def counselor(org, program):
+    person = Person.all_objects.create(organization=org, first_name="Mira", last_name="Sandberg")
+    return Membership.all_objects.create(program=program, person=person, role="counselor", is_active=True)
+
+
+@pytest.fixture
+def template(org):
+    return ReflectionTemplate.all_objects.create(
+        organization=org, name="Bunk Reflection", slug="bunk-reflection-audience",
+        cadence="daily", subject_mode="single_subject", schema=SCHEMA, languages=["en"],
+        is_active=True, author_role_filter=["counselor"],
+    )
+
+
+@pytest.fixture
+def bunk(org, program):
+    return AssignmentGroup.objects.create(
+        organization=org, program=program, name="Bunk Maple", slug="bunk-maple",
+        group_type="bunk", is_active=True,
+    )
+
+
+def _assignment(program, template, target_type, payload=None, **extra):
+    return TemplateAssignment.all_objects.create(
+        organization=program.organization, program=program, template=template,
+        target_type=target_type, target_payload=payload or {},
+        start_date=TODAY - timedelta(days=1),
+        status=TemplateAssignment.Status.ACTIVE,
+        **extra,
+    )
+
+
+def _audience(assignment):
+    return set(
+        AssignmentAudience.all_objects.filter(assignment=assignment).values_list("membership_id", flat=True),
+    )
+
+
+def _expected(assignment):
+    assignment.refresh_from_db(fields=["expected_count", "submitted_count"])
+    return assignment.expected_count
+
+
+def test_role_assignment_materializes_audience(program, template, counselor):
+    assignment = _assignment(program, template, "role", {"role": "counselor"})
+
+    assert _audience(assignment) == {counselor.pk}
+    assert _expected(assignment) == 1
+    row = AssignmentAudience.all_objects.get(assignment=assignment)
+    assert (row.start_date, row.end_date) == (assignment.start_date, None)
+
+
+def test_membership_changes_move_member_in_and_out(program, template, counselor):
+    by_role = _assignment(program, template, "role", {"role": "counselor"})
+    by_tag = _assignment(program, template, "tag_group", {"tag": "waterfront"})
+    assert _audience(by_tag) == set()
+
+    counselor.tags = ["waterfront"]
+    counselor.save()
+    assert _audience(by_tag) == {counselor.pk}
+    assert _expected(by_tag) == 1
+
+    counselor.is_active = False
+    counselor.save()
+    assert _audience(by_role) == set()
+    assert _audience(by_tag) == set()
+    assert _expected(by_role) == 0
+
+
+def test_roster_rows_drive_assignment_group_audience(program, template, counselor, bunk):
+    assignment = _assignment(program, template, "assignment_group", assignment_group=bunk)
+    assert _audience(assignment) == set()
+
+    roster_row = AssignmentGroupMembership.objects.create(
+        group=bunk, person=counselor.person, role_in_group="author", is_active=True,
+    )
+    assert _audience(assignment) == {counselor.pk}
+
+    roster_row.delete()
+    assert _audience(assignment) == set()
+    assert _expected(assignment) == 0
+
+
+def test_deleting_membership_fixes_expected_count(program, template, counselor):
+    assignment = _assignment(program, template, "role", {"role": "counselor"})
+    counselor.delete()
+    assert _expected(assignment) == 0
+
+
+def test_cancelled_assignment_has_no_audience(program, template, counselor):
+    assignment = _assignment(program, template, "role", {"role": "counselor"})
+    assignment.status = TemplateAssignment.Status.CANCELLED
+    assignment.save()
+    assert _audience(assignment) == set()
+    assert _expected(assignment) == 0
+
+
+def test_reflections_update_submitted_count(org, program, template, counselor, bunk):
+    assignment = _assignment(program, template, "assignment_group", assignment_group=bunk)
+    reflection = Reflection.all_objects.create(
+        organization=org, program=program, template=template,
+        author=counselor.person, subject=counselor.person, assignment_group=bunk,
+        period_start=TODAY, period_end=TODAY, answers={"note": "ok"},
+    )
+    assignment.refresh_from_db()
+    assert assignment.submitted_count == 1
+
+    reflection.delete()
+    assignment.refresh_from_db()
+    assert assignment.submitted_count == 0
+
+
+def test_rebuild_all_repairs_stale_rows(org, program, template, counselor):
+    assignment = _assignment(program, template, "role", {"role": "counselor"})
+    Reflection.all_objects.create(
+        organization=org, program=program, template=template,
+        author=counselor.person, subject=counselor.person,
+        period_start=TODAY, period_end=TODAY, answers={"note": "ok"},
+    )
+    AssignmentAudience.all_objects.filter(assignment=assignment).delete()
+    TemplateAssignment.all_objects.filter(pk=assignment.pk).update(expected_count=0, submitted_count=0)
+
+    assert rebuild_all() == 1
+    assert _audience(assignment) == {counselor.pk}
+    assert _expected(assignment) == 1
+    assert assignment.submitted_count == 1
+
+
+def test_incremental_sync_matches_full_rebuild(org, program, template, counselor, bunk):
+    other = Membership.all_objects.create(
+        program=program,
+        person=Person.all_objects.create(organization=org, first_name="Eli", last_name="Roth"),
+        role="counselor",
+        is_active=True,
+        tags=["lead"],
+    )
+    AssignmentGroupMembership.objects.create(group=bunk, person=other.person, role_in_group="author", is_active=True)
+    assignments = [
+        _assignment(program, template, "role", {"role": "counselor"}),
+        _assignment(program, template, "individuals", {"membership_ids": [counselor.pk]}),
+        _assignment(program, template, "tag_group", {"tag": "lead"}),
+        _assignment(program, template, "assignment_group", assignment_group=bunk),
+    ]
+    # Change memberships after the assignments exist (incremental path).
+    counselor.tags = ["lead"]
+    counselor.save()
+    AssignmentGroupMembership.objects.create(group=bunk, person=counselor.person, role_in_group="author", is_active=True)
+
+    for assignment in assignments:
+        incremental = _audience(assignment)
+        rebuild_assignment(assignment)
+        assert incremental == _audience(assignment)
+        assert incremental == set(resolve_members(assignment, TODAY).values_list("pk", flat=True))
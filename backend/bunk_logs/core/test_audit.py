@@ -9,15 +9,21 @@ Covers:
   via the model + via the manager queryset).
 * End-to-end dual-write integration with the state machine
   (:class:`OrderableContent.transition_to`) and Supervision.
+* ``audit.buffered`` -- bulk flush on exit, savepoint-style discard for
+  failed nested blocks, and the async (Celery on-commit) flush mode.
 """
 
 from __future__ import annotations
 
 from datetime import date
+from unittest.mock import patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from bunk_logs.core import audit as audit_module
+from bunk_logs.core import tasks as core_tasks
 from bunk_logs.core.context import organization_context
 from bunk_logs.core.models import AuditEvent
 from bunk_logs.core.models import Membership
@@ -230,6 +236,159 @@ class TestAppendOnly:
             AuditEvent.all_objects.filter(content_type="order").delete()
 
 
+# ---------------------------------------------------------------------------
+# Buffered writes
+# ---------------------------------------------------------------------------
+
+
+class _RolledBackError(Exception):
+    """Stands in for whatever aborts a business write mid-block."""
+
+
+def _created_then_raise(actor, content) -> None:
+    with audit_module.buffered():
+        audit_module.created(actor, content)
+        raise _RolledBackError
+
+
+class TestBufferedWrites:
+    def test_events_are_written_once_on_exit(self, admin_membership, order):
+        with audit_module.buffered() as events:
+            for status in ("a", "b", "c"):
+                audit_module.state_changed(admin_membership, order, "new", status)
+            assert not AuditEvent.all_objects.exists()
+        assert len(events) == 3
+        assert AuditEvent.all_objects.count() == 3
+        assert {e.id for e in AuditEvent.all_objects.all()} == {e.id for e in events}
+
+    def test_flush_is_a_single_insert(self, admin_membership, order):
+        events = [
+            AuditEvent(
+                event_type=AuditEvent.EventType.EDITED,
+                content_type="order",
+                content_id=str(order.id),
+                organization=order.organization,
+            )
+            for _ in range(5)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            assert audit_module.flush_events(events) == 5
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+
+    def test_failed_nested_block_discards_only_its_events(
+        self, admin_membership, order,
+    ):
+        with audit_module.buffered():
+            audit_module.edited(admin_membership, order, {"n": 1}, {"n": 2})
+            try:
+                with audit_module.buffered():
+                    audit_module.edited(admin_membership, order, {"n": 2}, {"n": 3})
+                    raise _RolledBackError
+            except _RolledBackError:
+                pass
+            with audit_module.buffered():
+                audit_module.edited(admin_membership, order, {"n": 2}, {"n": 4})
+        after = sorted(
+            e.after_state["n"] for e in AuditEvent.all_objects.filter(
+                event_type=AuditEvent.EventType.EDITED,
+            )
+        )
+        assert after == [2, 4]
+
+    def test_non_atomic_block_batches_inside_an_open_transaction(self, admin_membership, order):
+        # The test transaction stands in for ATOMIC_REQUESTS.
+        with audit_module.buffered(atomic=False) as events:
+            with audit_module.buffered():
+                audit_module.edited(admin_membership, order, {"n": 1}, {"n": 2})
+            try:
+                with audit_module.buffered():
+                    audit_module.edited(admin_membership, order, {"n": 2}, {"n": 3})
+                    raise _RolledBackError
+            except _RolledBackError:
+                pass
+            assert not AuditEvent.all_objects.exists()
+        assert len(events) == 1
+        assert [e.after_state for e in AuditEvent.all_objects.all()] == [{"n": 2}]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_non_atomic_block_in_autocommit_flushes_per_item(self, admin_membership, order):
+        with audit_module.buffered(atomic=False) as events:
+            with audit_module.buffered():
+                audit_module.edited(admin_membership, order, {"n": 1}, {"n": 2})
+            # Committed with its item, not held for the end of the loop.
+            assert AuditEvent.all_objects.count() == 1
+        assert events == []
+
+    def test_exception_in_outer_block_writes_nothing(self, admin_membership, order):
+        with pytest.raises(_RolledBackError):
+            _created_then_raise(admin_membership, order)
+        assert not AuditEvent.all_objects.exists()
+
+    def test_unbuffered_writes_are_immediate_after_block(self, admin_membership, order):
+        with audit_module.buffered():
+            pass
+        event = audit_module.created(admin_membership, order)
+        assert AuditEvent.all_objects.filter(pk=event.pk).exists()
+
+    def test_async_flush_enqueues_on_commit(
+        self, admin_membership, order, settings, django_capture_on_commit_callbacks,
+    ):
+        settings.AUDIT_ASYNC_FLUSH = True
+        with patch.object(core_tasks.flush_audit_events, "delay") as delay, \
+             django_capture_on_commit_callbacks(execute=True):
+            with audit_module.buffered():
+                audit_module.created(admin_membership, order, after_state={"x": 1})
+            assert not AuditEvent.all_objects.exists()
+
+        payload = delay.call_args.args[0]
+        assert payload[0]["after_state"] == {"x": 1}
+        assert payload[0]["actor_membership_id"] == admin_membership.id
+        assert not AuditEvent.all_objects.exists()
+
+        result = core_tasks.flush_audit_events.run(payload)
+        assert result == {"written": 1}
+        # A redelivered task must not duplicate the row.
+        core_tasks.flush_audit_events.run(payload)
+        assert AuditEvent.all_objects.count() == 1
+
+    def test_payload_without_created_at_still_deserializes(self, order):
+        # Queued before ``created_at`` was part of the payload.
+        event = AuditEvent(
+            event_type=AuditEvent.EventType.EDITED,
+            content_type="order",
+            content_id=str(order.id),
+            organization=order.organization,
+        )
+        payload = [audit_module._serialize_event(event)]
+        del payload[0]["created_at"]
+
+        (restored,) = audit_module.deserialize_events(payload)
+        assert restored.id == event.id
+        assert restored.created_at is not None
+
+    def test_async_flush_not_enqueued_on_rollback(
+        self, admin_membership, order, settings, django_capture_on_commit_callbacks,
+    ):
+        settings.AUDIT_ASYNC_FLUSH = True
+        with patch.object(core_tasks.flush_audit_events, "delay") as delay, \
+             django_capture_on_commit_callbacks(execute=True) as callbacks, \
+             pytest.raises(_RolledBackError):
+            _created_then_raise(admin_membership, order)
+        assert callbacks == []
+        delay.assert_not_called()
+
+    def test_enqueue_failure_falls_back_to_inline_write(
+        self, admin_membership, order, settings, django_capture_on_commit_callbacks,
+    ):
+        settings.AUDIT_ASYNC_FLUSH = True
+        with patch.object(
+            core_tasks.flush_audit_events, "delay", side_effect=ConnectionError,
+        ), django_capture_on_commit_callbacks(execute=True), audit_module.buffered():
+            audit_module.created(admin_membership, order)
+        assert AuditEvent.all_objects.count() == 1
+
+
 # ---------------------------------------------------------------------------
 # Integration: dual-writes from the state machine
 # ---------------------------------------------------------------------------
@@ -0,0 +1,194 @@
+"""Tests for monthly ``AuditEvent`` partitioning and archival.
+
+Covers the migrated table shape, :func:`ensure_partitions` (look-ahead
+creation, draining the default partition), the archive command writing
+gzipped JSONL and dropping the partition, and a ``created_at`` range
+reaching the planner as a prunable bound.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from bunk_logs.core import audit as audit_module
+from bunk_logs.core import audit_partitions
+from bunk_logs.core.context import organization_context
+from bunk_logs.core.models import AuditEvent
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Order
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+
+pytestmark = pytest.mark.django_db
+
+OLD_MONTH = date(2020, 1, 1)
+
+
+@pytest.fixture
+def org(db):
+    return Organization.objects.create(name="Partition Org", slug="partition-org")
+
+
+@pytest.fixture
+def program(org):
+    return Program.all_objects.create(
+        organization=org,
+        name="Partition Org Summer",
+        slug="partition-summer",
+        program_type="summer_camp",
+        start_date=date(2026, 6, 1),
+        end_date=date(2026, 8, 31),
+    )
+
+
+@pytest.fixture
+def admin_membership(org, program):
+    person = Person.all_objects.create(
+        organization=org, first_name="Pat", last_name="Admin",
+    )
+    return Membership.all_objects.create(
+        program=program, person=person, role="admin", is_active=True,
+    )
+
+
+@pytest.fixture
+def order(org, program):
+    with organization_context(org):
+        return Order.objects.create(organization=org, program=program)
+
+
+@pytest.fixture
+def archive_storage(settings, tmp_path):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(tmp_path)},
+        },
+    }
+    settings.AUDIT_ARCHIVE_STORAGE = "default"
+    return tmp_path
+
+
+def _old_event(actor, content, when: datetime) -> AuditEvent:
+    """Buffered emit keeps the assigned ``created_at`` through the bulk insert."""
+    with audit_module.buffered():
+        event = audit_module.created(actor, content)
+        event.created_at = when
+    return event
+
+
+def _partition_of(event: AuditEvent) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT tableoid::regclass::text FROM core_auditevent WHERE id = %s",
+            [event.id],
+        )
+        return cursor.fetchone()[0]
+
+
+class TestPartitionedTable:
+    def test_migration_partitions_table_by_month(self):
+        assert audit_partitions.is_partitioned()
+        current = audit_partitions.month_start(timezone.now())
+        names = {p.name for p in audit_partitions.list_partitions()}
+        assert audit_partitions.partition_name(current) in names
+
+    def test_new_event_lands_in_current_month_partition(self, admin_membership, order):
+        event = audit_module.created(admin_membership, order)
+        expected = audit_partitions.partition_name(
+            audit_partitions.month_start(event.created_at),
+        )
+        assert _partition_of(event) == expected
+
+    def test_secondary_indexes_survive_conversion(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename = %s",
+                [audit_partitions.TABLE],
+            )
+            names = {row[0] for row in cursor.fetchall()}
+        assert "core_audite_content_690cb9_idx" in names
+        assert "core_audite_organiz_79e83d_idx" in names
+
+
+class TestEnsurePartitions:
+    def test_idempotent(self):
+        audit_partitions.ensure_partitions()
+        assert audit_partitions.ensure_partitions() == []
+
+    def test_creates_months_ahead(self, settings):
+        settings.AUDIT_PARTITION_MONTHS_AHEAD = 6
+        audit_partitions.ensure_partitions()
+        current = audit_partitions.month_start(timezone.now())
+        names = {p.name for p in audit_partitions.list_partitions()}
+        assert audit_partitions.partition_name(
+            audit_partitions.add_months(current, 6),
+        ) in names
+
+    def test_drains_default_partition(self, admin_membership, order):
+        event = _old_event(admin_membership, order, datetime(2020, 1, 15, tzinfo=UTC))
+        assert _partition_of(event) == audit_partitions.DEFAULT_PARTITION
+
+        created = audit_partitions.ensure_partitions()
+
+        assert audit_partitions.partition_name(OLD_MONTH) in created
+        assert _partition_of(event) == audit_partitions.partition_name(OLD_MONTH)
+
+
+class TestArchiveCommand:
+    def test_dry_run_keeps_partition(self, admin_membership, order, archive_storage):
+        _old_event(admin_membership, order, datetime(2020, 1, 15, tzinfo=UTC))
+        audit_partitions.ensure_partitions()
+
+        call_command("archive_audit_partitions")
+
+        names = {p.name for p in audit_partitions.list_partitions()}
+        assert audit_partitions.partition_name(OLD_MONTH) in names
+        assert not (archive_storage / "audit-archive").exists()
+
+    def test_apply_writes_jsonl_and_drops_partition(
+        self, admin_membership, order, archive_storage,
+    ):
+        old = _old_event(admin_membership, order, datetime(2020, 1, 15, tzinfo=UTC))
+        recent = audit_module.created(admin_membership, order)
+        audit_partitions.ensure_partitions()
+
+        call_command("archive_audit_partitions", "--apply")
+
+        name = audit_partitions.partition_name(OLD_MONTH)
+        assert name not in {p.name for p in audit_partitions.list_partitions()}
+        rows = audit_partitions.read_archive(f"audit-archive/{name}.jsonl.gz")
+        assert [row["id"] for row in rows] == [str(old.id)]
+        assert rows[0]["event_type"] == "created"
+        assert not AuditEvent.all_objects.filter(id=old.id).exists()
+        assert AuditEvent.all_objects.filter(id=recent.id).exists()
+
+    def test_retention_window_keeps_recent_months(self):
+        current = audit_partitions.month_start(timezone.now())
+        audit_partitions.ensure_partitions(since=audit_partitions.add_months(current, -1))
+        closed = {p.start for p in audit_partitions.closed_partitions(keep_months=1)}
+        assert current not in closed
+        assert audit_partitions.add_months(current, -1) not in closed
+
+
+class TestPruning:
+    def test_window_filter_prunes_other_months(self, org, admin_membership, order):
+        _old_event(admin_membership, order, datetime(2020, 1, 15, tzinfo=UTC))
+        audit_partitions.ensure_partitions()
+        current = audit_partitions.month_start(timezone.now())
+        qs = AuditEvent.all_objects.filter(
+            organization=org,
+            created_at__gte=datetime.combine(current, datetime.min.time(), tzinfo=UTC),
+        )
+        plan = qs.explain()
+        assert audit_partitions.partition_name(current) in plan
+        assert audit_partitions.partition_name(OLD_MONTH) not in plan
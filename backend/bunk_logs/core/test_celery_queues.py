@@ -0,0 +1,90 @@
+"""Tests for Celery queue routing and the queue stats helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from django.conf import settings
+
+from bunk_logs.core.celery_queues import ENQUEUED_AT_HEADER
+from bunk_logs.core.celery_queues import queue_stats
+from bunk_logs.core.celery_queues import stamp_enqueued_at
+from bunk_logs.core.celery_queues import worker_commands
+from bunk_logs.core.theme_tagging.tasks import tag_reflection_themes
+from config.celery_app import app
+
+
+@pytest.mark.parametrize(
+    ("task_name", "queue"),
+    [
+        ("bunk_logs.core.translation.translate_reflection_to_english", "interactive"),
+        ("bunk_logs.core.tasks.process_inbound_emails", "interactive"),
+        ("maintenance.send_maintenance_digest", "notifications"),
+        ("bunk_logs.core.theme_tagging.tag_reflection_themes_batch", "bulk"),
+        ("bunk_logs.core.tasks.import_roster_task", "bulk"),
+        ("bunk_logs.core.translation.purge_expired_translations", "maintenance"),
+        ("some.unrouted.task", "interactive"),
+    ],
+)
+def test_tasks_route_to_their_queue(task_name, queue):
+    assert app.amqp.router.route({}, task_name)["queue"].name == queue
+
+
+def test_every_route_targets_a_declared_queue():
+    declared = {q.name for q in settings.CELERY_TASK_QUEUES}
+    assert {r["queue"] for r in settings.CELERY_TASK_ROUTES.values()} <= declared
+    consumed = {q for spec in settings.CELERY_QUEUE_WORKERS.values() for q in spec["queues"]}
+    assert consumed == declared
+
+
+def test_llm_tasks_are_rate_limited():
+    assert tag_reflection_themes.rate_limit == settings.THEME_TAGGING_TASK_RATE_LIMIT
+
+
+class FakeRedis:
+    def __init__(self, lists):
+        self.lists = lists
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def lindex(self, key, index):
+        return self.lists[key][index]
+
+
+def _message(enqueued_at=None):
+    headers = {} if enqueued_at is None else {ENQUEUED_AT_HEADER: enqueued_at}
+    return json.dumps({"headers": headers, "body": ""})
+
+
+def test_queue_stats_depth_and_oldest_age():
+    client = FakeRedis({
+        "interactive": [_message(990.0), _message(900.0)],
+        "bulk\x06\x163": [_message(700.0)],
+        "bulk": [_message()],
+    })
+
+    stats = queue_stats(client, ["interactive", "bulk", "maintenance"], now=1000.0)
+
+    assert [(s.name, s.depth, s.oldest_age_seconds) for s in stats] == [
+        ("interactive", 2, 100.0),
+        ("bulk", 2, 300.0),
+        ("maintenance", 0, None),
+    ]
+
+
+def test_stamp_enqueued_at_keeps_existing_header():
+    headers = {ENQUEUED_AT_HEADER: 5.0}
+    stamp_enqueued_at(headers=headers)
+    assert headers[ENQUEUED_AT_HEADER] == 5.0
+    fresh: dict = {}
+    stamp_enqueued_at(headers=fresh)
+    assert isinstance(fresh[ENQUEUED_AT_HEADER], float)
+
+
+def test_worker_commands_follow_settings():
+    commands = worker_commands()
+    assert set(commands) == set(settings.CELERY_QUEUE_WORKERS)
+    assert "-Q interactive,notifications" in commands["interactive"]
+    assert "--prefetch-multiplier=1" in commands["interactive"]
@@ -0,0 +1,164 @@
+"""Tests for write-time Concerns Inbox extraction (:mod:`bunk_logs.core.concerns`).
+
+Covers the ``post_save`` sync (create, edit, incomplete), rating-group
+category keys, bunk-concern references feeding the Unit Head badge lookup,
+and the backfill command rebuilding rows written through ``.update()``.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+
+from bunk_logs.api.unit_head.common import bunk_concerns_referencing
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import ConcernItem
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import ReflectionTemplate
+
+pytestmark = pytest.mark.django_db
+
+DAY = date(2026, 7, 10)
+
+
+@pytest.fixture
+def org():
+    return Organization.objects.create(name="Concern Org", slug="concern-org")
+
+
+@pytest.fixture
+def program(org):
+    return Program.all_objects.create(
+        organization=org,
+        name="Concern Org Summer",
+        slug="concern-summer",
+        program_type="summer_camp",
+        start_date=date(2026, 6, 1),
+        end_date=date(2026, 8, 31),
+    )
+
+
+@pytest.fixture
+def bunk(org, program):
+    return AssignmentGroup.all_objects.create(
+        organization=org, program=program, name="Cedar", slug="concern-cedar", group_type="bunk",
+    )
+
+
+@pytest.fixture
+def template(org):
+    return ReflectionTemplate.all_objects.create(
+        organization=org,
+        name="Bunk Obs",
+        slug="concern-bunk-obs",
+        cadence="daily",
+        schema={
+            "fields": [
+                {"key": "overall", "type": "single_rating", "dashboard_role": "primary_rating"},
+                {
+                    "key": "areas",
+                    "type": "rating_group",
+                    "categories": [
+                        {"key": "social", "labels": {"en": "Social"}},
+                        {"key": "sleep", "labels": {"en": "Sleep"}},
+                    ],
+                },
+                {
+                    "key": "concerns",
+                    "type": "textarea",
+                    "dashboard_role": "open_concern",
+                    "prompts": {"en": "Concerns?"},
+                },
+            ],
+        },
+    )
+
+
+@pytest.fixture
+def camper(org):
+    return Person.all_objects.create(organization=org, first_name="Cam", last_name="Per")
+
+
+def _reflection(org, program, template, camper, bunk, answers, **extra):
+    return Reflection.all_objects.create(
+        organization=org, program=program, template=template,
+        subject=camper, author=camper, assignment_group=bunk,
+        period_start=DAY, period_end=DAY, answers=answers, **extra,
+    )
+
+
+def _items(reflection):
+    return list(
+        ConcernItem.all_objects.filter(reflection=reflection).values_list(
+            "kind", "field_key", "severity", "value_text", "value_number",
+        ),
+    )
+
+
+class TestSyncOnSave:
+    def test_extracts_text_and_low_ratings_in_schema_order(
+        self, org, program, template, camper, bunk,
+    ):
+        r = _reflection(
+            org, program, template, camper, bunk,
+            {"overall": 1, "areas": {"social": 4, "sleep": 1}, "concerns": "  homesick  "},
+        )
+        assert _items(r) == [
+            ("low_rating", "overall", ConcernItem.Severity.HIGH, "", 1.0),
+            ("low_rating", "areas__sleep", ConcernItem.Severity.HIGH, "", 1.0),
+            ("open_concern", "concerns", ConcernItem.Severity.MEDIUM, "homesick", None),
+        ]
+        item = ConcernItem.all_objects.get(reflection=r, field_key="concerns")
+        assert (item.subject_id, item.assignment_group_id, item.date) == (camper.id, bunk.id, DAY)
+
+    def test_edit_replaces_items(self, org, program, template, camper, bunk):
+        r = _reflection(org, program, template, camper, bunk, {"overall": 1, "concerns": "x"})
+        r.answers = {"overall": 4, "concerns": ""}
+        r.save()
+        assert _items(r) == []
+
+    def test_incomplete_reflection_has_no_items(self, org, program, template, camper, bunk):
+        r = _reflection(
+            org, program, template, camper, bunk, {"concerns": "draft"}, is_complete=False,
+        )
+        assert _items(r) == []
+
+    def test_unrelated_update_fields_skip_resync(self, org, program, template, camper, bunk):
+        r = _reflection(org, program, template, camper, bunk, {"concerns": "x"})
+        ConcernItem.all_objects.filter(reflection=r).delete()
+        r.save(update_fields=["team_visibility"])
+        assert _items(r) == []
+
+
+class TestBunkConcerns:
+    def test_references_feed_unit_head_lookup(self, org, program, template, camper, bunk):
+        other = AssignmentGroup.all_objects.create(
+            organization=org, program=program, name="Pine", slug="concern-pine", group_type="bunk",
+        )
+        r = _reflection(
+            org, program, template, camper, bunk,
+            {"bunk_concerns_bunks": [other.id, str(bunk.id), "nope", 999999]},
+        )
+
+        by_bunk = bunk_concerns_referencing(organization=org, program=program, target_date=DAY)
+
+        assert by_bunk == {bunk.id: [r], other.id: [r]}
+        assert bunk_concerns_referencing(
+            organization=org, program=program, target_date=date(2026, 7, 11),
+        ) == {}
+
+
+class TestBackfillCommand:
+    def test_rebuilds_rows_after_queryset_update(self, org, program, template, camper, bunk):
+        r = _reflection(org, program, template, camper, bunk, {"concerns": ""})
+        Reflection.all_objects.filter(pk=r.pk).update(answers={"concerns": "bullied at lunch"})
+        assert _items(r) == []
+
+        call_command("backfill_concern_items", "--org", org.slug, "--batch-size", "1")
+
+        assert [row[:2] for row in _items(r)] == [("open_concern", "concerns")]
@@ -0,0 +1,146 @@
+"""Tests for the Camper Care flag pipeline (``bunk_logs.core.flags``).
+
+Covers
+------
+* A batch raises one flag per help-requesting reflection, attributed to
+  each author's membership, in a fixed number of queries.
+* Open flags are reused and resolved flags are not re-raised.
+* Affected Camper Care dashboard caches are invalidated.
+* ``backfill_camper_care_flags`` goes through the same path.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from bunk_logs.core.flags import raise_flag_from_camper_reflection
+from bunk_logs.core.flags import raise_flags_for_reflections
+from bunk_logs.core.models import Flag
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import ReflectionTemplate
+
+pytestmark = pytest.mark.django_db
+
+TODAY = date(2026, 7, 2)
+SCHEMA = {
+    "fields": [
+        {"key": "needs_cc", "type": "yes_no", "required": False, "dashboard_role": "help_request_camper_care"},
+        {"key": "note", "type": "textarea", "required": False},
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def org():
+    return Organization.objects.create(name="Flag Camp", slug="flag-camp")
+
+
+@pytest.fixture
+def program(org):
+    return Program.all_objects.create(
+        organization=org, name="Flag Summer 2026", slug="summer-2026",
+        program_type="summer_camp",
+        start_date=date(2026, 6, 1), end_date=date(2026, 8, 31),
+    )
+
+
+@pytest.fixture
+def template(org):
+    return ReflectionTemplate.all_objects.create(
+        organization=org, name="Camper log", slug="flag-camper-log",
+        cadence="daily", subject_mode="single_subject", schema=SCHEMA, languages=["en"],
+        is_active=True, author_role_filter=["counselor"],
+    )
+
+
+def _membership(org, program, first, role="counselor"):
+    person = Person.all_objects.create(organization=org, first_name=first, last_name="Test")
+    return Membership.all_objects.create(program=program, person=person, role=role, is_active=True)
+
+
+def _reflections(org, program, template, author, answers_list):
+    out = []
+    for i, answers in enumerate(answers_list):
+        camper = Person.all_objects.create(organization=org, first_name=f"Camper{i}", last_name="Test")
+        out.append(
+            Reflection.all_objects.create(
+                organization=org, program=program, template=template, author=author.person,
+                subject=camper, period_start=TODAY, period_end=TODAY, answers=answers,
+                is_complete=True,
+            ),
+        )
+    return out
+
+
+def test_batch_raises_one_flag_per_help_request(org, program, template, django_assert_max_num_queries):
+    author = _membership(org, program, "Mira")
+    reflections = _reflections(
+        org, program, template, author,
+        [{"needs_cc": "yes"}, {"request_camper_care_help": True}, {"needs_cc": "no"}, {"note": "fine"}] * 5,
+    )
+    with django_assert_max_num_queries(5):
+        batch = raise_flags_for_reflections(reflections)
+
+    assert len(batch.created) == 10
+    flags = Flag.all_objects.filter(trigger_content_type="reflection")
+    assert flags.count() == 10
+    assert {f.raised_by_membership_id for f in flags} == {author.pk}
+    assert set(batch.flags) == {
+        r.id for r in reflections
+        if r.answers.get("needs_cc") == "yes" or r.answers.get("request_camper_care_help")
+    }
+
+
+def test_open_flags_are_reused_and_resolved_are_not_reraised(org, program, template):
+    author = _membership(org, program, "Mira")
+    open_refl, resolved_refl = _reflections(
+        org, program, template, author, [{"needs_cc": "yes"}, {"needs_cc": "yes"}],
+    )
+    existing = raise_flag_from_camper_reflection(open_refl)
+    resolved = raise_flag_from_camper_reflection(resolved_refl)
+    Flag.all_objects.filter(pk=resolved.pk).update(status=Flag.Status.RESOLVED)
+
+    batch = raise_flags_for_reflections([open_refl, resolved_refl, open_refl])
+
+    assert batch.created == []
+    assert batch.flags == {open_refl.id: existing}
+    assert Flag.all_objects.count() == 2
+
+
+def test_batch_busts_camper_care_dashboards(org, program, template):
+    author = _membership(org, program, "Mira")
+    cc = _membership(org, program, "Dana", role="camper_care")
+    key = f"camper_care_dashboard:{org.id}:{cc.person_id}:{TODAY.isoformat()}"
+    cache.set(key, {"stale": True})
+
+    raise_flags_for_reflections(_reflections(org, program, template, author, [{"needs_cc": "yes"}]))
+
+    assert cache.get(key) is None
+
+
+def test_backfill_command_uses_batch_path(org, program, template):
+    author = _membership(org, program, "Mira")
+    _reflections(org, program, template, author, [{"needs_cc": "yes"}] * 3 + [{"needs_cc": "no"}])
+
+    out = StringIO()
+    call_command("backfill_camper_care_flags", "--org", org.slug, "--batch-size", "2", stdout=out)
+    call_command("backfill_camper_care_flags", "--org", org.slug, stdout=StringIO())
+
+    assert "Raised 3 flag(s) across 4 reflection(s)" in out.getvalue()
+    assert Flag.all_objects.count() == 3
@@ -0,0 +1,101 @@
+"""Tests for the blocking-key duplicate Person finder."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.person_duplicates import email_local_part
+from bunk_logs.core.person_duplicates import find_duplicate_candidates
+from bunk_logs.core.person_duplicates import normalize_name
+from bunk_logs.core.person_duplicates import soundex
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def org(db):
+    return Organization.objects.create(name="Dup Org", slug="dup-org")
+
+
+def _person(org, first, last, **extra):
+    return Person.all_objects.create(organization=org, first_name=first, last_name=last, **extra)
+
+
+def _pairs(candidates):
+    return {frozenset((c.person_id, c.other_person_id)) for c in candidates}
+
+
+class TestKeys:
+    def test_normalize_name_strips_accents_and_punctuation(self):
+        assert normalize_name(" José-Luis ") == "joseluis"
+
+    @pytest.mark.parametrize(
+        ("name", "code"),
+        [("robert", "R163"), ("rupert", "R163"), ("ashcraft", "A261"), ("tymczak", "T522"), ("lee", "L000")],
+    )
+    def test_soundex(self, name, code):
+        assert soundex(name) == code
+
+    def test_email_local_part_ignores_tags_and_dots(self):
+        assert email_local_part("Jane.Doe+camp@Example.com") == "janedoe"
+
+
+class TestFindDuplicateCandidates:
+    def test_exact_name_and_birthdate(self, org):
+        a = _person(org, "Maya", "Cohen", date_of_birth=date(2012, 3, 4))
+        b = _person(org, "maya", "COHEN", date_of_birth=date(2012, 3, 4))
+        _person(org, "Noah", "Levi")
+
+        candidates = find_duplicate_candidates(org)
+
+        assert _pairs(candidates) == {frozenset((a.id, b.id))}
+        assert "same_name" in candidates[0].reasons
+        assert "same_birthdate" in candidates[0].reasons
+
+    def test_phonetic_and_email_match(self, org):
+        a = _person(org, "Jon", "Smyth", email="jon.smyth@example.com")
+        b = _person(org, "John", "Smith", email="jonsmyth+camp@example.org")
+
+        assert _pairs(find_duplicate_candidates(org)) == {frozenset((a.id, b.id))}
+
+    def test_preferred_name_counts_as_first_name(self, org):
+        a = _person(org, "Elizabeth", "Katz", preferred_name="Lizzy")
+        b = _person(org, "Lizzy", "Katz")
+
+        assert _pairs(find_duplicate_candidates(org)) == {frozenset((a.id, b.id))}
+
+    def test_different_birthdates_are_not_reported(self, org):
+        _person(org, "Sam", "Green", date_of_birth=date(2010, 1, 1))
+        _person(org, "Sam", "Green", date_of_birth=date(2014, 6, 1))
+
+        assert find_duplicate_candidates(org) == []
+
+    def test_conflicting_campminder_ids_are_skipped(self, org):
+        _person(org, "Ari", "Stone", external_ids={"campminder_id": "1"})
+        _person(org, "Ari", "Stone", external_ids={"campminder_id": "2"})
+
+        assert find_duplicate_candidates(org) == []
+
+    def test_other_orgs_are_ignored(self, org):
+        other = Organization.objects.create(name="Other Dup Org", slug="other-dup-org")
+        _person(org, "Tal", "Bar")
+        _person(other, "Tal", "Bar")
+
+        assert find_duplicate_candidates(org) == []
+
+    def test_large_org_is_a_single_query(self, org, django_assert_num_queries):
+        Person.all_objects.bulk_create(
+            Person(organization=org, first_name=f"First{i}", last_name=f"Last{i}")
+            for i in range(2000)
+        )
+        a = _person(org, "Dana", "Weiss")
+        b = _person(org, "Dana", "Weiss")
+
+        with django_assert_num_queries(1):
+            candidates = find_duplicate_candidates(org)
+
+        assert frozenset((a.id, b.id)) in _pairs(candidates)
@@ -0,0 +1,180 @@
+"""Tests for ``bunk_logs.core.program_rollover``.
+
+Covers
+------
+* A rollover clones the group tree with parents remapped and slugs resolved
+  against the target program, plus rosters and program memberships.
+* The plan is a dry run; re-running reuses already-cloned groups.
+* Assignments move by the gap between the two programs' start dates.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+
+from bunk_logs.core.group_clone import GroupCloneError
+from bunk_logs.core.models import ROLE_TO_CAPABILITY
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import Membership
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+from bunk_logs.core.models import ReflectionTemplate
+from bunk_logs.core.models import TemplateAssignment
+from bunk_logs.core.program_rollover import execute_rollover
+from bunk_logs.core.program_rollover import plan_rollover
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def org():
+    return Organization.objects.create(name="Rollover Camp", slug="rollover-camp")
+
+
+def _program(org, slug, start):
+    return Program.all_objects.create(
+        organization=org, name=slug, slug=slug, program_type="summer_camp",
+        start_date=start, end_date=date(start.year, 8, 31),
+    )
+
+
+@pytest.fixture
+def session1(org):
+    return _program(org, "session-1", date(2026, 6, 1))
+
+
+@pytest.fixture
+def session2(org):
+    return _program(org, "session-2", date(2026, 7, 13))
+
+
+@pytest.fixture
+def tree(org, session1):
+    unit = AssignmentGroup.all_objects.create(
+        organization=org, program=session1, name="Unit Aleph", slug="unit-aleph", group_type="unit",
+    )
+    bunks = [
+        AssignmentGroup.all_objects.create(
+            organization=org, program=session1, name=f"Bunk {n}", slug=f"bunk-{n}",
+            group_type="bunk", parent=unit,
+        )
+        for n in (1, 2)
+    ]
+    for i, bunk in enumerate(bunks):
+        counselor = Person.all_objects.create(organization=org, first_name=f"Mira{i}", last_name="Test")
+        Membership.all_objects.create(program=session1, person=counselor, role="counselor", is_active=True)
+        AssignmentGroupMembership.all_objects.create(
+            group=bunk, person=counselor, role_in_group="author", is_active=True,
+        )
+        for j in range(3):
+            camper = Person.all_objects.create(organization=org, first_name=f"Camper{i}{j}", last_name="Test")
+            Membership.all_objects.create(program=session1, person=camper, role="camper", is_active=True)
+            AssignmentGroupMembership.all_objects.create(
+                group=bunk, person=camper, role_in_group="subject", is_active=True,
+            )
+    return unit, bunks
+
+
+def test_rollover_clones_tree_rosters_and_memberships(org, session1, session2, tree):
+    unit, _ = tree
+    AssignmentGroup.all_objects.create(
+        organization=org, program=session2, name="Existing", slug="bunk-1", group_type="bunk",
+    )
+
+    plan = plan_rollover(source_program=session1, target_program=session2)
+    result = execute_rollover(plan)
+
+    assert result.groups_created == 3
+    assert result.roster_rows_copied == 8
+    assert result.program_memberships_copied == 8
+    cloned_unit = AssignmentGroup.all_objects.get(program=session2, slug="unit-aleph")
+    cloned_bunks = AssignmentGroup.all_objects.filter(program=session2, parent=cloned_unit)
+    assert sorted(b.slug for b in cloned_bunks) == ["bunk-1-2", "bunk-2"]
+    assert cloned_unit.metadata["cloned_from"] == {"group_id": unit.pk, "program_id": session1.pk}
+    assert AssignmentGroupMembership.all_objects.filter(
+        group__in=cloned_bunks, role_in_group="subject", is_active=True,
+    ).count() == 6
+    campers = Membership.all_objects.filter(program=session2, role="camper")
+    assert campers.count() == 6
+    assert {m.capability for m in campers} == {ROLE_TO_CAPABILITY["camper"]}
+
+
+def test_plan_is_dry_run_and_rerun_reuses_groups(session1, session2, tree):
+    plan = plan_rollover(source_program=session1, target_program=session2)
+    summary = plan.as_summary()
+
+    assert len(summary["groups_to_create"]) == 3
+    assert summary["memberships_to_create"] == 8
+    assert not AssignmentGroup.all_objects.filter(program=session2).exists()
+
+    execute_rollover(plan)
+    again = plan_rollover(source_program=session1, target_program=session2)
+    assert again.creates == []
+    assert len(again.reused) == 3
+    assert again.memberships_to_create == 0
+
+    execute_rollover(again)
+    assert AssignmentGroup.all_objects.filter(program=session2).count() == 3
+    assert AssignmentGroupMembership.all_objects.filter(group__program=session2).count() == 8
+
+
+def test_subtree_rollover_attaches_to_matching_parent(org, session1, session2, tree):
+    _unit, bunks = tree
+    target_unit = AssignmentGroup.all_objects.create(
+        organization=org, program=session2, name="Unit Aleph", slug="unit-aleph", group_type="unit",
+    )
+
+    plan = plan_rollover(
+        source_program=session1, target_program=session2, root_group_ids=[bunks[0].pk],
+    )
+    execute_rollover(plan)
+
+    cloned = AssignmentGroup.all_objects.get(program=session2, slug="bunk-1")
+    assert cloned.parent_id == target_unit.pk
+
+
+def test_assignments_shift_by_program_gap(org, session1, session2, tree):
+    _, bunks = tree
+    template = ReflectionTemplate.all_objects.create(
+        organization=org, name="Camper log", slug="rollover-camper-log", cadence="daily",
+        subject_mode="single_subject", schema={"fields": []}, languages=["en"], is_active=True,
+    )
+    TemplateAssignment.all_objects.create(
+        organization=org, program=session1, template=template,
+        target_type=TemplateAssignment.TargetType.ASSIGNMENT_GROUP, assignment_group=bunks[0],
+        start_date=date(2026, 6, 2), end_date=date(2026, 7, 10),
+        status=TemplateAssignment.Status.ACTIVE,
+    )
+
+    plan = plan_rollover(
+        source_program=session1, target_program=session2, include_assignments=True,
+    )
+    execute_rollover(plan)
+    rerun = plan_rollover(
+        source_program=session1, target_program=session2, include_assignments=True,
+    )
+
+    copied = TemplateAssignment.all_objects.get(program=session2)
+    assert copied.assignment_group.slug == "bunk-1"
+    assert copied.start_date == date(2026, 7, 14)
+    assert copied.end_date == date(2026, 8, 21)
+    assert copied.status == TemplateAssignment.Status.SCHEDULED
+    assert rerun.assignments == []
+    assert rerun.assignments_existing == 1
+
+
+def test_same_program_rejected(session1):
+    with pytest.raises(GroupCloneError):
+        plan_rollover(source_program=session1, target_program=session1)
@@ -8,6 +8,8 @@ from io import StringIO
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from bunk_logs.core.campminder_csv import build_import_template_csv
 from bunk_logs.core.campminder_csv import decode_csv_bytes
@@ -15,6 +17,7 @@ from bunk_logs.core.campminder_csv import infer_role_from_position
 from bunk_logs.core.campminder_csv import normalize_campminder_row
 from bunk_logs.core.campminder_csv import normalize_role_value
 from bunk_logs.core.campminder_csv import read_campminder_csv_rows
+from bunk_logs.core.campminder_person_match import persons_by_campminder_id
 from bunk_logs.core.models import AssignmentGroup
 from bunk_logs.core.models import AssignmentGroupMembership
 from bunk_logs.core.models import Membership
@@ -522,6 +525,39 @@ class TestCampminderDryRun:
         assert AssignmentGroup.all_objects.filter(program=program).count() == 0
 
 
+@pytest.mark.django_db
+class TestCampminderIdLookup:
+    def test_persons_by_campminder_id_is_org_scoped(self, org):
+        other = Organization.objects.create(name="Other Camp", slug="other-camp")
+        mine = Person.all_objects.create(
+            organization=org, first_name="A", last_name="One", external_ids={"campminder_id": "CM1"},
+        )
+        Person.all_objects.create(
+            organization=other, first_name="B", last_name="Two", external_ids={"campminder_id": "CM2"},
+        )
+
+        found = persons_by_campminder_id(org, ["CM1", "CM2", "", "CM9"])
+
+        assert found == {"CM1": mine}
+        assert persons_by_campminder_id(org, []) == {}
+
+    def test_lookup_uses_expression_index(self, org):
+        qs = Person.all_objects.filter(
+            organization=org, external_ids__campminder_id__in=["CM1", "CM2"],
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = qs.explain()
+        assert "core_person_cm_id" in plan
+
+    def test_rows_resolve_ids_in_one_query(self, tmp_path, program):
+        _run_campminder(tmp_path, CAMPMINDER_BUNK_CSV)
+        with CaptureQueriesContext(connection) as ctx:
+            _run_campminder(tmp_path, CAMPMINDER_BUNK_CSV)
+        cm_lookups = [q for q in ctx.captured_queries if "campminder_id" in q["sql"] and "core_person" in q["sql"]]
+        assert len(cm_lookups) == 1
+
+
 # ---------------------------------------------------------------------------
 # TBE classroom importer
 # ---------------------------------------------------------------------------
@@ -0,0 +1,144 @@
+"""Tests for ``bunk_logs.core.roster_snapshot``.
+
+Covers
+------
+* The snapshot maps groups to name-ordered subjects / authors and parents.
+* A warm snapshot answers without touching the database.
+* Roster row and group writes retire the cached snapshot.
+* Snapshots expire after ``ROSTER_SNAPSHOT_CACHE_SECONDS`` (Person renames).
+* The dashboard roster helpers read from it.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+
+from bunk_logs.api.counselor.bunk_requests import bunk_camper_ids
+from bunk_logs.api.dashboards.group_roster import build_group_roster
+from bunk_logs.core import roster_snapshot as roster_snapshot_module
+from bunk_logs.core.models import AssignmentGroup
+from bunk_logs.core.models import AssignmentGroupMembership
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+from bunk_logs.core.roster_snapshot import roster_snapshot
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def org():
+    return Organization.objects.create(name="Roster Camp", slug="roster-camp")
+
+
+@pytest.fixture
+def program(org):
+    return Program.all_objects.create(
+        organization=org, name="Roster Summer 2026", slug="summer-2026",
+        program_type="summer_camp",
+        start_date=date(2026, 6, 1), end_date=date(2026, 8, 31),
+    )
+
+
+@pytest.fixture
+def unit(org, program):
+    return AssignmentGroup.all_objects.create(
+        organization=org, program=program, name="Unit Aleph", slug="unit-aleph", group_type="unit",
+    )
+
+
+@pytest.fixture
+def bunk(org, program, unit):
+    return AssignmentGroup.all_objects.create(
+        organization=org, program=program, name="Bunk Cedar", slug="bunk-cedar",
+        group_type="bunk", parent=unit,
+    )
+
+
+def _person(org, first, last):
+    return Person.all_objects.create(organization=org, first_name=first, last_name=last)
+
+
+def _add(group, person, role_in_group):
+    return AssignmentGroupMembership.all_objects.create(
+        group=group, person=person, role_in_group=role_in_group, is_active=True,
+    )
+
+
+def test_snapshot_maps_groups_to_ordered_people(org, program, unit, bunk):
+    zed = _add(bunk, _person(org, "Ari", "Zed"), "subject").person
+    abel = _add(bunk, _person(org, "Noa", "Abel"), "subject").person
+    counselor = _add(bunk, _person(org, "Mira", "Sandberg"), "author").person
+
+    snapshot = roster_snapshot(program.id)
+
+    assert snapshot.subject_ids(bunk.id) == [abel.id, zed.id]
+    assert snapshot.author_ids(bunk.id) == [counselor.id]
+    assert snapshot.parent_id(bunk.id) == unit.id
+    assert snapshot.author_group_ids(counselor.id, group_type="bunk") == [bunk.id]
+    assert snapshot.author_group_ids(counselor.id, group_type="unit") == []
+
+
+def test_warm_snapshot_needs_no_queries(org, program, bunk, django_assert_num_queries):
+    _add(bunk, _person(org, "Noa", "Abel"), "subject")
+    roster_snapshot(program.id)
+
+    with django_assert_num_queries(0):
+        assert len(roster_snapshot(program.id).subject_ids(bunk.id)) == 1
+        assert len(bunk_camper_ids(bunk)) == 1
+
+
+def test_roster_writes_invalidate(org, program, bunk):
+    camper = _person(org, "Noa", "Abel")
+    assert roster_snapshot(program.id).subject_ids(bunk.id) == []
+
+    row = _add(bunk, camper, "subject")
+    assert roster_snapshot(program.id).subject_ids(bunk.id) == [camper.id]
+
+    row.is_active = False
+    row.save()
+    assert roster_snapshot(program.id).subject_ids(bunk.id) == []
+
+    row.delete()
+    counselor = _add(bunk, _person(org, "Mira", "Sandberg"), "author").person
+    assert roster_snapshot(program.id).author_group_ids(counselor.id) == [bunk.id]
+
+    bunk.is_active = False
+    bunk.save()
+    assert roster_snapshot(program.id).author_group_ids(counselor.id) == []
+
+
+def test_rename_resorts_after_ttl(org, program, bunk, settings, monkeypatch):
+    settings.ROSTER_SNAPSHOT_CACHE_SECONDS = 60
+    abel = _add(bunk, _person(org, "Noa", "Abel"), "subject").person
+    zed = _add(bunk, _person(org, "Ari", "Zed"), "subject").person
+    assert roster_snapshot(program.id).subject_ids(bunk.id) == [abel.id, zed.id]
+
+    Person.all_objects.filter(pk=zed.pk).update(last_name="Aaron")
+    assert roster_snapshot(program.id).subject_ids(bunk.id) == [abel.id, zed.id]
+
+    now = roster_snapshot_module.time.time()
+    monkeypatch.setattr(roster_snapshot_module.time, "time", lambda: now + 61)
+    assert roster_snapshot(program.id).subject_ids(bunk.id) == [zed.id, abel.id]
+
+
+def test_group_roster_lists_authors_then_subjects(org, program, bunk):
+    _add(bunk, _person(org, "Noa", "Abel"), "subject")
+    _add(bunk, _person(org, "Mira", "Sandberg"), "author")
+
+    roster = build_group_roster(group=bunk, program=program)
+
+    assert [(m["name"], m["role_in_group"]) for m in roster] == [
+        ("Mira Sandberg", "author"),
+        ("Noa Abel", "subject"),
+    ]
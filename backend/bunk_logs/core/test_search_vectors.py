@@ -0,0 +1,145 @@
+"""Tests for the stored ``search_vector`` columns behind admin search.
+
+Covers the save-time refresh (and its ``update_fields`` short-circuit), a
+Spanish reflection becoming findable by English words once its
+translation completes, and the backfill command filling rows written
+through ``.update()``.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+
+from bunk_logs.core.models import MaintenanceTicket
+from bunk_logs.core.models import Order
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import Person
+from bunk_logs.core.models import Program
+from bunk_logs.core.models import Reflection
+from bunk_logs.core.models import ReflectionTemplate
+from bunk_logs.core.models import TranslationRecord
+from bunk_logs.core.search_vectors import search_query
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def org():
+    return Organization.objects.create(name="Search Org", slug="search-org")
+
+
+@pytest.fixture
+def program(org):
+    return Program.all_objects.create(
+        organization=org,
+        name="Search Org Summer",
+        slug="search-summer",
+        program_type="summer_camp",
+        start_date=date(2026, 6, 1),
+        end_date=date(2026, 8, 31),
+    )
+
+
+@pytest.fixture
+def template(org):
+    return ReflectionTemplate.all_objects.create(
+        organization=org,
+        name="Counselor Daily",
+        slug="search-counselor-daily",
+        description="Nightly check-in for bunk counselors",
+        cadence="daily",
+        role="counselor",
+        program_type="summer_camp",
+        schema={"fields": [{"key": "highlights", "type": "textarea"}]},
+        is_active=True,
+    )
+
+
+@pytest.fixture
+def author(org):
+    return Person.all_objects.create(organization=org, first_name="Ana", last_name="Lopez")
+
+
+def _reflection(org, program, template, author, answers, language="es"):
+    return Reflection.all_objects.create(
+        organization=org,
+        program=program,
+        template=template,
+        subject=author,
+        author=author,
+        period_start=date(2026, 7, 1),
+        period_end=date(2026, 7, 7),
+        answers=answers,
+        language=language,
+    )
+
+
+def _matches(model, raw: str) -> list:
+    return list(model._base_manager.filter(search_vector=search_query(raw)).values_list("pk", flat=True))
+
+
+class TestRefreshOnSave:
+    def test_order_vector_stems_english(self, org, program):
+        order = Order.all_objects.create(
+            organization=org, program=program, item="Flashlights", description="Batteries running low",
+        )
+        assert _matches(Order, "flashlight") == [order.pk]
+        assert _matches(Order, "battery") == [order.pk]
+
+    def test_ticket_and_template_are_indexed(self, org, program, template):
+        ticket = MaintenanceTicket.all_objects.create(
+            organization=org, program=program, title="Leaking sink", location="Cabin 4",
+        )
+        assert _matches(MaintenanceTicket, "leak") == [ticket.pk]
+        assert _matches(ReflectionTemplate, "counselors") == [template.pk]
+
+    def test_edit_replaces_vector(self, org, program):
+        order = Order.all_objects.create(organization=org, program=program, item="Tent pegs")
+        order.item = "Sleeping bags"
+        order.save()
+        assert _matches(Order, "tent") == []
+        assert _matches(Order, "sleeping") == [order.pk]
+
+    def test_unrelated_update_fields_skip_refresh(self, org, program):
+        order = Order.all_objects.create(organization=org, program=program, item="Canoe")
+        Order.all_objects.filter(pk=order.pk).update(search_vector=None)
+        order.save(update_fields=["updated_at"])
+        order.refresh_from_db()
+        assert order.search_vector is None
+
+
+class TestReflectionVector:
+    def test_spanish_answers_match_spanish_stems(self, org, program, template, author):
+        reflection = _reflection(org, program, template, author, {"highlights": "Los campistas nadaron"})
+        assert _matches(Reflection, "campistas") == [reflection.pk]
+
+    def test_completed_translation_makes_english_terms_findable(self, org, program, template, author):
+        reflection = _reflection(org, program, template, author, {"highlights": "Hoy fue un buen día."})
+        record = TranslationRecord.objects.create(
+            organization=org,
+            content_type="reflection",
+            content_id=str(reflection.pk),
+            source_language="es",
+            translated_text="Today was a wonderful day.",
+        )
+        assert _matches(Reflection, "wonderful") == []
+
+        record.status = TranslationRecord.Status.COMPLETED
+        record.save()
+
+        assert _matches(Reflection, "wonderful") == [reflection.pk]
+
+
+class TestBackfillCommand:
+    def test_fills_missing_vectors(self, org, program, template):
+        order = Order.all_objects.create(organization=org, program=program, item="Paddles")
+        Order.all_objects.filter(pk=order.pk).update(search_vector=None)
+        ReflectionTemplate.all_objects.filter(pk=template.pk).update(search_vector=None)
+
+        call_command("backfill_search_vectors", "--only-missing", "--batch-size", "1")
+
+        assert _matches(Order, "paddle") == [order.pk]
+        assert _matches(ReflectionTemplate, "nightly") == [template.pk]
@@ -0,0 +1,77 @@
+"""Tests for the memoized template schema views (:mod:`bunk_logs.core.template_view`)."""
+
+from __future__ import annotations
+
+import pytest
+
+from bunk_logs.core.models import Organization
+from bunk_logs.core.models import ReflectionTemplate
+from bunk_logs.core.reflection_scores import find_field_by_dashboard_role
+from bunk_logs.core.reflection_scores import iter_grid_fields
+from bunk_logs.core.reflection_scores import iter_scored_fields
+from bunk_logs.core.template_view import compile_template_view
+from bunk_logs.core.template_view import template_view
+
+SCHEMA = {
+    "fields": [
+        {"type": "section_header", "key": "intro"},
+        {"key": "overall", "type": "single_rating", "scale": [1, 4], "dashboard_role": "primary_rating"},
+        {
+            "key": "areas",
+            "type": "rating_group",
+            "categories": [{"key": "social", "labels": {"en": "Social", "es": "Social"}}, "bad"],
+            "thread_enabled": True,
+        },
+        {
+            "key": "notes", "type": "textarea", "dashboard_role": "open_concern",
+            "prompts": {"en": "Notes", "es": "Notas"}, "share_with_cohort": True,
+        },
+        "not-a-field",
+        {"type": "text"},
+    ],
+}
+
+
+def test_compiled_projections():
+    view = compile_template_view(SCHEMA)
+
+    assert [label for _f, label, _sm in view.scored_fields] == ["overall", "areas__social"]
+    assert [(label, sm) for _f, label, sm in view.grid_fields] == [
+        ("overall", 4), ("areas__social", 5), ("notes", None),
+    ]
+    assert view.by_dashboard_role["open_concern"]["key"] == "notes"
+    assert [f["key"] for f in view.concern_fields] == ["overall", "areas", "notes"]
+    assert [f["key"] for f in view.threaded_fields] == ["areas"]
+    assert [f["key"] for f in view.shared_fields] == ["notes"]
+    assert view.localized_schema("es")["fields"][3]["prompts"] == {"es": "Notas"}
+    first = view.localized_schema("es")
+    first["fields"].clear()
+    assert view.localized_schema("es")["fields"][3]["prompts"] == {"es": "Notas"}
+
+
+def test_empty_and_malformed_schemas():
+    for schema in (None, {}, {"fields": {"a": 1}}):
+        view = compile_template_view(schema)
+        assert view.fields == ()
+        assert view.grid_fields == ()
+
+
+@pytest.mark.django_db
+def test_memoized_per_template_version_and_schema():
+    org = Organization.objects.create(name="View Org", slug="view-org")
+    template = ReflectionTemplate.all_objects.create(
+        organization=org, name="T", slug="view-t", cadence="daily", schema=SCHEMA,
+    )
+
+    first = template_view(template)
+    assert template_view(ReflectionTemplate.all_objects.get(pk=template.pk)) is first
+    assert find_field_by_dashboard_role(template, "primary_rating")["key"] == "overall"
+    assert list(iter_scored_fields(template)) == list(first.scored_fields)
+    assert list(iter_grid_fields(template)) == list(first.grid_fields)
+
+    # A draft edited in place keeps its version; the save evicts its views.
+    template.schema = {"fields": [SCHEMA["fields"][1]]}
+    template.save(update_fields=["schema"])
+    edited = template_view(ReflectionTemplate.all_objects.get(pk=template.pk))
+    assert edited is not first
+    assert [label for _f, label, _sm in edited.scored_fields] == ["overall"]
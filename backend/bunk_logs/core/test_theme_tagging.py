@@ -33,8 +33,11 @@ from bunk_logs.core.models import ReflectionTemplate
 from bunk_logs.core.models import ReflectionThemeTag
 from bunk_logs.core.models import ReflectionThemeTagging
 from bunk_logs.core.theme_tagging import tasks as tasks_module
+from bunk_logs.core.theme_tagging.client import ThemeTaggingBatchResult
 from bunk_logs.core.theme_tagging.client import ThemeTaggingFailureError
 from bunk_logs.core.theme_tagging.client import ThemeTaggingResult
+from bunk_logs.core.theme_tagging.client import estimate_tokens
+from bunk_logs.core.theme_tagging.client import tag_reflection_batch
 from bunk_logs.core.theme_tagging.client import tag_reflection_text
 from bunk_logs.core.theme_tagging.taxonomy import TAXONOMY_VERSION
 from bunk_logs.core.theme_tagging.taxonomy import complexity_tier
@@ -168,6 +171,7 @@ def _reflection(org, program, template, author, *, answers=None):
 class _StubUsage:
     input_tokens: int
     output_tokens: int
+    cache_read_input_tokens: int = 0
 
 
 @dataclass
@@ -177,9 +181,20 @@ class _StubBlock:
 
 
 class _StubResponse:
-    def __init__(self, text: str, *, input_tokens: int = 40, output_tokens: int = 15):
+    def __init__(
+        self,
+        text: str,
+        *,
+        input_tokens: int = 40,
+        output_tokens: int = 15,
+        cache_read_input_tokens: int = 0,
+    ):
         self.content = [_StubBlock(type="text", text=text)]
-        self.usage = _StubUsage(input_tokens=input_tokens, output_tokens=output_tokens)
+        self.usage = _StubUsage(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_input_tokens=cache_read_input_tokens,
+        )
 
 
 class _StubMessages:
@@ -228,10 +243,12 @@ class TestTagReflectionText:
         }
         assert result.model_id == "claude-test"
         assert result.tokens_used == 55
-        # The taxonomy must reach the model, otherwise it is guessing.
-        prompt = stub.messages.calls[0]["messages"][0]["content"]
-        assert "classroom_management" in prompt
-        assert "kids keep fighting" in prompt
+        # The taxonomy must reach the model, otherwise it is guessing. It
+        # rides in the cacheable system prefix; entries go in the user turn.
+        call = stub.messages.calls[0]
+        assert "classroom_management" in call["system"][0]["text"]
+        assert "kids keep fighting" in call["messages"][0]["content"]
+        assert "kids keep fighting" not in call["system"][0]["text"]
 
     def test_unknown_theme_keys_are_dropped(self):
         stub = _StubClient(
@@ -310,6 +327,98 @@ class TestTagReflectionText:
             tag_reflection_text([("wins", "text")])
         assert exc.value.retryable is False
 
+    def test_system_prefix_is_cache_marked_and_cached_reads_counted(self):
+        stub = _StubClient(
+            response=_StubResponse(
+                json.dumps({"1": ["other"]}), cache_read_input_tokens=600,
+            ),
+        )
+        result = tag_reflection_text([("wins", "text")], client=stub)
+        system = stub.messages.calls[0]["system"]
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+        assert result.cached_tokens == 600
+        assert result.tokens_used == 655
+
+    def test_prompt_caching_can_be_disabled(self, settings):
+        settings.THEME_TAGGING_PROMPT_CACHING = False
+        stub = _StubClient(response=_StubResponse(json.dumps({"1": ["other"]})))
+        tag_reflection_text([("wins", "text")], client=stub)
+        assert "cache_control" not in stub.messages.calls[0]["system"][0]
+
+    def test_system_prefix_is_identical_across_calls(self):
+        # Any per-request byte in the prefix would defeat the prompt cache.
+        stub = _StubClient(response=_StubResponse(json.dumps({"1": ["other"]})))
+        tag_reflection_text([("wins", "first")], client=stub)
+        tag_reflection_text([("improvements", "second")], client=stub)
+        first, second = stub.messages.calls
+        assert first["system"] == second["system"]
+
+
+class TestTagReflectionBatch:
+    def test_entries_are_numbered_across_reflections_and_mapped_back(self):
+        stub = _StubClient(
+            response=_StubResponse(
+                json.dumps({
+                    "1": ["classroom_management"],
+                    "2": ["lesson_content"],
+                    "3": ["own_confidence"],
+                }),
+                input_tokens=90,
+                output_tokens=10,
+            ),
+        )
+        result = tag_reflection_batch(
+            [
+                (11, [("question_or_concern", "kids fight"), ("wins", "led prayer")]),
+                (12, [("wins", "spoke up in class")]),
+            ],
+            client=stub,
+        )
+        assert result.themes_by_reflection == {
+            11: {
+                "question_or_concern": ["classroom_management"],
+                "wins": ["lesson_content"],
+            },
+            12: {"wins": ["own_confidence"]},
+        }
+        assert len(stub.messages.calls) == 1
+        assert "3. spoke up in class" in stub.messages.calls[0]["messages"][0]["content"]
+        # Spend is apportioned per reflection and sums to the reported total.
+        assert sum(result.tokens_by_reflection.values()) == result.tokens_used == 100
+
+    def test_reflection_with_no_valid_themes_maps_to_empty(self):
+        stub = _StubClient(response=_StubResponse(json.dumps({"1": ["other"]})))
+        result = tag_reflection_batch(
+            [(1, [("wins", "text")]), (2, [("wins", "more text")])], client=stub,
+        )
+        assert result.themes_by_reflection == {1: {"wins": ["other"]}, 2: {}}
+
+    def test_blank_batch_is_non_retryable(self):
+        with pytest.raises(ThemeTaggingFailureError) as exc:
+            tag_reflection_batch([(1, [("wins", "  ")])], client=_StubClient())
+        assert exc.value.retryable is False
+
+
+class TestEstimateTokens:
+    def test_split_reports_prefix_as_cached(self):
+        estimate = estimate_tokens([("wins", "x" * 400)])
+        assert estimate.cached_input > 0
+        assert estimate.uncached_input == len("Entries:\n1. " + "x" * 400) // 4
+        assert estimate.calls == 1
+        assert estimate.total == (
+            estimate.cached_input + estimate.uncached_input + estimate.output
+        )
+
+    def test_without_caching_prefix_is_uncached(self, settings):
+        cached = estimate_tokens([("wins", "text")])
+        settings.THEME_TAGGING_PROMPT_CACHING = False
+        uncached = estimate_tokens([("wins", "text")])
+        assert uncached.cached_input == 0
+        assert uncached.uncached_input == cached.cached_input + cached.uncached_input
+
+    def test_empty_items_estimate_nothing(self):
+        assert estimate_tokens([]).total == 0
+
 
 # ---------------------------------------------------------------------------
 # Celery task
@@ -442,6 +551,100 @@ class TestTagReflectionThemesTask:
         assert tag.grade_level is None
 
 
+class TestTagReflectionThemesBatchTask:
+    def test_batch_writes_tags_per_reflection(
+        self, org, program, template, author, membership,
+    ):
+        first = _reflection(org, program, template, author)
+        second = _reflection(
+            org, program, template, author,
+            answers={"question_or_concern": "Need more prep time"},
+        )
+        with patch.object(tasks_module, "tag_reflection_batch") as fake:
+            fake.return_value = ThemeTaggingBatchResult(
+                themes_by_reflection={
+                    first.pk: {"wins": ["own_confidence"]},
+                    second.pk: {"question_or_concern": ["logistics_scheduling"]},
+                },
+                tokens_by_reflection={first.pk: 60, second.pk: 40},
+                model_id="claude-test",
+                tokens_used=100,
+            )
+            summary = tasks_module.tag_reflection_themes_batch.run(
+                [first.pk, second.pk],
+            )
+
+        assert fake.call_count == 1
+        assert summary["completed"] == 2
+        assert summary["tags"] == 2
+        assert summary["tokens_used"] == 100
+        for reflection, tokens in ((first, 60), (second, 40)):
+            record = ReflectionThemeTagging.all_objects.get(reflection=reflection)
+            assert record.status == ReflectionThemeTagging.Status.COMPLETED
+            assert record.tokens_used == tokens
+        tag = ReflectionThemeTag.all_objects.get(reflection=second)
+        assert tag.theme_key == "logistics_scheduling"
+        assert tag.grade_level == 11
+
+    def test_empty_reflection_fails_without_sinking_the_batch(
+        self, org, program, template, author, membership,
+    ):
+        tagged = _reflection(org, program, template, author)
+        empty = _reflection(
+            org, program, template, author, answers={"ratings": {"initiative": 3}},
+        )
+        with patch.object(tasks_module, "tag_reflection_batch") as fake:
+            fake.return_value = ThemeTaggingBatchResult(
+                themes_by_reflection={tagged.pk: {"wins": ["other"]}},
+                tokens_by_reflection={tagged.pk: 10},
+                model_id="m",
+                tokens_used=10,
+            )
+            summary = tasks_module.tag_reflection_themes_batch.run(
+                [tagged.pk, empty.pk],
+            )
+
+        assert [pk for pk, _items in fake.call_args.args[0]] == [tagged.pk]
+        assert summary["completed"] == 1
+        assert summary["failed"] == 1
+        assert ReflectionThemeTagging.all_objects.get(
+            reflection=empty,
+        ).status == ReflectionThemeTagging.Status.FAILED_TERMINAL
+
+    def test_retryable_failure_marks_whole_batch_and_retries(
+        self, org, program, template, author, membership,
+    ):
+        reflections = [_reflection(org, program, template, author) for _ in range(2)]
+        with patch.object(tasks_module, "tag_reflection_batch") as fake, \
+             patch.object(
+                 tasks_module.tag_reflection_themes_batch,
+                 "retry",
+                 side_effect=Retry("scheduled"),
+             ):
+            fake.side_effect = ThemeTaggingFailureError("transient", retryable=True)
+            with pytest.raises(Retry):
+                tasks_module.tag_reflection_themes_batch.run(
+                    [r.pk for r in reflections],
+                )
+
+        statuses = set(
+            ReflectionThemeTagging.all_objects.values_list("status", flat=True),
+        )
+        assert statuses == {ReflectionThemeTagging.Status.FAILED_RETRYABLE}
+
+    def test_non_retryable_failure_is_terminal_for_batch(
+        self, org, program, template, author, membership,
+    ):
+        reflection = _reflection(org, program, template, author)
+        with patch.object(tasks_module, "tag_reflection_batch") as fake:
+            fake.side_effect = ThemeTaggingFailureError("bad json", retryable=False)
+            summary = tasks_module.tag_reflection_themes_batch.run([reflection.pk])
+
+        assert summary["status"] == "failed_terminal"
+        record = ReflectionThemeTagging.all_objects.get(reflection=reflection)
+        assert record.status == ReflectionThemeTagging.Status.FAILED_TERMINAL
+
+
 # ---------------------------------------------------------------------------
 # Enqueue helper + taxonomy
 # ---------------------------------------------------------------------------
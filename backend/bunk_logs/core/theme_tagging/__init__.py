@@ -10,14 +10,19 @@ categories, :mod:`client` owns the LLM boundary, :mod:`tasks` owns Celery and
 persistence, :mod:`metrics` owns the observability sink.
 """
 
+from bunk_logs.core.theme_tagging.client import ThemeTaggingBatchResult
 from bunk_logs.core.theme_tagging.client import ThemeTaggingFailureError
 from bunk_logs.core.theme_tagging.client import ThemeTaggingResult
+from bunk_logs.core.theme_tagging.client import TokenEstimate
 from bunk_logs.core.theme_tagging.client import estimate_tokens
+from bunk_logs.core.theme_tagging.client import tag_reflection_batch
 from bunk_logs.core.theme_tagging.client import tag_reflection_text
+from bunk_logs.core.theme_tagging.tasks import enqueue_theme_tagging_batch
 from bunk_logs.core.theme_tagging.tasks import enqueue_theme_tagging_for_reflection
 from bunk_logs.core.theme_tagging.tasks import extract_taggable_items
 from bunk_logs.core.theme_tagging.tasks import is_taggable_reflection
 from bunk_logs.core.theme_tagging.tasks import tag_reflection_themes
+from bunk_logs.core.theme_tagging.tasks import tag_reflection_themes_batch
 from bunk_logs.core.theme_tagging.taxonomy import TAGGED_DASHBOARD_ROLES
 from bunk_logs.core.theme_tagging.taxonomy import TAXONOMY_VERSION
 from bunk_logs.core.theme_tagging.taxonomy import THEME_TAXONOMY_V1
@@ -29,15 +34,20 @@ __all__ = [
     "TAGGED_DASHBOARD_ROLES",
     "TAXONOMY_VERSION",
     "THEME_TAXONOMY_V1",
+    "ThemeTaggingBatchResult",
     "ThemeTaggingFailureError",
     "ThemeTaggingResult",
+    "TokenEstimate",
     "complexity_tier",
+    "enqueue_theme_tagging_batch",
     "enqueue_theme_tagging_for_reflection",
     "estimate_tokens",
     "extract_taggable_items",
     "is_taggable_reflection",
+    "tag_reflection_batch",
     "tag_reflection_text",
     "tag_reflection_themes",
+    "tag_reflection_themes_batch",
     "taxonomy_payload",
     "theme_label",
 ]
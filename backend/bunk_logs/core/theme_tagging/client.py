@@ -8,6 +8,11 @@ Key design choices:
 
 * One request per reflection covering every taggable field at once. Tagging
   fields separately would triple the call count for no accuracy gain.
+  :func:`tag_reflection_batch` goes further for backfills and packs several
+  reflections' entries into one request, mapping results back per reflection.
+* The taxonomy + instructions are a static system prefix marked for Anthropic
+  prompt caching, so repeat calls read it from cache instead of re-billing
+  it as fresh input. Only the numbered entries vary per request.
 * The model is asked for strict JSON and its output is validated against the
   taxonomy: unknown keys are dropped rather than trusted, so a model that
   invents a category can never widen the taxonomy behind our back.
@@ -39,7 +44,14 @@ MAX_TOKENS = 1024
 # pre-flight cost estimate. Not load-bearing for correctness.
 CHARS_PER_TOKEN = 4
 
-TAGGING_PROMPT = (
+# Output ceiling for a multi-reflection request. Scales with batch size (the
+# JSON answer grows per entry) but is capped so one oversized batch cannot
+# run away with the token budget.
+MAX_BATCH_TOKENS = 8192
+
+# Static prefix: identical bytes on every call so Anthropic's prompt cache
+# can serve it. Anything request-specific belongs in ENTRIES_PROMPT.
+TAGGING_INSTRUCTIONS = (
     "You are categorising weekly self-reflections written by Jewish "
     "religious-school teen assistants (Madrichim, grades 8-12) so their "
     "Director can see how concerns differ by grade.\n\n"
@@ -50,13 +62,16 @@ TAGGING_PROMPT = (
     "- Choose at most {max_themes} themes per entry, most relevant first.\n"
     "- Use 'other' only when no other theme genuinely applies.\n"
     "- Judge what the entry is ABOUT, not whether it is positive or negative.\n"
+    "- Judge each entry on its own; neighbouring entries may come from "
+    "different people.\n"
     "- Do not invent theme keys. Do not explain your reasoning.\n\n"
     "Return only a JSON object mapping each entry number (as a string) to an "
     'array of theme keys, e.g. {{"1": ["classroom_management"], '
-    '"2": ["lesson_content", "own_confidence"]}}.\n\n'
-    "Entries:\n{entries}"
+    '"2": ["lesson_content", "own_confidence"]}}.'
 )
 
+ENTRIES_PROMPT = "Entries:\n{entries}"
+
 
 @dataclass(frozen=True)
 class ThemeTaggingResult:
@@ -69,6 +84,55 @@ class ThemeTaggingResult:
     themes_by_field: dict[str, list[str]]
     model_id: str
     tokens_used: int
+    cached_tokens: int = 0
+
+
+@dataclass(frozen=True)
+class ThemeTaggingBatchResult:
+    """Successful response from :func:`tag_reflection_batch`.
+
+    ``themes_by_reflection`` maps each caller-supplied reflection key to a
+    ``themes_by_field`` dict shaped like :attr:`ThemeTaggingResult.themes_by_field`.
+    Reflections the model said nothing valid about map to ``{}``.
+    ``tokens_by_reflection`` apportions the call's token spend by entry
+    length so each ``ReflectionThemeTagging`` row still carries a cost.
+    """
+
+    themes_by_reflection: dict[int, dict[str, list[str]]]
+    tokens_by_reflection: dict[int, int]
+    model_id: str
+    tokens_used: int
+    cached_tokens: int = 0
+
+
+@dataclass(frozen=True)
+class TokenEstimate:
+    """Pre-flight input/output token estimate, split by cacheability.
+
+    ``cached_input`` is the static taxonomy/instruction prefix, which is
+    served from Anthropic's prompt cache after the first call in a run when
+    caching is enabled. ``uncached_input`` is the per-call entries text (plus
+    the prefix when caching is off). ``output`` is the ``max_tokens`` ceiling,
+    so the total is an upper bound. Estimates add, so the backfill command
+    can sum one per call.
+    """
+
+    cached_input: int = 0
+    uncached_input: int = 0
+    output: int = 0
+    calls: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.cached_input + self.uncached_input + self.output
+
+    def __add__(self, other: TokenEstimate) -> TokenEstimate:
+        return TokenEstimate(
+            cached_input=self.cached_input + other.cached_input,
+            uncached_input=self.uncached_input + other.uncached_input,
+            output=self.output + other.output,
+            calls=self.calls + other.calls,
+        )
 
 
 class ThemeTaggingFailureError(Exception):
@@ -91,56 +155,80 @@ def _taxonomy_block() -> str:
     )
 
 
+def _prompt_caching_enabled() -> bool:
+    return bool(getattr(settings, "THEME_TAGGING_PROMPT_CACHING", True))
+
+
+def _system_prompt() -> str:
+    return TAGGING_INSTRUCTIONS.format(
+        taxonomy=_taxonomy_block(),
+        max_themes=MAX_THEMES_PER_FIELD,
+    )
+
+
+def _system_blocks() -> list[dict]:
+    """System prompt as content blocks, cache-marked when caching is on.
+
+    The ``cache_control`` breakpoint sits on the only system block, so the
+    cached prefix is exactly the taxonomy + instructions.
+    """
+    block: dict = {"type": "text", "text": _system_prompt()}
+    if _prompt_caching_enabled():
+        block["cache_control"] = {"type": "ephemeral"}
+    return [block]
+
+
 def _build_prompt(items: list[tuple[str, str]]) -> str:
+    """Per-request user message: just the numbered entries."""
     entries = "\n".join(
         f"{index}. {text}" for index, (_field_key, text) in enumerate(items, start=1)
     )
-    return TAGGING_PROMPT.format(
-        taxonomy=_taxonomy_block(),
-        max_themes=MAX_THEMES_PER_FIELD,
-        entries=entries,
-    )
+    return ENTRIES_PROMPT.format(entries=entries)
+
+
+def _batch_max_tokens(reflection_count: int) -> int:
+    return min(MAX_TOKENS * max(1, reflection_count), MAX_BATCH_TOKENS)
 
 
-def estimate_tokens(items: list[tuple[str, str]]) -> int:
-    """Rough input-token estimate for a single tagging call.
+def estimate_tokens(
+    items: list[tuple[str, str]], *, reflection_count: int = 1,
+) -> TokenEstimate:
+    """Rough token estimate for a single tagging call over ``items``.
 
     Used by ``backfill_reflection_themes`` to print a pre-flight cost
     figure. Deliberately crude -- it exists so an operator does not fire a
-    few thousand LLM calls blind.
+    few thousand LLM calls blind. ``reflection_count`` is how many
+    reflections' entries ``items`` spans (it sizes the output ceiling for
+    batched calls).
     """
     if not items:
-        return 0
-    prompt = _build_prompt(items)
-    return max(1, len(prompt) // CHARS_PER_TOKEN) + MAX_TOKENS
-
-
-def tag_reflection_text(
-    items: list[tuple[str, str]],
-    *,
-    model_id: str | None = None,
-    client=None,
-) -> ThemeTaggingResult:
-    """Tag ``items`` -- a list of ``(field_key, text)`` pairs -- with themes.
+        return TokenEstimate()
+    prefix = max(1, len(_system_prompt()) // CHARS_PER_TOKEN)
+    entries = max(1, len(_build_prompt(items)) // CHARS_PER_TOKEN)
+    output = _batch_max_tokens(reflection_count)
+    if _prompt_caching_enabled():
+        return TokenEstimate(
+            cached_input=prefix, uncached_input=entries, output=output, calls=1,
+        )
+    return TokenEstimate(uncached_input=prefix + entries, output=output, calls=1)
 
-    Returns a :class:`ThemeTaggingResult` whose ``themes_by_field`` only ever
-    contains keys from the current taxonomy. Raises
-    :class:`ThemeTaggingFailureError` on any error; the ``retryable`` flag
-    tells the Celery wrapper which retry path to take.
 
-    ``client`` is an optional pre-built Anthropic client (used by tests to
-    inject a stub without monkey-patching the SDK). ``model_id`` overrides
-    the configured ``ANTHROPIC_THEME_TAGGING_MODEL`` when provided.
-    """
-    cleaned = [
+def _clean_items(items: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    return [
         (field_key, text.strip())
         for field_key, text in items
         if isinstance(text, str) and text.strip()
     ]
-    if not cleaned:
-        msg = "tag_reflection_text: no non-empty text to tag"
-        raise ThemeTaggingFailureError(msg, retryable=False)
 
+
+def _call_model(
+    entries: list[tuple[str, str]],
+    *,
+    model_id: str | None,
+    client,
+    max_tokens: int,
+):
+    """Send one tagging request; returns ``(model, response, parsed_json)``."""
     model = model_id or getattr(
         settings, "ANTHROPIC_THEME_TAGGING_MODEL", DEFAULT_MODEL,
     )
@@ -148,12 +236,12 @@ def tag_reflection_text(
     if client is None:
         client = _build_client()
 
-    prompt = _build_prompt(cleaned)
     try:
         response = client.messages.create(
             model=model,
-            max_tokens=MAX_TOKENS,
-            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            system=_system_blocks(),
+            messages=[{"role": "user", "content": _build_prompt(entries)}],
         )
     except Exception as exc:
         # network / status / decoding errors all surface here. Treat as
@@ -167,15 +255,115 @@ def tag_reflection_text(
         msg = "Anthropic returned an empty theme-tagging response."
         raise ThemeTaggingFailureError(msg, retryable=True)
 
-    parsed = _parse_response(raw)
-    themes_by_field = _validate_themes(parsed, cleaned)
+    return model, response, _parse_response(raw)
+
+
+def tag_reflection_text(
+    items: list[tuple[str, str]],
+    *,
+    model_id: str | None = None,
+    client=None,
+) -> ThemeTaggingResult:
+    """Tag ``items`` -- a list of ``(field_key, text)`` pairs -- with themes.
+
+    Returns a :class:`ThemeTaggingResult` whose ``themes_by_field`` only ever
+    contains keys from the current taxonomy. Raises
+    :class:`ThemeTaggingFailureError` on any error; the ``retryable`` flag
+    tells the Celery wrapper which retry path to take.
+
+    ``client`` is an optional pre-built Anthropic client (used by tests to
+    inject a stub without monkey-patching the SDK). ``model_id`` overrides
+    the configured ``ANTHROPIC_THEME_TAGGING_MODEL`` when provided.
+    """
+    cleaned = _clean_items(items)
+    if not cleaned:
+        msg = "tag_reflection_text: no non-empty text to tag"
+        raise ThemeTaggingFailureError(msg, retryable=False)
+
+    model, response, parsed = _call_model(
+        cleaned, model_id=model_id, client=client, max_tokens=MAX_TOKENS,
+    )
+    themes_by_position = _validate_themes(parsed, len(cleaned))
     return ThemeTaggingResult(
-        themes_by_field=themes_by_field,
+        themes_by_field=_themes_by_field(themes_by_position, cleaned),
         model_id=model,
         tokens_used=_extract_tokens(response),
+        cached_tokens=_extract_cached_tokens(response),
     )
 
 
+def tag_reflection_batch(
+    batch: list[tuple[int, list[tuple[str, str]]]],
+    *,
+    model_id: str | None = None,
+    client=None,
+) -> ThemeTaggingBatchResult:
+    """Tag several reflections' items in one request.
+
+    ``batch`` is a list of ``(reflection_key, items)`` where ``items`` has
+    the same ``(field_key, text)`` shape :func:`tag_reflection_text` takes.
+    Entries are numbered consecutively across the whole batch and mapped
+    back afterwards, so the prompt and response format are identical to the
+    single-reflection call. Reflections with no non-empty text are left out
+    of the request and of the result; callers treat them as empty sources.
+    """
+    flat: list[tuple[str, str]] = []
+    owners: list[int] = []
+    for reflection_key, items in batch:
+        for field_key, text in _clean_items(items):
+            flat.append((field_key, text))
+            owners.append(reflection_key)
+    if not flat:
+        msg = "tag_reflection_batch: no non-empty text to tag"
+        raise ThemeTaggingFailureError(msg, retryable=False)
+
+    reflection_keys = list(dict.fromkeys(owners))
+    model, response, parsed = _call_model(
+        flat,
+        model_id=model_id,
+        client=client,
+        max_tokens=_batch_max_tokens(len(reflection_keys)),
+    )
+    themes_by_position = _validate_themes(parsed, len(flat))
+
+    themes_by_reflection: dict[int, dict[str, list[str]]] = {
+        key: {} for key in reflection_keys
+    }
+    for position, themes in themes_by_position.items():
+        field_key = flat[position - 1][0]
+        themes_by_reflection[owners[position - 1]][field_key] = themes
+
+    tokens_used = _extract_tokens(response)
+    return ThemeTaggingBatchResult(
+        themes_by_reflection=themes_by_reflection,
+        tokens_by_reflection=_apportion_tokens(tokens_used, flat, owners),
+        model_id=model,
+        tokens_used=tokens_used,
+        cached_tokens=_extract_cached_tokens(response),
+    )
+
+
+def _apportion_tokens(
+    tokens_used: int, flat: list[tuple[str, str]], owners: list[int],
+) -> dict[int, int]:
+    """Split a batched call's spend across reflections by entry length.
+
+    Any rounding remainder goes to the first reflection so the per-row
+    figures always sum to what Anthropic reported.
+    """
+    weights: dict[int, int] = {}
+    for (_field_key, text), owner in zip(flat, owners, strict=True):
+        weights[owner] = weights.get(owner, 0) + len(text)
+    total_weight = sum(weights.values()) or 1
+    shares = {
+        owner: tokens_used * weight // total_weight
+        for owner, weight in weights.items()
+    }
+    first = next(iter(shares))
+    shares[first] += tokens_used - sum(shares.values())
+    return shares
+
+
 def _parse_response(raw: str) -> dict:
     """Parse the model's JSON, tolerating a markdown code fence around it."""
     candidate = raw.strip()
@@ -195,26 +383,23 @@ def _parse_response(raw: str) -> dict:
     return parsed
 
 
-def _validate_themes(
-    parsed: dict, items: list[tuple[str, str]],
-) -> dict[str, list[str]]:
-    """Map the model's 1-indexed entry numbers back to field keys.
+def _validate_themes(parsed: dict, entry_count: int) -> dict[int, list[str]]:
+    """Validate the model's 1-indexed entry map against the taxonomy.
 
     Unknown theme keys and out-of-range entry numbers are dropped with a
     warning rather than raising: a partially-usable tagging beats discarding
     the whole reflection because the model hallucinated one category.
     """
-    out: dict[str, list[str]] = {}
+    out: dict[int, list[str]] = {}
     for raw_index, raw_themes in parsed.items():
         try:
             position = int(str(raw_index).strip())
         except (TypeError, ValueError):
             logger.warning("theme tagging: non-numeric entry key %r", raw_index)
             continue
-        if not 1 <= position <= len(items):
+        if not 1 <= position <= entry_count:
             logger.warning("theme tagging: entry %s out of range", position)
             continue
-        field_key = items[position - 1][0]
 
         if isinstance(raw_themes, str):
             raw_themes = [raw_themes]
@@ -233,10 +418,19 @@ def _validate_themes(
             if key not in seen:
                 seen.append(key)
         if seen:
-            out[field_key] = seen[:MAX_THEMES_PER_FIELD]
+            out[position] = seen[:MAX_THEMES_PER_FIELD]
     return out
 
 
+def _themes_by_field(
+    themes_by_position: dict[int, list[str]], items: list[tuple[str, str]],
+) -> dict[str, list[str]]:
+    return {
+        items[position - 1][0]: themes
+        for position, themes in themes_by_position.items()
+    }
+
+
 def _build_client():
     """Lazily import + construct the Anthropic SDK client.
 
@@ -287,12 +481,31 @@ def _extract_text(response) -> str:
 
 
 def _extract_tokens(response) -> int:
+    """Total tokens billed for the call, cached prefix reads/writes included.
+
+    With prompt caching Anthropic reports the cached prefix separately from
+    ``input_tokens``; folding it back in keeps ``tokens_used`` comparable
+    with rows tagged before caching existed.
+    """
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return 0
+    return sum(
+        int(getattr(usage, attr, 0) or 0)
+        for attr in (
+            "input_tokens",
+            "output_tokens",
+            "cache_creation_input_tokens",
+            "cache_read_input_tokens",
+        )
+    )
+
+
+def _extract_cached_tokens(response) -> int:
     usage = getattr(response, "usage", None)
     if usage is None:
         return 0
-    in_tokens = getattr(usage, "input_tokens", 0) or 0
-    out_tokens = getattr(usage, "output_tokens", 0) or 0
-    return int(in_tokens) + int(out_tokens)
+    return int(getattr(usage, "cache_read_input_tokens", 0) or 0)
 
 
 def _looks_like_auth_error(exc: Exception) -> bool:
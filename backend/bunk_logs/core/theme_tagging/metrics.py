@@ -19,6 +19,8 @@ METRIC_SUBMITTED = "bunklogs.theme_tagging.submitted"
 METRIC_COMPLETED = "bunklogs.theme_tagging.completed"
 METRIC_FAILED = "bunklogs.theme_tagging.failed"
 METRIC_TOKENS_USED = "bunklogs.theme_tagging.tokens_used"
+METRIC_CACHED_TOKENS = "bunklogs.theme_tagging.cached_tokens"
+METRIC_BATCH_SIZE = "bunklogs.theme_tagging.batch_size"
 
 
 def _emit_counter(name: str, value: int = 1, tags: Iterable[str] | None = None) -> None:
@@ -78,3 +80,17 @@ def record_failed(taxonomy_version: str, *, reason: str, terminal: bool) -> None
         f"terminal:{'true' if terminal else 'false'}",
     ]
     _emit_counter(METRIC_FAILED, tags=tags)
+
+
+def record_call(
+    taxonomy_version: str, *, reflection_count: int, cached_tokens: int,
+) -> None:
+    """Per-Anthropic-call figures: batch width and prompt-cache reads.
+
+    ``record_completed`` is per reflection; this is per request, so the
+    dashboard can show how much batching and caching are actually saving.
+    """
+    tags = _base_tags(taxonomy_version)
+    _emit_distribution(METRIC_BATCH_SIZE, reflection_count, tags=tags)
+    if cached_tokens:
+        _emit_distribution(METRIC_CACHED_TOKENS, cached_tokens, tags=tags)
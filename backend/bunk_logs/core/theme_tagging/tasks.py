@@ -5,6 +5,9 @@
   replaces the :class:`ReflectionThemeTag` rows for the current taxonomy
   version. Retries with the same 1/5/30-minute backoff as auto-translation;
   jumps straight to ``failed_terminal`` for non-retryable errors.
+* :func:`tag_reflection_themes_batch` -- backfill task. Same persistence and
+  retry rules, but tags several reflections in one Anthropic call; the whole
+  batch succeeds, retries or fails together.
 * :func:`enqueue_theme_tagging_for_reflection` -- application-side helper
   that revokes any pending task and enqueues a fresh one (re-tagging on
   edit), gated on the template allowlist so tagging cost stays bounded.
@@ -24,7 +27,10 @@ from bunk_logs.core.models import Reflection
 from bunk_logs.core.models import ReflectionThemeTag
 from bunk_logs.core.models import ReflectionThemeTagging
 from bunk_logs.core.theme_tagging.client import ThemeTaggingFailureError
+from bunk_logs.core.theme_tagging.client import ThemeTaggingResult
+from bunk_logs.core.theme_tagging.client import tag_reflection_batch
 from bunk_logs.core.theme_tagging.client import tag_reflection_text
+from bunk_logs.core.theme_tagging.metrics import record_call
 from bunk_logs.core.theme_tagging.metrics import record_completed
 from bunk_logs.core.theme_tagging.metrics import record_failed
 from bunk_logs.core.theme_tagging.metrics import record_submitted
@@ -43,6 +49,17 @@ def _soft_time_limit() -> int:
     return int(getattr(settings, "THEME_TAGGING_TASK_SOFT_TIME_LIMIT_SECONDS", 30))
 
 
+def _batch_soft_time_limit() -> int:
+    return int(
+        getattr(settings, "THEME_TAGGING_BATCH_TASK_SOFT_TIME_LIMIT_SECONDS", 120),
+    )
+
+
+def batch_size() -> int:
+    """Reflections per Anthropic call for backfills (``1`` disables batching)."""
+    return max(1, int(getattr(settings, "THEME_TAGGING_BATCH_SIZE", 10)))
+
+
 def _max_retries() -> int:
     return int(getattr(settings, "THEME_TAGGING_TASK_MAX_RETRIES", 3))
 
@@ -114,6 +131,33 @@ def resolve_grade_level(reflection: Reflection) -> int | None:
     )
 
 
+def resolve_grade_levels(reflections: list[Reflection]) -> dict[int, int | None]:
+    """Bulk :func:`resolve_grade_level`: one Membership query for a batch.
+
+    Returns ``{reflection_id: grade_level}`` with the same precedence as the
+    single-reflection resolver (active first, then most recent).
+    """
+    pairs = {
+        (r.program_id, r.author_id)
+        for r in reflections
+        if r.program_id and r.author_id
+    }
+    grades: dict[tuple[int, int], int] = {}
+    if pairs:
+        rows = (
+            Membership.all_objects.filter(
+                program_id__in={program_id for program_id, _ in pairs},
+                person_id__in={person_id for _, person_id in pairs},
+                grade_level__isnull=False,
+            )
+            .order_by("-is_active", "-created_at")
+            .values_list("program_id", "person_id", "grade_level")
+        )
+        for program_id, person_id, grade_level in rows:
+            grades.setdefault((program_id, person_id), grade_level)
+    return {r.pk: grades.get((r.program_id, r.author_id)) for r in reflections}
+
+
 def _dashboard_roles(reflection: Reflection) -> dict[str, str]:
     return {
         field["key"]: field["dashboard_role"]
@@ -152,23 +196,7 @@ def tag_reflection_themes(self, reflection_id: int) -> dict:
         return {"status": "skipped", "reason": "template_not_tagged"}
 
     record_submitted(TAXONOMY_VERSION)
-
-    record = ReflectionThemeTagging.latest_for(reflection_id, TAXONOMY_VERSION)
-    if record is None:
-        record = ReflectionThemeTagging.all_objects.create(
-            organization=reflection.organization,
-            reflection=reflection,
-            taxonomy_version=TAXONOMY_VERSION,
-            status=ReflectionThemeTagging.Status.PENDING,
-            celery_task_id=self.request.id or "",
-        )
-    else:
-        ReflectionThemeTagging.all_objects.filter(pk=record.pk).update(
-            status=ReflectionThemeTagging.Status.PENDING,
-            celery_task_id=self.request.id or "",
-            updated_at=timezone.now(),
-        )
-        record.refresh_from_db()
+    record = _start_record(reflection, self.request.id)
 
     items = extract_taggable_items(reflection)
     if not items:
@@ -206,11 +234,148 @@ def tag_reflection_themes(self, reflection_id: int) -> dict:
             exc=exc, countdown=countdown, max_retries=_max_retries() - 1,
         )
 
-    tag_count = _persist_tags(record, reflection, result)
+    record_call(
+        TAXONOMY_VERSION, reflection_count=1, cached_tokens=result.cached_tokens,
+    )
+    tag_count = _persist_tags(
+        record, reflection, result, grade_level=resolve_grade_level(reflection),
+    )
+    _complete(record, model_id=result.model_id, tokens_used=result.tokens_used)
+    record_completed(
+        TAXONOMY_VERSION, tokens_used=result.tokens_used, tag_count=tag_count,
+    )
+    return {
+        "status": "completed",
+        "record_id": str(record.id),
+        "tags": tag_count,
+        "tokens_used": result.tokens_used,
+    }
+
+
+@shared_task(
+    bind=True,
+    name="bunk_logs.core.theme_tagging.tag_reflection_themes_batch",
+    soft_time_limit=120,  # overridden at runtime via apply_async
+)
+def tag_reflection_themes_batch(self, reflection_ids: list[int]) -> dict:
+    """Tag several reflections with one Anthropic call (backfill path).
+
+    Per-reflection outcomes match :func:`tag_reflection_themes` -- one
+    ``ReflectionThemeTagging`` row each, tags replaced idempotently -- but a
+    client failure applies to every reflection in the batch, since they
+    shared the request.
+    """
+    reflections = list(
+        Reflection.all_objects.select_related("organization", "template", "program")
+        .filter(pk__in=reflection_ids)
+        .order_by("pk"),
+    )
+    summary: dict = {
+        "status": "completed",
+        "completed": 0,
+        "failed": 0,
+        "skipped": len(set(reflection_ids)) - len(reflections),
+        "tags": 0,
+        "tokens_used": 0,
+    }
 
+    records: dict[int, ReflectionThemeTagging] = {}
+    items_by_id: dict[int, list[tuple[str, str]]] = {}
+    for reflection in reflections:
+        if not is_taggable_reflection(reflection):
+            summary["skipped"] += 1
+            continue
+        record_submitted(TAXONOMY_VERSION)
+        record = _start_record(reflection, self.request.id)
+        items = extract_taggable_items(reflection)
+        if not items:
+            _fail(record, "Reflection has no taggable free-text answers.", terminal=True)
+            record_failed(TAXONOMY_VERSION, reason="empty_source", terminal=True)
+            summary["failed"] += 1
+            continue
+        records[reflection.pk] = record
+        items_by_id[reflection.pk] = items
+
+    if not items_by_id:
+        return summary
+
+    try:
+        result = tag_reflection_batch(list(items_by_id.items()))
+    except ThemeTaggingFailureError as exc:
+        attempts = 0
+        for record in records.values():
+            record.attempt_count = (record.attempt_count or 0) + 1
+            attempts = max(attempts, record.attempt_count)
+        terminal = not exc.retryable or attempts >= _max_retries()
+        for record in records.values():
+            _fail(record, str(exc), terminal=terminal, bump_attempt=False)
+            record_failed(TAXONOMY_VERSION, reason="client_error", terminal=terminal)
+        if terminal:
+            summary["status"] = "failed_terminal"
+            summary["failed"] += len(records)
+            summary["reason"] = str(exc)[:200]
+            return summary
+        countdown = RETRY_BACKOFF_SECONDS[
+            min(attempts - 1, len(RETRY_BACKOFF_SECONDS) - 1)
+        ]
+        raise self.retry(
+            exc=exc, countdown=countdown, max_retries=_max_retries() - 1,
+        )
+
+    record_call(
+        TAXONOMY_VERSION,
+        reflection_count=len(items_by_id),
+        cached_tokens=result.cached_tokens,
+    )
+    by_id = {reflection.pk: reflection for reflection in reflections}
+    grade_levels = resolve_grade_levels([by_id[pk] for pk in items_by_id])
+    for reflection_id, themes_by_field in result.themes_by_reflection.items():
+        record = records[reflection_id]
+        tokens_used = result.tokens_by_reflection.get(reflection_id, 0)
+        tag_count = _persist_tags(
+            record,
+            by_id[reflection_id],
+            ThemeTaggingResult(
+                themes_by_field=themes_by_field,
+                model_id=result.model_id,
+                tokens_used=tokens_used,
+            ),
+            grade_level=grade_levels.get(reflection_id),
+        )
+        _complete(record, model_id=result.model_id, tokens_used=tokens_used)
+        record_completed(
+            TAXONOMY_VERSION, tokens_used=tokens_used, tag_count=tag_count,
+        )
+        summary["completed"] += 1
+        summary["tags"] += tag_count
+    summary["tokens_used"] = result.tokens_used
+    return summary
+
+
+def _start_record(reflection: Reflection, task_id: str | None) -> ReflectionThemeTagging:
+    """Create or reset the (reflection, taxonomy_version) row to ``pending``."""
+    record = ReflectionThemeTagging.latest_for(reflection.pk, TAXONOMY_VERSION)
+    if record is None:
+        return ReflectionThemeTagging.all_objects.create(
+            organization=reflection.organization,
+            reflection=reflection,
+            taxonomy_version=TAXONOMY_VERSION,
+            status=ReflectionThemeTagging.Status.PENDING,
+            celery_task_id=task_id or "",
+        )
+    ReflectionThemeTagging.all_objects.filter(pk=record.pk).update(
+        status=ReflectionThemeTagging.Status.PENDING,
+        celery_task_id=task_id or "",
+        updated_at=timezone.now(),
+    )
+    record.refresh_from_db()
+    return record
+
+
+def _complete(record, *, model_id: str, tokens_used: int) -> None:
     record.status = ReflectionThemeTagging.Status.COMPLETED
-    record.model_id = result.model_id
-    record.tokens_used = result.tokens_used
+    record.model_id = model_id
+    record.tokens_used = tokens_used
     record.attempt_count = (record.attempt_count or 0) + 1
     record.last_error = ""
     record.save(
@@ -223,26 +388,23 @@ def tag_reflection_themes(self, reflection_id: int) -> dict:
             "updated_at",
         ],
     )
-    record_completed(
-        TAXONOMY_VERSION, tokens_used=result.tokens_used, tag_count=tag_count,
-    )
-    return {
-        "status": "completed",
-        "record_id": str(record.id),
-        "tags": tag_count,
-        "tokens_used": result.tokens_used,
-    }
 
 
-def _persist_tags(record, reflection: Reflection, result) -> int:
+def _persist_tags(
+    record,
+    reflection: Reflection,
+    result,
+    *,
+    grade_level: int | None,
+) -> int:
     """Replace the tag rows for ``record`` with the tagger's output.
 
     Delete-then-insert keeps re-tagging simple and makes the task
     idempotent: whatever the model returned this run is the whole truth for
-    this (reflection, taxonomy_version).
+    this (reflection, taxonomy_version). ``grade_level`` is resolved by the
+    caller so batches can look it up in bulk.
     """
     roles = _dashboard_roles(reflection)
-    grade_level = resolve_grade_level(reflection)
     rows = [
         ReflectionThemeTag(
             tagging=record,
@@ -315,6 +477,21 @@ def enqueue_theme_tagging_for_reflection(reflection: Reflection) -> str | None:
     return async_result_holder.get("id")
 
 
+def enqueue_theme_tagging_batch(reflection_ids: list[int]) -> str:
+    """Enqueue one :func:`tag_reflection_themes_batch` task; returns its id.
+
+    Used by ``backfill_reflection_themes``, which runs outside any request
+    transaction, so no ``on_commit`` deferral is needed here.
+    """
+    soft_time_limit = _batch_soft_time_limit()
+    async_result = tag_reflection_themes_batch.apply_async(
+        args=[list(reflection_ids)],
+        soft_time_limit=soft_time_limit,
+        time_limit=soft_time_limit + 30,
+    )
+    return async_result.id
+
+
 def _revoke_task(task_id: str) -> None:
     """Best-effort task revocation -- swallow broker errors.
 
@@ -0,0 +1,41 @@
+"""Cache backends that report hits and misses to the request instrumentation.
+
+Django's cache API has no hooks, so hit rates are counted by wrapping
+``get`` (and Redis's ``get_many``) of the configured backend. Point ``CACHES`` at the
+instrumented subclass of the backend in use; each lookup is added to the
+current request's :class:`~bunk_logs.utils.instrumentation.RequestStats`
+and is a no-op outside a request.
+"""
+
+from __future__ import annotations
+
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+
+from bunk_logs.utils.instrumentation import record_cache_lookup
+
+_MISSING = object()
+
+
+class InstrumentedCacheMixin:
+    def get(self, key, default=None, version=None, **kwargs):
+        value = super().get(key, _MISSING, version=version, **kwargs)
+        if value is _MISSING:
+            record_cache_lookup(0, 1)
+            return default
+        record_cache_lookup(1, 0)
+        return value
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    def get_many(self, keys, version=None, **kwargs):
+        # One MGET here; the base class's get_many would go through get().
+        keys = list(keys)
+        found = super().get_many(keys, version=version, **kwargs)
+        record_cache_lookup(len(found), len(keys) - len(found))
+        return found
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    # LocMemCache.get_many loops over get(), which already counts.
+    pass
@@ -0,0 +1,189 @@
+"""Per-request query / cache / hot-path instrumentation exported to Datadog.
+
+:class:`RequestMetricsMiddleware` opens a :class:`RequestStats` for every
+request, counts SQL through ``connection.execute_wrapper`` and, once the
+response is built, records through :func:`bunk_logs.utils.metrics.client`
+(tagged ``endpoint`` = URL name, ``method`` and ``status_class``):
+
+* ``bunklogs.request.duration_ms`` / ``.queries`` / ``.db_ms`` /
+  ``.response_bytes`` -- distributions;
+* ``bunklogs.request.cache_hits`` / ``.cache_misses`` -- counters, fed by
+  the cache backends in :mod:`bunk_logs.utils.cache_backends`;
+* ``bunklogs.hot_path.duration_ms`` (tag ``path``) for each
+  :func:`hot_path` section entered while serving the request.
+
+Requests slower than ``REQUEST_METRICS_SLOW_MS`` or issuing at least
+``REQUEST_METRICS_SLOW_QUERIES`` queries are also logged with their
+breakdown, so a regression can be read from the logs without Datadog.
+
+:func:`hot_path` wraps a named hot section as a decorator or ``with``
+block::
+
+    @hot_path("visibility.compile")
+    def reflections_visible_to(user, queryset=None): ...
+
+Outside a request (Celery, management commands) it still emits its
+duration, tagged ``endpoint:none``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import ContextDecorator
+from contextlib import ExitStack
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+from asgiref.local import Local
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from bunk_logs.utils import metrics
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+    from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+_request_local = Local()
+
+
+@dataclass
+class RequestStats:
+    endpoint: str = "unresolved"
+    queries: int = 0
+    db_ms: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    hot_paths: dict[str, float] = field(default_factory=dict)
+
+    def record_query(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_ms += (time.perf_counter() - start) * 1000
+
+
+def current_stats() -> RequestStats | None:
+    """Stats of the request being served on this thread / task, if any."""
+    return getattr(_request_local, "stats", None)
+
+
+def record_cache_lookup(hits: int, misses: int) -> None:
+    stats = current_stats()
+    if stats is not None:
+        stats.cache_hits += hits
+        stats.cache_misses += misses
+
+
+class hot_path(ContextDecorator):  # noqa: N801 -- used as a decorator
+    """Time a named hot section into ``bunklogs.hot_path.duration_ms``."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = 0.0
+
+    def _recreate_cm(self):
+        # A fresh timer per decorated call keeps concurrent calls apart.
+        return type(self)(self.name)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        stats = current_stats()
+        if stats is not None:
+            stats.hot_paths[self.name] = stats.hot_paths.get(self.name, 0.0) + elapsed_ms
+        metrics.client().distribution(
+            "bunklogs.hot_path.duration_ms",
+            elapsed_ms,
+            tags={"path": self.name, "endpoint": stats.endpoint if stats else "none"},
+        )
+        return False
+
+
+def _response_bytes(response: HttpResponse) -> int | None:
+    if getattr(response, "streaming", False):
+        return None
+    return len(response.content)
+
+
+class RequestMetricsMiddleware:
+    """Record query count, DB time, cache hits and response size per view."""
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        stats = RequestStats()
+        _request_local.stats = stats
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(stats.record_query))
+                response = self.get_response(request)
+        finally:
+            del _request_local.stats
+        duration_ms = (time.perf_counter() - start) * 1000
+        if getattr(request, "resolver_match", None) is not None:
+            self._record(request, response, stats, duration_ms)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        stats = current_stats()
+        match = request.resolver_match
+        if stats is not None and match is not None:
+            stats.endpoint = match.view_name or match.route or "unnamed"
+
+    def _record(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        stats: RequestStats,
+        duration_ms: float,
+    ) -> None:
+        client = metrics.client()
+        tags = {
+            "endpoint": stats.endpoint,
+            "method": request.method,
+            "status_class": f"{response.status_code // 100}xx",
+        }
+        client.distribution("bunklogs.request.duration_ms", duration_ms, tags=tags)
+        client.distribution("bunklogs.request.queries", stats.queries, tags=tags)
+        client.distribution("bunklogs.request.db_ms", stats.db_ms, tags=tags)
+        if stats.cache_hits:
+            client.increment("bunklogs.request.cache_hits", stats.cache_hits, tags=tags)
+        if stats.cache_misses:
+            client.increment("bunklogs.request.cache_misses", stats.cache_misses, tags=tags)
+        size = _response_bytes(response)
+        if size is not None:
+            client.distribution("bunklogs.request.response_bytes", size, tags=tags)
+
+        if (
+            duration_ms >= settings.REQUEST_METRICS_SLOW_MS
+            or stats.queries >= settings.REQUEST_METRICS_SLOW_QUERIES
+        ):
+            logger.warning(
+                "Slow request %s %s (%s): %.0f ms, %d queries / %.0f ms DB, "
+                "cache %d hit / %d miss, hot paths %s",
+                request.method,
+                request.path,
+                stats.endpoint,
+                duration_ms,
+                stats.queries,
+                stats.db_ms,
+                stats.cache_hits,
+                stats.cache_misses,
+                {name: round(ms, 1) for name, ms in stats.hot_paths.items()},
+            )
@@ -1,42 +1,188 @@
 """Custom Datadog metrics via DogStatsD UDP.
 
-Sends counters to the Datadog Agent on DD_AGENT_HOST:DD_DOGSTATSD_PORT.
-Silently no-ops when no agent is reachable, so local dev is unaffected.
+Sends to the Datadog Agent on DD_AGENT_HOST:DD_DOGSTATSD_PORT. Silently
+no-ops when no agent is reachable, so local dev is unaffected.
+
+:func:`client` returns the process-wide :class:`DogStatsdClient`. It keeps
+one UDP socket open and aggregates in memory: counters are summed and
+distribution samples collected per (metric, tags) context, then written as
+packed datagrams every ``DD_METRICS_FLUSH_INTERVAL`` seconds (checked on
+each record, and once more at exit). Celery's prefork children skip
+``atexit``, so ``config.celery_app`` connects :func:`flush_after_task` and
+:func:`flush_on_worker_shutdown` to flush from the worker side. The
+per-request instrumentation in :mod:`bunk_logs.utils.instrumentation`
+records through it.
 
 Usage:
     from bunk_logs.utils.metrics import reflection_submitted, user_logged_in
     reflection_submitted(tenant="crane-lake")
     user_logged_in()
+
+    from bunk_logs.utils.metrics import client
+    client().distribution("bunklogs.some.duration_ms", 12.5, tags={"path": "x"})
 """
 
+from __future__ import annotations
+
+import atexit
 import logging
 import os
 import socket
+import threading
+import time
+
+from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Stays under a 1500-byte Ethernet MTU after IP/UDP headers, as the Datadog
+# client libraries do for UDP.
+MAX_PACKET_BYTES = 1432
+SAMPLES_PER_LINE = 50
+
+_client: DogStatsdClient | None = None
+_client_lock = threading.Lock()
+
+
+def _format_tags(tags: dict | None) -> tuple[str, ...]:
+    return tuple(sorted(f"{k}:{v}" for k, v in (tags or {}).items()))
+
+
+class DogStatsdClient:
+    """Buffering, aggregating DogStatsD writer over one persistent socket."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        constant_tags: dict | None = None,
+        flush_interval: float = 10.0,
+    ):
+        self.address = (host, port)
+        self.constant_tags = _format_tags(constant_tags)
+        self.flush_interval = flush_interval
+        self._counters: dict[tuple[str, tuple[str, ...]], float] = {}
+        self._distributions: dict[tuple[str, tuple[str, ...]], list[float]] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._socket: socket.socket | None = None
+        self._socket_pid: int | None = None
+
+    # -- recording ---------------------------------------------------------
+
+    def increment(self, metric: str, value: float = 1, tags: dict | None = None) -> None:
+        key = (metric, _format_tags(tags))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        self._maybe_flush()
+
+    def distribution(self, metric: str, value: float, tags: dict | None = None) -> None:
+        key = (metric, _format_tags(tags))
+        with self._lock:
+            self._distributions.setdefault(key, []).append(value)
+        self._maybe_flush()
+
+    # -- flushing ----------------------------------------------------------
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def _lines(self, counters, distributions) -> list[str]:
+        lines = []
+        for (metric, tags), value in counters.items():
+            lines.append(f"{metric}:{_format_value(value)}|c{self._tag_suffix(tags)}")
+        for (metric, tags), values in distributions.items():
+            suffix = self._tag_suffix(tags)
+            # DogStatsD 1.1 packs several samples of one context into a line.
+            for start in range(0, len(values), SAMPLES_PER_LINE):
+                chunk = ":".join(_format_value(v) for v in values[start:start + SAMPLES_PER_LINE])
+                lines.append(f"{metric}:{chunk}|d{suffix}")
+        return lines
+
+    def _tag_suffix(self, tags: tuple[str, ...]) -> str:
+        all_tags = self.constant_tags + tags
+        return f"|#{','.join(all_tags)}" if all_tags else ""
+
+    def flush(self) -> None:
+        """Write everything buffered so far, packing lines into datagrams."""
+        with self._lock:
+            counters, self._counters = self._counters, {}
+            distributions, self._distributions = self._distributions, {}
+            self._last_flush = time.monotonic()
+        if not counters and not distributions:
+            return
+        packet: list[bytes] = []
+        size = 0
+        for line in self._lines(counters, distributions):
+            encoded = line.encode()
+            if packet and size + 1 + len(encoded) > MAX_PACKET_BYTES:
+                self._write(b"\n".join(packet))
+                packet, size = [], 0
+            packet.append(encoded)
+            size += len(encoded) + (1 if size else 0)
+        if packet:
+            self._write(b"\n".join(packet))
+
+    def _write(self, payload: bytes) -> None:
+        try:
+            self._get_socket().sendto(payload, self.address)
+        except OSError:
+            logger.debug("DogStatsD write to %s:%s failed", *self.address)
+
+    def _get_socket(self) -> socket.socket:
+        # A forked worker must not share its parent's socket.
+        pid = os.getpid()
+        if self._socket is None or self._socket_pid != pid:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setblocking(False)  # noqa: FBT003 -- never stall a request on a full buffer
+            self._socket, self._socket_pid = sock, pid
+        return self._socket
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and not value.is_integer():
+        return f"{value:.3f}".rstrip("0").rstrip(".")
+    return str(int(value))
+
+
+def client() -> DogStatsdClient:
+    """The process-wide client, built from the ``DD_*`` settings on first use."""
+    global _client  # noqa: PLW0603
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = DogStatsdClient(
+                    settings.DD_AGENT_HOST,
+                    settings.DD_DOGSTATSD_PORT,
+                    constant_tags={"env": settings.DD_ENV, "service": settings.DD_SERVICE},
+                    flush_interval=settings.DD_METRICS_FLUSH_INTERVAL,
+                )
+                atexit.register(_client.flush)
+    return _client
+
+
+def _flush_if_started() -> None:
+    if _client is not None:
+        _client.flush()
+
+
+def flush_after_task(**kwargs) -> None:
+    """``task_postrun`` receiver: ship what the task recorded right away."""
+    _flush_if_started()
+
 
-def _send(metric: str, value: int = 1, tags: dict | None = None) -> None:
-    host = os.environ.get("DD_AGENT_HOST", "localhost")
-    port = int(os.environ.get("DD_DOGSTATSD_PORT", "8125"))
-    base_tags = [
-        f"env:{os.environ.get('DD_ENV', 'development')}",
-        f"service:{os.environ.get('DD_SERVICE', 'bunklogs-backend')}",
-    ]
-    extra = [f"{k}:{v}" for k, v in (tags or {}).items()]
-    payload = f"{metric}:{value}|c|#{','.join(base_tags + extra)}".encode()
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-            sock.sendto(payload, (host, port))
-    except OSError:
-        pass
+def flush_on_worker_shutdown(**kwargs) -> None:
+    """``worker_process_shutdown`` receiver: pool children never run ``atexit``."""
+    _flush_if_started()
 
 
 def reflection_submitted(tenant: str = "unknown") -> None:
     """Increment bunklogs.reflections.submitted counter."""
-    _send("bunklogs.reflections.submitted", tags={"tenant": tenant})
+    client().increment("bunklogs.reflections.submitted", tags={"tenant": tenant})
 
 
 def user_logged_in(method: str = "password") -> None:
     """Increment bunklogs.users.logged_in counter."""
-    _send("bunklogs.users.logged_in", tags={"method": method})
+    client().increment("bunklogs.users.logged_in", tags={"method": method})
@@ -0,0 +1,135 @@
+"""Tests for the DogStatsD client and per-request instrumentation."""
+
+import socket
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
+
+from bunk_logs.core.models import Organization
+from bunk_logs.utils import metrics
+from bunk_logs.utils.cache_backends import InstrumentedLocMemCache
+from bunk_logs.utils.instrumentation import RequestMetricsMiddleware
+from bunk_logs.utils.instrumentation import hot_path
+
+
+@pytest.fixture
+def agent():
+    """A UDP socket standing in for the Datadog agent."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(2)
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def statsd(agent, monkeypatch):
+    client = metrics.DogStatsdClient(
+        *agent.getsockname(), constant_tags={"env": "test"}, flush_interval=3600,
+    )
+    monkeypatch.setattr(metrics, "_client", client)
+    return client
+
+
+def _datagrams(agent) -> list[bytes]:
+    out = []
+    agent.settimeout(0.2)
+    try:
+        while True:
+            out.append(agent.recv(65535))
+    except TimeoutError:
+        pass
+    return out
+
+
+def _received(agent) -> list[str]:
+    return [line for d in _datagrams(agent) for line in d.decode().split("\n")]
+
+
+class TestDogStatsdClient:
+    def test_aggregates_until_flush(self, agent, statsd):
+        statsd.increment("bunklogs.test.count", tags={"k": "a"})
+        statsd.increment("bunklogs.test.count", 2, tags={"k": "a"})
+        statsd.distribution("bunklogs.test.ms", 1.5)
+        statsd.distribution("bunklogs.test.ms", 3)
+        assert _received(agent) == []
+
+        statsd.flush()
+
+        assert sorted(_received(agent)) == [
+            "bunklogs.test.count:3|c|#env:test,k:a",
+            "bunklogs.test.ms:1.5:3|d|#env:test",
+        ]
+
+    def test_packs_lines_into_bounded_datagrams(self, agent, statsd):
+        for i in range(200):
+            statsd.increment(f"bunklogs.test.metric_{i}")
+        statsd.flush()
+
+        datagrams = _datagrams(agent)
+        assert len(datagrams) > 1
+        assert all(len(d) <= metrics.MAX_PACKET_BYTES for d in datagrams)
+        assert sum(d.count(b"|c") for d in datagrams) == 200
+
+
+@pytest.mark.django_db
+class TestRequestMetricsMiddleware:
+    def test_records_queries_cache_and_size_per_endpoint(self, agent, statsd):
+        cache = InstrumentedLocMemCache("instrumentation-test", {})
+        cache.set("warm", 1)
+
+        def view(request):
+            list(Organization.objects.all())
+            cache.get("warm")
+            cache.get("cold")
+            cache.get_many(["warm", "cold", "colder"])
+            with hot_path("test.section"):
+                pass
+            return HttpResponse(b"x" * 42)
+
+        request = RequestFactory().get("/api/v1/webhooks/mailgun/inbound/")
+        request.resolver_match = resolve("/api/v1/webhooks/mailgun/inbound/")
+
+        def get_response(req):
+            middleware.process_view(req, view, (), {})
+            return view(req)
+
+        middleware = RequestMetricsMiddleware(get_response)
+        middleware(request)
+        statsd.flush()
+
+        lines = _received(agent)
+        endpoint = request.resolver_match.view_name
+        tags = f"|#endpoint:{endpoint},env:test,method:GET,status_class:2xx"
+        assert f"bunklogs.request.queries:1|d{tags}" in lines
+        assert f"bunklogs.request.cache_hits:2|c{tags}" in lines
+        assert f"bunklogs.request.cache_misses:3|c{tags}" in lines
+        assert f"bunklogs.request.response_bytes:42|d{tags}" in lines
+        assert any(
+            line.startswith("bunklogs.hot_path.duration_ms:")
+            and line.endswith(f"|#endpoint:{endpoint},env:test,path:test.section")
+            for line in lines
+        )
+
+
+def test_hot_path_outside_request_tags_no_endpoint(agent, statsd):
+    @hot_path("test.decorated")
+    def work():
+        return 7
+
+    assert work() == 7
+    statsd.flush()
+
+    (line,) = _received(agent)
+    assert line.endswith("|d|#endpoint:none,env:test,path:test.decorated")
+
+
+def test_celery_task_postrun_flushes_buffer(agent, statsd):
+    statsd.increment("bunklogs.test.task")
+    assert _received(agent) == []
+
+    metrics.flush_after_task(sender=None, task_id="t")
+
+    assert _received(agent) == ["bunklogs.test.task:1|c|#env:test"]
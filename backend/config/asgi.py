@@ -0,0 +1,30 @@
+"""
+ASGI config for Bunk Logs project.
+
+Serves the same Django project as ``config.wsgi`` but is needed for
+long-lived connections: the live dashboard event stream
+(``/api/v1/live/events/``) is an async view that would otherwise hold a sync
+gunicorn worker per open tab. Run it under uvicorn workers, e.g.::
+
+    gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker
+
+and point the SPA's ``EventSource`` at that service. Regular API traffic can
+stay on ``config.wsgi``.
+
+Not yet deployed: ``render.yaml`` only runs ``config.wsgi``, so the live
+stream answers 503 there until an ASGI web service is added.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from django.core.asgi import get_asgi_application
+
+# This allows easy placement of apps within the interior
+# bunk_logs directory.
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR / "bunk_logs"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+application = get_asgi_application()
@@ -8,9 +8,23 @@ except ImportError:
     pass
 
 from celery import Celery
+from celery.signals import before_task_publish
+from celery.signals import task_postrun
+from celery.signals import worker_process_shutdown
+
+from bunk_logs.core.celery_queues import stamp_enqueued_at
+from bunk_logs.utils.metrics import flush_after_task
+from bunk_logs.utils.metrics import flush_on_worker_shutdown
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
 
 app = Celery("bunk_logs")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+# Stamp publish time so ``celery_queue_stats`` can report queue age.
+before_task_publish.connect(stamp_enqueued_at, weak=False)
+
+# Buffered DogStatsD metrics: prefork children exit without running atexit.
+task_postrun.connect(flush_after_task, weak=False)
+worker_process_shutdown.connect(flush_on_worker_shutdown, weak=False)
@@ -0,0 +1,140 @@
+"""Local verification of Google Sign-In ID tokens.
+
+``validate_google_token`` used to ask ``oauth2.googleapis.com/tokeninfo``
+about every credential, so each sign-in waited on a remote round trip and a
+slow Google endpoint could hang a sync worker. The ID token is an RS256 JWT;
+we verify its signature against Google's published JWKS and check the
+audience, issuer and expiry ourselves.
+
+The JWKS is cached in process memory and in the Django cache for as long as
+Google's ``Cache-Control: max-age`` allows (keys rotate roughly weekly), so
+the hot path makes no outbound call. A token signed with a ``kid`` we don't
+know triggers one refetch, rate-limited to ``GOOGLE_JWKS_MIN_REFRESH_SECONDS``.
+The Google ``SocialApp`` client id is cached for
+``GOOGLE_CLIENT_ID_CACHE_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+
+import jwt
+import requests
+from allauth.socialaccount.models import SocialApp
+from django.conf import settings
+from django.core.cache import cache
+
+GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = frozenset({"accounts.google.com", "https://accounts.google.com"})
+
+JWKS_CACHE_KEY = "google_id_token:jwks"
+CLIENT_ID_CACHE_KEY = "google_id_token:client_id"
+
+_DEFAULT_MAX_AGE = 3600
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Process-local copy of the JWKS; times are ``time.monotonic()`` values.
+_local: dict = {"keys": None, "expires_at": 0.0, "fetched_at": 0.0}
+
+
+class GoogleTokenError(ValueError):
+    """The credential is not a valid Google ID token for this app."""
+
+
+def _max_age(response: requests.Response) -> int:
+    match = _MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+    return int(match.group(1)) if match else _DEFAULT_MAX_AGE
+
+
+def _fetch_jwks() -> tuple[dict[str, dict], int]:
+    """Download Google's signing keys; returns ``(keys by kid, max_age)``."""
+    try:
+        response = requests.get(GOOGLE_JWKS_URL, timeout=settings.GOOGLE_JWKS_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        keys = {key["kid"]: key for key in response.json()["keys"]}
+    except (requests.RequestException, ValueError, KeyError) as exc:
+        msg = "Could not load Google signing keys."
+        raise GoogleTokenError(msg) from exc
+    return keys, _max_age(response)
+
+
+def _remember(keys: dict[str, dict], max_age: int, *, fetched: bool) -> None:
+    now = time.monotonic()
+    _local.update(keys=keys, expires_at=now + max_age)
+    if fetched:
+        _local["fetched_at"] = now
+
+
+def _signing_keys(*, refresh: bool = False) -> dict[str, dict]:
+    if not refresh:
+        if _local["keys"] is not None and time.monotonic() < _local["expires_at"]:
+            return _local["keys"]
+        cached = cache.get(JWKS_CACHE_KEY)
+        if cached is not None:
+            # The shared entry expires with Google's max-age; re-check it
+            # from the cache once a minute rather than holding it longer.
+            _remember(cached, 60, fetched=False)
+            return cached
+    keys, max_age = _fetch_jwks()
+    cache.set(JWKS_CACHE_KEY, keys, max_age)
+    _remember(keys, max_age, fetched=True)
+    return keys
+
+
+def _signing_key(kid: str | None) -> dict:
+    keys = _signing_keys()
+    if kid in keys:
+        return keys[kid]
+    # Possibly a rotation we haven't seen yet -- refetch, but not in a loop
+    # for a flood of tokens with bogus ``kid`` headers.
+    if time.monotonic() - _local["fetched_at"] >= settings.GOOGLE_JWKS_MIN_REFRESH_SECONDS:
+        keys = _signing_keys(refresh=True)
+        if kid in keys:
+            return keys[kid]
+    msg = "Unknown Google signing key."
+    raise GoogleTokenError(msg)
+
+
+def google_client_id() -> str | None:
+    """Client id of the Google ``SocialApp``, or ``None`` if not configured."""
+    client_id = cache.get(CLIENT_ID_CACHE_KEY)
+    if client_id is None:
+        app = SocialApp.objects.filter(provider="google").only("client_id").first()
+        if app is None:
+            return None
+        client_id = app.client_id
+        cache.set(CLIENT_ID_CACHE_KEY, client_id, settings.GOOGLE_CLIENT_ID_CACHE_SECONDS)
+    return client_id
+
+
+def verify_id_token(token: str, *, audience: str) -> dict:
+    """Verify a Google ID token locally and return its claims.
+
+    Raises :class:`GoogleTokenError` on a bad signature, wrong audience or
+    issuer, or an expired token.
+    """
+    try:
+        header = jwt.get_unverified_header(token)
+    except jwt.PyJWTError as exc:
+        msg = "Malformed ID token."
+        raise GoogleTokenError(msg) from exc
+    key = jwt.PyJWK(_signing_key(header.get("kid")))
+    try:
+        claims = jwt.decode(
+            token,
+            key.key,
+            algorithms=["RS256"],
+            audience=audience,
+            leeway=settings.GOOGLE_ID_TOKEN_LEEWAY_SECONDS,
+            options={"require": ["exp", "iat", "aud", "iss", "sub"]},
+        )
+    except jwt.InvalidAudienceError as exc:
+        msg = "Invalid client ID"
+        raise GoogleTokenError(msg) from exc
+    except jwt.PyJWTError as exc:
+        raise GoogleTokenError(str(exc)) from exc
+    if claims["iss"] not in GOOGLE_ISSUERS:
+        msg = "Invalid issuer."
+        raise GoogleTokenError(msg)
+    return claims
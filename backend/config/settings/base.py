@@ -6,6 +6,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import environ
+from kombu import Queue
 
 BASE_DIR = Path(__file__).resolve(strict=True).parent.parent.parent
 # bunk_logs/
@@ -60,6 +61,9 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 ROOT_URLCONF = "config.urls"
 # https://docs.djangoproject.com/en/dev/ref/settings/#wsgi-application
 WSGI_APPLICATION = "config.wsgi.application"
+# Long-lived connections (the live dashboard event stream) are served by the
+# ASGI app under uvicorn workers, not the sync gunicorn workers.
+ASGI_APPLICATION = "config.asgi.application"
 
 # APPS
 # ------------------------------------------------------------------------------
@@ -166,6 +170,8 @@ AUTH_PASSWORD_VALIDATORS = [
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    # Outermost after CORS so auth / tenant middleware queries are counted too.
+    "bunk_logs.utils.instrumentation.RequestMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -368,6 +374,10 @@ if REDIS_SSL:
 FRONTEND_BASE_URL = env("FRONTEND_BASE_URL", default="https://clc.bunklogs.net")
 # Inbound subdomain for reply-to-ticket addresses (ticket+{uuid}@domain).
 MAILGUN_INBOUND_DOMAIN = env("MAILGUN_INBOUND_DOMAIN", default="")
+# Store verified inbound payloads and create notes from a Celery task instead
+# of inside the webhook request (see bunk_logs.api.webhooks.mailgun_inbound).
+MAILGUN_INBOUND_ASYNC = env.bool("MAILGUN_INBOUND_ASYNC", default=False)
+MAILGUN_INBOUND_BATCH_SIZE = env.int("MAILGUN_INBOUND_BATCH_SIZE", default=50)
 
 # AUTO-TRANSLATION (Step 7_5; see docs/user_stories/00_cross_cutting/i18n.md)
 # ------------------------------------------------------------------------------
@@ -410,6 +420,153 @@ THEME_TAGGING_TASK_SOFT_TIME_LIMIT_SECONDS = env.int(
 THEME_TAGGING_TASK_MAX_RETRIES = env.int(
     "THEME_TAGGING_TASK_MAX_RETRIES", default=3,
 )
+# Mark the static taxonomy/instruction prefix for Anthropic prompt caching so
+# repeat calls bill it as a cache read instead of fresh input.
+THEME_TAGGING_PROMPT_CACHING = env.bool("THEME_TAGGING_PROMPT_CACHING", default=True)
+# Reflections packed into one Anthropic call by backfill_reflection_themes.
+THEME_TAGGING_BATCH_SIZE = env.int("THEME_TAGGING_BATCH_SIZE", default=10)
+THEME_TAGGING_BATCH_TASK_SOFT_TIME_LIMIT_SECONDS = env.int(
+    "THEME_TAGGING_BATCH_TASK_SOFT_TIME_LIMIT_SECONDS", default=120,
+)
+
+# AUDIT TRAIL (Step 7_4; see bunk_logs/core/AUDIT_TRAIL.md)
+# ------------------------------------------------------------------------------
+# Events emitted inside ``audit.buffered()`` are bulk-inserted when the block
+# exits. With this on, the insert is instead handed to Celery after the
+# business transaction commits, taking it off the request's lock-hold path.
+AUDIT_ASYNC_FLUSH = env.bool("AUDIT_ASYNC_FLUSH", default=False)
+# ``core_auditevent`` is partitioned by month. The nightly maintenance task
+# keeps this many future months pre-created; ``archive_audit_partitions``
+# moves months older than the retention window to gzipped JSONL in the
+# named STORAGES alias and drops them.
+AUDIT_PARTITION_MONTHS_AHEAD = env.int("AUDIT_PARTITION_MONTHS_AHEAD", default=3)
+AUDIT_ARCHIVE_AFTER_MONTHS = env.int("AUDIT_ARCHIVE_AFTER_MONTHS", default=13)
+AUDIT_ARCHIVE_STORAGE = env("AUDIT_ARCHIVE_STORAGE", default="default")
+AUDIT_ARCHIVE_PREFIX = env("AUDIT_ARCHIVE_PREFIX", default="audit-archive")
+
+# DASHBOARD WARM-UP (see bunk_logs/api/dashboards/warmup.py)
+# ------------------------------------------------------------------------------
+# Role home dashboards are rebuilt into their cache keys every minute during
+# the first DASHBOARD_WARMUP_WINDOW_MINUTES of the org's rollover hour and of
+# each evening hour listed here (org-local), so first loads are cache hits.
+DASHBOARD_WARMUP_EVENING_HOURS = [int(h) for h in env.list("DASHBOARD_WARMUP_EVENING_HOURS", default=["20", "21"])]
+DASHBOARD_WARMUP_WINDOW_MINUTES = env.int("DASHBOARD_WARMUP_WINDOW_MINUTES", default=15)
+# Warmed entries are held this long (views cache their own builds for 30s);
+# it is also the cross-viewer staleness bound inside a window. 0 keeps the
+# views' TTL.
+DASHBOARD_WARMUP_TTL_SECONDS = env.int("DASHBOARD_WARMUP_TTL_SECONDS", default=90)
+DASHBOARD_WARMUP_CHUNK_SIZE = env.int("DASHBOARD_WARMUP_CHUNK_SIZE", default=25)
+DASHBOARD_WARMUP_MAX_VIEWERS = env.int("DASHBOARD_WARMUP_MAX_VIEWERS", default=500)
+# Only viewers who logged in within this many days are warmed.
+DASHBOARD_WARMUP_ACTIVE_DAYS = env.int("DASHBOARD_WARMUP_ACTIVE_DAYS", default=7)
+
+# COUNSELOR CHANGE FEED (see bunk_logs/api/counselor/sync.py)
+# ------------------------------------------------------------------------------
+# Returned cursors trail "now" by this much so rows whose transaction commits
+# after the response (updated_at is stamped at save time) are still picked
+# up on the next poll; clients upsert, so the overlap is harmless.
+SYNC_CURSOR_LAG_SECONDS = env.int("SYNC_CURSOR_LAG_SECONDS", default=30)
+# More changed rows than this for any one type answers ``reset: true``.
+SYNC_MAX_ROWS = env.int("SYNC_MAX_ROWS", default=500)
+# Cursors older than the tombstone retention also answer ``reset: true``.
+SYNC_TOMBSTONE_RETENTION_DAYS = env.int("SYNC_TOMBSTONE_RETENTION_DAYS", default=14)
+
+# LIVE DASHBOARD EVENTS (see bunk_logs/core/live_events.py, bunk_logs/api/live.py)
+# ------------------------------------------------------------------------------
+# Publish invalidation events on Redis pub/sub after qualifying writes. Off
+# until an ASGI service serves the stream and the SPA subscribes to it;
+# nothing consumes the events before then.
+LIVE_EVENTS_ENABLED = env.bool("LIVE_EVENTS_ENABLED", default=False)
+# redis-py kwargs for the publisher and the stream's subscriber. Short socket
+# timeouts keep an unreachable Redis from stalling the write that publishes.
+LIVE_REDIS_OPTIONS: dict = {
+    "socket_connect_timeout": env.float("LIVE_REDIS_CONNECT_TIMEOUT", default=1.0),
+    "socket_timeout": env.float("LIVE_REDIS_SOCKET_TIMEOUT", default=1.0),
+}
+if REDIS_SSL:
+    import ssl
+
+    LIVE_REDIS_OPTIONS["ssl_cert_reqs"] = ssl.CERT_NONE
+# Lifetime of the signed ticket an EventSource presents to open the stream.
+LIVE_TICKET_MAX_AGE_SECONDS = env.int("LIVE_TICKET_MAX_AGE_SECONDS", default=60)
+# Comment line sent on an idle stream so proxies don't reap the connection.
+LIVE_HEARTBEAT_SECONDS = env.int("LIVE_HEARTBEAT_SECONDS", default=20)
+# Streams close after this long with a ``reauth`` event; the client then
+# fetches a fresh ticket (re-checking the viewer's memberships) and reopens.
+LIVE_STREAM_MAX_SECONDS = env.int("LIVE_STREAM_MAX_SECONDS", default=600)
+
+# ROSTER SNAPSHOT (see bunk_logs/core/roster_snapshot.py)
+# ------------------------------------------------------------------------------
+# Roster writes retire a program's snapshot immediately; this TTL only bounds
+# how long a Person rename takes to re-sort the cached name order.
+ROSTER_SNAPSHOT_CACHE_SECONDS = env.int("ROSTER_SNAPSHOT_CACHE_SECONDS", default=3600)
+
+# CELERY QUEUES (see bunk_logs/core/celery_queues.py)
+# ------------------------------------------------------------------------------
+# Latency-sensitive work (translations users watch spin, inbound email notes)
+# must never wait behind a theme-tagging backfill or a roster import, so tasks
+# are routed by name onto four queues. A worker started without ``-Q``
+# consumes all of them; production runs separate workers per queue group
+# (render.yaml) with the concurrency / prefetch in CELERY_QUEUE_WORKERS.
+CELERY_QUEUE_INTERACTIVE = "interactive"
+CELERY_QUEUE_NOTIFICATIONS = "notifications"
+CELERY_QUEUE_BULK = "bulk"
+CELERY_QUEUE_MAINTENANCE = "maintenance"
+CELERY_TASK_DEFAULT_QUEUE = CELERY_QUEUE_INTERACTIVE
+CELERY_TASK_QUEUES = tuple(
+    Queue(name, routing_key=name)
+    for name in (
+        CELERY_QUEUE_INTERACTIVE,
+        CELERY_QUEUE_NOTIFICATIONS,
+        CELERY_QUEUE_BULK,
+        CELERY_QUEUE_MAINTENANCE,
+    )
+)
+CELERY_TASK_ROUTES = {
+    "bunk_logs.core.translation.translate_reflection_to_english": {"queue": CELERY_QUEUE_INTERACTIVE},
+    "bunk_logs.core.tasks.process_inbound_emails": {"queue": CELERY_QUEUE_INTERACTIVE},
+    "bunk_logs.core.tasks.send_reflection_reminders": {"queue": CELERY_QUEUE_NOTIFICATIONS},
+    "bunk_logs.core.tasks.dispatch_reflection_reminders": {"queue": CELERY_QUEUE_NOTIFICATIONS},
+    "maintenance.send_ticket_created_email": {"queue": CELERY_QUEUE_NOTIFICATIONS},
+    "maintenance.dispatch_daily_digests": {"queue": CELERY_QUEUE_NOTIFICATIONS},
+    "maintenance.send_maintenance_digest": {"queue": CELERY_QUEUE_NOTIFICATIONS},
+    "bunk_logs.core.theme_tagging.tag_reflection_themes": {"queue": CELERY_QUEUE_BULK},
+    "bunk_logs.core.theme_tagging.tag_reflection_themes_batch": {"queue": CELERY_QUEUE_BULK},
+    "bunk_logs.core.tasks.import_roster_task": {"queue": CELERY_QUEUE_BULK},
+    "bunk_logs.core.tasks.rollover_program_task": {"queue": CELERY_QUEUE_BULK},
+    "bunk_logs.core.translation.purge_expired_translations": {"queue": CELERY_QUEUE_MAINTENANCE},
+    "bunk_logs.core.tasks.maintain_audit_partitions": {"queue": CELERY_QUEUE_MAINTENANCE},
+    "bunk_logs.core.tasks.flush_audit_events": {"queue": CELERY_QUEUE_MAINTENANCE},
+    "bunk_logs.core.tasks.dispatch_dashboard_warmup": {"queue": CELERY_QUEUE_MAINTENANCE},
+    "bunk_logs.core.tasks.warm_dashboards": {"queue": CELERY_QUEUE_MAINTENANCE},
+    "bunk_logs.core.tasks.prune_sync_tombstones": {"queue": CELERY_QUEUE_MAINTENANCE},
+}
+# Per-queue-group worker shape. Interactive workers take one message at a time
+# per process (prefetch 1) so a slow LLM call never strands queued work behind
+# it; bulk trades latency for throughput. ``celery_queue_stats --workers``
+# prints the matching ``celery worker`` command lines.
+CELERY_QUEUE_WORKERS = {
+    "interactive": {
+        "queues": [CELERY_QUEUE_INTERACTIVE, CELERY_QUEUE_NOTIFICATIONS],
+        "concurrency": env.int("CELERY_INTERACTIVE_CONCURRENCY", default=2),
+        "prefetch_multiplier": 1,
+    },
+    "bulk": {
+        "queues": [CELERY_QUEUE_BULK, CELERY_QUEUE_MAINTENANCE],
+        "concurrency": env.int("CELERY_BULK_CONCURRENCY", default=1),
+        "prefetch_multiplier": 4,
+    },
+}
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# Per-worker-process rate limits for the Anthropic-bound tasks, so a bulk
+# backfill cannot burn through the account's request quota.
+TRANSLATION_TASK_RATE_LIMIT = env("TRANSLATION_TASK_RATE_LIMIT", default="120/m")
+THEME_TAGGING_TASK_RATE_LIMIT = env("THEME_TAGGING_TASK_RATE_LIMIT", default="30/m")
+CELERY_TASK_ANNOTATIONS = {
+    "bunk_logs.core.translation.translate_reflection_to_english": {"rate_limit": TRANSLATION_TASK_RATE_LIMIT},
+    "bunk_logs.core.theme_tagging.tag_reflection_themes": {"rate_limit": THEME_TAGGING_TASK_RATE_LIMIT},
+    "bunk_logs.core.theme_tagging.tag_reflection_themes_batch": {"rate_limit": THEME_TAGGING_TASK_RATE_LIMIT},
+}
 
 
 # django-allauth
@@ -439,6 +596,13 @@ SOCIALACCOUNT_PROVIDERS = {
 
 SOCIALACCOUNT_STORE_TOKENS = True
 
+# Google ID tokens are verified locally (see config/google_tokens.py).
+GOOGLE_JWKS_TIMEOUT_SECONDS = env.float("GOOGLE_JWKS_TIMEOUT_SECONDS", default=5.0)
+# Minimum gap between JWKS refetches triggered by an unknown ``kid``.
+GOOGLE_JWKS_MIN_REFRESH_SECONDS = env.int("GOOGLE_JWKS_MIN_REFRESH_SECONDS", default=60)
+GOOGLE_ID_TOKEN_LEEWAY_SECONDS = env.int("GOOGLE_ID_TOKEN_LEEWAY_SECONDS", default=30)
+GOOGLE_CLIENT_ID_CACHE_SECONDS = env.int("GOOGLE_CLIENT_ID_CACHE_SECONDS", default=300)
+
 SOCIALACCOUNT_AUTO_SIGNUP = True
 SOCIALACCOUNT_EMAIL_VERIFICATION = "none"
 SOCIALACCOUNT_EMAIL_REQUIRED = False
@@ -694,4 +858,12 @@ DD_TRACE_ENABLED = env.bool("DD_TRACE_ENABLED", default=False)
 DD_LOGS_INJECTION = env.bool("DD_LOGS_INJECTION", default=False)
 # Link API request traces to Celery task spans (set on web + worker in production).
 DD_CELERY_DISTRIBUTED_TRACING = env.bool("DD_CELERY_DISTRIBUTED_TRACING", default=False)
+# Custom metrics (bunk_logs.utils.metrics) are aggregated in-process and
+# flushed to DogStatsD at most this often.
+DD_METRICS_FLUSH_INTERVAL = env.float("DD_METRICS_FLUSH_INTERVAL", default=10.0)
+# Per-request query / cache / hot-path metrics (bunk_logs.utils.instrumentation).
+REQUEST_METRICS_ENABLED = env.bool("REQUEST_METRICS_ENABLED", default=True)
+# Requests over either threshold are logged with their breakdown.
+REQUEST_METRICS_SLOW_MS = env.int("REQUEST_METRICS_SLOW_MS", default=1000)
+REQUEST_METRICS_SLOW_QUERIES = env.int("REQUEST_METRICS_SLOW_QUERIES", default=100)
 
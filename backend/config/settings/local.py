@@ -64,7 +64,7 @@ ALLOWED_HOSTS = ["localhost", "0.0.0.0", "127.0.0.1", "testserver", ".bunklogs.n
 # https://docs.djangoproject.com/en/dev/ref/settings/#caches
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "bunk_logs.utils.cache_backends.InstrumentedLocMemCache",
         "LOCATION": "",
     },
 }
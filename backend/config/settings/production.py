@@ -31,7 +31,7 @@ DATABASES["default"]["ATOMIC_REQUESTS"] = False
 # ------------------------------------------------------------------------------
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "bunk_logs.utils.cache_backends.InstrumentedRedisCache",
         "LOCATION": REDIS_URL,
         "OPTIONS": build_redis_cache_options(ignore_exceptions=True),
     },
@@ -58,3 +58,8 @@ MEDIA_URL = "http://media.testserver/"
 # ------------------------------------------------------------------------------
 # OrganizationMiddleware: allow X-Organization-Slug / ?org= in tests (DEBUG is False in CI).
 ORGANIZATION_ROUTING_DEV_OVERRIDES = True
+
+# LIVE DASHBOARD EVENTS
+# ------------------------------------------------------------------------------
+# No Redis in CI; tests that exercise publishing enable it and patch the send.
+LIVE_EVENTS_ENABLED = False
@@ -0,0 +1,120 @@
+"""Tests for local Google ID token verification (``config.google_tokens``)."""
+
+import json
+import time
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import jwt
+import pytest
+from allauth.socialaccount.models import SocialApp
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory
+
+from config import google_tokens
+from config.google_tokens import GoogleTokenError
+from config.google_tokens import verify_id_token
+from config.views import validate_google_token
+
+CLIENT_ID = "bunklogs-test.apps.googleusercontent.com"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    cache.clear()
+    google_tokens._local.update(keys=None, expires_at=0.0, fetched_at=0.0)
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def signing_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def jwks(signing_key):
+    """Patch the JWKS download to serve ``signing_key`` as kid ``k1``."""
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(signing_key.public_key()))
+    jwk.update(kid="k1", alg="RS256", use="sig")
+    response = MagicMock()
+    response.json.return_value = {"keys": [jwk]}
+    response.headers = {"Cache-Control": "public, max-age=21600, must-revalidate"}
+    with patch("config.google_tokens.requests.get", return_value=response) as get:
+        yield get
+
+
+def _token(key, *, kid="k1", **overrides):
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "1234567890",
+        "email": "mira@example.com",
+        "email_verified": True,
+        "iat": now,
+        "exp": now + 3600,
+        **overrides,
+    }
+    return jwt.encode(claims, key, algorithm="RS256", headers={"kid": kid})
+
+
+def test_valid_token_verifies_and_keys_are_fetched_once(signing_key, jwks):
+    assert verify_id_token(_token(signing_key), audience=CLIENT_ID)["sub"] == "1234567890"
+    verify_id_token(_token(signing_key), audience=CLIENT_ID)
+    assert jwks.call_count == 1
+    assert cache.get(google_tokens.JWKS_CACHE_KEY).keys() == {"k1"}
+
+
+def test_keys_are_reused_from_shared_cache(signing_key, jwks):
+    verify_id_token(_token(signing_key), audience=CLIENT_ID)
+    # Another worker process: empty local copy, warm shared cache.
+    google_tokens._local.update(keys=None, expires_at=0.0)
+    verify_id_token(_token(signing_key), audience=CLIENT_ID)
+    assert jwks.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"aud": "someone-else"}, "Invalid client ID"),
+        ({"iss": "https://evil.example.com"}, "Invalid issuer."),
+        ({"exp": int(time.time()) - 3600}, "Signature has expired"),
+    ],
+)
+def test_rejects_bad_claims(signing_key, jwks, overrides, message):
+    with pytest.raises(GoogleTokenError, match=message):
+        verify_id_token(_token(signing_key, **overrides), audience=CLIENT_ID)
+
+
+def test_rejects_token_signed_by_another_key(jwks):
+    forger = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    with pytest.raises(GoogleTokenError):
+        verify_id_token(_token(forger), audience=CLIENT_ID)
+
+
+def test_unknown_kid_refetches_at_most_once_per_window(signing_key, jwks, settings):
+    settings.GOOGLE_JWKS_MIN_REFRESH_SECONDS = 0
+    with pytest.raises(GoogleTokenError, match="Unknown Google signing key"):
+        verify_id_token(_token(signing_key, kid="rotated"), audience=CLIENT_ID)
+    assert jwks.call_count == 2
+
+    settings.GOOGLE_JWKS_MIN_REFRESH_SECONDS = 60
+    with pytest.raises(GoogleTokenError, match="Unknown Google signing key"):
+        verify_id_token(_token(signing_key, kid="rotated"), audience=CLIENT_ID)
+    assert jwks.call_count == 2
+
+
+@pytest.mark.django_db
+def test_validate_google_token_signs_in_without_tokeninfo(signing_key, jwks):
+    SocialApp.objects.create(provider="google", name="Google", client_id=CLIENT_ID, secret="s")
+
+    request = APIRequestFactory().post("/", {"credential": _token(signing_key)}, format="json")
+    with patch("config.views.login"):
+        resp = validate_google_token(request)
+
+    assert resp.status_code == 200, resp.data
+    assert resp.data["user"]["email"] == "mira@example.com"
+    assert set(resp.data["tokens"]) == {"access", "refresh"}
+    assert jwks.call_args.args == (google_tokens.GOOGLE_JWKS_URL,)
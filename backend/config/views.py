@@ -34,6 +34,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from config.google_tokens import GoogleTokenError
+from config.google_tokens import google_client_id
+from config.google_tokens import verify_id_token
+
 User = get_user_model()
 
 from django.db import connections
@@ -349,25 +353,16 @@ def validate_google_token(request):
         return Response({"error": "ID token is required"}, status=400)
 
     try:
-        # Get the Google SocialApp configuration
-        try:
-            social_app = SocialApp.objects.get(provider="google")
-        except SocialApp.DoesNotExist:
+        client_id = google_client_id()
+        if client_id is None:
             return Response({"error": "Google authentication is not configured"}, status=500)
 
-        # Verify the token with Google
-        response = requests.get(
-            f"https://oauth2.googleapis.com/tokeninfo?id_token={credential}",
-        )
-
-        id_info = response.json()
-
-        if "error" in id_info:
-            return Response({"error": id_info["error"]}, status=400)
-
-        # Verify the audience
-        if id_info["aud"] != social_app.client_id:
-            return Response({"error": "Invalid client ID"}, status=400)
+        # Verified locally against Google's cached signing keys; no
+        # outbound call on the sign-in path (see config.google_tokens).
+        try:
+            id_info = verify_id_token(credential, audience=client_id)
+        except GoogleTokenError as e:
+            return Response({"error": str(e)}, status=400)
 
         # Check if the user exists
         try: